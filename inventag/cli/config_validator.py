@@ -450,6 +450,37 @@ class ConfigValidator:
         if args.max_concurrent_accounts and args.max_concurrent_accounts < 1:
             result.errors.append("--max-concurrent-accounts must be a positive integer")
 
+        max_region_workers = getattr(args, "max_region_workers", None)
+        if max_region_workers is not None and max_region_workers < 1:
+            result.errors.append("--max-region-workers must be a positive integer")
+
+        response_cache_ttl = getattr(args, "response_cache_ttl", None)
+        if response_cache_ttl is not None and response_cache_ttl < 0:
+            result.errors.append("--response-cache-ttl cannot be negative")
+
+        response_cache_max_mb = getattr(args, "response_cache_max_mb", None)
+        if response_cache_max_mb is not None and response_cache_max_mb < 1:
+            result.errors.append("--response-cache-max-mb must be a positive integer")
+
+        for option in ("planner_empty_runs", "planner_full_sweep_interval"):
+            value = getattr(args, option, None)
+            if value is not None and value < 1:
+                result.errors.append(
+                    f"--{option.replace('_', '-')} must be a positive integer"
+                )
+
+        if getattr(args, "refresh_service", None) and not getattr(
+            args, "enable_response_cache", False
+        ):
+            result.warnings.append(
+                "--refresh-service has no effect without --enable-response-cache"
+            )
+
+        if getattr(args, "ingest_price_list", None) and not getattr(
+            args, "price_catalog", None
+        ):
+            result.errors.append("--ingest-price-list requires --price-catalog")
+
         # Validate timeout
         if args.account_processing_timeout and args.account_processing_timeout < 60:
             result.errors.append(
@@ -191,6 +191,23 @@ Examples:
         action="store_true",
         help="Enable cost analysis and optimization recommendations",
     )
+    analysis_group.add_argument(
+        "--price-catalog",
+        type=str,
+        help=(
+            "SQLite price catalog used for cost estimation; services ingested "
+            "into it are priced locally instead of through the Pricing API"
+        ),
+    )
+    analysis_group.add_argument(
+        "--ingest-price-list",
+        nargs="+",
+        metavar="OFFER_FILE",
+        help=(
+            "Load AWS bulk price-list offer files (JSON or CSV) into "
+            "--price-catalog and exit; run on a schedule to keep prices current"
+        ),
+    )
     analysis_group.add_argument(
         "--fallback-display",
         choices=["auto", "always", "never"],
@@ -268,6 +285,12 @@ Examples:
         default=1800,
         help="Timeout in seconds for processing each account (default: 1800)",
     )
+    parallel_group.add_argument(
+        "--max-region-workers",
+        type=int,
+        default=10,
+        help="Maximum number of regions to scan concurrently per account (default: 10)",
+    )
     parallel_group.add_argument(
         "--disable-parallel-processing",
         action="store_true",
@@ -341,6 +364,59 @@ Examples:
         action="store_true",
         help="Generate separate BOM reports for each account (in addition to consolidated report)",
     )
+    output_group.add_argument(
+        "--enable-response-cache",
+        action="store_true",
+        help="Cache AWS List/Describe responses under <output-directory>/state/api_cache "
+        "and reuse them on later runs until they expire",
+    )
+    output_group.add_argument(
+        "--response-cache-ttl",
+        type=int,
+        default=900,
+        help="Lifetime of cached responses in seconds for services without their own "
+        "TTL (default: 900; IAM/Organizations 24h, Route53/CloudFront 6h, S3 1h)",
+    )
+    output_group.add_argument(
+        "--response-cache-max-mb",
+        type=int,
+        default=256,
+        help="Size limit of the response cache before the oldest entries are evicted "
+        "(default: 256)",
+    )
+    output_group.add_argument(
+        "--enable-discovery-planner",
+        action="store_true",
+        help="Use recorded discovery history to skip service/region pairs that were "
+        "empty in recent runs and scan the largest pairs first",
+    )
+    output_group.add_argument(
+        "--planner-empty-runs",
+        type=int,
+        default=3,
+        help="Consecutive empty runs before a service/region pair is skipped (default: 3)",
+    )
+    output_group.add_argument(
+        "--planner-full-sweep-interval",
+        type=int,
+        default=10,
+        help="Scan every service/region pair every Nth run to catch new usage "
+        "(default: 10)",
+    )
+    output_group.add_argument(
+        "--disable-owner-scoping",
+        action="store_true",
+        help="Do not add owner-scoping parameters (Scope=Local, Owners=self, ...) to "
+        "discovery requests; AWS-managed resources are then filtered client-side",
+    )
+    output_group.add_argument(
+        "--refresh-service",
+        action="append",
+        default=[],
+        metavar="SERVICE",
+        help="Ignore cached responses for this service (botocore client name, e.g. iam "
+        "or ec2) and fetch fresh data. Can be repeated",
+    )
 
     # Logging and debug options
     logging_group = parser.add_argument_group("Logging and Debug Options")
@@ -677,6 +753,7 @@ def create_multi_account_config(args) -> MultiAccountConfig:
         enable_network_analysis=getattr(args, "enable_network_analysis", False),
         enable_security_analysis=getattr(args, "enable_security_analysis", False),
         enable_cost_analysis=getattr(args, "enable_cost_analysis", False),
+        price_catalog_path=getattr(args, "price_catalog", None),
     )
 
     if args.service_descriptions:
@@ -714,6 +791,15 @@ def create_multi_account_config(args) -> MultiAccountConfig:
         fallback_display_mode=(
             args.fallback_display if not args.hide_fallback_resources else "never"
         ),
+        max_region_workers=getattr(args, "max_region_workers", 10),
+        enable_response_cache=getattr(args, "enable_response_cache", False),
+        response_cache_ttl=getattr(args, "response_cache_ttl", 900),
+        response_cache_max_mb=getattr(args, "response_cache_max_mb", 256),
+        refresh_services=getattr(args, "refresh_service", None) or [],
+        enable_discovery_planner=getattr(args, "enable_discovery_planner", False),
+        planner_empty_runs=getattr(args, "planner_empty_runs", 3),
+        planner_full_sweep_interval=getattr(args, "planner_full_sweep_interval", 10),
+        owner_scoped_discovery=not getattr(args, "disable_owner_scoping", False),
     )
 
     return config
@@ -849,6 +935,30 @@ def validate_credentials_only(config: MultiAccountConfig) -> bool:
     return all_valid
 
 
+def ingest_price_list(catalog_path: str, offer_files: List[str]) -> bool:
+    """Load bulk price-list offer files into the local price catalog."""
+    from ..discovery.price_catalog import PriceCatalog
+
+    logger = logging.getLogger(__name__)
+
+    logger.info(f"Ingesting {len(offer_files)} offer file(s) into {catalog_path}")
+
+    success = True
+    with PriceCatalog(catalog_path) as catalog:
+        for offer_file in offer_files:
+            try:
+                summary = catalog.ingest_offer_file(offer_file)
+                logger.info(
+                    f"✓ {summary.source}: {summary.product_count} "
+                    f"{summary.service_code} prices"
+                )
+            except Exception as e:
+                logger.error(f"✗ Failed to ingest {offer_file}: {e}")
+                success = False
+
+    return success
+
+
 def main():
     """Main CLI entry point."""
     parser = create_parser()
@@ -879,6 +989,11 @@ def main():
         for warning in validation_result.warnings:
             logger.warning(f"  - {warning}")
 
+    # Price catalog refresh needs no AWS credentials
+    if args.ingest_price_list:
+        success = ingest_price_list(args.price_catalog, args.ingest_price_list)
+        sys.exit(0 if success else 1)
+
     try:
         # Early AWS credential validation (unless skipped or using interactive prompt)
         if (
@@ -21,7 +21,7 @@ import json
 import yaml
 import getpass
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
@@ -29,7 +29,14 @@ from pathlib import Path
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
 
 # Import InvenTag components
-from ..discovery import AWSResourceInventory
+from ..discovery import (
+    AWSResourceInventory,
+    APIResponseCache,
+    DailyCostStore,
+    DiscoveryPlanner,
+    NetworkAnalyzer,
+    OperationPlanIndex,
+)
 from ..compliance import ComprehensiveTagComplianceChecker
 from ..reporting import BOMConverter, BOMDataProcessor, BOMProcessingConfig
 from ..state import StateManager, DeltaDetector, ChangelogGenerator
@@ -90,6 +97,15 @@ class MultiAccountConfig:
     credential_validation_timeout: int = 30
     hide_fallback_resources: bool = False  # Legacy, deprecated
     fallback_display_mode: str = "auto"  # "auto", "always", "never"
+    max_region_workers: int = 10  # Concurrent regions per account discovery
+    enable_response_cache: bool = False  # Reuse API responses across runs
+    response_cache_ttl: int = 900  # seconds, for services without their own TTL
+    response_cache_max_mb: int = 256
+    refresh_services: List[str] = field(default_factory=list)
+    enable_discovery_planner: bool = False  # Skip pairs empty in recent runs
+    planner_empty_runs: int = 3
+    planner_full_sweep_interval: int = 10  # Scan every pair every Nth run
+    owner_scoped_discovery: bool = True  # Request only account-owned resources
 
 
 class CloudBOMGenerator:
@@ -130,6 +146,26 @@ class CloudBOMGenerator:
         self.output_dir = Path(self.config.output_directory)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Opt-in API response cache shared by every account, kept with run state
+        self.response_cache: Optional[APIResponseCache] = None
+        if self.config.enable_response_cache:
+            self.response_cache = APIResponseCache(
+                cache_dir=str(self.output_dir / "state" / "api_cache"),
+                default_ttl=self.config.response_cache_ttl,
+                max_size_mb=self.config.response_cache_max_mb,
+                refresh_services=self.config.refresh_services,
+            )
+
+        # Compiled botocore operation plans, kept with run state so later
+        # runs skip compiling the service models
+        self.operation_index = OperationPlanIndex(str(self.output_dir / "state"))
+
+        # Daily Cost Explorer spend shared by billing validation and cost
+        # trends, kept with run state so later runs only fetch new days
+        self.cost_store = DailyCostStore(
+            str(self.output_dir / "state" / "daily_costs.db")
+        )
+
         self.logger.info(
             f"Initialized CloudBOMGenerator with {len(self.config.accounts)} accounts"
         )
@@ -632,6 +668,20 @@ class CloudBOMGenerator:
         )
         return all_resources
 
+    def _create_discovery_planner(self, account_id: str) -> Optional[DiscoveryPlanner]:
+        """Create the per-account discovery planner when enabled."""
+        if not self.config.enable_discovery_planner:
+            return None
+
+        state_dir = self.output_dir / "state"
+        return DiscoveryPlanner(
+            history_file=str(state_dir / f"discovery_history_{account_id}.json"),
+            empty_runs_to_skip=self.config.planner_empty_runs,
+            full_sweep_interval=self.config.planner_full_sweep_interval,
+            state_manager=StateManager(state_dir=str(state_dir)),
+            account_id=account_id,
+        )
+
     def _discover_account_resources(
         self, account_id: str, context: AccountContext
     ) -> List[Dict[str, Any]]:
@@ -671,6 +721,14 @@ class CloudBOMGenerator:
                 or None,  # None means all services
                 tag_filters=context.credentials.tags,
                 fallback_display_mode=self.config.fallback_display_mode,
+                max_region_workers=self.config.max_region_workers,
+                response_cache=self.response_cache,
+                discovery_planner=self._create_discovery_planner(
+                    context.credentials.account_id
+                ),
+                owner_scoped_discovery=self.config.owner_scoped_discovery,
+                cost_store=self.cost_store,
+                operation_index=self.operation_index,
             )
 
             # Discover resources
@@ -814,8 +872,17 @@ class CloudBOMGenerator:
                 raise Exception("No valid session available for BOM generation")
 
             # Initialize BOM processor
+            # Failed dynamic-discovery patterns are kept with run state
+            bom_config = self.config.bom_processing_config
+            if not bom_config.pattern_failure_cache_dir:
+                bom_config = replace(
+                    bom_config,
+                    pattern_failure_cache_dir=str(self.output_dir / "state"),
+                )
             bom_processor = BOMDataProcessor(
-                config=self.config.bom_processing_config, session=session
+                config=bom_config,
+                session=session,
+                cost_store=self.cost_store,
             )
 
             # Process inventory data into BOM format
@@ -843,6 +910,12 @@ class CloudBOMGenerator:
                 }
             )
 
+            # Compare VPC address space across every account
+            if len(self.account_contexts) > 1 and getattr(
+                self.config.bom_processing_config, "enable_network_analysis", False
+            ):
+                self._add_cross_account_cidr_analysis(resources, bom_data)
+
             # Add compliance results to BOM data
             if compliance_results:
                 bom_data.compliance_summary = compliance_results
@@ -918,6 +991,50 @@ class CloudBOMGenerator:
                 "generation_timestamp": datetime.now(timezone.utc).isoformat(),
             }
 
+    def _add_cross_account_cidr_analysis(
+        self, resources: List[Dict[str, Any]], bom_data
+    ):
+        """Add CIDR overlaps and free space across all accounts' VPCs to the BOM."""
+        try:
+            resources_by_account: Dict[str, List[Dict[str, Any]]] = {}
+            for resource in resources:
+                if resource.get("service") == "VPC" and resource.get("type") in [
+                    "VPC",
+                    "Subnet",
+                ]:
+                    account_id = resource.get("source_account_id", "unknown")
+                    resources_by_account.setdefault(account_id, []).append(resource)
+
+            vpc_analyses = []
+            analyzer = None
+            for account_id, context in self.account_contexts.items():
+                account_resources = resources_by_account.get(account_id)
+                if not context.session or not account_resources:
+                    continue
+                # The VPC describes are served from the run's EC2 snapshot
+                analyzer = NetworkAnalyzer(context.session)
+                for vpc in analyzer.analyze_vpc_resources(account_resources).values():
+                    vpc.account_id = vpc.account_id or account_id
+                    vpc_analyses.append(vpc)
+
+            if analyzer is None:
+                return
+
+            cidr_analysis = analyzer.analyze_cidr_space(vpc_analyses)
+            if isinstance(bom_data.network_analysis, dict):
+                bom_data.network_analysis["cidr_analysis"] = cidr_analysis
+            else:
+                bom_data.network_analysis.cidr_analysis = cidr_analysis
+
+            self.logger.info(
+                f"Compared {cidr_analysis['total_cidr_blocks']} VPC CIDR blocks "
+                f"across {len(resources_by_account)} accounts: "
+                f"{cidr_analysis['overlap_count']} overlapping pairs in "
+                f"{cidr_analysis['overlap_group_count']} groups"
+            )
+        except Exception as e:
+            self.logger.warning(f"Cross-account CIDR analysis failed: {e}")
+
     def _generate_state_artifacts(
         self, resources: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -6,6 +6,15 @@ Provides comprehensive AWS resource discovery across all services and regions.
 """
 
 from .inventory import AWSResourceInventory
+from .client_pool import AWSClientPool, get_client_pool
+from .ec2_snapshot import EC2SnapshotStore, RegionalEC2Snapshot, get_ec2_snapshot_store
+from .rate_limiter import AdaptiveRateLimiter, is_throttling_error
+from .streaming import stream_from_producer, iter_batches
+from .response_cache import APIResponseCache
+from .billing_store import DailyCostStore
+from .discovery_planner import DiscoveryPlanner, DiscoveryPlan
+from .operation_index import OperationPlanIndex, OperationPlan, get_operation_index
+from .owner_scope import OWNER_SCOPED_PARAMETERS, get_owner_scope_params
 from .service_enrichment import (
     ServiceAttributeEnricher,
     ServiceHandler,
@@ -19,6 +28,8 @@ from .network_analyzer import (
     SubnetAnalysis,
     NetworkSummary,
 )
+from .network_topology import NetworkTopologyGraph
+from .cidr_index import CIDRIndex, CIDROverlap, CIDROverlapGroup
 from .security_analyzer import (
     SecurityAnalyzer,
     SecurityGroupAnalysis,
@@ -27,6 +38,7 @@ from .security_analyzer import (
     NACLRule,
     SecuritySummary,
 )
+from .exposure_engine import ExposureEngine, PortRangeSet, ResourceExposure
 from .service_descriptions import (
     ServiceDescriptionManager,
     ServiceDescription,
@@ -48,6 +60,24 @@ try:
 
     __all__ = [
         "AWSResourceInventory",
+        "AWSClientPool",
+        "get_client_pool",
+        "EC2SnapshotStore",
+        "RegionalEC2Snapshot",
+        "get_ec2_snapshot_store",
+        "AdaptiveRateLimiter",
+        "is_throttling_error",
+        "stream_from_producer",
+        "iter_batches",
+        "APIResponseCache",
+        "DailyCostStore",
+        "DiscoveryPlanner",
+        "DiscoveryPlan",
+        "OperationPlanIndex",
+        "OperationPlan",
+        "get_operation_index",
+        "OWNER_SCOPED_PARAMETERS",
+        "get_owner_scope_params",
         "ServiceAttributeEnricher",
         "ServiceHandler",
         "ServiceHandlerFactory",
@@ -57,12 +87,19 @@ try:
         "VPCAnalysis",
         "SubnetAnalysis",
         "NetworkSummary",
+        "NetworkTopologyGraph",
+        "CIDRIndex",
+        "CIDROverlap",
+        "CIDROverlapGroup",
         "SecurityAnalyzer",
         "SecurityGroupAnalysis",
         "SecurityRule",
         "NACLAnalysis",
         "NACLRule",
         "SecuritySummary",
+        "ExposureEngine",
+        "PortRangeSet",
+        "ResourceExposure",
         "ServiceDescriptionManager",
         "ServiceDescription",
         "DescriptionTemplate",
@@ -83,6 +120,24 @@ except ImportError:
     # Fallback if service handlers are not available
     __all__ = [
         "AWSResourceInventory",
+        "AWSClientPool",
+        "get_client_pool",
+        "EC2SnapshotStore",
+        "RegionalEC2Snapshot",
+        "get_ec2_snapshot_store",
+        "AdaptiveRateLimiter",
+        "is_throttling_error",
+        "stream_from_producer",
+        "iter_batches",
+        "APIResponseCache",
+        "DailyCostStore",
+        "DiscoveryPlanner",
+        "DiscoveryPlan",
+        "OperationPlanIndex",
+        "OperationPlan",
+        "get_operation_index",
+        "OWNER_SCOPED_PARAMETERS",
+        "get_owner_scope_params",
         "ServiceAttributeEnricher",
         "ServiceHandler",
         "ServiceHandlerFactory",
@@ -92,12 +147,19 @@ except ImportError:
         "VPCAnalysis",
         "SubnetAnalysis",
         "NetworkSummary",
+        "NetworkTopologyGraph",
+        "CIDRIndex",
+        "CIDROverlap",
+        "CIDROverlapGroup",
         "SecurityAnalyzer",
         "SecurityGroupAnalysis",
         "SecurityRule",
         "NACLAnalysis",
         "NACLRule",
         "SecuritySummary",
+        "ExposureEngine",
+        "PortRangeSet",
+        "ResourceExposure",
         "ServiceDescriptionManager",
         "ServiceDescription",
         "DescriptionTemplate",
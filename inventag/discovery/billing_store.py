@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+InvenTag - Daily Cost Store
+Persistent store of daily Cost Explorer spend shared by every billing consumer.
+
+Cost Explorer is slow and charged per request, yet billing validation in the
+inventory and trend analysis in the cost analyzer both need per-service spend
+over overlapping windows. Daily BlendedCost and UsageQuantity are kept in a
+SQLite store keyed by (account, service, day). A query only fetches the days
+of its window that were never fetched or were fetched before they settled;
+Cost Explorer keeps revising the most recent days, so a day is final once it
+is older than ``settle_days``. Unsettled days are fetched again once their
+copy is older than ``unsettled_ttl``, so consumers within one run share it.
+
+The account is the one whose credentials the boto3 session carries, so the
+spend of a management account covers its whole organization, exactly as
+Cost Explorer reports it.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+import boto3
+
+from .client_pool import get_client_pool
+
+logger = logging.getLogger(__name__)
+
+# Cost Explorer revises the spend of recent days for a while
+DEFAULT_SETTLE_DAYS = 3
+
+# Unsettled days fetched more recently than this are not fetched again
+DEFAULT_UNSETTLED_TTL = timedelta(hours=6)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_costs (
+    account_id TEXT NOT NULL,
+    service TEXT NOT NULL,
+    day TEXT NOT NULL,
+    cost TEXT NOT NULL,
+    usage REAL NOT NULL,
+    PRIMARY KEY (account_id, day, service)
+);
+CREATE TABLE IF NOT EXISTS fetched_days (
+    account_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    final INTEGER NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (account_id, day)
+);
+"""
+
+
+@dataclass
+class ServiceCost:
+    """Spend and usage of one billing service over a window."""
+
+    service: str
+    cost: Decimal
+    usage: float
+
+
+class DailyCostStore:
+    """Thread-safe SQLite store of daily per-service spend fetched incrementally."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        settle_days: int = DEFAULT_SETTLE_DAYS,
+        unsettled_ttl: timedelta = DEFAULT_UNSETTLED_TTL,
+    ):
+        """
+        Initialize the store. The database is opened on first use.
+
+        Args:
+            path: SQLite database file, or ":memory:" to keep costs for the run
+            settle_days: Days after which Cost Explorer spend is treated as final
+            unsettled_ttl: How long a fetched, not yet final day is reused
+        """
+        self.path = path
+        self.settle_days = max(0, settle_days)
+        self.unsettled_ttl = unsettled_ttl
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # account -> lock serializing its refreshes
+        self._account_locks: Dict[str, threading.Lock] = {}
+        self._accounts = weakref.WeakKeyDictionary()
+        self._stats = {"requests": 0, "days_fetched": 0, "days_served": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, opening it once."""
+        with self._lock:
+            if self._connection is None:
+                if self.path != ":memory:":
+                    directory = os.path.dirname(os.path.abspath(self.path))
+                    os.makedirs(directory, exist_ok=True)
+                self._connection = sqlite3.connect(self.path, check_same_thread=False)
+                self._connection.executescript(SCHEMA)
+            return self._connection
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_account_id(self, session: boto3.Session) -> str:
+        """Return (and remember) the account a boto3 session belongs to."""
+        with self._lock:
+            account_id = self._accounts.get(session)
+        if account_id:
+            return account_id
+
+        sts_client = get_client_pool().get_client(session, "sts")
+        account_id = sts_client.get_caller_identity()["Account"]
+
+        with self._lock:
+            self._accounts[session] = account_id
+        return account_id
+
+    def service_costs(
+        self, session: boto3.Session, start: date, end: date
+    ) -> Dict[str, ServiceCost]:
+        """
+        Return the total spend and usage of every service from start to end.
+
+        Args:
+            session: boto3 session of the account to report on
+            start: First day of the window
+            end: Day after the last day of the window
+
+        Returns:
+            ServiceCost per Cost Explorer service name
+        """
+        account_id = self.refresh(session, start, end)
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT service, cost, usage FROM daily_costs "
+                    "WHERE account_id = ? AND day >= ? AND day < ?",
+                    (account_id, start.isoformat(), end.isoformat()),
+                )
+                .fetchall()
+            )
+
+        totals: Dict[str, ServiceCost] = {}
+        for service, cost, usage in rows:
+            total = totals.get(service)
+            if total is None:
+                totals[service] = ServiceCost(service, Decimal(cost), usage)
+            else:
+                total.cost += Decimal(cost)
+                total.usage += usage
+        return totals
+
+    def daily_service_costs(
+        self, session: boto3.Session, start: date, end: date
+    ) -> Dict[str, List[Tuple[date, Decimal]]]:
+        """
+        Return the daily spend of every service from start to end.
+
+        Returns:
+            (day, cost) pairs in day order per Cost Explorer service name
+        """
+        account_id = self.refresh(session, start, end)
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT service, day, cost FROM daily_costs "
+                    "WHERE account_id = ? AND day >= ? AND day < ? ORDER BY day",
+                    (account_id, start.isoformat(), end.isoformat()),
+                )
+                .fetchall()
+            )
+
+        daily: Dict[str, List[Tuple[date, Decimal]]] = defaultdict(list)
+        for service, day, cost in rows:
+            daily[service].append((date.fromisoformat(day), Decimal(cost)))
+        return dict(daily)
+
+    def refresh(self, session: boto3.Session, start: date, end: date) -> str:
+        """
+        Fetch the days from start to end that are missing or not yet final.
+
+        Unsettled days fetched within ``unsettled_ttl`` are kept as they are.
+
+        Errors from Cost Explorer (missing permission, not enabled) propagate
+        to the caller; days already stored are kept.
+
+        Returns:
+            The account the spend is stored under
+        """
+        account_id = self.get_account_id(session)
+        with self._lock:
+            account_lock = self._account_locks.setdefault(account_id, threading.Lock())
+
+        with account_lock:
+            days = [start + timedelta(days=n) for n in range((end - start).days)]
+            fresh_after = datetime.now(timezone.utc) - self.unsettled_ttl
+            with self._lock:
+                stored_days = {
+                    row[0]
+                    for row in self._connect().execute(
+                        "SELECT day FROM fetched_days WHERE account_id = ? AND "
+                        "(final = 1 OR fetched_at >= ?) AND day >= ? AND day < ?",
+                        (
+                            account_id,
+                            fresh_after.isoformat(),
+                            start.isoformat(),
+                            end.isoformat(),
+                        ),
+                    )
+                }
+            missing = [day for day in days if day.isoformat() not in stored_days]
+
+            with self._lock:
+                self._stats["days_served"] += len(days) - len(missing)
+
+            if missing:
+                ce_client = get_client_pool().get_client(
+                    session, "ce", region_name="us-east-1"
+                )
+                for run_start, run_end in _contiguous_runs(missing):
+                    self._fetch_days(ce_client, account_id, run_start, run_end)
+
+        return account_id
+
+    def _fetch_days(self, ce_client, account_id: str, start: date, end: date):
+        """Fetch and store the daily spend of one contiguous run of days."""
+        request = {
+            "TimePeriod": {"Start": start.isoformat(), "End": end.isoformat()},
+            "Granularity": "DAILY",
+            "Metrics": ["BlendedCost", "UsageQuantity"],
+            "GroupBy": [{"Type": "DIMENSION", "Key": "SERVICE"}],
+        }
+
+        rows = []
+        while True:
+            response = ce_client.get_cost_and_usage(**request)
+            with self._lock:
+                self._stats["requests"] += 1
+            for result in response.get("ResultsByTime", []):
+                day = result["TimePeriod"]["Start"]
+                for group in result.get("Groups", []):
+                    metrics = group.get("Metrics", {})
+                    rows.append(
+                        (
+                            account_id,
+                            group["Keys"][0] if group.get("Keys") else "Unknown",
+                            day,
+                            metrics.get("BlendedCost", {}).get("Amount", "0"),
+                            float(metrics.get("UsageQuantity", {}).get("Amount", 0)),
+                        )
+                    )
+            token = response.get("NextPageToken")
+            if not token:
+                break
+            request["NextPageToken"] = token
+
+        today = datetime.now(timezone.utc).date()
+        settled_before = today - timedelta(days=self.settle_days)
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        days = [start + timedelta(days=n) for n in range((end - start).days)]
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "DELETE FROM daily_costs WHERE account_id = ? AND "
+                    "day >= ? AND day < ?",
+                    (account_id, start.isoformat(), end.isoformat()),
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO daily_costs VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO fetched_days VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            account_id,
+                            day.isoformat(),
+                            int(day < settled_before),
+                            fetched_at,
+                        )
+                        for day in days
+                    ],
+                )
+            self._stats["days_fetched"] += len(days)
+
+        logger.debug(
+            f"Fetched {len(days)} day(s) of Cost Explorer spend for {account_id} "
+            f"from {start} to {end}"
+        )
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Return Cost Explorer requests made and days fetched or served locally."""
+        with self._lock:
+            return dict(self._stats)
+
+
+def _contiguous_runs(days: List[date]) -> List[Tuple[date, date]]:
+    """Group sorted days into (first day, day after last day) runs."""
+    runs: List[Tuple[date, date]] = []
+    for day in days:
+        if runs and runs[-1][1] == day:
+            runs[-1] = (runs[-1][0], day + timedelta(days=1))
+        else:
+            runs.append((day, day + timedelta(days=1)))
+    return runs
+
+
+_shared_store: Optional[DailyCostStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_daily_cost_store() -> DailyCostStore:
+    """Return the process-wide in-memory daily cost store shared by all consumers."""
+    global _shared_store
+
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                _shared_store = DailyCostStore()
+    return _shared_store
@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+InvenTag - CIDR Index
+Interval index over VPC CIDR blocks for cross-account overlap and free space queries.
+
+Every CIDR is stored as an inclusive integer range. Overlaps are found with a
+single sweep over the ranges sorted by start address, keeping the still-open
+ranges in a heap keyed by end address. The number of overlapping pairs can be
+quadratic (every default VPC uses 172.31.0.0/16), so overlaps are reported as
+groups: CIDR blocks either nest or are disjoint, so each group is an outermost
+block with every block nested in it, and its pair counts are kept as counters
+during the sweep. Grouping costs O(n log n) for n blocks; pair details are
+only produced on request, up to a limit. Free space inside a container CIDR is
+the gap list between merged used ranges, located by binary search and split
+into aligned CIDR blocks.
+"""
+
+import bisect
+import heapq
+import ipaddress
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CIDREntry:
+    """A CIDR block owned by a VPC, as an inclusive integer range."""
+
+    cidr: str
+    version: int
+    start: int
+    end: int
+    vpc_id: str
+    account_id: Optional[str] = None
+    region: Optional[str] = None
+    is_default: bool = False
+
+    @property
+    def size(self) -> int:
+        """Number of addresses in the block."""
+        return self.end - self.start + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the owner and block as a plain dictionary."""
+        return {
+            "cidr": self.cidr,
+            "vpc_id": self.vpc_id,
+            "account_id": self.account_id,
+            "region": self.region,
+            "is_default": self.is_default,
+        }
+
+
+@dataclass
+class CIDROverlap:
+    """Two CIDR blocks of different VPCs that share addresses."""
+
+    first: CIDREntry
+    second: CIDREntry
+    overlapping_cidr: str
+    overlapping_ips: int
+    cross_account: bool = False
+    cross_region: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the overlap as a plain dictionary."""
+        return {
+            "first": self.first.to_dict(),
+            "second": self.second.to_dict(),
+            "overlapping_cidr": self.overlapping_cidr,
+            "overlapping_ips": self.overlapping_ips,
+            "cross_account": self.cross_account,
+            "cross_region": self.cross_region,
+        }
+
+
+@dataclass
+class CIDROverlapGroup:
+    """An outermost CIDR block and every block nested in it, from several VPCs."""
+
+    cidr: str
+    members: List[CIDREntry] = field(default_factory=list)
+    overlap_count: int = 0
+    cross_account_overlap_count: int = 0
+
+    @property
+    def vpc_ids(self) -> List[str]:
+        """IDs of the member VPCs, in address order."""
+        return list(dict.fromkeys(entry.vpc_id for entry in self.members))
+
+    def to_dict(self, max_members: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Return the group as a plain dictionary.
+
+        Default VPCs are counted rather than listed, and at most
+        ``max_members`` of the other blocks are listed.
+        """
+        listed = [entry for entry in self.members if not entry.is_default]
+        default_vpcs = {entry.vpc_id for entry in self.members if entry.is_default}
+        return {
+            "cidr": self.cidr,
+            "vpc_count": len(self.vpc_ids),
+            "account_count": len({entry.account_id for entry in self.members}),
+            "region_count": len({entry.region for entry in self.members}),
+            "default_vpc_count": len(default_vpcs),
+            "overlap_count": self.overlap_count,
+            "cross_account_overlap_count": self.cross_account_overlap_count,
+            "members": [entry.to_dict() for entry in listed[:max_members]],
+            "members_truncated": max_members is not None and len(listed) > max_members,
+        }
+
+
+def parse_cidr(cidr: str) -> Optional[Tuple[int, int, int]]:
+    """Return (version, first address, last address) for a CIDR, or None if invalid."""
+    try:
+        network = ipaddress.ip_network(cidr, strict=False)
+    except (TypeError, ValueError):
+        return None
+    return (
+        network.version,
+        int(network.network_address),
+        int(network.broadcast_address),
+    )
+
+
+def merge_ranges(ranges: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge inclusive integer ranges into sorted, disjoint ranges."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def free_cidr_blocks(
+    container: str,
+    used: List[Tuple[int, int]],
+    prefix_length: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[str]:
+    """
+    Return the unused space of a container CIDR as aligned CIDR blocks.
+
+    Args:
+        container: CIDR to look for free space in
+        used: Sorted, disjoint used ranges of the container's IP version
+        prefix_length: Only return blocks large enough to hold a block of
+            this prefix length
+        limit: Maximum number of blocks to return
+
+    Returns:
+        Free CIDR blocks in address order
+    """
+    network = ipaddress.ip_network(container, strict=False)
+    address_class = (
+        ipaddress.IPv4Address if network.version == 4 else ipaddress.IPv6Address
+    )
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+
+    # Used ranges are disjoint, so their ends are sorted too
+    position = bisect.bisect_left(used, (first,))
+    if position > 0 and used[position - 1][1] >= first:
+        position -= 1
+
+    blocks: List[str] = []
+    cursor = first
+    while cursor <= last:
+        if position < len(used) and used[position][0] <= last:
+            gap_end = used[position][0] - 1
+            next_cursor = used[position][1] + 1
+            position += 1
+        else:
+            gap_end = last
+            next_cursor = last + 1
+
+        if gap_end >= cursor:
+            for block in ipaddress.summarize_address_range(
+                address_class(cursor), address_class(min(gap_end, last))
+            ):
+                if prefix_length is None or block.prefixlen <= prefix_length:
+                    blocks.append(str(block))
+                    if limit is not None and len(blocks) >= limit:
+                        return blocks
+        cursor = max(cursor, next_cursor)
+
+    return blocks
+
+
+def count_free_blocks(free_blocks: Iterable[str], prefix_length: int) -> int:
+    """Return how many blocks of prefix_length fit in the given free blocks."""
+    count = 0
+    for block in free_blocks:
+        block_prefix = int(block.rsplit("/", 1)[1])
+        if block_prefix <= prefix_length:
+            count += 2 ** (prefix_length - block_prefix)
+    return count
+
+
+class CIDRIndex:
+    """Thread-safe interval index of VPC CIDR blocks across accounts and regions."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._lock = threading.RLock()
+        self._entries: List[CIDREntry] = []
+        # version -> merged used ranges, rebuilt lazily after adds
+        self._merged: Dict[int, List[Tuple[int, int]]] = {}
+
+    def add(
+        self,
+        cidr: str,
+        vpc_id: str,
+        account_id: Optional[str] = None,
+        region: Optional[str] = None,
+        is_default: bool = False,
+    ) -> Optional[CIDREntry]:
+        """
+        Add a VPC CIDR block to the index.
+
+        Returns:
+            The stored entry, or None if the CIDR could not be parsed
+        """
+        parsed = parse_cidr(cidr)
+        if parsed is None:
+            logger.debug(f"Skipping invalid CIDR {cidr} for {vpc_id}")
+            return None
+
+        version, start, end = parsed
+        entry = CIDREntry(
+            cidr=cidr,
+            version=version,
+            start=start,
+            end=end,
+            vpc_id=vpc_id,
+            account_id=account_id,
+            region=region,
+            is_default=is_default,
+        )
+        with self._lock:
+            self._entries.append(entry)
+            self._merged.pop(version, None)
+        return entry
+
+    def add_vpc(self, vpc_analysis: Any) -> List[CIDREntry]:
+        """Add every CIDR block of a VPCAnalysis."""
+        cidr_blocks = vpc_analysis.cidr_blocks or [vpc_analysis.cidr_block]
+        entries = []
+        for cidr in cidr_blocks:
+            entry = self.add(
+                cidr,
+                vpc_analysis.vpc_id,
+                account_id=getattr(vpc_analysis, "account_id", None),
+                region=getattr(vpc_analysis, "region", None),
+                is_default=getattr(vpc_analysis, "is_default", False),
+            )
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    @classmethod
+    def from_vpc_analyses(cls, vpc_analyses: Iterable[Any]) -> "CIDRIndex":
+        """Build an index from VPCAnalysis objects."""
+        index = cls()
+        for vpc_analysis in vpc_analyses:
+            index.add_vpc(vpc_analysis)
+        return index
+
+    def find_overlap_groups(self) -> List[CIDROverlapGroup]:
+        """
+        Return the groups of blocks that overlap a block of another VPC.
+
+        Pairs are counted, not built, so identical blocks shared by thousands
+        of VPCs still cost one group.
+
+        Returns:
+            Groups in address order; blocks overlapping no other VPC's block
+            are left out
+        """
+        groups: List[CIDROverlapGroup] = []
+        group: Optional[CIDROverlapGroup] = None
+        group_end = -1
+        version = None
+
+        active: List[Tuple[int, int, CIDREntry]] = []
+        active_by_vpc: Counter = Counter()
+        active_by_account: Counter = Counter()
+
+        def close_group():
+            if group is not None and group.overlap_count:
+                groups.append(group)
+
+        for position, entry in enumerate(self._sorted_entries()):
+            if entry.version != version or entry.start > group_end:
+                close_group()
+                if entry.version != version:
+                    active, version = [], entry.version
+                    active_by_vpc.clear()
+                    active_by_account.clear()
+                group = CIDROverlapGroup(cidr=entry.cidr)
+                group_end = entry.end
+
+            # Drop blocks that ended before this one starts
+            while active and active[0][0] < entry.start:
+                _, _, ended = heapq.heappop(active)
+                active_by_vpc[ended.vpc_id] -= 1
+                active_by_account[ended.account_id] -= 1
+
+            # Every open block contains this one
+            group.members.append(entry)
+            group.overlap_count += len(active) - active_by_vpc[entry.vpc_id]
+            group.cross_account_overlap_count += (
+                len(active) - active_by_account[entry.account_id]
+            )
+
+            heapq.heappush(active, (entry.end, position, entry))
+            active_by_vpc[entry.vpc_id] += 1
+            active_by_account[entry.account_id] += 1
+
+        close_group()
+        return groups
+
+    def find_overlaps(
+        self, limit: Optional[int] = None, skip_default_pairs: bool = False
+    ) -> List[CIDROverlap]:
+        """
+        Return pairs of blocks from different VPCs that share addresses.
+
+        The number of pairs can grow with the square of the number of
+        blocks, so callers reporting on many VPCs should pass a limit and
+        use find_overlap_groups for totals.
+
+        Args:
+            limit: Maximum number of pairs to return
+            skip_default_pairs: Leave out pairs of two default VPCs
+
+        Returns:
+            Overlapping pairs in address order
+        """
+        return list(islice(self._iter_overlaps(skip_default_pairs), limit))
+
+    def _iter_overlaps(self, skip_default_pairs: bool) -> Iterator[CIDROverlap]:
+        """
+        Yield overlapping pairs lazily.
+
+        CIDR blocks either nest or are disjoint, so the shared space of an
+        overlapping pair is always the smaller of the two blocks. Default and
+        other blocks are kept in separate heaps so pairs of default VPCs can be
+        skipped without visiting them.
+        """
+        # is_default -> heap of open blocks keyed by end address
+        active: Dict[bool, List[Tuple[int, int, CIDREntry]]] = {True: [], False: []}
+        version = None
+        for position, entry in enumerate(self._sorted_entries()):
+            if entry.version != version:
+                active = {True: [], False: []}
+                version = entry.version
+
+            for heap in active.values():
+                # Drop blocks that ended before this one starts
+                while heap and heap[0][0] < entry.start:
+                    heapq.heappop(heap)
+
+            candidates = list(active[False])
+            if not (skip_default_pairs and entry.is_default):
+                candidates.extend(active[True])
+            for _, _, other in sorted(candidates, key=lambda item: item[1]):
+                if other.vpc_id == entry.vpc_id:
+                    continue
+                inner = entry if entry.size <= other.size else other
+                yield CIDROverlap(
+                    first=other,
+                    second=entry,
+                    overlapping_cidr=inner.cidr,
+                    overlapping_ips=inner.size,
+                    cross_account=other.account_id != entry.account_id,
+                    cross_region=other.region != entry.region,
+                )
+
+            heapq.heappush(active[entry.is_default], (entry.end, position, entry))
+
+    def _sorted_entries(self) -> List[CIDREntry]:
+        """Return the entries by version, start address and size, largest first."""
+        with self._lock:
+            return sorted(self._entries, key=lambda e: (e.version, e.start, -e.end))
+
+    def find_free_blocks(
+        self,
+        within: str,
+        prefix_length: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Return address blocks inside a CIDR that no indexed VPC uses.
+
+        Args:
+            within: CIDR to search, e.g. the organization's 10.0.0.0/8 range
+            prefix_length: Only return blocks that can hold this prefix length
+            limit: Maximum number of blocks to return
+
+        Returns:
+            Free CIDR blocks in address order
+        """
+        parsed = parse_cidr(within)
+        if parsed is None:
+            raise ValueError(f"Invalid CIDR: {within}")
+        return free_cidr_blocks(
+            within, self._merged_ranges(parsed[0]), prefix_length, limit
+        )
+
+    def _merged_ranges(self, version: int) -> List[Tuple[int, int]]:
+        """Return the merged used ranges of an IP version."""
+        with self._lock:
+            merged = self._merged.get(version)
+            if merged is None:
+                merged = merge_ranges(
+                    (e.start, e.end) for e in self._entries if e.version == version
+                )
+                self._merged[version] = merged
+            return merged
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class VPCAddressSpace:
+    """Unallocated address space of a VPC after its subnets."""
+
+    vpc_id: str
+    account_id: Optional[str]
+    region: Optional[str]
+    total_ips: int
+    unallocated_ips: int
+    largest_free_blocks: List[str] = field(default_factory=list)
+    free_block_count: int = 0
+
+
+def analyze_vpc_address_space(
+    vpc_analysis: Any, prefix_length: int = 24, max_blocks: int = 5
+) -> VPCAddressSpace:
+    """
+    Find the space of a VPC's CIDR blocks not allocated to any of its subnets.
+
+    Args:
+        vpc_analysis: VPCAnalysis with its subnets attached
+        prefix_length: Subnet size to count free blocks of
+        max_blocks: Number of largest free blocks to report
+
+    Returns:
+        VPCAddressSpace for the VPC
+    """
+    used_by_version: Dict[int, List[Tuple[int, int]]] = {}
+    for subnet in vpc_analysis.subnets:
+        parsed = parse_cidr(subnet.cidr_block)
+        if parsed is not None:
+            used_by_version.setdefault(parsed[0], []).append(parsed[1:])
+    merged = {v: merge_ranges(r) for v, r in used_by_version.items()}
+
+    total_ips = 0
+    free_blocks: List[str] = []
+    for cidr in vpc_analysis.cidr_blocks or [vpc_analysis.cidr_block]:
+        parsed = parse_cidr(cidr)
+        if parsed is None:
+            continue
+        total_ips += parsed[2] - parsed[1] + 1
+        free_blocks.extend(free_cidr_blocks(cidr, merged.get(parsed[0], [])))
+
+    unallocated_ips = 0
+    for block in free_blocks:
+        parsed = parse_cidr(block)
+        unallocated_ips += parsed[2] - parsed[1] + 1
+
+    largest = sorted(free_blocks, key=lambda b: int(b.rsplit("/", 1)[1]))
+    return VPCAddressSpace(
+        vpc_id=vpc_analysis.vpc_id,
+        account_id=getattr(vpc_analysis, "account_id", None),
+        region=getattr(vpc_analysis, "region", None),
+        total_ips=total_ips,
+        unallocated_ips=unallocated_ips,
+        largest_free_blocks=largest[:max_blocks],
+        free_block_count=count_free_blocks(free_blocks, prefix_length),
+    )
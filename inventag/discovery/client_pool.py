@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Shared AWS Client Pool
+
+Thread-safe pool of botocore clients shared by every discovery engine, analyzer
+and service handler in a run.
+
+Creating a client is expensive (endpoint resolution, loading the service model)
+and a boto3 Session is not thread-safe, so clients are created once under a lock
+and reused from any thread afterwards. Clients are keyed by
+(account, service, region), where the account is identified by the boto3 session
+that carries its credentials. Entries for a session disappear when the session
+is garbage collected.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import boto3
+from botocore.config import Config
+
+from .rate_limiter import ADAPTIVE_RETRY_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# botocore's own default is 10 connections per client
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+
+class AWSClientPool:
+    """Thread-safe, session-aware pool of botocore clients with hit/miss stats."""
+
+    def __init__(
+        self,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        client_config: Optional[Config] = None,
+    ):
+        """
+        Initialize the client pool.
+
+        Args:
+            max_pool_connections: Size of each client's HTTP connection pool
+            client_config: Optional base botocore Config merged into every client
+        """
+        self.max_pool_connections = max(1, max_pool_connections)
+        self.client_config = client_config
+        self._lock = threading.RLock()
+        # session -> {(service, region): (client, pool_size)}
+        self._clients = weakref.WeakKeyDictionary()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "resized": 0,
+            "creation_errors": 0,
+            "creation_time_seconds": 0.0,
+        }
+
+    def get_client(
+        self,
+        session: boto3.Session,
+        service_name: str,
+        region_name: Optional[str] = None,
+    ):
+        """
+        Return a shared client for (session, service, region), creating it once.
+
+        Args:
+            session: boto3 session identifying the account credentials
+            service_name: botocore service name, e.g. "ec2"
+            region_name: Region for the client; None uses the session default
+
+        Returns:
+            botocore client safe to use from multiple threads
+        """
+        key = (service_name, region_name)
+
+        with self._lock:
+            session_clients = self._clients.setdefault(session, {})
+            entry = session_clients.get(key)
+            if entry is not None:
+                if entry[1] >= self.max_pool_connections:
+                    self._stats["hits"] += 1
+                    return entry[0]
+                # Pool was grown after this client was built; rebuild it
+                self._stats["resized"] += 1
+
+            self._stats["misses"] += 1
+            start_time = time.time()
+            try:
+                client = session.client(
+                    service_name,
+                    region_name=region_name,
+                    config=self._build_config(),
+                )
+            except Exception:
+                self._stats["creation_errors"] += 1
+                raise
+            finally:
+                self._stats["creation_time_seconds"] += time.time() - start_time
+
+            session_clients[key] = (client, self.max_pool_connections)
+            return client
+
+    def ensure_capacity(self, max_workers: int):
+        """
+        Grow the per-client connection pool to at least ``max_workers``.
+
+        Clients created with a smaller pool are rebuilt on their next request so
+        that a wider thread pool does not block on connection checkout.
+        """
+        with self._lock:
+            if max_workers > self.max_pool_connections:
+                logger.debug(
+                    f"Growing client connection pool from {self.max_pool_connections} "
+                    f"to {max_workers}"
+                )
+                self.max_pool_connections = max_workers
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return pool hit/miss statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached_clients"] = sum(
+                len(clients) for clients in self._clients.values()
+            )
+            stats["max_pool_connections"] = self.max_pool_connections
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Drop all cached clients and reset statistics."""
+        with self._lock:
+            self._clients = weakref.WeakKeyDictionary()
+            for stat in self._stats:
+                self._stats[stat] = 0.0 if stat.endswith("seconds") else 0
+
+    def _build_config(self) -> Config:
+        """Build the botocore Config used for new clients."""
+        pool_config = Config(max_pool_connections=self.max_pool_connections)
+        if self.client_config is not None:
+            return self.client_config.merge(pool_config)
+        return pool_config
+
+
+_shared_pool: Optional[AWSClientPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> AWSClientPool:
+    """Return the process-wide client pool shared by all discovery components.
+
+    Clients from the shared pool use botocore's adaptive retry mode.
+    """
+    global _shared_pool
+
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = AWSClientPool(client_config=ADAPTIVE_RETRY_CONFIG)
+    return _shared_pool
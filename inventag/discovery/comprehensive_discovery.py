@@ -14,13 +14,21 @@ This ensures resources like VPCs, subnets, security groups, etc. are always disc
 """
 
 import logging
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import boto3
 from botocore.exceptions import ClientError
 
+from .client_pool import get_client_pool
+from .rate_limiter import AdaptiveRateLimiter, is_throttling_error
+from .response_cache import APIResponseCache
+from .discovery_planner import DiscoveryPlanner
+from .owner_scope import apply_owner_scope, client_service_name
+from .streaming import stream_from_producer
+
 
 class ComprehensiveAWSDiscovery:
     """
@@ -36,8 +44,23 @@ class ComprehensiveAWSDiscovery:
         regions: List[str] = None,
         hide_fallback_resources: bool = False,  # Legacy, deprecated
         fallback_display_mode: str = "auto",  # "auto", "always", "never"
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        max_throttle_retries: int = 5,
+        response_cache: Optional[APIResponseCache] = None,
+        planner: Optional[DiscoveryPlanner] = None,
+        owner_scoped: bool = True,
     ):
         self.session = session or boto3.Session()
+        self.client_pool = get_client_pool()
+        # Per (service, region) AIMD token buckets for API calls
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.max_throttle_retries = max_throttle_retries
+        # Optional on-disk cache of List/Describe responses across runs
+        self.response_cache = response_cache
+        # Optional history-driven task ordering/skipping across runs
+        self.planner = planner
+        # Request only account-owned resources where the API supports it
+        self.owner_scoped = owner_scoped
         self.logger = logging.getLogger(__name__)
         self.logger.propagate = False  # Prevent duplicate logging
         self.regions = regions or ["us-east-1"]
@@ -73,6 +96,20 @@ class ComprehensiveAWSDiscovery:
         # Track services with primary discoveries for smart fallback logic
         self.services_with_primary_resources = set()
 
+        # Receives primary resources instead of self.resources while streaming
+        self._resource_sink: Optional[Callable[[Dict[str, Any]], None]] = None
+
+        # Discovery statistics (task outcomes, throttling, rate-limit waits)
+        self._stats_lock = threading.Lock()
+        self.discovery_stats = {
+            "tasks_total": 0,
+            "tasks_failed": 0,
+            "operations_incomplete": 0,
+            "throttle_retries": 0,
+            "tasks_skipped": 0,
+            "calls_avoided": 0,
+        }
+
         # Billing data for validation
         self.billing_services = set()
         self.billing_spend = {}
@@ -344,6 +381,10 @@ class ComprehensiveAWSDiscovery:
 
         start_time = time.time()
 
+        # Size client connection pools to the worker count so threads sharing a
+        # regional client do not queue on connection checkout
+        self.client_pool.ensure_capacity(max_workers)
+
         # Step 1: Discover billing services for validation
         self._discover_billing_services()
 
@@ -366,12 +407,138 @@ class ComprehensiveAWSDiscovery:
             f"from {len(self.discovered_services)} services in {execution_time:.1f}s"
         )
 
+        pool_stats = self.client_pool.get_statistics()
+        self.logger.info(
+            f"   Client pool: {pool_stats['cached_clients']} clients, "
+            f"{pool_stats['hits']} hits / {pool_stats['misses']} misses"
+        )
+
+        if self.response_cache is not None:
+            cache_stats = self.response_cache.get_statistics()
+            self.logger.info(
+                f"   Response cache: {cache_stats['hits']} hits / "
+                f"{cache_stats['misses'] + cache_stats['expired']} misses, "
+                f"{cache_stats['refreshed']} refreshed"
+            )
+
+        stats = self.get_discovery_statistics()
+        if stats["tasks_skipped"]:
+            self.logger.info(
+                f"   Planner: {stats['tasks_skipped']} tasks skipped, "
+                f"~{stats['calls_avoided']} API calls avoided"
+            )
+        if stats["throttle_events"]:
+            self.logger.info(
+                f"   Throttling: {stats['throttle_events']} events across "
+                f"{stats['throttled_keys']} service/region pairs, "
+                f"{stats['rate_limit_wait_seconds']:.1f}s waiting on rate limits, "
+                f"{stats['operations_incomplete']} operations incomplete"
+            )
+
         return self.resources
 
+    def iter_resources(
+        self, max_workers: int = 15, max_buffered: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream resources as service API pages arrive instead of returning a list.
+
+        Tagging API tags are fetched up front and merged into each resource
+        before it is yielded, together with the S3 bucket region and billing
+        metadata. Resources are deduplicated by ARN on the fly and tagged
+        resources the service APIs missed are yielded last as fallback
+        resources. Streamed resources are not retained in ``self.resources`` and
+        the Lambda/RDS/CloudFormation post-process enhancements are skipped.
+
+        Args:
+            max_workers: Concurrent service/region discovery tasks
+            max_buffered: Resources buffered ahead of the consumer before
+                discovery workers block
+
+        Yields:
+            Normalized resource dictionaries
+        """
+        self.logger.info("🔍 Starting streaming AWS resource discovery")
+        self.client_pool.ensure_capacity(max_workers)
+
+        self._discover_billing_services()
+
+        # ARN -> (region, tags); matched entries are removed as resources stream by
+        tag_index = {
+            arn: (region, tags) for region, arn, tags in self._iter_tag_mappings()
+        }
+        s3_client = None
+        seen_arns = set()
+        streamed_count = 0
+
+        def produce(emit):
+            self._resource_sink = emit
+            try:
+                self._discover_all_service_resources(max_workers)
+            finally:
+                self._resource_sink = None
+
+        for resource in stream_from_producer(
+            produce, max_buffered=max_buffered, thread_name="comprehensive-discovery"
+        ):
+            if self._is_s3_bucket(resource):
+                if s3_client is None:
+                    s3_client = self.client_pool.get_client(self.session, "s3")
+                self._resolve_s3_bucket_region(resource, s3_client)
+
+            arn = resource.get("arn")
+            if arn:
+                if arn in seen_arns:
+                    continue
+                seen_arns.add(arn)
+                if arn in tag_index:
+                    self._merge_tags(resource, tag_index.pop(arn)[1])
+
+            self._apply_billing_metadata(resource)
+            streamed_count += 1
+            yield resource
+
+        for arn, (region, tags) in tag_index.items():
+            if arn in seen_arns:
+                continue
+            fallback_resource = self._create_fallback_resource(arn, tags, region)
+            if fallback_resource:
+                self._apply_billing_metadata(fallback_resource)
+                streamed_count += 1
+                yield fallback_resource
+
+        self._log_fallback_mode()
+        self.logger.info(
+            f"✅ Streaming discovery complete: {streamed_count} resources "
+            f"from {len(self.discovered_services)} services"
+        )
+
+    def get_discovery_statistics(self) -> Dict[str, Any]:
+        """Return task, throttling and rate-limit statistics for the last run."""
+        limiter_stats = self.rate_limiter.get_statistics()
+        with self._stats_lock:
+            stats = dict(self.discovery_stats)
+        stats.update(
+            {
+                "api_requests": limiter_stats["requests"],
+                "throttle_events": limiter_stats["throttle_events"],
+                "throttled_keys": limiter_stats["throttled_keys"],
+                "throttles_by_key": limiter_stats["throttles_by_key"],
+                "rate_limit_wait_seconds": limiter_stats["wait_time_seconds"],
+            }
+        )
+        return stats
+
+    def _increment_stat(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self.discovery_stats[name] += amount
+
     def _discover_billing_services(self):
         """Discover services with billing usage for validation."""
         try:
-            ce_client = self.session.client("ce", region_name="us-east-1")
+            ce_client = self.client_pool.get_client(
+                self.session, "ce", region_name="us-east-1"
+            )
 
             response = ce_client.get_cost_and_usage(
                 TimePeriod={
@@ -447,6 +614,24 @@ class ComprehensiveAWSDiscovery:
         # Sort by priority (critical services first)
         discovery_tasks.sort(key=lambda x: x["priority"])
 
+        # Drop pairs that were empty in recent runs and order by expected size
+        if self.planner is not None:
+            plan = self.planner.plan(discovery_tasks)
+            discovery_tasks = plan.tasks
+            self._increment_stat("tasks_skipped", len(plan.skipped))
+            self._increment_stat("calls_avoided", plan.calls_avoided)
+            if plan.full_sweep:
+                self.logger.info("🧭 Discovery planner: full sweep of all pairs")
+            else:
+                self.logger.info(
+                    f"🧭 Discovery planner: skipping {len(plan.skipped)} "
+                    f"service/region pairs empty in recent runs "
+                    f"(~{plan.calls_avoided} API calls avoided)"
+                )
+
+        self._increment_stat("tasks_total", len(discovery_tasks))
+        task_results = {}
+
         self.logger.info(
             f"🔍 Executing {len(discovery_tasks)} discovery tasks with {max_workers} workers"
         )
@@ -465,7 +650,11 @@ class ComprehensiveAWSDiscovery:
                 task = future_to_task[future]
                 try:
                     resources_found = future.result()
-                    if resources_found > 0:
+                    task_results[(task["service"], task["region"])] = resources_found
+                    if resources_found is None:
+                        # Failed operations are not evidence that the pair is empty
+                        self._increment_stat("tasks_failed")
+                    elif resources_found > 0:
                         self.discovered_services.add(task["service"])
                         self.logger.debug(
                             f"✅ {task['service']} in {task['region']}: {resources_found} resources"
@@ -478,21 +667,36 @@ class ComprehensiveAWSDiscovery:
                         )
 
                 except Exception as e:
+                    self._increment_stat("tasks_failed")
+                    task_results[(task["service"], task["region"])] = None
                     self.logger.warning(
                         f"❌ {task['service']} in {task['region']} failed: {e}"
                     )
 
-    def _discover_service_in_region(self, task: Dict[str, Any]) -> int:
-        """Discover resources for a specific service in a specific region."""
+        if self.planner is not None:
+            self.planner.record_run(task_results)
+
+    def _discover_service_in_region(self, task: Dict[str, Any]) -> Optional[int]:
+        """
+        Discover resources for a specific service in a specific region.
+
+        Returns:
+            Number of resources found, or None if nothing was found and an
+            operation (or the client) failed, so the pair is not known to be
+            empty
+        """
         service_name = task["service"]
         region = task["region"]
         config = task["config"]
         resources_found = 0
+        operation_failed = False
 
         try:
             # Create service client (handle special cases like VPC using EC2 client)
             client_service = config.get("client_service", service_name)
-            client = self.session.client(client_service, region_name=region)
+            client = self.client_pool.get_client(
+                self.session, client_service, region_name=region
+            )
 
             # Execute all operations for this service
             for operation_config in config["operations"]:
@@ -501,6 +705,7 @@ class ComprehensiveAWSDiscovery:
                         client, service_name, region, operation_config
                     )
                 except ClientError as e:
+                    operation_failed = True
                     error_code = e.response.get("Error", {}).get("Code", "")
                     if error_code in ["AccessDenied", "UnauthorizedOperation"]:
                         # Handle access denied gracefully for services that support it
@@ -513,73 +718,227 @@ class ComprehensiveAWSDiscovery:
                         self.logger.debug(f"Operation failed for {service_name}: {e}")
                         continue
                 except Exception as e:
+                    operation_failed = True
                     self.logger.debug(f"Operation error for {service_name}: {e}")
                     continue
 
         except Exception as e:
+            operation_failed = True
             self.logger.warning(
                 f"Service client creation failed for {service_name}: {e}"
             )
 
+        if operation_failed and resources_found == 0:
+            return None
         return resources_found
 
     def _execute_discovery_operation(
         self, client, service_name: str, region: str, operation_config: Tuple
     ) -> int:
-        """Execute a single discovery operation and extract resources."""
+        """
+        Execute a single discovery operation and extract resources.
+
+        Returns:
+            Number of resources extracted; when the operation fails after
+            some pages were read, the resources from those pages
+
+        Raises:
+            The operation's error if it failed before any page was read, so a
+            denied or throttled operation is not mistaken for an empty one
+        """
         operation_name, response_key, resource_type = operation_config[:3]
         operation_params = operation_config[3] if len(operation_config) > 3 else {}
+        if self.owner_scoped:
+            operation_params = apply_owner_scope(
+                client_service_name(client) or service_name,
+                operation_name,
+                operation_params,
+            )
+
+        resources_found = 0
+        pages_extracted = 0
+
+        def extract_page(page: Dict):
+            nonlocal resources_found, pages_extracted
+            pages_extracted += 1
+            resources_found += self._extract_resources_from_response(
+                page,
+                response_key,
+                service_name,
+                region,
+                resource_type,
+                operation_name,
+            )
 
         try:
-            # Get the operation method
-            operation = getattr(client, operation_name)
+            self._fetch_operation_pages(
+                client,
+                operation_name,
+                operation_params,
+                (service_name, region),
+                extract_page,
+            )
+        except Exception as e:
+            if is_throttling_error(e):
+                self._increment_stat("operations_incomplete")
+                self.logger.warning(
+                    f"⚠️ {service_name}.{operation_name} in {region} still throttled "
+                    f"after {self.max_throttle_retries} retries; keeping "
+                    f"{pages_extracted} page(s) fetched so far"
+                )
+            if pages_extracted == 0:
+                raise
+            # Partial results are kept; the caller treats them as found
 
-            # Execute with pagination if available
-            resources_found = 0
+        return resources_found
 
-            if hasattr(client, "get_paginator"):
-                try:
-                    paginator = client.get_paginator(operation_name)
-                    pages = paginator.paginate(**operation_params)
-
-                    for page in pages:
-                        resources_found += self._extract_resources_from_response(
-                            page,
-                            response_key,
-                            service_name,
-                            region,
-                            resource_type,
-                            operation_name,
-                        )
+    def _fetch_operation_pages(
+        self,
+        client,
+        operation_name: str,
+        operation_params: Dict,
+        throttle_key: Tuple[str, str],
+        on_page: Callable[[Dict], None],
+    ):
+        """
+        Fetch every response page for an operation, passing each to ``on_page``.
 
-                except Exception:
-                    # Fallback to direct call if pagination fails
-                    response = operation(**operation_params)
-                    resources_found += self._extract_resources_from_response(
-                        response,
-                        response_key,
-                        service_name,
-                        region,
-                        resource_type,
-                        operation_name,
-                    )
-            else:
-                # Direct operation call
-                response = operation(**operation_params)
-                resources_found += self._extract_resources_from_response(
-                    response,
-                    response_key,
-                    service_name,
-                    region,
-                    resource_type,
-                    operation_name,
+        When a response cache is configured, a complete unexpired cached page
+        chain is served without calling AWS, and live results are written back
+        once the pagination completes.
+        """
+        if self.response_cache is None:
+            self._fetch_live_pages(
+                client, operation_name, operation_params, throttle_key, on_page
+            )
+            return
+
+        cache_key = self.response_cache.operation_key(
+            self.session, client, operation_name, operation_params
+        )
+        cached_pages = self.response_cache.get_pages(*cache_key)
+        if cached_pages is not None:
+            for page in cached_pages:
+                on_page(page)
+            return
+
+        fetched_pages = []
+
+        def record_page(page: Dict):
+            fetched_pages.append(page)
+            on_page(page)
+
+        self._fetch_live_pages(
+            client, operation_name, operation_params, throttle_key, record_page
+        )
+        self.response_cache.put_pages(*cache_key, fetched_pages)
+
+    def _fetch_live_pages(
+        self,
+        client,
+        operation_name: str,
+        operation_params: Dict,
+        throttle_key: Tuple[str, str],
+        on_page: Callable[[Dict], None],
+    ):
+        """
+        Fetch every response page for an operation from AWS.
+
+        Each request first takes a token from the (service, region) bucket.
+        Throttling errors shrink that bucket's rate and the request (or the whole
+        pagination) is retried up to ``max_throttle_retries`` times before the
+        error is raised.
+        """
+        operation = getattr(client, operation_name)
+        pages_delivered = 0
+
+        def deliver(page: Dict):
+            nonlocal pages_delivered
+            pages_delivered += 1
+            on_page(page)
+
+        paginator = None
+        if hasattr(client, "get_paginator"):
+            try:
+                paginator = client.get_paginator(operation_name)
+            except Exception:
+                paginator = None
+
+        if paginator is not None:
+            try:
+                self._fetch_paginated(
+                    paginator, operation_params, throttle_key, deliver
                 )
+                return
+            except Exception as e:
+                if is_throttling_error(e) or pages_delivered:
+                    raise
+                # Fallback to direct call if pagination fails
 
-            return resources_found
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(throttle_key)
+            try:
+                response = operation(**operation_params)
+            except ClientError as e:
+                attempt = self._handle_throttle(e, throttle_key, attempt)
+                continue
+            self.rate_limiter.record_success(throttle_key)
+            deliver(response)
+            return
 
-        except Exception:
-            # Operation-level errors are expected and handled gracefully
-            return 0
+    def _fetch_paginated(
+        self,
+        paginator,
+        operation_params: Dict,
+        throttle_key: Tuple[str, str],
+        on_page: Callable[[Dict], None],
+    ):
+        """Iterate a paginator under the rate limiter, restarting after throttling.
+
+        A restarted pagination skips the pages already passed to ``on_page`` so
+        no resource is extracted twice.
+        """
+        attempt = 0
+        pages_delivered = 0
+
+        while True:
+            page_index = 0
+            page_iterator = iter(paginator.paginate(**operation_params))
+
+            try:
+                while True:
+                    self.rate_limiter.acquire(throttle_key)
+                    try:
+                        page = next(page_iterator)
+                    except StopIteration:
+                        return
+                    self.rate_limiter.record_success(throttle_key)
+
+                    page_index += 1
+                    if page_index > pages_delivered:
+                        on_page(page)
+                        pages_delivered += 1
+            except ClientError as e:
+                attempt = self._handle_throttle(e, throttle_key, attempt)
+
+    def _handle_throttle(
+        self, error: ClientError, throttle_key: Tuple[str, str], attempt: int
+    ) -> int:
+        """Record a throttling error and return the next attempt number.
+
+        Re-raises ``error`` if it is not throttling or retries are exhausted.
+        """
+        if not is_throttling_error(error):
+            raise error
+
+        self.rate_limiter.record_throttle(throttle_key)
+
+        if attempt >= self.max_throttle_retries:
+            raise error
+
+        self._increment_stat("throttle_retries")
+        return attempt + 1
 
     def _extract_resources_from_response(
         self,
@@ -618,27 +977,21 @@ class ComprehensiveAWSDiscovery:
                                     operation_name,
                                 )
                                 if instance_resource:
-                                    self.resources.append(instance_resource)
-                                    resources_added += 1
-                                    # Track service with primary resources for smart fallback logic
-                                    self.services_with_primary_resources.add(
-                                        service_name
+                                    self._record_resource(
+                                        instance_resource, service_name
                                     )
+                                    resources_added += 1
                         else:
-                            self.resources.append(resource)
+                            self._record_resource(resource, service_name)
                             resources_added += 1
-                            # Track service with primary resources for smart fallback logic
-                            self.services_with_primary_resources.add(service_name)
                 elif isinstance(item, str):
                     # Handle string responses (like SQS queue URLs)
                     resource = self._create_string_resource(
                         item, service_name, region, resource_type, operation_name
                     )
                     if resource:
-                        self.resources.append(resource)
+                        self._record_resource(resource, service_name)
                         resources_added += 1
-                        # Track service with primary resources for smart fallback logic
-                        self.services_with_primary_resources.add(service_name)
 
             return resources_added
 
@@ -646,6 +999,15 @@ class ComprehensiveAWSDiscovery:
             self.logger.debug(f"Resource extraction failed for {service_name}: {e}")
             return 0
 
+    def _record_resource(self, resource: Dict[str, Any], service_name: str):
+        """Store a primary resource, or hand it to the active stream consumer."""
+        if self._resource_sink is not None:
+            self._resource_sink(resource)
+        else:
+            self.resources.append(resource)
+        # Track service with primary resources for smart fallback logic
+        self.services_with_primary_resources.add(service_name)
+
     def _normalize_resource(
         self,
         raw_data: Dict,
@@ -844,7 +1206,7 @@ class ComprehensiveAWSDiscovery:
         try:
             # Get account ID from STS if available
             try:
-                sts = self.session.client("sts")
+                sts = self.client_pool.get_client(self.session, "sts")
                 account_id = sts.get_caller_identity()["Account"]
             except Exception:
                 account_id = "000000000000"  # Placeholder
@@ -874,10 +1236,31 @@ class ComprehensiveAWSDiscovery:
         enriched_count = 0
         new_resources_found = 0
 
+        for region, arn, tags in self._iter_tag_mappings():
+            if arn in arn_to_resource:
+                # Enrich existing resource with additional tags
+                self._merge_tags(arn_to_resource[arn], tags)
+                enriched_count += 1
+            else:
+                # This is a resource we missed - add it as fallback only
+                new_resource = self._create_fallback_resource(arn, tags, region)
+                if new_resource:
+                    self.resources.append(new_resource)
+                    new_resources_found += 1
+
+        self._log_fallback_mode()
+
+        self.logger.info(
+            f"🏷️ Tag enrichment complete: enriched {enriched_count} resources, "
+            f"found {new_resources_found} additional tagged resources"
+        )
+
+    def _iter_tag_mappings(self) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+        """Yield (region, arn, tags) for every resource the tagging API reports."""
         for region in self.regions:
             try:
-                rgt_client = self.session.client(
-                    "resourcegroupstaggingapi", region_name=region
+                rgt_client = self.client_pool.get_client(
+                    self.session, "resourcegroupstaggingapi", region_name=region
                 )
                 paginator = rgt_client.get_paginator("get_resources")
 
@@ -887,89 +1270,88 @@ class ComprehensiveAWSDiscovery:
                         tags = {
                             tag["Key"]: tag["Value"] for tag in resource.get("Tags", [])
                         }
-
-                        if arn in arn_to_resource:
-                            # Enrich existing resource with additional tags
-                            existing_resource = arn_to_resource[arn]
-                            existing_resource["tags"].update(tags)
-                            existing_resource["tagged"] = bool(
-                                existing_resource["tags"]
-                            )
-                            enriched_count += 1
-                        else:
-                            # This is a resource we missed - add it as fallback only
-                            # Check if we should show this fallback resource based on display mode
-                            should_show_fallback = False
-
-                            if self.fallback_display_mode == "always":
-                                should_show_fallback = True
-                            elif self.fallback_display_mode == "never":
-                                should_show_fallback = False
-                            else:  # auto mode
-                                # Show fallback only if no primary resources were found for this service
-                                try:
-                                    service = self._extract_service_from_arn(arn)
-                                    should_show_fallback = (
-                                        service
-                                        not in self.services_with_primary_resources
-                                    )
-                                except Exception:
-                                    # If we can't determine service, default to showing in auto mode
-                                    should_show_fallback = True
-
-                            if should_show_fallback:
-                                try:
-                                    service = self._extract_service_from_arn(arn)
-                                    if service:
-                                        resource_id = (
-                                            arn.split("/")[-1]
-                                            if "/" in arn
-                                            else arn.split(":")[-1]
-                                        )
-
-                                        # Apply the same service classification logic for fallback resources
-                                        actual_service = self._determine_actual_service(
-                                            service, "Unknown", resource_id, arn
-                                        )
-
-                                        new_resource = {
-                                            "service": actual_service.upper(),
-                                            "resource_type": "Unknown",
-                                            "resource_id": resource_id,
-                                            "resource_name": tags.get("Name"),
-                                            "arn": arn,
-                                            "region": region,
-                                            "account_id": self._extract_account_id(arn),
-                                            "tags": tags,
-                                            "raw_data": {"arn": arn},
-                                            "discovered_via": "ResourceGroupsTaggingAPI:Fallback",
-                                            "discovered_at": datetime.utcnow().isoformat(),
-                                            "tagged": True,
-                                            "priority": "fallback",  # Mark as lower priority
-                                        }
-                                        self.resources.append(new_resource)
-                                        new_resources_found += 1
-                                except Exception as e:
-                                    self.logger.debug(
-                                        f"Failed to process tagged resource {arn}: {e}"
-                                    )
-                            else:
-                                # Resource would have been added as fallback but is filtered
-                                if self.fallback_display_mode == "auto":
-                                    self.logger.debug(
-                                        f"Skipping fallback resource {arn} - primary resources exist for service"
-                                    )
-                                elif self.fallback_display_mode == "never":
-                                    self.logger.debug(
-                                        f"Skipping fallback resource {arn} - fallback display disabled"
-                                    )
+                        yield region, arn, tags
 
             except Exception as e:
                 self.logger.warning(
                     f"ResourceGroupsTagging enrichment failed in {region}: {e}"
                 )
 
-        # Report services with primary resources for transparency
+    def _merge_tags(self, resource: Dict[str, Any], tags: Dict[str, str]):
+        """Merge tagging API tags into a discovered resource."""
+        resource["tags"].update(tags)
+        resource["tagged"] = bool(resource["tags"])
+
+    def _create_fallback_resource(
+        self, arn: str, tags: Dict[str, str], region: str
+    ) -> Optional[Dict[str, Any]]:
+        """Build a fallback resource for a tagged ARN the service APIs missed.
+
+        Returns None when the fallback display mode hides it.
+        """
+        # Check if we should show this fallback resource based on display mode
+        should_show_fallback = False
+
+        if self.fallback_display_mode == "always":
+            should_show_fallback = True
+        elif self.fallback_display_mode == "never":
+            should_show_fallback = False
+        else:  # auto mode
+            # Show fallback only if no primary resources were found for this service
+            try:
+                service = self._extract_service_from_arn(arn)
+                should_show_fallback = (
+                    service not in self.services_with_primary_resources
+                )
+            except Exception:
+                # If we can't determine service, default to showing in auto mode
+                should_show_fallback = True
+
+        if not should_show_fallback:
+            # Resource would have been added as fallback but is filtered
+            if self.fallback_display_mode == "auto":
+                self.logger.debug(
+                    f"Skipping fallback resource {arn} - primary resources exist for service"
+                )
+            elif self.fallback_display_mode == "never":
+                self.logger.debug(
+                    f"Skipping fallback resource {arn} - fallback display disabled"
+                )
+            return None
+
+        try:
+            service = self._extract_service_from_arn(arn)
+            if not service:
+                return None
+
+            resource_id = arn.split("/")[-1] if "/" in arn else arn.split(":")[-1]
+
+            # Apply the same service classification logic for fallback resources
+            actual_service = self._determine_actual_service(
+                service, "Unknown", resource_id, arn
+            )
+
+            return {
+                "service": actual_service.upper(),
+                "resource_type": "Unknown",
+                "resource_id": resource_id,
+                "resource_name": tags.get("Name"),
+                "arn": arn,
+                "region": region,
+                "account_id": self._extract_account_id(arn),
+                "tags": tags,
+                "raw_data": {"arn": arn},
+                "discovered_via": "ResourceGroupsTaggingAPI:Fallback",
+                "discovered_at": datetime.utcnow().isoformat(),
+                "tagged": True,
+                "priority": "fallback",  # Mark as lower priority
+            }
+        except Exception as e:
+            self.logger.debug(f"Failed to process tagged resource {arn}: {e}")
+            return None
+
+    def _log_fallback_mode(self):
+        """Report services with primary resources for transparency."""
         if self.fallback_display_mode == "auto":
             if self.services_with_primary_resources:
                 self.logger.info(
@@ -980,11 +1362,6 @@ class ComprehensiveAWSDiscovery:
                 "without primary discoveries"
             )
 
-        self.logger.info(
-            f"🏷️ Tag enrichment complete: enriched {enriched_count} resources, "
-            f"found {new_resources_found} additional tagged resources"
-        )
-
     def _extract_service_from_arn(self, arn: str) -> Optional[str]:
         """Extract service name from ARN."""
         if arn and arn.startswith("arn:aws:"):
@@ -1093,9 +1470,7 @@ class ComprehensiveAWSDiscovery:
 
         # Add billing metadata
         for resource in self.resources:
-            service = resource["service"].lower()
-            resource["billing_validated"] = service in self.billing_services
-            resource["monthly_spend"] = self.billing_spend.get(service, 0.0)
+            self._apply_billing_metadata(resource)
 
         self.logger.info(
             f"📊 Post-processing complete: {len(self.resources)} unique resources"
@@ -1104,37 +1479,11 @@ class ComprehensiveAWSDiscovery:
     def _enhance_s3_buckets(self):
         """Use boto3 APIs to get correct regions and metadata for all services."""
         # S3 bucket region detection
-        s3_client = self.session.client("s3")
+        s3_client = self.client_pool.get_client(self.session, "s3")
 
         for resource in self.resources:
-            if (
-                resource.get("service") == "S3"
-                and resource.get("resource_type") == "Bucket"
-            ):
-                bucket_name = resource.get("resource_id")
-                try:
-                    # Use boto3 S3 API to get bucket location
-                    response = s3_client.get_bucket_location(Bucket=bucket_name)
-                    region = (
-                        response.get("LocationConstraint") or "us-east-1"
-                    )  # us-east-1 returns None
-
-                    # Update resource with correct region
-                    resource["region"] = region
-                    resource["raw_data"]["boto3_region"] = region
-
-                    # Reconstruct ARN with correct region
-                    resource["arn"] = f"arn:aws:s3:::{bucket_name}"
-
-                    self.logger.debug(
-                        f"Enhanced S3 bucket {bucket_name} with region {region}"
-                    )
-
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed to get S3 bucket region for {bucket_name}: {e}"
-                    )
-                    continue
+            if self._is_s3_bucket(resource):
+                self._resolve_s3_bucket_region(resource, s3_client)
 
         # Lambda function region/runtime enhancement
         self._enhance_lambda_functions()
@@ -1145,6 +1494,40 @@ class ComprehensiveAWSDiscovery:
         # CloudFormation stack region/status enhancement
         self._enhance_cloudformation_stacks()
 
+    def _apply_billing_metadata(self, resource: Dict[str, Any]):
+        """Attach billing validation flags and service spend to a resource."""
+        service = resource["service"].lower()
+        resource["billing_validated"] = service in self.billing_services
+        resource["monthly_spend"] = self.billing_spend.get(service, 0.0)
+
+    def _is_s3_bucket(self, resource: Dict[str, Any]) -> bool:
+        return (
+            resource.get("service") == "S3"
+            and resource.get("resource_type") == "Bucket"
+        )
+
+    def _resolve_s3_bucket_region(self, resource: Dict[str, Any], s3_client):
+        """Set a bucket's actual region and canonical ARN from get_bucket_location."""
+        bucket_name = resource.get("resource_id")
+        try:
+            # Use boto3 S3 API to get bucket location
+            response = s3_client.get_bucket_location(Bucket=bucket_name)
+            region = (
+                response.get("LocationConstraint") or "us-east-1"
+            )  # us-east-1 returns None
+
+            # Update resource with correct region
+            resource["region"] = region
+            resource["raw_data"]["boto3_region"] = region
+
+            # Reconstruct ARN with correct region
+            resource["arn"] = f"arn:aws:s3:::{bucket_name}"
+
+            self.logger.debug(f"Enhanced S3 bucket {bucket_name} with region {region}")
+
+        except Exception as e:
+            self.logger.debug(f"Failed to get S3 bucket region for {bucket_name}: {e}")
+
     def _enhance_lambda_functions(self):
         """Enhance Lambda functions with detailed metadata from boto3 API."""
         for region in self.regions:
@@ -1158,7 +1541,9 @@ class ComprehensiveAWSDiscovery:
                 continue
 
             try:
-                lambda_client = self.session.client("lambda", region_name=region)
+                lambda_client = self.client_pool.get_client(
+                    self.session, "lambda", region_name=region
+                )
 
                 for resource in lambda_functions:
                     function_name = resource.get("resource_id")
@@ -1204,7 +1589,9 @@ class ComprehensiveAWSDiscovery:
                 continue
 
             try:
-                rds_client = self.session.client("rds", region_name=region)
+                rds_client = self.client_pool.get_client(
+                    self.session, "rds", region_name=region
+                )
 
                 for resource in rds_instances:
                     instance_id = resource.get("resource_id")
@@ -1259,7 +1646,9 @@ class ComprehensiveAWSDiscovery:
                 continue
 
             try:
-                cf_client = self.session.client("cloudformation", region_name=region)
+                cf_client = self.client_pool.get_client(
+                    self.session, "cloudformation", region_name=region
+                )
 
                 for resource in cf_stacks:
                     stack_name = resource.get("resource_id")
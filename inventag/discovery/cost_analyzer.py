@@ -10,12 +10,93 @@ import logging
 import boto3
 from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from decimal import Decimal
 import json
+import re
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import time
+from botocore.exceptions import ClientError
+
+from .billing_store import DailyCostStore, get_daily_cost_store
+from .client_pool import get_client_pool
+from .cost_frame import CostFrame
+from .price_catalog import PriceCatalog
+from .rate_limiter import AdaptiveRateLimiter, is_throttling_error
+
+# (service, type) -> [(indicator, namespace, metric, dimension, statistic)]
+ACTIVITY_METRICS = {
+    ("EC2", "Instance"): [
+        ("cpu_utilization", "AWS/EC2", "CPUUtilization", "InstanceId", "Average"),
+        ("network_activity", "AWS/EC2", "NetworkIn", "InstanceId", "Sum"),
+    ],
+    ("RDS", "DBInstance"): [
+        (
+            "database_connections",
+            "AWS/RDS",
+            "DatabaseConnections",
+            "DBInstanceIdentifier",
+            "Average",
+        ),
+    ],
+    ("S3", "Bucket"): [
+        ("s3_requests", "AWS/S3", "AllRequests", "BucketName", "Sum"),
+    ],
+}
+
+# GetMetricData accepts at most 500 metric queries per request
+METRIC_DATA_MAX_QUERIES = 500
+ACTIVITY_PERIOD_SECONDS = 86400  # Daily
+
+# Resources analyzed per wave of forgotten-resource detection; the time
+# budget is checked between waves and between resources within a wave
+FORGOTTEN_ANALYSIS_WAVE_SIZE = 500
+
+# Resource types that cost nothing on their own, matched via _resource_type_key
+FREE_RESOURCE_TYPES = {
+    ("EC2", "SecurityGroup"),
+    ("EC2", "VPC"),
+    ("EC2", "Subnet"),
+    ("EC2", "RouteTable"),
+    ("EC2", "NetworkAcl"),
+    ("EC2", "InternetGateway"),
+    ("EC2", "KeyPair"),
+    ("EC2", "DhcpOptions"),
+    # The inventory reports VPC networking under the VPC service
+    ("VPC", "VPC"),
+    ("VPC", "Subnet"),
+    ("VPC", "RouteTable"),
+    ("VPC", "NetworkAcl"),
+    ("VPC", "InternetGateway"),
+    ("VPC", "SecurityGroup"),
+    ("VPC", "DhcpOptions"),
+    ("IAM", "Role"),
+    ("IAM", "User"),
+    ("IAM", "Group"),
+    ("IAM", "Policy"),
+}
+
+
+def _resource_type_key(service: str, resource_type: str) -> Tuple[str, str]:
+    """
+    Return a (service, type) lookup key that ignores how the type is spelled.
+
+    The inventory reports display names ("Security Group", "Network ACL"),
+    ARNs carry "security-group" and API names are "SecurityGroup"; all map to
+    the same key.
+    """
+    return (
+        (service or "").upper(),
+        re.sub(r"[\s_-]", "", resource_type or "").casefold(),
+    )
+
+
+_FREE_RESOURCE_KEYS = frozenset(
+    _resource_type_key(service, resource_type)
+    for service, resource_type in FREE_RESOURCE_TYPES
+)
 
 
 @dataclass
@@ -27,6 +108,8 @@ class CostThresholds:
     high_cost_alert_threshold: Decimal = Decimal("1000.00")
     cost_trend_alert_percentage: float = 50.0
     unused_resource_utilization_threshold: float = 5.0
+    # Resources estimated below this are skipped by forgotten-resource detection
+    forgotten_resource_cost_floor: Decimal = Decimal("0.01")
 
 
 @dataclass
@@ -43,6 +126,8 @@ class ResourceCostEstimate:
     cost_factors: Dict[str, Any] = field(default_factory=dict)
     confidence_level: str = "medium"
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    account_id: Optional[str] = None
+    tags: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -104,6 +189,9 @@ class CostAnalysisSummary:
     analysis_timestamp: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
+    cost_by_account: Dict[str, Decimal] = field(default_factory=dict)
+    cost_by_cost_center: Dict[str, Decimal] = field(default_factory=dict)
+    cost_percentiles: Dict[str, Decimal] = field(default_factory=dict)
 
 
 class CostAnalyzer:
@@ -122,11 +210,36 @@ class CostAnalyzer:
         self,
         session: Optional[boto3.Session] = None,
         thresholds: Optional[CostThresholds] = None,
+        max_workers: int = 8,
+        price_catalog: Optional[PriceCatalog] = None,
+        cost_store: Optional[DailyCostStore] = None,
     ):
-        """Initialize the cost analyzer."""
+        """Initialize the cost analyzer.
+
+        Args:
+            session: boto3 session used for the AWS API calls
+            thresholds: Cost analysis thresholds
+            max_workers: Regions whose CloudWatch metrics are fetched concurrently
+            price_catalog: Local price catalog; services ingested into it are
+                priced without calling the Pricing API
+            cost_store: Daily Cost Explorer spend shared with the other
+                billing consumers of the run
+        """
         self.session = session or boto3.Session()
         self.thresholds = thresholds or CostThresholds()
+        self.max_workers = max(1, max_workers)
         self.logger = logging.getLogger(f"{__name__}.CostAnalyzer")
+        self.client_pool = get_client_pool()
+        self.rate_limiter = AdaptiveRateLimiter()
+        self.max_throttle_retries = 5
+        self.price_catalog = price_catalog
+        self.cost_store = cost_store or get_daily_cost_store()
+
+        if price_catalog is not None and price_catalog.is_stale():
+            self.logger.warning(
+                f"Price catalog {price_catalog.path} is older than "
+                f"{price_catalog.max_age.days} days; re-ingest the offer files"
+            )
 
         # Initialize AWS clients
         self._initialize_clients()
@@ -135,6 +248,11 @@ class CostAnalyzer:
         self._pricing_cache: Dict[str, Any] = {}
         self._cache_lock = threading.Lock()
 
+        # Activity metrics per (region, service, type, id), kept for the run;
+        # every lookup shares one metric time window
+        self._activity_cache: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+        self._activity_window: Optional[Tuple[datetime, datetime]] = None
+
         # Historical cost data storage
         self._historical_costs: Dict[str, List[Tuple[datetime, Decimal]]] = defaultdict(
             list
@@ -153,7 +271,10 @@ class CostAnalyzer:
         """Lazily create and return pricing client."""
         if self.pricing_client is None:
             try:
-                self.pricing_client = boto3.client("pricing", region_name="us-east-1")
+                # The Pricing API is only served from a few regions
+                self.pricing_client = self.session.client(
+                    "pricing", region_name="us-east-1"
+                )
                 self.logger.debug("Created pricing client")
             except Exception as e:
                 self.logger.warning(f"Failed to create pricing client: {e}")
@@ -268,6 +389,9 @@ class CostAnalyzer:
                 pricing_model=pricing_info.get("pricing_model", "on-demand"),
                 cost_factors=pricing_info.get("cost_factors", {}),
                 confidence_level=confidence_level,
+                account_id=resource.get("account_id")
+                or resource.get("source_account_id"),
+                tags=resource.get("tags") or {},
             )
 
         except Exception as e:
@@ -279,32 +403,38 @@ class CostAnalyzer:
     def _get_pricing_info(
         self, service: str, resource_type: str, region: str, resource: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        """Get pricing information from AWS Pricing API."""
-        cache_key = f"{service}:{resource_type}:{region}"
+        """Get pricing information from the price catalog or AWS Pricing API."""
+        # Map service names to pricing service codes
+        service_code = self._map_service_to_pricing_code(service)
+        if not service_code:
+            return None
+
+        # Build filters for pricing query
+        filters = self._build_pricing_filters(service, resource_type, region, resource)
+        cache_key = f"{service}:{resource_type}:" + ":".join(
+            f"{f['Field']}={f['Value']}" for f in filters
+        )
 
         with self._cache_lock:
             if cache_key in self._pricing_cache:
                 return self._pricing_cache[cache_key]
 
         try:
-            # Map service names to pricing service codes
-            service_code = self._map_service_to_pricing_code(service)
-            if not service_code:
-                return None
-
-            # Build filters for pricing query
-            filters = self._build_pricing_filters(
-                service, resource_type, region, resource
-            )
-
-            # Query pricing API
-            response = self._get_pricing_client().get_products(
-                ServiceCode=service_code, Filters=filters, MaxResults=10
-            )
-
-            pricing_info = self._parse_pricing_response(
-                response, service, resource_type
-            )
+            location = self._map_region_to_location(region)
+            if self.price_catalog is not None and self.price_catalog.has_offer(
+                service_code, location
+            ):
+                pricing_info = self._lookup_catalog_price(
+                    service_code, filters, service, resource_type
+                )
+            else:
+                # Query pricing API
+                response = self._get_pricing_client().get_products(
+                    ServiceCode=service_code, Filters=filters, MaxResults=10
+                )
+                pricing_info = self._parse_pricing_response(
+                    response, service, resource_type
+                )
 
             with self._cache_lock:
                 self._pricing_cache[cache_key] = pricing_info
@@ -317,6 +447,32 @@ class CostAnalyzer:
             )
             return None
 
+    def _lookup_catalog_price(
+        self,
+        service_code: str,
+        filters: List[Dict[str, Any]],
+        service: str,
+        resource_type: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Look up pricing information for Pricing API filters in the price catalog."""
+        price = self.price_catalog.lookup(
+            service_code, attributes={f["Field"]: f["Value"] for f in filters}
+        )
+        if price is None:
+            return None
+
+        return {
+            "price_per_unit": price.price_per_unit,
+            "unit": price.unit,
+            "pricing_model": "on-demand",
+            "cost_factors": {
+                "service": service,
+                "resource_type": resource_type,
+                "unit": price.unit,
+            },
+            "product_attributes": price.attributes,
+        }
+
     def _map_service_to_pricing_code(self, service: str) -> Optional[str]:
         """Map AWS service names to pricing service codes."""
         service_mapping = {
@@ -607,55 +763,142 @@ class CostAnalyzer:
         Returns:
             List of expensive resources
         """
-        expensive_resources = []
-
-        for estimate in cost_estimates:
-            if (
-                estimate.estimated_monthly_cost
-                >= self.thresholds.expensive_resource_monthly_threshold
-            ):
-                expensive_resources.append(estimate)
+        frame = self.build_cost_frame(cost_estimates)
+        expensive_resources = [
+            cost_estimates[i]
+            for i in frame.indices_at_least(
+                self.thresholds.expensive_resource_monthly_threshold
+            )
+        ]
 
         self.logger.info(f"Identified {len(expensive_resources)} expensive resources")
         return expensive_resources
 
+    def build_cost_frame(self, cost_estimates: List[ResourceCostEstimate]) -> CostFrame:
+        """
+        Return the columnar cost frame of a list of cost estimates.
+
+        The frame is built from the list as it is now; callers running
+        several rollups over one list build it once and query it.
+
+        Args:
+            cost_estimates: List of resource cost estimates
+
+        Returns:
+            CostFrame with one row per estimate, in list order
+        """
+        return CostFrame.from_estimates(cost_estimates)
+
     def detect_forgotten_resources(
-        self, resources: List[Dict[str, Any]]
+        self,
+        resources: List[Dict[str, Any]],
+        time_budget: Optional[float] = None,
     ) -> List[ForgottenResourceAnalysis]:
         """
         Detect forgotten resources based on activity patterns and usage metrics.
 
+        Resources are estimated cheaply first; those below the configured
+        cost floor are skipped and the rest are analyzed most expensive
+        first, in waves across a worker pool. When a time budget is given the
+        analysis stops once it runs out, so the costliest forgotten resources
+        are found even when the run is cut short.
+
         Args:
             resources: List of resource dictionaries
+            time_budget: Seconds the analysis may take, or None for no limit
 
         Returns:
-            List of ForgottenResourceAnalysis objects
+            List of ForgottenResourceAnalysis objects, most expensive first
         """
         self.logger.info(
             f"Analyzing {len(resources)} resources for forgotten resource detection"
         )
 
+        candidates = self._prioritize_forgotten_candidates(resources)
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+
         forgotten_resources = []
+        analyzed = 0
+        for wave_start in range(0, len(candidates), FORGOTTEN_ANALYSIS_WAVE_SIZE):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            wave = candidates[wave_start : wave_start + FORGOTTEN_ANALYSIS_WAVE_SIZE]
 
-        for resource in resources:
-            try:
-                analysis = self._analyze_resource_activity(resource)
+            # Fetch the wave's metrics up front in batched requests
+            self._prefetch_activity_metrics(wave)
+
+            for analysis in self._analyze_activity_wave(wave, deadline):
+                analyzed += 1
                 if (
                     analysis
                     and analysis.days_since_last_activity
                     >= self.thresholds.forgotten_resource_days_threshold
                 ):
                     forgotten_resources.append(analysis)
-            except Exception as e:
-                self.logger.debug(
-                    f"Activity analysis failed for resource {resource.get('id', 'unknown')}: {e}"
-                )
+
+        if analyzed < len(candidates):
+            self.logger.warning(
+                f"Forgotten resource analysis stopped after its {time_budget}s "
+                f"budget; {len(candidates) - analyzed} lower-cost resources "
+                f"were not analyzed"
+            )
 
         self.logger.info(
             f"Detected {len(forgotten_resources)} potentially forgotten resources"
         )
         return forgotten_resources
 
+    def _prioritize_forgotten_candidates(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Return the resources above the cost floor, most expensive first."""
+        floor = self.thresholds.forgotten_resource_cost_floor
+        estimated = []
+        for resource in resources:
+            cost = self._estimate_resource_cost_simple(resource)
+            if cost >= floor:
+                estimated.append((cost, resource))
+
+        skipped = len(resources) - len(estimated)
+        if skipped:
+            self.logger.debug(
+                f"Skipping {skipped} resources estimated below ${floor}/month"
+            )
+
+        # sort is stable, so equally priced resources keep their input order
+        estimated.sort(key=lambda item: item[0], reverse=True)
+        return [resource for _, resource in estimated]
+
+    def _analyze_activity_wave(
+        self, wave: List[Dict[str, Any]], deadline: Optional[float]
+    ) -> List[Optional[ForgottenResourceAnalysis]]:
+        """
+        Analyze a wave of resources across the worker pool.
+
+        Resources not started before the deadline are dropped. Results keep
+        the wave's order.
+        """
+
+        def analyze(resource: Dict[str, Any]) -> Optional[ForgottenResourceAnalysis]:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError
+            return self._analyze_resource_activity(resource)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(analyze, resource) for resource in wave]
+            for resource, future in zip(wave, futures):
+                try:
+                    results.append(future.result())
+                except TimeoutError:
+                    continue
+                except Exception as e:
+                    self.logger.debug(
+                        f"Activity analysis failed for resource {resource.get('id', 'unknown')}: {e}"
+                    )
+                    results.append(None)
+        return results
+
     def _analyze_resource_activity(
         self, resource: Dict[str, Any]
     ) -> Optional[ForgottenResourceAnalysis]:
@@ -713,87 +956,171 @@ class CostAnalyzer:
         resource_id: str,
         resource: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """Get activity metrics from CloudWatch."""
-        activity_indicators = {}
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(
-            days=self.thresholds.forgotten_resource_days_threshold
-        )
+        """Get activity metrics from CloudWatch, cached for the run."""
+        metrics = ACTIVITY_METRICS.get((service, resource_type))
+        if not metrics or not resource_id:
+            return {}
 
-        try:
-            if service == "EC2" and resource_type == "Instance":
-                # Get CPU utilization
-                cpu_metrics = self._get_cloudwatch_client().get_metric_statistics(
-                    Namespace="AWS/EC2",
-                    MetricName="CPUUtilization",
-                    Dimensions=[{"Name": "InstanceId", "Value": resource_id}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=86400,  # Daily
-                    Statistics=["Average", "Maximum"],
-                )
-                activity_indicators["cpu_utilization"] = cpu_metrics.get(
-                    "Datapoints", []
-                )
+        region = resource.get("region", "")
+        key = (region, service, resource_type, resource_id)
+        with self._cache_lock:
+            cached = self._activity_cache.get(key)
+        if cached is None:
+            self._fetch_region_activity(region, [(key, resource_id, metrics)])
+            with self._cache_lock:
+                cached = self._activity_cache[key]
+        return cached
 
-                # Get network activity
-                network_metrics = self._get_cloudwatch_client().get_metric_statistics(
-                    Namespace="AWS/EC2",
-                    MetricName="NetworkIn",
-                    Dimensions=[{"Name": "InstanceId", "Value": resource_id}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=86400,
-                    Statistics=["Sum"],
-                )
-                activity_indicators["network_activity"] = network_metrics.get(
-                    "Datapoints", []
-                )
+    def _prefetch_activity_metrics(self, resources: List[Dict[str, Any]]):
+        """Fetch activity metrics for resources not cached yet, region by region.
 
-            elif service == "RDS" and resource_type == "DBInstance":
-                # Get database connections
-                connection_metrics = (
-                    self._get_cloudwatch_client().get_metric_statistics(
-                        Namespace="AWS/RDS",
-                        MetricName="DatabaseConnections",
-                        Dimensions=[
-                            {"Name": "DBInstanceIdentifier", "Value": resource_id}
-                        ],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=86400,
-                        Statistics=["Average", "Maximum"],
-                    )
-                )
-                activity_indicators["database_connections"] = connection_metrics.get(
-                    "Datapoints", []
+        Each region's metrics are requested in GetMetricData batches of up to
+        500 queries, and regions are fetched concurrently.
+        """
+        pending: Dict[str, List[Tuple[Tuple[str, str, str, str], str, List]]] = (
+            defaultdict(list)
+        )
+        queued = set()
+        with self._cache_lock:
+            for resource in resources:
+                service = resource.get("service", "").upper()
+                resource_type = resource.get("type", "")
+                resource_id = resource.get("id", "")
+                metrics = ACTIVITY_METRICS.get((service, resource_type))
+                if not metrics or not resource_id:
+                    continue
+                region = resource.get("region", "")
+                key = (region, service, resource_type, resource_id)
+                if key in self._activity_cache or key in queued:
+                    continue
+                queued.add(key)
+                pending[region].append((key, resource_id, metrics))
+
+        if not pending:
+            return
+
+        self.logger.info(
+            f"Fetching activity metrics for {len(queued)} resources "
+            f"across {len(pending)} regions"
+        )
+        self.client_pool.ensure_capacity(self.max_workers)
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending))
+        ) as executor:
+            futures = [
+                executor.submit(self._fetch_region_activity, region, entries)
+                for region, entries in pending.items()
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _fetch_region_activity(
+        self,
+        region: str,
+        entries: List[Tuple[Tuple[str, str, str, str], str, List]],
+    ):
+        """Fetch and cache the activity metrics of resources in one region."""
+        start_time, end_time = self._get_activity_window()
+
+        queries = []
+        targets = {}  # query id -> (indicators, indicator name, statistic)
+        activities = {}
+        for key, resource_id, metrics in entries:
+            indicators: Dict[str, Any] = {}
+            activities[key] = indicators
+            for indicator, namespace, metric_name, dimension, stat in metrics:
+                indicators[indicator] = []
+                query_id = f"m{len(queries)}"
+                queries.append(
+                    {
+                        "Id": query_id,
+                        "MetricStat": {
+                            "Metric": {
+                                "Namespace": namespace,
+                                "MetricName": metric_name,
+                                "Dimensions": [
+                                    {"Name": dimension, "Value": resource_id}
+                                ],
+                            },
+                            "Period": ACTIVITY_PERIOD_SECONDS,
+                            "Stat": stat,
+                        },
+                        "ReturnData": True,
+                    }
                 )
+                targets[query_id] = (indicators, indicator, stat)
 
-            elif service == "S3" and resource_type == "Bucket":
-                # Get request metrics (if enabled)
-                try:
-                    request_metrics = (
-                        self._get_cloudwatch_client().get_metric_statistics(
-                            Namespace="AWS/S3",
-                            MetricName="AllRequests",
-                            Dimensions=[{"Name": "BucketName", "Value": resource_id}],
-                            StartTime=start_time,
-                            EndTime=end_time,
-                            Period=86400,
-                            Statistics=["Sum"],
+        try:
+            client = self.client_pool.get_client(
+                self.session, "cloudwatch", region_name=region or None
+            )
+            for offset in range(0, len(queries), METRIC_DATA_MAX_QUERIES):
+                batch = queries[offset : offset + METRIC_DATA_MAX_QUERIES]
+                for result in self._get_metric_data(
+                    client, region, batch, start_time, end_time
+                ):
+                    indicators, indicator, stat = targets[result["Id"]]
+                    indicators[indicator].extend(
+                        {"Timestamp": timestamp, stat: value}
+                        for timestamp, value in zip(
+                            result.get("Timestamps", []), result.get("Values", [])
                         )
                     )
-                    activity_indicators["s3_requests"] = request_metrics.get(
-                        "Datapoints", []
-                    )
-                except Exception:
-                    # S3 request metrics might not be enabled
-                    activity_indicators["s3_requests"] = []
-
         except Exception as e:
-            self.logger.debug(f"Failed to get activity metrics for {resource_id}: {e}")
+            # Resources without metrics are treated as inactive, as before
+            self.logger.debug(
+                f"Failed to get activity metrics in {region or 'default region'}: {e}"
+            )
+
+        with self._cache_lock:
+            self._activity_cache.update(activities)
+
+    def _get_metric_data(
+        self,
+        client: Any,
+        region: str,
+        queries: List[Dict[str, Any]],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Run one GetMetricData batch through all pages, backing off on throttling."""
+        throttle_key = ("cloudwatch", region)
+        params = {
+            "MetricDataQueries": queries,
+            "StartTime": start_time,
+            "EndTime": end_time,
+            "ScanBy": "TimestampAscending",
+        }
+        results = []
+        attempt = 0
+
+        while True:
+            self.rate_limiter.acquire(throttle_key)
+            try:
+                response = client.get_metric_data(**params)
+            except ClientError as e:
+                if not is_throttling_error(e) or attempt >= self.max_throttle_retries:
+                    raise
+                self.rate_limiter.record_throttle(throttle_key)
+                attempt += 1
+                continue
+            self.rate_limiter.record_success(throttle_key)
 
-        return activity_indicators
+            results.extend(response.get("MetricDataResults", []))
+            if not response.get("NextToken"):
+                return results
+            params["NextToken"] = response["NextToken"]
+
+    def _get_activity_window(self) -> Tuple[datetime, datetime]:
+        """Return the metric time window shared by every lookup in the run."""
+        with self._cache_lock:
+            if self._activity_window is None:
+                end_time = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+                start_time = end_time - timedelta(
+                    days=self.thresholds.forgotten_resource_days_threshold
+                )
+                self._activity_window = (start_time, end_time)
+            return self._activity_window
 
     def _calculate_days_since_activity(
         self, activity_indicators: Dict[str, Any]
@@ -838,19 +1165,21 @@ class CostAnalyzer:
 
     def _estimate_resource_cost_simple(self, resource: Dict[str, Any]) -> Decimal:
         """Simple cost estimation for forgotten resource analysis."""
-        service = resource.get("service", "").upper()
-        resource_type = resource.get("type", "")
+        key = _resource_type_key(resource.get("service", ""), resource.get("type", ""))
+
+        if key in _FREE_RESOURCE_KEYS:
+            return Decimal("0.00")
 
         # Simple cost estimates based on service type
         cost_estimates = {
-            ("EC2", "Instance"): Decimal("50.00"),  # Average EC2 instance
-            ("RDS", "DBInstance"): Decimal("100.00"),  # Average RDS instance
-            ("S3", "Bucket"): Decimal("10.00"),  # Average S3 bucket
-            ("ELB", "LoadBalancer"): Decimal("25.00"),  # Load balancer
-            ("LAMBDA", "Function"): Decimal("5.00"),  # Lambda function
+            ("EC2", "instance"): Decimal("50.00"),  # Average EC2 instance
+            ("RDS", "dbinstance"): Decimal("100.00"),  # Average RDS instance
+            ("S3", "bucket"): Decimal("10.00"),  # Average S3 bucket
+            ("ELB", "loadbalancer"): Decimal("25.00"),  # Load balancer
+            ("LAMBDA", "function"): Decimal("5.00"),  # Lambda function
         }
 
-        return cost_estimates.get((service, resource_type), Decimal("20.00"))
+        return cost_estimates.get(key, Decimal("20.00"))
 
     def _determine_forgotten_resource_risk(
         self, days_since_activity: int, estimated_cost: Decimal
@@ -923,38 +1252,38 @@ class CostAnalyzer:
 
         trend_analyses = []
 
-        cost_client = self._get_cost_explorer_client()
-        if not cost_client:
+        try:
+            # Daily spend for the last two 30-day periods, served from the
+            # shared store; only unfetched or unsettled days hit Cost Explorer
+            end_date = datetime.now().date()
+            start_date = end_date - timedelta(days=60)
+            daily_costs = self.cost_store.daily_service_costs(
+                self.session, start_date, end_date
+            )
+        except Exception as e:
             self.logger.warning(
-                "Cost Explorer client not available - skipping trend analysis"
+                f"Cost Explorer data not available - skipping trend analysis: {e}"
             )
             return trend_analyses
 
-        try:
-            # Get cost data for the last two months
-            end_date = datetime.now().strftime("%Y-%m-%d")
-            start_date = (datetime.now() - timedelta(days=60)).strftime("%Y-%m-%d")
-
-            # Group resources by service for cost analysis
-            resources_by_service = defaultdict(list)
-            for resource in resources:
-                service = resource.get("service", "Unknown")
-                resources_by_service[service].append(resource)
-
-            for service, service_resources in resources_by_service.items():
-                try:
-                    trend_analysis = self._analyze_service_cost_trend(
-                        service, service_resources, start_date, end_date
-                    )
-                    if trend_analysis:
-                        trend_analyses.extend(trend_analysis)
-                except Exception as e:
-                    self.logger.debug(
-                        f"Cost trend analysis failed for service {service}: {e}"
-                    )
+        # Group resources by service for cost analysis
+        resources_by_service = defaultdict(list)
+        for resource in resources:
+            service = resource.get("service", "Unknown")
+            resources_by_service[service].append(resource)
 
-        except Exception as e:
-            self.logger.error(f"Cost trend analysis failed: {e}")
+        period_start = end_date - timedelta(days=30)
+        for service, service_resources in resources_by_service.items():
+            try:
+                trend_analysis = self._analyze_service_cost_trend(
+                    service, service_resources, daily_costs, period_start
+                )
+                if trend_analysis:
+                    trend_analyses.extend(trend_analysis)
+            except Exception as e:
+                self.logger.debug(
+                    f"Cost trend analysis failed for service {service}: {e}"
+                )
 
         self.logger.info(f"Generated {len(trend_analyses)} cost trend analyses")
         return trend_analyses
@@ -963,39 +1292,30 @@ class CostAnalyzer:
         self,
         service: str,
         resources: List[Dict[str, Any]],
-        start_date: str,
-        end_date: str,
+        daily_costs: Dict[str, List[Tuple[date, Decimal]]],
+        period_start: date,
     ) -> List[CostTrendAnalysis]:
-        """Analyze cost trend for a specific service."""
-        try:
-            # Get cost and usage data from Cost Explorer
-            cost_client = self._get_cost_explorer_client()
-            if not cost_client:
-                return []
-
-            response = cost_client.get_cost_and_usage(
-                TimePeriod={"Start": start_date, "End": end_date},
-                Granularity="MONTHLY",
-                Metrics=["BlendedCost"],
-                GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
-            )
+        """Analyze cost trend for a specific service.
 
+        Compares the spend of the 30 days from period_start with the 30 days
+        before it.
+        """
+        try:
             # Find cost data for this service
-            service_costs = []
-            for result in response.get("ResultsByTime", []):
-                for group in result.get("Groups", []):
-                    if service.lower() in group.get("Keys", [""])[0].lower():
-                        cost = Decimal(
-                            group.get("Metrics", {})
-                            .get("BlendedCost", {})
-                            .get("Amount", "0")
-                        )
-                        service_costs.append(cost)
-
-            if len(service_costs) >= 2:
-                current_cost = service_costs[-1]
-                previous_cost = service_costs[-2]
-
+            current_cost = Decimal("0")
+            previous_cost = Decimal("0")
+            matched = False
+            for billing_service, costs in daily_costs.items():
+                if service.lower() not in billing_service.lower():
+                    continue
+                matched = True
+                for day, cost in costs:
+                    if day >= period_start:
+                        current_cost += cost
+                    else:
+                        previous_cost += cost
+
+            if matched:
                 # Calculate trend
                 if previous_cost > 0:
                     change_percentage = float(
@@ -1176,29 +1496,30 @@ class CostAnalyzer:
         """Generate recommendations for underutilized resources."""
         recommendations = []
 
-        for estimate in cost_estimates:
+        # This would require additional metrics analysis
+        # For now, provide generic recommendations for high-cost resources
+        frame = self.build_cost_frame(cost_estimates)
+        for index in frame.indices_at_least(Decimal("200.00"), inclusive=False):
+            estimate = cost_estimates[index]
             try:
-                # This would require additional metrics analysis
-                # For now, provide generic recommendations for high-cost resources
-                if estimate.estimated_monthly_cost > Decimal("200.00"):
-                    rec = CostOptimizationRecommendation(
-                        resource_id=estimate.resource_id,
-                        resource_type=estimate.resource_type,
-                        service=estimate.service,
-                        recommendation_type="utilization_review",
-                        current_monthly_cost=estimate.estimated_monthly_cost,
-                        potential_monthly_savings=estimate.estimated_monthly_cost
-                        * Decimal("0.4"),
-                        confidence_level="low",
-                        implementation_effort="medium",
-                        description=f"Review utilization patterns for this high-cost {estimate.service} resource",
-                        action_items=[
-                            "Analyze resource utilization metrics over the past 30 days",
-                            "Consider scheduling or auto-scaling options",
-                            "Evaluate if resource can be shared or consolidated",
-                        ],
-                    )
-                    recommendations.append(rec)
+                rec = CostOptimizationRecommendation(
+                    resource_id=estimate.resource_id,
+                    resource_type=estimate.resource_type,
+                    service=estimate.service,
+                    recommendation_type="utilization_review",
+                    current_monthly_cost=estimate.estimated_monthly_cost,
+                    potential_monthly_savings=estimate.estimated_monthly_cost
+                    * Decimal("0.4"),
+                    confidence_level="low",
+                    implementation_effort="medium",
+                    description=f"Review utilization patterns for this high-cost {estimate.service} resource",
+                    action_items=[
+                        "Analyze resource utilization metrics over the past 30 days",
+                        "Consider scheduling or auto-scaling options",
+                        "Evaluate if resource can be shared or consolidated",
+                    ],
+                )
+                recommendations.append(rec)
 
             except Exception as e:
                 self.logger.debug(
@@ -1225,13 +1546,15 @@ class CostAnalyzer:
             CostAnalysisSummary object
         """
         try:
+            frame = self.build_cost_frame(cost_estimates)
+
             # Calculate total estimated monthly cost
-            total_cost = sum(
-                estimate.estimated_monthly_cost for estimate in cost_estimates
-            )
+            total_cost = frame.total()
 
             # Count expensive resources
-            expensive_count = len(self.identify_expensive_resources(cost_estimates))
+            expensive_count = frame.count_at_least(
+                self.thresholds.expensive_resource_monthly_threshold
+            )
 
             # Calculate total potential savings
             total_savings = sum(
@@ -1245,25 +1568,18 @@ class CostAnalyzer:
                 if forgotten.risk_level == "high"
             ]
 
-            # Calculate cost by service
-            cost_by_service = defaultdict(Decimal)
-            for estimate in cost_estimates:
-                cost_by_service[estimate.service] += estimate.estimated_monthly_cost
-
-            # Calculate cost by region
-            cost_by_region = defaultdict(Decimal)
-            for estimate in cost_estimates:
-                cost_by_region[estimate.region] += estimate.estimated_monthly_cost
-
             return CostAnalysisSummary(
                 total_estimated_monthly_cost=total_cost,
                 expensive_resources_count=expensive_count,
                 forgotten_resources_count=len(forgotten_resources),
                 total_potential_savings=total_savings,
                 high_risk_resources=high_risk_resources,
-                cost_by_service=dict(cost_by_service),
-                cost_by_region=dict(cost_by_region),
+                cost_by_service=frame.group_sum("service"),
+                cost_by_region=frame.group_sum("region"),
                 optimization_opportunities=len(recommendations),
+                cost_by_account=frame.group_sum("account"),
+                cost_by_cost_center=frame.group_sum("cost_center"),
+                cost_percentiles=frame.percentiles(),
             )
 
         except Exception as e:
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+InvenTag - Cost Frame
+Columnar view of resource cost estimates for fast rollups over large estates.
+
+Monthly costs are held in one NumPy array of integer micro-dollars, so sums
+stay exact to the sixth decimal and convert back to Decimal without float
+drift. Every dimension (service, region, account, resource type, cost-center
+tag) is integer-coded: an array of codes per resource plus the list of labels
+they index. A group-by sum is then a single ``bincount`` and a threshold or
+top-N query a vectorized comparison or partition, instead of Python loops
+over dataclasses.
+"""
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Monthly costs are stored as integer multiples of 1/COST_SCALE dollars
+COST_DIGITS = 6
+COST_SCALE = 10**COST_DIGITS
+
+# Largest integer every float64 below it represents exactly
+FLOAT_EXACT_LIMIT = 2**53
+
+# Resource tags treated as the cost center, matched case-insensitively
+COST_CENTER_TAG_KEYS = ("CostCenter", "Cost-Center", "cost_center")
+
+# Label of resources without a value for a dimension
+UNSET_LABEL = "Unassigned"
+
+DIMENSIONS = ("service", "region", "account", "resource_type", "cost_center")
+
+
+def to_micro_dollars(amount: Any) -> int:
+    """Return an amount of dollars as integer micro-dollars."""
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int(amount.scaleb(COST_DIGITS).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def from_micro_dollars(amount: int) -> Decimal:
+    """Return integer micro-dollars as a Decimal amount of dollars."""
+    return Decimal(int(amount)) / COST_SCALE
+
+
+def cost_center_of(tags: Any) -> Optional[str]:
+    """Return the cost-center tag value of a resource, if it has one."""
+    if not tags:
+        return None
+    if isinstance(tags, list):
+        # Raw AWS form: [{"Key": ..., "Value": ...}]
+        tags = {t.get("Key", ""): t.get("Value") for t in tags if isinstance(t, dict)}
+    keys = {key.lower() for key in COST_CENTER_TAG_KEYS}
+    for key, value in tags.items():
+        if key.lower() in keys and value:
+            return str(value)
+    return None
+
+
+class _Encoder:
+    """Assigns consecutive integer codes to labels in first-seen order."""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.labels: List[str] = []
+
+    def encode(self, label: Optional[str]) -> int:
+        label = label or UNSET_LABEL
+        code = self.codes.get(label)
+        if code is None:
+            code = len(self.labels)
+            self.codes[label] = code
+            self.labels.append(label)
+        return code
+
+
+class CostFrame:
+    """Monthly resource costs with integer-coded dimensions."""
+
+    def __init__(
+        self,
+        resource_ids: Sequence[str],
+        costs: np.ndarray,
+        codes: Dict[str, np.ndarray],
+        labels: Dict[str, List[str]],
+    ):
+        """
+        Initialize a frame from prepared columns.
+
+        Args:
+            resource_ids: Resource identifier of each row
+            costs: Monthly cost of each row in micro-dollars (int64)
+            codes: Dimension -> code of each row
+            labels: Dimension -> label of each code
+        """
+        self.resource_ids = list(resource_ids)
+        self.costs = costs
+        self.codes = codes
+        self.labels = labels
+
+    @classmethod
+    def from_estimates(cls, estimates: Iterable[Any]) -> "CostFrame":
+        """
+        Build a frame from ResourceCostEstimate objects.
+
+        Estimates without an account or cost-center tag are grouped under
+        "Unassigned" for that dimension.
+        """
+        encoders = {dimension: _Encoder() for dimension in DIMENSIONS}
+        resource_ids: List[str] = []
+        costs: List[int] = []
+        columns: Dict[str, List[int]] = {dimension: [] for dimension in DIMENSIONS}
+
+        for estimate in estimates:
+            resource_ids.append(estimate.resource_id)
+            costs.append(to_micro_dollars(estimate.estimated_monthly_cost))
+            values = {
+                "service": estimate.service,
+                "region": estimate.region,
+                "account": getattr(estimate, "account_id", None),
+                "resource_type": estimate.resource_type,
+                "cost_center": cost_center_of(getattr(estimate, "tags", None)),
+            }
+            for dimension, value in values.items():
+                columns[dimension].append(encoders[dimension].encode(value))
+
+        return cls(
+            resource_ids,
+            np.array(costs, dtype=np.int64),
+            {d: np.array(c, dtype=np.int32) for d, c in columns.items()},
+            {d: encoders[d].labels for d in DIMENSIONS},
+        )
+
+    def __len__(self) -> int:
+        return len(self.resource_ids)
+
+    def total(self) -> Decimal:
+        """Return the summed monthly cost of every row."""
+        return from_micro_dollars(self.costs.sum()) if len(self) else Decimal("0")
+
+    def group_sum(self, dimension: str) -> Dict[str, Decimal]:
+        """Return the summed monthly cost per label of a dimension."""
+        labels = self.labels[dimension]
+        if not labels:
+            return {}
+        if int(self.costs.sum()) < FLOAT_EXACT_LIMIT:
+            # bincount sums float64 weights, exact for integers below 2**53
+            sums = np.bincount(
+                self.codes[dimension], weights=self.costs, minlength=len(labels)
+            ).astype(np.int64)
+        else:
+            sums = np.zeros(len(labels), dtype=np.int64)
+            np.add.at(sums, self.codes[dimension], self.costs)
+        return {label: from_micro_dollars(total) for label, total in zip(labels, sums)}
+
+    def group_count(self, dimension: str) -> Dict[str, int]:
+        """Return the number of rows per label of a dimension."""
+        labels = self.labels[dimension]
+        counts = np.bincount(self.codes[dimension], minlength=len(labels))
+        return {label: int(count) for label, count in zip(labels, counts)}
+
+    def indices_at_least(self, threshold: Any, inclusive: bool = True) -> np.ndarray:
+        """Return the row indices, in row order, whose cost reaches a threshold."""
+        limit = to_micro_dollars(threshold)
+        mask = self.costs >= limit if inclusive else self.costs > limit
+        return np.flatnonzero(mask)
+
+    def count_at_least(self, threshold: Any, inclusive: bool = True) -> int:
+        """Return how many rows cost at least (or more than) a threshold."""
+        return int(self.indices_at_least(threshold, inclusive).size)
+
+    def top_n(self, n: int) -> np.ndarray:
+        """Return the row indices of the n most expensive rows, most expensive first."""
+        n = min(max(n, 0), len(self))
+        if n == 0:
+            return np.array([], dtype=np.int64)
+        if n < len(self):
+            candidates = np.argpartition(self.costs, len(self) - n)[len(self) - n :]
+        else:
+            candidates = np.arange(len(self))
+        # Stable order among equal costs: earlier rows first
+        order = np.lexsort((candidates, -self.costs[candidates]))
+        return candidates[order]
+
+    def percentile(self, q: float) -> Decimal:
+        """Return the q-th percentile (0-100) of monthly cost."""
+        if not len(self):
+            return Decimal("0")
+        value = np.percentile(self.costs, q)
+        return from_micro_dollars(int(round(float(value))))
+
+    def percentiles(self, qs: Iterable[float] = (50, 90, 99)) -> Dict[str, Decimal]:
+        """Return several cost percentiles keyed as "p50", "p90", ..."""
+        return {f"p{q:g}": self.percentile(q) for q in qs}
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Discovery Planner
+
+History-driven planning of ComprehensiveAWSDiscovery service/region tasks.
+
+Most service/region pairs in an account hold no resources, yet every run scans
+the full cross product. The planner keeps a small per-account history of task
+results next to the state snapshots and uses it to:
+
+- order tasks by expected resource count so the largest scans start first
+- skip pairs that returned nothing in each of the last N runs
+- run a full sweep every K runs so new usage in skipped pairs is picked up
+
+Before any history exists, expected counts are seeded from the latest
+StateManager snapshot.
+"""
+
+import json
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TaskKey = Tuple[str, str]  # (service, region)
+
+
+@dataclass
+class DiscoveryPlan:
+    """Tasks selected for a discovery run."""
+
+    tasks: List[Dict[str, Any]]
+    skipped: List[TaskKey] = field(default_factory=list)
+    calls_avoided: int = 0
+    full_sweep: bool = False
+
+
+class DiscoveryPlanner:
+    """Orders and prunes discovery tasks from recorded per-pair results."""
+
+    def __init__(
+        self,
+        history_file: str,
+        empty_runs_to_skip: int = 3,
+        full_sweep_interval: int = 10,
+        state_manager=None,
+        account_id: Optional[str] = None,
+    ):
+        """
+        Initialize the planner.
+
+        Args:
+            history_file: JSON file holding recorded task results
+            empty_runs_to_skip: Consecutive empty runs before a pair is skipped
+            full_sweep_interval: Every Nth run scans every pair
+            state_manager: Optional StateManager used to seed expected counts
+            account_id: Account whose snapshot resources seed expected counts
+        """
+        self.history_file = Path(history_file)
+        self.empty_runs_to_skip = max(1, empty_runs_to_skip)
+        self.full_sweep_interval = max(1, full_sweep_interval)
+        self.state_manager = state_manager
+        self.account_id = account_id
+
+        self.history = self._load_history()
+        self._snapshot_counts: Optional[Dict[TaskKey, int]] = None
+        self.last_plan: Optional[DiscoveryPlan] = None
+
+    def plan(self, tasks: List[Dict[str, Any]]) -> DiscoveryPlan:
+        """
+        Order tasks by priority and expected count, dropping known-empty pairs.
+
+        Tasks are the dictionaries built by ComprehensiveAWSDiscovery with
+        ``service``, ``region``, ``config`` and ``priority`` keys.
+        """
+        full_sweep = self.history["runs_since_full_sweep"] + 1 >= (
+            self.full_sweep_interval
+        )
+
+        planned = []
+        plan = DiscoveryPlan(tasks=planned, full_sweep=full_sweep)
+
+        for task in tasks:
+            key = (task["service"], task["region"])
+            if not full_sweep and self._is_persistently_empty(key):
+                plan.skipped.append(key)
+                plan.calls_avoided += len(task["config"].get("operations", []))
+                continue
+            planned.append(task)
+
+        # Largest expected scans first within each priority band; pairs with
+        # no history are treated as potentially large
+        planned.sort(
+            key=lambda t: (
+                t["priority"],
+                -self.expected_count((t["service"], t["region"])),
+            )
+        )
+
+        self.last_plan = plan
+        return plan
+
+    def record_run(self, results: Dict[TaskKey, Optional[int]]):
+        """
+        Record the resource count of each executed task and save the history.
+
+        A count of None marks a failed task, which is not treated as empty.
+        """
+        pairs = self.history["pairs"]
+        for (service, region), count in results.items():
+            if count is None:
+                continue
+            recorded = pairs.setdefault(self._pair_id(service, region), [])
+            recorded.append(count)
+            del recorded[: -self._history_length()]
+
+        if self.last_plan is not None and self.last_plan.full_sweep:
+            self.history["runs_since_full_sweep"] = 0
+        else:
+            self.history["runs_since_full_sweep"] += 1
+
+        self._save_history()
+
+    def expected_count(self, key: TaskKey) -> float:
+        """Return the expected resource count for a pair (inf if unknown)."""
+        recorded = self.history["pairs"].get(self._pair_id(*key))
+        if recorded:
+            return sum(recorded) / len(recorded)
+
+        snapshot_counts = self._get_snapshot_counts()
+        if snapshot_counts:
+            return snapshot_counts.get(key, 0)
+        return float("inf")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return statistics about the last plan."""
+        plan = self.last_plan
+        return {
+            "tracked_pairs": len(self.history["pairs"]),
+            "tasks_planned": len(plan.tasks) if plan else 0,
+            "tasks_skipped": len(plan.skipped) if plan else 0,
+            "calls_avoided": plan.calls_avoided if plan else 0,
+            "full_sweep": plan.full_sweep if plan else False,
+            "runs_since_full_sweep": self.history["runs_since_full_sweep"],
+        }
+
+    def _is_persistently_empty(self, key: TaskKey) -> bool:
+        recorded = self.history["pairs"].get(self._pair_id(*key), [])
+        if len(recorded) < self.empty_runs_to_skip:
+            return False
+        return not any(recorded[-self.empty_runs_to_skip :])
+
+    def _history_length(self) -> int:
+        # Keep enough runs for the skip rule plus a window for averaging
+        return max(self.empty_runs_to_skip, 10)
+
+    def _get_snapshot_counts(self) -> Dict[TaskKey, int]:
+        """Count resources per (service, region) in the latest state snapshot."""
+        if self._snapshot_counts is not None:
+            return self._snapshot_counts
+
+        self._snapshot_counts = {}
+        if self.state_manager is None:
+            return self._snapshot_counts
+
+        try:
+            snapshot = self.state_manager.load_state()
+        except Exception as e:
+            logger.debug(f"Could not load snapshot for discovery planning: {e}")
+            snapshot = None
+
+        if snapshot is None:
+            return self._snapshot_counts
+
+        counts = defaultdict(int)
+        for resource in snapshot.resources:
+            if self.account_id and self.account_id not in (
+                resource.get("source_account_id"),
+                resource.get("account_id"),
+            ):
+                continue
+            service = str(resource.get("service", "")).lower()
+            region = resource.get("region") or "global"
+            counts[(service, region)] += 1
+
+        self._snapshot_counts = dict(counts)
+        return self._snapshot_counts
+
+    @staticmethod
+    def _pair_id(service: str, region: str) -> str:
+        return f"{service}:{region}"
+
+    def _load_history(self) -> Dict[str, Any]:
+        history = {"runs_since_full_sweep": 0, "pairs": {}}
+        if not self.history_file.exists():
+            return history
+
+        try:
+            with open(self.history_file, "r") as f:
+                loaded = json.load(f)
+            history["runs_since_full_sweep"] = int(
+                loaded.get("runs_since_full_sweep", 0)
+            )
+            history["pairs"] = dict(loaded.get("pairs", {}))
+        except Exception as e:
+            logger.warning(f"Could not load discovery history: {e}")
+        return history
+
+    def _save_history(self):
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.history_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(self.history, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self.history_file)
+        except Exception as e:
+            logger.error(f"Could not save discovery history: {e}")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Shared Regional EC2 Snapshot
+
+Run-scoped store of EC2 describe results shared by the inventory, the network
+and security analyzers, the BOM converter and the EC2 service handler.
+
+Each (account, region) gets one snapshot. A snapshot fetches a kind of data
+(VPCs, subnets, security groups, ...) the first time any consumer asks for it,
+paging with the largest page size the API accepts, and every later consumer
+reads the stored items. A describe denied to the caller is remembered and
+re-raised, so each EC2 describe call happens at most once per region per run;
+transient failures such as throttling are retried on the next request. Like
+the client pool, the account is identified by the boto3 session carrying its credentials
+and a session's snapshots disappear when it is garbage collected.
+"""
+
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from .client_pool import get_client_pool
+
+logger = logging.getLogger(__name__)
+
+# Error codes that fail the same way on every retry; only these are remembered
+NON_RETRYABLE_ERROR_CODES = {
+    "AccessDenied",
+    "AccessDeniedException",
+    "UnauthorizedOperation",
+    "AuthFailure",
+    "OptInRequired",
+}
+
+# Snapshot kind -> (operation, result key, largest page size the API accepts)
+EC2_SNAPSHOT_CALLS = {
+    "vpcs": ("describe_vpcs", "Vpcs", 1000),
+    "subnets": ("describe_subnets", "Subnets", 1000),
+    "security_groups": ("describe_security_groups", "SecurityGroups", 1000),
+    "network_acls": ("describe_network_acls", "NetworkAcls", 100),
+    "route_tables": ("describe_route_tables", "RouteTables", 100),
+    "network_interfaces": (
+        "describe_network_interfaces",
+        "NetworkInterfaces",
+        1000,
+    ),
+    "instances": ("describe_instances", "Reservations", 1000),
+    "internet_gateways": ("describe_internet_gateways", "InternetGateways", 1000),
+    "nat_gateways": ("describe_nat_gateways", "NatGateways", 1000),
+    "vpc_endpoints": ("describe_vpc_endpoints", "VpcEndpoints", 1000),
+    "peering_connections": (
+        "describe_vpc_peering_connections",
+        "VpcPeeringConnections",
+        1000,
+    ),
+    "transit_gateway_attachments": (
+        "describe_transit_gateway_attachments",
+        "TransitGatewayAttachments",
+        1000,
+    ),
+}
+
+
+class RegionalEC2Snapshot:
+    """Lazily fetched, thread-safe EC2 describe results for one account and region."""
+
+    def __init__(self, session: boto3.Session, region: str):
+        """
+        Initialize the snapshot.
+
+        Args:
+            session: boto3 session identifying the account credentials
+            region: Region the describe calls are made in
+        """
+        # Weak so the store's entry for the session can still be collected
+        self._session_ref = weakref.ref(session)
+        self.region = region
+        self._locks = {kind: threading.Lock() for kind in EC2_SNAPSHOT_CALLS}
+        self._items: Dict[str, List[Dict[str, Any]]] = {}
+        self._errors: Dict[str, Exception] = {}
+        # kind -> describe calls made, written only under that kind's lock
+        self._api_calls: Dict[str, int] = {}
+
+    @property
+    def api_calls(self) -> int:
+        """Total describe calls made by this snapshot."""
+        return sum(self._api_calls.values())
+
+    def get(self, kind: str) -> List[Dict[str, Any]]:
+        """
+        Return every item of a snapshot kind, describing it on first use.
+
+        Args:
+            kind: Key of EC2_SNAPSHOT_CALLS, e.g. "vpcs"
+
+        Returns:
+            List of items as returned by the describe call; for "instances"
+            the reservations are flattened into instances
+
+        Raises:
+            The exception raised by the describe call. Non-retryable errors
+            (see NON_RETRYABLE_ERROR_CODES) are raised again on every later
+            request for the same kind; other errors are retried.
+        """
+        if kind not in EC2_SNAPSHOT_CALLS:
+            raise ValueError(f"Unknown EC2 snapshot kind: {kind}")
+
+        with self._locks[kind]:
+            if kind not in self._items and kind not in self._errors:
+                try:
+                    self._items[kind] = self._describe(kind)
+                except ClientError as e:
+                    if (
+                        e.response.get("Error", {}).get("Code")
+                        in NON_RETRYABLE_ERROR_CODES
+                    ):
+                        self._errors[kind] = e
+                    raise
+            if kind in self._errors:
+                raise self._errors[kind]
+            return self._items[kind]
+
+    def peek(self, kind: str) -> Optional[List[Dict[str, Any]]]:
+        """Return a kind's items if they were already fetched, else None."""
+        return self._items.get(kind)
+
+    def prefetch(self, kinds: Iterable[str], max_workers: int = 8):
+        """Fetch several kinds concurrently; errors surface again from get()."""
+        pending = [kind for kind in kinds if self.peek(kind) is None]
+        if not pending:
+            return
+
+        def fetch(kind: str):
+            try:
+                self.get(kind)
+            except Exception:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            list(executor.map(fetch, pending))
+
+    def _describe(self, kind: str) -> List[Dict[str, Any]]:
+        """Page through a describe call with the largest page size."""
+        operation_name, result_key, page_size = EC2_SNAPSHOT_CALLS[kind]
+        session = self._session_ref()
+        if session is None:
+            raise RuntimeError("Session for EC2 snapshot no longer exists")
+
+        logger.debug(f"Describing EC2 {kind} in {self.region}")
+        client = get_client_pool().get_client(session, "ec2", region_name=self.region)
+        paginator = client.get_paginator(operation_name)
+
+        items: List[Dict[str, Any]] = []
+        for page in paginator.paginate(PaginationConfig={"PageSize": page_size}):
+            self._api_calls[kind] = self._api_calls.get(kind, 0) + 1
+            items.extend(page.get(result_key, []))
+
+        if kind == "instances":
+            items = [
+                instance
+                for reservation in items
+                for instance in reservation.get("Instances", [])
+            ]
+        return items
+
+
+class EC2SnapshotStore:
+    """Holds one RegionalEC2Snapshot per (session, region) for the current run."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._lock = threading.Lock()
+        # session -> {region: RegionalEC2Snapshot}
+        self._snapshots = weakref.WeakKeyDictionary()
+
+    def get_snapshot(self, session: boto3.Session, region: str) -> RegionalEC2Snapshot:
+        """Return the snapshot for (session, region), creating it once."""
+        with self._lock:
+            regions = self._snapshots.setdefault(session, {})
+            snapshot = regions.get(region)
+            if snapshot is None:
+                snapshot = RegionalEC2Snapshot(session, region)
+                regions[region] = snapshot
+            return snapshot
+
+    def invalidate(self, session: Optional[boto3.Session] = None):
+        """Drop the snapshots of one session, or of every session, to start a new run."""
+        with self._lock:
+            if session is None:
+                self._snapshots = weakref.WeakKeyDictionary()
+            else:
+                self._snapshots.pop(session, None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return snapshot counts and the describe calls made so far."""
+        with self._lock:
+            snapshots = [
+                snapshot
+                for regions in self._snapshots.values()
+                for snapshot in regions.values()
+            ]
+        return {
+            "snapshots": len(snapshots),
+            "api_calls": sum(snapshot.api_calls for snapshot in snapshots),
+        }
+
+
+_shared_store: Optional[EC2SnapshotStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_ec2_snapshot_store() -> EC2SnapshotStore:
+    """Return the process-wide EC2 snapshot store shared by all consumers."""
+    global _shared_store
+
+    if _shared_store is None:
+        with _shared_store_lock:
+            if _shared_store is None:
+                _shared_store = EC2SnapshotStore()
+    return _shared_store
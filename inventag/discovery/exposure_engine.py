@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+InvenTag - Exposure Engine
+Compiled security group and NACL rules for internet exposure queries.
+
+Each security group is compiled once into merged port-range interval sets per
+protocol and source class (internet, external CIDR, VPC CIDR, referenced
+security group). Security group references are resolved transitively in one
+breadth-first pass from the internet-exposed groups, and NACL inbound rules are
+evaluated once per NACL and protocol in rule-number order. Resource exposure is
+then a handful of interval-set unions and intersections, memoized per
+(security groups, subnet) combination, so the answer computed for the BOM can
+be reused by later stages.
+"""
+
+import ipaddress
+import logging
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .cidr_index import merge_ranges
+from .network_topology import security_group_ids_of
+
+logger = logging.getLogger(__name__)
+
+MIN_PORT = 0
+MAX_PORT = 65535
+
+# Source classes
+INTERNET = "internet"
+EXTERNAL = "external"
+VPC = "vpc"
+
+# Protocols a rule for all protocols ("-1") is expanded into
+TRACKED_PROTOCOLS = ("tcp", "udp", "icmp")
+
+PROTOCOL_NAMES = {
+    "-1": "all",
+    "all": "all",
+    "6": "tcp",
+    "17": "udp",
+    "1": "icmp",
+    "58": "icmpv6",
+}
+
+INTERNET_SOURCES = ("0.0.0.0/0", "::/0")
+
+
+class PortRangeSet:
+    """Immutable set of ports stored as sorted, merged inclusive ranges."""
+
+    __slots__ = ("_ranges",)
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()):
+        self._ranges: Tuple[Tuple[int, int], ...] = tuple(merge_ranges(ranges))
+
+    @classmethod
+    def full(cls) -> "PortRangeSet":
+        """Return the set of every port."""
+        return cls([(MIN_PORT, MAX_PORT)])
+
+    @property
+    def ranges(self) -> Tuple[Tuple[int, int], ...]:
+        """The merged (from, to) ranges."""
+        return self._ranges
+
+    def union(self, other: "PortRangeSet") -> "PortRangeSet":
+        """Return the ports in either set."""
+        if not other._ranges:
+            return self
+        if not self._ranges:
+            return other
+        return PortRangeSet(self._ranges + other._ranges)
+
+    def intersection(self, other: "PortRangeSet") -> "PortRangeSet":
+        """Return the ports in both sets."""
+        result = []
+        i = j = 0
+        while i < len(self._ranges) and j < len(other._ranges):
+            start = max(self._ranges[i][0], other._ranges[j][0])
+            end = min(self._ranges[i][1], other._ranges[j][1])
+            if start <= end:
+                result.append((start, end))
+            if self._ranges[i][1] < other._ranges[j][1]:
+                i += 1
+            else:
+                j += 1
+        return PortRangeSet(result)
+
+    def difference(self, other: "PortRangeSet") -> "PortRangeSet":
+        """Return the ports in this set but not in other."""
+        result = []
+        j = 0
+        for start, end in self._ranges:
+            while j < len(other._ranges) and other._ranges[j][1] < start:
+                j += 1
+            k = j
+            while k < len(other._ranges) and other._ranges[k][0] <= end:
+                if other._ranges[k][0] > start:
+                    result.append((start, other._ranges[k][0] - 1))
+                start = max(start, other._ranges[k][1] + 1)
+                k += 1
+            if start <= end:
+                result.append((start, end))
+        return PortRangeSet(result)
+
+    def __contains__(self, port: int) -> bool:
+        return any(start <= port <= end for start, end in self._ranges)
+
+    def __bool__(self) -> bool:
+        return bool(self._ranges)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PortRangeSet) and self._ranges == other._ranges
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __str__(self) -> str:
+        if self._ranges == ((MIN_PORT, MAX_PORT),):
+            return "All"
+        return ",".join(
+            str(start) if start == end else f"{start}-{end}"
+            for start, end in self._ranges
+        )
+
+    def __repr__(self) -> str:
+        return f"PortRangeSet({list(self._ranges)!r})"
+
+
+ProtocolPorts = Dict[str, PortRangeSet]
+
+
+def normalize_protocol(protocol: Any) -> str:
+    """Return the lower-case protocol name used by the engine."""
+    name = str(protocol).strip().lower()
+    return PROTOCOL_NAMES.get(name, name)
+
+
+def parse_port_range(port_range: Any, protocol: str) -> PortRangeSet:
+    """Parse a rule port range such as "All", "22" or "1024-2048"."""
+    if protocol not in ("tcp", "udp"):
+        # ICMP type/code and other protocols have no ports
+        return PortRangeSet.full()
+    text = str(port_range).strip()
+    if not text or text.lower() == "all":
+        return PortRangeSet.full()
+    start_text, _, end_text = text.partition("-")
+    try:
+        start = int(start_text)
+        end = int(end_text) if end_text else start
+    except ValueError:
+        # "-1" and other unparseable ranges mean every port
+        return PortRangeSet.full()
+    if start < MIN_PORT or end < MIN_PORT:
+        return PortRangeSet.full()
+    return PortRangeSet([(start, min(end, MAX_PORT))])
+
+
+def classify_source(cidr: str) -> Optional[str]:
+    """Return the source class of a CIDR, or None if it cannot be parsed."""
+    if cidr in INTERNET_SOURCES:
+        return INTERNET
+    try:
+        network = ipaddress.ip_network(cidr, strict=False)
+    except (TypeError, ValueError):
+        return None
+    if network.prefixlen == 0:
+        return INTERNET
+    return VPC if network.is_private else EXTERNAL
+
+
+def add_ports(target: ProtocolPorts, protocol: str, ports: PortRangeSet):
+    """Union ports into target, expanding "all" into the tracked protocols."""
+    protocols = TRACKED_PROTOCOLS if protocol == "all" else (protocol,)
+    for name in protocols:
+        existing = target.get(name)
+        target[name] = ports if existing is None else existing.union(ports)
+
+
+def merge_protocol_ports(target: ProtocolPorts, source: ProtocolPorts):
+    """Union every protocol of source into target."""
+    for protocol, ports in source.items():
+        add_ports(target, protocol, ports)
+
+
+def format_protocol_ports(ports: ProtocolPorts) -> Dict[str, str]:
+    """Return the non-empty protocols as {protocol: "22,443"} strings."""
+    return {
+        protocol: str(ports[protocol]) for protocol in sorted(ports) if ports[protocol]
+    }
+
+
+@dataclass
+class CompiledSecurityGroup:
+    """Inbound rules of a security group as port-range sets."""
+
+    group_id: str
+    vpc_id: str
+    sources: Dict[str, ProtocolPorts] = field(default_factory=dict)
+    references: Dict[str, ProtocolPorts] = field(default_factory=dict)
+
+
+@dataclass
+class CompiledNACL:
+    """Inbound entries of a NACL in evaluation order."""
+
+    nacl_id: str
+    vpc_id: str
+    is_default: bool
+    # (protocol, ports, source class, allow)
+    entries: List[Tuple[str, PortRangeSet, str, bool]] = field(default_factory=list)
+
+
+@dataclass
+class ResourceExposure:
+    """Internet-reachable ports of a resource."""
+
+    resource_id: str
+    internet_ports: Dict[str, str] = field(default_factory=dict)
+    indirect_ports: Dict[str, str] = field(default_factory=dict)
+    exposing_security_groups: List[str] = field(default_factory=list)
+    pivot_security_groups: List[str] = field(default_factory=list)
+    nacl_id: Optional[str] = None
+
+    @property
+    def is_internet_exposed(self) -> bool:
+        """True if any port is reachable directly from the internet."""
+        return bool(self.internet_ports)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the exposure as a plain dictionary."""
+        return {
+            "resource_id": self.resource_id,
+            "internet_ports": self.internet_ports,
+            "indirect_ports": self.indirect_ports,
+            "exposing_security_groups": self.exposing_security_groups,
+            "pivot_security_groups": self.pivot_security_groups,
+            "nacl_id": self.nacl_id,
+        }
+
+
+def compile_security_group(sg: Any) -> CompiledSecurityGroup:
+    """Compile a SecurityGroupAnalysis's inbound rules."""
+    compiled = CompiledSecurityGroup(group_id=sg.group_id, vpc_id=sg.vpc_id)
+    for rule in sg.inbound_rules:
+        protocol = normalize_protocol(rule.protocol)
+        ports = parse_port_range(rule.port_range, protocol)
+        if rule.references_security_group:
+            if rule.referenced_sg_id:
+                target = compiled.references.setdefault(rule.referenced_sg_id, {})
+                add_ports(target, protocol, ports)
+            continue
+        source_class = classify_source(rule.source_destination)
+        if source_class is not None:
+            add_ports(compiled.sources.setdefault(source_class, {}), protocol, ports)
+    return compiled
+
+
+def compile_nacl(nacl: Any) -> CompiledNACL:
+    """Compile a NACLAnalysis's inbound rules in rule-number order."""
+    compiled = CompiledNACL(
+        nacl_id=nacl.nacl_id, vpc_id=nacl.vpc_id, is_default=nacl.is_default
+    )
+    for rule in sorted(nacl.inbound_rules, key=lambda r: r.rule_number):
+        source_class = classify_source(rule.cidr_block)
+        if source_class not in (INTERNET, EXTERNAL):
+            continue
+        protocol = normalize_protocol(rule.protocol)
+        compiled.entries.append(
+            (
+                protocol,
+                parse_port_range(rule.port_range, protocol),
+                source_class,
+                str(rule.rule_action).lower() == "allow",
+            )
+        )
+    return compiled
+
+
+class ExposureEngine:
+    """
+    Precomputed internet exposure for security groups, NACLs and resources.
+
+    Build it once from the analyzer caches and query it for any number of
+    resources; every intermediate result is memoized.
+    """
+
+    def __init__(
+        self,
+        security_groups: Dict[str, Any],
+        nacls: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Compile security groups and NACLs.
+
+        Args:
+            security_groups: SecurityGroupAnalysis objects by group ID
+            nacls: NACLAnalysis objects by NACL ID
+        """
+        self._lock = threading.RLock()
+        self.groups: Dict[str, CompiledSecurityGroup] = {
+            sg_id: compile_security_group(sg) for sg_id, sg in security_groups.items()
+        }
+
+        self.nacls: Dict[str, CompiledNACL] = {}
+        self._nacl_by_subnet: Dict[str, str] = {}
+        self._default_nacl_by_vpc: Dict[str, str] = {}
+        for nacl_id, nacl in (nacls or {}).items():
+            self.nacls[nacl_id] = compile_nacl(nacl)
+            for subnet_id in nacl.associated_subnets:
+                self._nacl_by_subnet[subnet_id] = nacl_id
+            if nacl.is_default:
+                self._default_nacl_by_vpc[nacl.vpc_id] = nacl_id
+
+        self._nacl_allowed: Dict[Tuple[str, str], PortRangeSet] = {}
+        self._indirect: Optional[Dict[str, Tuple[ProtocolPorts, Set[str]]]] = None
+        self._combinations: Dict[Tuple[Tuple[str, ...], Optional[str]], Tuple] = {}
+
+    def internet_ports(self, sg_id: str) -> ProtocolPorts:
+        """Ports a security group opens to the whole internet."""
+        group = self.groups.get(sg_id)
+        if group is None:
+            return {}
+        return group.sources.get(INTERNET, {})
+
+    def indirect_internet_ports(self, sg_id: str) -> Tuple[ProtocolPorts, Set[str]]:
+        """
+        Ports a security group opens to members of internet-exposed groups.
+
+        Returns:
+            Tuple of the ports and the referenced groups they are opened to
+        """
+        return self._resolve_references().get(sg_id, ({}, set()))
+
+    def nacl_for_subnet(self, subnet_id: Optional[str], vpc_id: Optional[str] = None):
+        """Return the ID of the NACL governing a subnet, if known."""
+        if subnet_id and subnet_id in self._nacl_by_subnet:
+            return self._nacl_by_subnet[subnet_id]
+        if vpc_id:
+            return self._default_nacl_by_vpc.get(vpc_id)
+        return None
+
+    def nacl_allowed_ports(self, nacl_id: str, protocol: str) -> PortRangeSet:
+        """
+        Ports of a protocol a NACL lets in from at least one internet address.
+
+        Entries are evaluated in rule-number order: an entry for 0.0.0.0/0
+        decides its ports, an allow entry for a narrower public CIDR lets those
+        ports in for part of the internet without deciding them for the rest.
+        """
+        key = (nacl_id, protocol)
+        with self._lock:
+            allowed = self._nacl_allowed.get(key)
+            if allowed is not None:
+                return allowed
+
+            undecided = PortRangeSet.full()
+            allowed = PortRangeSet()
+            for rule_protocol, ports, source_class, allow in self.nacls[
+                nacl_id
+            ].entries:
+                if rule_protocol not in ("all", protocol):
+                    continue
+                matched = ports.intersection(undecided)
+                if not matched:
+                    continue
+                if allow:
+                    allowed = allowed.union(matched)
+                if source_class == INTERNET:
+                    undecided = undecided.difference(matched)
+                    if not undecided:
+                        break
+
+            self._nacl_allowed[key] = allowed
+            return allowed
+
+    def exposure_for_resource(self, resource: Dict[str, Any]) -> ResourceExposure:
+        """Return the internet exposure of a resource dictionary."""
+        sg_ids = tuple(sorted(set(security_group_ids_of(resource))))
+        nacl_id = self.nacl_for_subnet(
+            resource.get("subnet_id"), resource.get("vpc_id")
+        )
+
+        key = (sg_ids, nacl_id)
+        with self._lock:
+            combination = self._combinations.get(key)
+            if combination is None:
+                combination = self._compute_combination(sg_ids, nacl_id)
+                self._combinations[key] = combination
+
+        internet_ports, indirect_ports, exposing, pivots = combination
+        return ResourceExposure(
+            resource_id=resource.get("id", "unknown"),
+            internet_ports=dict(internet_ports),
+            indirect_ports=dict(indirect_ports),
+            exposing_security_groups=list(exposing),
+            pivot_security_groups=list(pivots),
+            nacl_id=nacl_id,
+        )
+
+    def exposure_for_resources(
+        self, resources: Iterable[Dict[str, Any]]
+    ) -> Dict[str, ResourceExposure]:
+        """Return the exposure of every resource that has security groups."""
+        exposures = {}
+        for resource in resources:
+            resource_id = resource.get("id")
+            if resource_id and security_group_ids_of(resource):
+                exposures[resource_id] = self.exposure_for_resource(resource)
+        return exposures
+
+    def _compute_combination(
+        self, sg_ids: Tuple[str, ...], nacl_id: Optional[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str], List[str], List[str]]:
+        """Combine the groups of a resource and filter by its NACL."""
+        direct: ProtocolPorts = {}
+        indirect: ProtocolPorts = {}
+        exposing: List[str] = []
+        pivots: Set[str] = set()
+
+        for sg_id in sg_ids:
+            ports = self.internet_ports(sg_id)
+            if any(ports.values()):
+                exposing.append(sg_id)
+                merge_protocol_ports(direct, ports)
+            indirect_ports, via = self.indirect_internet_ports(sg_id)
+            merge_protocol_ports(indirect, indirect_ports)
+            pivots |= via
+
+        if nacl_id is not None and nacl_id in self.nacls:
+            direct = {
+                protocol: ports.intersection(self.nacl_allowed_ports(nacl_id, protocol))
+                for protocol, ports in direct.items()
+            }
+
+        return (
+            format_protocol_ports(direct),
+            format_protocol_ports(indirect),
+            exposing,
+            sorted(pivots),
+        )
+
+    def _resolve_references(self) -> Dict[str, Tuple[ProtocolPorts, Set[str]]]:
+        """
+        Resolve security group references transitively, once.
+
+        A group that allows traffic from an internet-exposed group is reachable
+        from the internet through that group's members, and so on along the
+        reference chain. A breadth-first pass from the directly exposed groups
+        over reversed references marks every such group once, so cycles and
+        shared chains cost nothing extra.
+        """
+        with self._lock:
+            if self._indirect is not None:
+                return self._indirect
+
+            # referenced group -> [(referencing group, ports it opens)]
+            referenced_by: Dict[str, List[Tuple[str, ProtocolPorts]]] = defaultdict(
+                list
+            )
+            for sg_id, group in self.groups.items():
+                for referenced_id, ports in group.references.items():
+                    referenced_by[referenced_id].append((sg_id, ports))
+
+            exposed = {
+                sg_id
+                for sg_id in self.groups
+                if any(self.internet_ports(sg_id).values())
+            }
+            indirect: Dict[str, Tuple[ProtocolPorts, Set[str]]] = {}
+            queue = deque(exposed)
+            reached = set(exposed)
+            while queue:
+                referenced_id = queue.popleft()
+                for sg_id, ports in referenced_by.get(referenced_id, ()):
+                    group_ports, via = indirect.setdefault(sg_id, ({}, set()))
+                    merge_protocol_ports(group_ports, ports)
+                    via.add(referenced_id)
+                    if sg_id not in reached:
+                        reached.add(sg_id)
+                        queue.append(sg_id)
+
+            logger.debug(
+                f"Resolved security group references: {len(exposed)} exposed, "
+                f"{len(indirect)} reachable through references"
+            )
+            self._indirect = indirect
+            return indirect
@@ -22,6 +22,9 @@ from datetime import datetime
 import boto3
 from botocore.exceptions import ClientError
 
+from .client_pool import get_client_pool
+from .owner_scope import apply_owner_scope, client_service_name
+
 
 @dataclass
 class StandardResource:
@@ -697,9 +700,17 @@ class IntelligentAWSDiscovery:
     regardless of the underlying AWS service complexity.
     """
 
-    def __init__(self, session: boto3.Session = None, regions: List[str] = None):
+    def __init__(
+        self,
+        session: boto3.Session = None,
+        regions: List[str] = None,
+        owner_scoped: bool = True,
+    ):
         self.session = session or boto3.Session()
+        self.client_pool = get_client_pool()
         self.regions = regions or self._get_available_regions()
+        # Request only account-owned resources where the API supports it
+        self.owner_scoped = owner_scoped
         self.field_mapper = IntelligentFieldMapper()
         self.logger = logging.getLogger(__name__)
         self.discovered_resources: List[StandardResource] = []
@@ -722,7 +733,9 @@ class IntelligentAWSDiscovery:
             self._clients_in_progress.add(client_key)
 
         try:
-            client = self.session.client(service_name, region_name=region)
+            client = self.client_pool.get_client(
+                self.session, service_name, region_name=region
+            )
             return client
         except Exception as e:
             self.logger.error(
@@ -826,14 +839,16 @@ class IntelligentAWSDiscovery:
             snake_case_op = self._pascal_to_snake_case(operation_name)
             operation = getattr(client, snake_case_op)
 
+            params = self._get_request_params(client, operation_name)
+
             # Call operation
             try:
                 # Try with paginator first
                 paginator = client.get_paginator(snake_case_op)
-                responses = paginator.paginate()
+                responses = paginator.paginate(**params)
             except Exception:
                 # Fallback to direct call
-                responses = [operation()]
+                responses = [operation(**params)]
 
             # Process responses
             for response in responses:
@@ -848,6 +863,13 @@ class IntelligentAWSDiscovery:
 
         return resources
 
+    def _get_request_params(self, client, operation_name: str) -> Dict[str, Any]:
+        """Return owner-scoping request parameters when owner scoping is on."""
+        if not self.owner_scoped:
+            return {}
+        service = client_service_name(client)
+        return apply_owner_scope(service, operation_name) if service else {}
+
     def _extract_resources_from_response(
         self,
         response: Dict[str, Any],
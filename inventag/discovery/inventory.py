@@ -14,14 +14,29 @@ import logging
 import time
 import sys
 import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from botocore.exceptions import ClientError
 
 # Import the discovery systems
 from .intelligent_discovery import IntelligentAWSDiscovery
 from .optimized_discovery import OptimizedAWSDiscovery
 from .comprehensive_discovery import ComprehensiveAWSDiscovery
+from .billing_store import DailyCostStore, get_daily_cost_store
+from .client_pool import get_client_pool
+from .ec2_snapshot import get_ec2_snapshot_store
+from .operation_index import OperationPlanIndex, get_operation_index
+from .owner_scope import apply_owner_scope, client_service_name
+from .response_cache import APIResponseCache
+from .discovery_planner import DiscoveryPlanner
+from .streaming import stream_from_producer
+
+# ResourceGroupsTagging GetResources limits for server-side filters
+MAX_RGT_TAG_FILTERS = 50
+MAX_RGT_TAG_VALUES = 20
+MAX_RGT_RESOURCE_TYPE_FILTERS = 100
 
 
 class ProgressSpinner:
@@ -77,10 +92,23 @@ class AWSResourceInventory:
         use_comprehensive: bool = True,
         hide_fallback_resources: bool = False,  # Legacy, deprecated
         fallback_display_mode: str = "auto",  # "auto", "always", "never"
+        max_region_workers: int = 10,
+        response_cache: Optional[APIResponseCache] = None,
+        discovery_planner: Optional[DiscoveryPlanner] = None,
+        owner_scoped_discovery: bool = True,
+        cost_store: Optional[DailyCostStore] = None,
+        operation_index: Optional[OperationPlanIndex] = None,
     ):
         """Initialize the AWS Resource Inventory tool."""
         self.session = session or boto3.Session()
+        self.client_pool = get_client_pool()
+        self.operation_index = operation_index or get_operation_index()
         self.resources = []
+        self._resources_lock = threading.Lock()
+        self.max_region_workers = max(1, max_region_workers)
+        self.response_cache = response_cache
+        # Push owner scoping (Scope=Local, Owners=self, ...) into API requests
+        self.owner_scoped_discovery = owner_scoped_discovery
         self.logger = self._setup_logging()
         self.regions = regions if regions is not None else self._get_available_regions()
         self.services = services  # Specific services to scan, None means all
@@ -98,18 +126,26 @@ class AWSResourceInventory:
         self.billing_validated_services: Set[str] = set()
         self.billing_spend_by_service: Dict[str, float] = {}
         self.enable_billing_validation = enable_billing_validation
+        self.cost_store = cost_store or get_daily_cost_store()
 
         # Initialize discovery systems
         self.intelligent_discovery = IntelligentAWSDiscovery(
-            session=self.session, regions=self.regions
+            session=self.session,
+            regions=self.regions,
+            owner_scoped=owner_scoped_discovery,
         )
         self.optimized_discovery = OptimizedAWSDiscovery(
-            session=self.session, regions=self.regions
+            session=self.session,
+            regions=self.regions,
+            owner_scoped=owner_scoped_discovery,
         )
         self.comprehensive_discovery = ComprehensiveAWSDiscovery(
             session=self.session,
             regions=self.regions,
             fallback_display_mode=self.fallback_display_mode,
+            response_cache=self.response_cache,
+            planner=discovery_planner,
+            owner_scoped=owner_scoped_discovery,
         )
 
         # Store original regions for fallback logic
@@ -235,6 +271,9 @@ class AWSResourceInventory:
             f"Starting comprehensive AWS resource discovery ({discovery_method} mode) with billing validation..."
         )
 
+        # A new run starts with fresh regional EC2 snapshots
+        get_ec2_snapshot_store().invalidate(self.session)
+
         # Step 1: Discover services with actual usage via billing data
         if self.enable_billing_validation:
             spinner = ProgressSpinner(
@@ -338,6 +377,9 @@ class AWSResourceInventory:
                         max_workers=min(
                             10, len(undiscovered_services) * 2
                         ),  # Reasonable parallelism
+                        response_cache=self.response_cache,
+                        owner_scoped=self.owner_scoped_discovery,
+                        operation_index=self.operation_index,
                     )
 
                     # Limit services to avoid excessive API calls
@@ -445,6 +487,58 @@ class AWSResourceInventory:
         )
         return self.resources
 
+    def iter_resources(self, max_buffered: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream discovered resources as discovery pages arrive.
+
+        Uses comprehensive discovery when enabled, otherwise the concurrent
+        ResourceGroupsTagging API scan. Billing metadata is attached when billing
+        validation is enabled and duplicates are dropped on the fly. Intelligent
+        discovery, AI predictions and billing gap-filling only run in
+        ``discover_resources()``; streamed resources are not kept in
+        ``self.resources``.
+
+        Args:
+            max_buffered: Resources buffered ahead of the consumer before
+                discovery workers block
+
+        Yields:
+            Resource dictionaries
+        """
+        self.logger.info("Starting streaming AWS resource discovery...")
+        get_ec2_snapshot_store().invalidate(self.session)
+
+        if self.enable_billing_validation:
+            self._discover_services_via_billing()
+
+        if self.use_comprehensive_discovery:
+            source = self.comprehensive_discovery.iter_resources(
+                max_buffered=max_buffered
+            )
+        else:
+            source = stream_from_producer(
+                self._discover_via_resource_groups_tagging_api,
+                max_buffered=max_buffered,
+                thread_name="tagging-api-discovery",
+            )
+
+        # Comprehensive discovery already drops duplicate ARNs while streaming
+        seen_keys = None if self.use_comprehensive_discovery else set()
+        streamed_count = 0
+
+        for resource in source:
+            if seen_keys is not None:
+                resource_key = self._create_unique_resource_key(resource)
+                if resource_key in seen_keys:
+                    continue
+                seen_keys.add(resource_key)
+
+            if self.enable_billing_validation:
+                self._apply_billing_metadata(resource)
+            streamed_count += 1
+            yield resource
+
+        self.logger.info(f"Streaming discovery yielded {streamed_count} resources")
+
     def _perform_intelligent_discovery(self):
         """Perform AI-capable intelligent resource discovery with standardized output."""
         self.logger.info(
@@ -819,47 +913,35 @@ class AWSResourceInventory:
         self.logger.info("Discovering services with actual usage via billing data...")
 
         try:
-            # Cost Explorer is only available in us-east-1
-            ce = self.session.client("ce", region_name="us-east-1")
-
-            # Get cost data for the last 30 days to identify active services
+            # Daily spend of the last 30 days, fetched from Cost Explorer only
+            # for days the shared store does not hold yet
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=30)
-
-            # Query cost and usage data grouped by service
-            response = ce.get_cost_and_usage(
-                TimePeriod={
-                    "Start": start_date.strftime("%Y-%m-%d"),
-                    "End": end_date.strftime("%Y-%m-%d"),
-                },
-                Granularity="MONTHLY",
-                Metrics=["BlendedCost", "UsageQuantity"],
-                GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
+            service_costs = self.cost_store.service_costs(
+                self.session, start_date, end_date
             )
 
             # Process billing data to identify active services
             services_with_usage = {}
             total_spend = 0.0
 
-            for result_by_time in response["ResultsByTime"]:
-                for group in result_by_time["Groups"]:
-                    service_name = group["Keys"][0] if group["Keys"] else "Unknown"
-                    cost_amount = float(group["Metrics"]["BlendedCost"]["Amount"])
-                    usage_quantity = float(group["Metrics"]["UsageQuantity"]["Amount"])
+            for service_name, totals in service_costs.items():
+                cost_amount = float(totals.cost)
+                usage_quantity = totals.usage
 
-                    if (
-                        cost_amount > 0.01 or usage_quantity > 0
-                    ):  # Services with minimal spend or usage
-                        normalized_service = self._normalize_billing_service_name(
-                            service_name
-                        )
-                        services_with_usage[normalized_service] = {
-                            "billing_name": service_name,
-                            "cost": cost_amount,
-                            "usage": usage_quantity,
-                            "aws_service_code": normalized_service,
-                        }
-                        total_spend += cost_amount
+                if (
+                    cost_amount > 0.01 or usage_quantity > 0
+                ):  # Services with minimal spend or usage
+                    normalized_service = self._normalize_billing_service_name(
+                        service_name
+                    )
+                    services_with_usage[normalized_service] = {
+                        "billing_name": service_name,
+                        "cost": cost_amount,
+                        "usage": usage_quantity,
+                        "aws_service_code": normalized_service,
+                    }
+                    total_spend += cost_amount
 
             # Store billing-validated services
             self.billing_validated_services = set(services_with_usage.keys())
@@ -1077,116 +1159,189 @@ class AWSResourceInventory:
             return
 
         for resource in self.resources:
-            service = resource.get("service", "").upper()
-            if service in self.billing_spend_by_service:
-                resource["billing_validated"] = True
-                resource["service_monthly_spend"] = self.billing_spend_by_service[
-                    service
-                ]
-            else:
-                resource["billing_validated"] = False
-                resource["service_monthly_spend"] = 0.0
+            self._apply_billing_metadata(resource)
 
-    def _discover_via_resource_groups_tagging_api(self):
-        """Use Resource Groups Tagging API to discover all taggable resources."""
+    def _apply_billing_metadata(self, resource: Dict[str, Any]):
+        """Add billing metadata to a single resource."""
+        service = resource.get("service", "").upper()
+        if service in self.billing_spend_by_service:
+            resource["billing_validated"] = True
+            resource["service_monthly_spend"] = self.billing_spend_by_service[service]
+        else:
+            resource["billing_validated"] = False
+            resource["service_monthly_spend"] = 0.0
+
+    def _discover_via_resource_groups_tagging_api(
+        self, emit: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """Use Resource Groups Tagging API to discover all taggable resources.
+
+        Regions are scanned concurrently (bounded by ``max_region_workers``), each
+        with its own regional client from the shared client pool. Resource entries
+        are appended to ``self.resources`` under a lock as pages are processed, or
+        handed to ``emit`` instead when streaming.
+        """
         self.logger.info("Discovering resources via ResourceGroupsTagging API...")
 
-        for region in self.regions:
-            try:
-                rgt_client = self.session.client(
-                    "resourcegroupstaggingapi", region_name=region
-                )
+        if not self.regions:
+            return
 
-                # Get all resources (paginated)
-                paginator = rgt_client.get_paginator("get_resources")
-                region_resources = 0
+        if emit is None:
 
-                for page in paginator.paginate():
-                    for resource in page.get("ResourceTagMappingList", []):
-                        try:
-                            # Parse ARN to extract service and resource info
-                            arn = resource["ResourceARN"]
-                            arn_parts = arn.split(":")
-
-                            if len(arn_parts) >= 6:
-                                service = arn_parts[2]
-                                region_from_arn = arn_parts[3] or region
-                                account_id = arn_parts[4]
-                                resource_part = arn_parts[5]
-
-                                # Extract resource type and ID
-                                if "/" in resource_part:
-                                    resource_type, resource_id = resource_part.split(
-                                        "/", 1
-                                    )
-                                else:
-                                    resource_type = resource_part
-                                    resource_id = resource_part
-
-                                # Convert tag list to dictionary
-                                tags = {
-                                    tag["Key"]: tag["Value"]
-                                    for tag in resource.get("Tags", [])
-                                }
-
-                                # Create resource entry with normalized service name
-                                normalized_service = self._normalize_service_name(
-                                    service
-                                )
-                                resource_entry = {
-                                    "service": normalized_service,
-                                    "type": self._normalize_resource_type(
-                                        service, resource_type
-                                    ),
-                                    "region": region_from_arn,
-                                    "id": resource_id,
-                                    "name": tags.get("Name", ""),
-                                    "arn": arn,
-                                    "account_id": account_id,
-                                    "tags": tags,
-                                    "discovered_via": "ResourceGroupsTaggingAPI",
-                                    "discovered_at": datetime.utcnow().isoformat(),
-                                }
-
-                                # Apply service filters if specified
-                                if self.services and service.upper() not in [
-                                    s.upper() for s in self.services
-                                ]:
-                                    continue
-
-                                # Apply tag filters if specified
-                                if self.tag_filters and not self._matches_tag_filters(
-                                    tags
-                                ):
-                                    continue
-
-                                self.resources.append(resource_entry)
-                                region_resources += 1
-
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Failed to process resource {resource.get('ResourceARN', 'unknown')}: {e}"
-                            )
-                            continue
+            def emit(resource_entry: Dict[str, Any]):
+                with self._resources_lock:
+                    self.resources.append(resource_entry)
 
-                self.logger.info(
-                    f"Found {region_resources} resources in region {region} via ResourceGroupsTagging API"
-                )
+        start_time = time.time()
+        max_workers = min(self.max_region_workers, len(self.regions))
+        self.client_pool.ensure_capacity(max_workers)
+        total_found = 0
 
-            except ClientError as e:
-                error_code = e.response.get("Error", {}).get("Code", "")
-                if error_code == "UnauthorizedOperation":
-                    self.logger.warning(
-                        f"No permission for ResourceGroupsTagging API in region {region}"
-                    )
-                else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_region = {
+                executor.submit(self._scan_region_via_tagging_api, region, emit): region
+                for region in self.regions
+            }
+
+            for future in as_completed(future_to_region):
+                region = future_to_region[future]
+                try:
+                    region_found, region_time = future.result()
+                except Exception as e:
                     self.logger.warning(
                         f"ResourceGroupsTagging API failed in region {region}: {e}"
                     )
-            except Exception as e:
+                    continue
+
+                total_found += region_found
+
+                self.logger.info(
+                    f"Found {region_found} resources in region {region} "
+                    f"via ResourceGroupsTagging API ({region_time:.2f}s)"
+                )
+
+        self.logger.info(
+            f"ResourceGroupsTagging API scan found {total_found} resources across "
+            f"{len(self.regions)} regions in {time.time() - start_time:.2f}s "
+            f"using {max_workers} workers"
+        )
+
+    def _scan_region_via_tagging_api(
+        self, region: str, emit: Callable[[Dict[str, Any]], None]
+    ) -> Tuple[int, float]:
+        """Scan a single region with the ResourceGroupsTagging API.
+
+        Each filtered resource entry is passed to ``emit`` as its page arrives.
+        Returns the number of entries emitted and the time taken. Client errors
+        are logged and end the scan for the region.
+        """
+        region_start = time.time()
+        region_found = 0
+
+        try:
+            rgt_client = self.client_pool.get_client(
+                self.session, "resourcegroupstaggingapi", region_name=region
+            )
+
+            # Get all resources (paginated), filtered server-side where possible
+            paginator = rgt_client.get_paginator("get_resources")
+            server_filters = self._build_tagging_api_filters()
+
+            try:
+                pages = iter(paginator.paginate(**server_filters))
+                first_page = next(pages, None)
+            except ClientError as e:
+                if not server_filters or e.response.get("Error", {}).get(
+                    "Code"
+                ) not in ("InvalidParameterException", "ValidationException"):
+                    raise
+                # Filters rejected (e.g. unknown service name); filter client-side
+                self.logger.debug(
+                    f"Server-side filters rejected in region {region}: {e}"
+                )
+                pages = iter(paginator.paginate())
+                first_page = next(pages, None)
+
+            for page in itertools.chain([first_page] if first_page else [], pages):
+                for resource in page.get("ResourceTagMappingList", []):
+                    try:
+                        resource_entry = self._create_resource_from_tag_mapping(
+                            resource, region
+                        )
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Failed to process resource {resource.get('ResourceARN', 'unknown')}: {e}"
+                        )
+                        continue
+
+                    if resource_entry:
+                        emit(resource_entry)
+                        region_found += 1
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if error_code == "UnauthorizedOperation":
+                self.logger.warning(
+                    f"No permission for ResourceGroupsTagging API in region {region}"
+                )
+            else:
                 self.logger.warning(
                     f"ResourceGroupsTagging API failed in region {region}: {e}"
                 )
+        except Exception as e:
+            self.logger.warning(
+                f"ResourceGroupsTagging API failed in region {region}: {e}"
+            )
+
+        return region_found, time.time() - region_start
+
+    def _create_resource_from_tag_mapping(
+        self, resource: Dict[str, Any], region: str
+    ) -> Optional[Dict[str, Any]]:
+        """Build an inventory entry from a ResourceTagMapping, applying filters."""
+        # Parse ARN to extract service and resource info
+        arn = resource["ResourceARN"]
+        arn_parts = arn.split(":")
+
+        if len(arn_parts) < 6:
+            return None
+
+        service = arn_parts[2]
+        region_from_arn = arn_parts[3] or region
+        account_id = arn_parts[4]
+        resource_part = arn_parts[5]
+
+        # Extract resource type and ID
+        if "/" in resource_part:
+            resource_type, resource_id = resource_part.split("/", 1)
+        else:
+            resource_type = resource_part
+            resource_id = resource_part
+
+        # Convert tag list to dictionary
+        tags = {tag["Key"]: tag["Value"] for tag in resource.get("Tags", [])}
+
+        # Apply service filters if specified
+        if self.services and service.upper() not in [s.upper() for s in self.services]:
+            return None
+
+        # Apply tag filters if specified
+        if self.tag_filters and not self._matches_tag_filters(tags):
+            return None
+
+        # Create resource entry with normalized service name
+        return {
+            "service": self._normalize_service_name(service),
+            "type": self._normalize_resource_type(service, resource_type),
+            "region": region_from_arn,
+            "id": resource_id,
+            "name": tags.get("Name", ""),
+            "arn": arn,
+            "account_id": account_id,
+            "tags": tags,
+            "discovered_via": "ResourceGroupsTaggingAPI",
+            "discovered_at": datetime.utcnow().isoformat(),
+        }
 
     def _normalize_service_name(self, service: str) -> str:
         """Normalize service names for consistent display across discovery methods."""
@@ -1357,10 +1512,13 @@ class AWSResourceInventory:
     ):
         """Dynamically discover resources for a service using its AWS API."""
         try:
-            client = self.session.client(client_name, region_name=region)
+            client = self.client_pool.get_client(
+                self.session, client_name, region_name=region
+            )
 
-            # Get all available operations for this client
-            available_operations = client._service_model.operation_names
+            # Operations callable without input that return a resource list,
+            # from the compiled operation plan index
+            available_operations = self._get_listable_operations(client)
 
             # Common list operations that typically return resources
             list_operations = [
@@ -1423,6 +1581,28 @@ class AWSResourceInventory:
                 f"Failed to create client for {client_name} in {region}: {e}"
             )
 
+    def _get_listable_operations(self, client) -> List[str]:
+        """Return operations that list resources and need no required input.
+
+        Falls back to every operation name when the service model cannot be
+        indexed.
+        """
+        try:
+            return [
+                plan.name
+                for plan in self.operation_index.get_discovery_operations(client)
+            ]
+        except Exception as e:
+            self.logger.debug(f"Operation plan index unavailable: {e}")
+            return list(client._service_model.operation_names)
+
+    def _get_operation_plan(self, client, operation_name: str):
+        """Return the compiled plan for an operation, if it can be indexed."""
+        try:
+            return self.operation_index.get_plan(client, operation_name)
+        except Exception:
+            return None
+
     def _call_operation_and_extract_resources(
         self, client, operation_name: str, service_name: str, region: str
     ):
@@ -1430,28 +1610,43 @@ class AWSResourceInventory:
         try:
             # Get the operation model to understand parameters
             operation_model = client._service_model.operation_model(operation_name)
+            plan = self._get_operation_plan(client, operation_name)
 
             # Convert PascalCase operation name to snake_case for boto3
             snake_case_operation = self._pascal_to_snake_case(operation_name)
             operation = getattr(client, snake_case_operation)
 
+            params = {}
+            if self.owner_scoped_discovery and client_service_name(client):
+                params = apply_owner_scope(client_service_name(client), operation_name)
+
             # Handle paginated operations
-            if hasattr(client, "get_paginator"):
+            if plan is not None and not plan.paginated:
+                response_data = [operation(**params)]
+            elif hasattr(client, "get_paginator"):
                 try:
                     paginator = client.get_paginator(snake_case_operation)
+                    pagination_config = plan.pagination_config() if plan else {}
+                    paginate_kwargs = dict(params)
+                    if pagination_config:
+                        paginate_kwargs["PaginationConfig"] = pagination_config
                     response_data = []
-                    for page in paginator.paginate():
+                    for page in paginator.paginate(**paginate_kwargs):
                         response_data.append(page)
                 except Exception:
                     # Fallback to direct call
-                    response_data = [operation()]
+                    response_data = [operation(**params)]
             else:
-                response_data = [operation()]
+                response_data = [operation(**params)]
 
             # Extract resources from the response
             for response in response_data:
                 self._extract_resources_from_response(
-                    response, service_name, region, operation_name
+                    response,
+                    service_name,
+                    region,
+                    operation_name,
+                    result_key=plan.result_key if plan else None,
                 )
 
         except Exception as e:
@@ -1459,14 +1654,39 @@ class AWSResourceInventory:
             raise
 
     def _extract_resources_from_response(
-        self, response: dict, service_name: str, region: str, operation_name: str
+        self,
+        response: dict,
+        service_name: str,
+        region: str,
+        operation_name: str,
+        result_key: Optional[str] = None,
     ):
-        """Extract resource information from AWS API response generically."""
+        """Extract resource information from AWS API response generically.
+
+        ``result_key`` names the output member holding the resource list (from
+        the operation plan index); without it list keys are guessed by name.
+        """
         if not isinstance(response, dict):
             return
 
+        if result_key and result_key in response:
+            resource_list_keys = [result_key]
+        else:
+            resource_list_keys = self._guess_resource_list_keys(response)
+
+        for key in resource_list_keys:
+            resource_list = response.get(key, [])
+            if isinstance(resource_list, list):
+                for resource_data in resource_list:
+                    if isinstance(resource_data, dict):
+                        self._create_resource_from_api_data(
+                            resource_data, service_name, region, operation_name, key
+                        )
+
+    def _guess_resource_list_keys(self, response: dict) -> List[str]:
+        """Guess which response keys hold resource lists from their names."""
         # Common response keys that contain resource lists
-        resource_list_keys = [
+        return [
             # Generic patterns
             key
             for key in response.keys()
@@ -1500,15 +1720,6 @@ class AWSResourceInventory:
             )
         ]
 
-        for key in resource_list_keys:
-            resource_list = response.get(key, [])
-            if isinstance(resource_list, list):
-                for resource_data in resource_list:
-                    if isinstance(resource_data, dict):
-                        self._create_resource_from_api_data(
-                            resource_data, service_name, region, operation_name, key
-                        )
-
     def _create_resource_from_api_data(
         self,
         resource_data: dict,
@@ -1875,6 +2086,53 @@ class AWSResourceInventory:
         # Capitalize first letter as fallback
         return resource_type.replace("-", " ").replace("_", " ").title()
 
+    def _build_tagging_api_filters(self) -> Dict[str, Any]:
+        """Translate service and tag filters into GetResources parameters.
+
+        Filters the API cannot express (too many keys or values) are left to
+        the client-side checks, which are always applied as well.
+        """
+        params = {}
+
+        if self.services and len(self.services) <= MAX_RGT_RESOURCE_TYPE_FILTERS:
+            params["ResourceTypeFilters"] = sorted(
+                {service.lower() for service in self.services}
+            )
+
+        tag_filters = []
+        for key, value in self.tag_filters.items():
+            if isinstance(value, str):
+                tag_filters.append({"Key": key, "Values": [value]})
+            elif isinstance(value, list):
+                if not value or len(value) > MAX_RGT_TAG_VALUES:
+                    tag_filters = None
+                    break
+                tag_filters.append({"Key": key, "Values": list(value)})
+            else:
+                # Only the key has to be present
+                tag_filters.append({"Key": key})
+        if tag_filters and len(tag_filters) <= MAX_RGT_TAG_FILTERS:
+            params["TagFilters"] = tag_filters
+
+        return params
+
+    def _build_ec2_tag_filters(self) -> List[Dict[str, Any]]:
+        """Translate tag filters into EC2 Describe* ``Filters``."""
+        filters = []
+        for key, value in self.tag_filters.items():
+            if isinstance(value, str):
+                filters.append({"Name": f"tag:{key}", "Values": [value]})
+            elif isinstance(value, list) and value:
+                filters.append({"Name": f"tag:{key}", "Values": list(value)})
+            else:
+                filters.append({"Name": "tag-key", "Values": [key]})
+
+        # EC2 ANDs distinct filter names only; repeated tag-key filters are
+        # left to the client-side check
+        if sum(1 for f in filters if f["Name"] == "tag-key") > 1:
+            filters = [f for f in filters if f["Name"] != "tag-key"]
+        return filters
+
     def _matches_tag_filters(self, tags: Dict[str, str]) -> bool:
         """Check if resource tags match the specified tag filters."""
         if not self.tag_filters:
@@ -1892,6 +2150,12 @@ class AWSResourceInventory:
 
         return True
 
+    def _matches_tag_list(self, tags: List[Dict[str, str]]) -> bool:
+        """Check an AWS ``[{"Key": ..., "Value": ...}]`` tag list against the filters."""
+        if not self.tag_filters:
+            return True
+        return self._matches_tag_filters({tag["Key"]: tag["Value"] for tag in tags})
+
     def _discover_legacy_service_resources(self):
         """Fallback to original hardcoded service discovery if ResourceGroupsTagging API fails."""
         self.logger.info("Using legacy service-specific discovery as fallback...")
@@ -2103,7 +2367,7 @@ class AWSResourceInventory:
     def _discover_rds_comprehensive(self, region: str):
         """Comprehensive RDS discovery including all resource types."""
         try:
-            rds = self.session.client("rds", region_name=region)
+            rds = self.client_pool.get_client(self.session, "rds", region_name=region)
 
             # DB Instances, Clusters, Snapshots, Parameter Groups, etc.
             resources_found = []
@@ -2165,7 +2429,9 @@ class AWSResourceInventory:
     def _discover_dynamodb_resources(self, region: str):
         """Discover DynamoDB resources."""
         try:
-            dynamodb = self.session.client("dynamodb", region_name=region)
+            dynamodb = self.client_pool.get_client(
+                self.session, "dynamodb", region_name=region
+            )
 
             tables = dynamodb.list_tables()
             for table_name in tables["TableNames"]:
@@ -2197,7 +2463,9 @@ class AWSResourceInventory:
     def _discover_elasticache_resources(self, region: str):
         """Discover ElastiCache resources."""
         try:
-            elasticache = self.session.client("elasticache", region_name=region)
+            elasticache = self.client_pool.get_client(
+                self.session, "elasticache", region_name=region
+            )
 
             # Redis clusters
             try:
@@ -2227,7 +2495,9 @@ class AWSResourceInventory:
     def _discover_redshift_resources(self, region: str):
         """Discover Redshift resources."""
         try:
-            redshift = self.session.client("redshift", region_name=region)
+            redshift = self.client_pool.get_client(
+                self.session, "redshift", region_name=region
+            )
 
             clusters = redshift.describe_clusters()
             for cluster in clusters["Clusters"]:
@@ -2251,7 +2521,9 @@ class AWSResourceInventory:
         """Discover ELB/ALB/NLB resources."""
         try:
             # ELBv2 (ALB/NLB)
-            elbv2 = self.session.client("elbv2", region_name=region)
+            elbv2 = self.client_pool.get_client(
+                self.session, "elbv2", region_name=region
+            )
             load_balancers = elbv2.describe_load_balancers()
 
             for lb in load_balancers["LoadBalancers"]:
@@ -2275,7 +2547,9 @@ class AWSResourceInventory:
     def _discover_apigateway_resources(self, region: str):
         """Discover API Gateway resources."""
         try:
-            apigw = self.session.client("apigateway", region_name=region)
+            apigw = self.client_pool.get_client(
+                self.session, "apigateway", region_name=region
+            )
 
             # REST APIs
             rest_apis = apigw.get_rest_apis()
@@ -2298,7 +2572,7 @@ class AWSResourceInventory:
     def _discover_sns_resources(self, region: str):
         """Discover SNS resources."""
         try:
-            sns = self.session.client("sns", region_name=region)
+            sns = self.client_pool.get_client(self.session, "sns", region_name=region)
 
             topics = sns.list_topics()
             for topic in topics["Topics"]:
@@ -2324,7 +2598,7 @@ class AWSResourceInventory:
     def _discover_sqs_resources(self, region: str):
         """Discover SQS resources."""
         try:
-            sqs = self.session.client("sqs", region_name=region)
+            sqs = self.client_pool.get_client(self.session, "sqs", region_name=region)
 
             queues = sqs.list_queues()
             for queue_url in queues.get("QueueUrls", []):
@@ -2349,7 +2623,9 @@ class AWSResourceInventory:
     def _discover_kinesis_resources(self, region: str):
         """Discover Kinesis resources."""
         try:
-            kinesis = self.session.client("kinesis", region_name=region)
+            kinesis = self.client_pool.get_client(
+                self.session, "kinesis", region_name=region
+            )
 
             streams = kinesis.list_streams()
             for stream_name in streams["StreamNames"]:
@@ -2371,7 +2647,9 @@ class AWSResourceInventory:
     def _discover_stepfunctions_resources(self, region: str):
         """Discover Step Functions resources."""
         try:
-            sfn = self.session.client("stepfunctions", region_name=region)
+            sfn = self.client_pool.get_client(
+                self.session, "stepfunctions", region_name=region
+            )
 
             state_machines = sfn.list_state_machines()
             for sm in state_machines["stateMachines"]:
@@ -2394,7 +2672,9 @@ class AWSResourceInventory:
     def _discover_secretsmanager_resources(self, region: str):
         """Discover Secrets Manager resources."""
         try:
-            secrets = self.session.client("secretsmanager", region_name=region)
+            secrets = self.client_pool.get_client(
+                self.session, "secretsmanager", region_name=region
+            )
 
             secret_list = secrets.list_secrets()
             for secret in secret_list["SecretList"]:
@@ -2417,7 +2697,7 @@ class AWSResourceInventory:
     def _discover_ssm_resources(self, region: str):
         """Discover Systems Manager resources."""
         try:
-            ssm = self.session.client("ssm", region_name=region)
+            ssm = self.client_pool.get_client(self.session, "ssm", region_name=region)
 
             # Parameters
             try:
@@ -2448,7 +2728,9 @@ class AWSResourceInventory:
             return
 
         try:
-            route53 = self.session.client("route53", region_name=region)
+            route53 = self.client_pool.get_client(
+                self.session, "route53", region_name=region
+            )
 
             hosted_zones = route53.list_hosted_zones()
             for zone in hosted_zones["HostedZones"]:
@@ -2473,7 +2755,9 @@ class AWSResourceInventory:
             return
 
         try:
-            cloudfront = self.session.client("cloudfront", region_name=region)
+            cloudfront = self.client_pool.get_client(
+                self.session, "cloudfront", region_name=region
+            )
 
             distributions = cloudfront.list_distributions()
             for dist in distributions.get("DistributionList", {}).get("Items", []):
@@ -2496,7 +2780,7 @@ class AWSResourceInventory:
     def _discover_acm_resources(self, region: str):
         """Discover ACM (Certificate Manager) resources."""
         try:
-            acm = self.session.client("acm", region_name=region)
+            acm = self.client_pool.get_client(self.session, "acm", region_name=region)
 
             certificates = acm.list_certificates()
             for cert in certificates["CertificateSummaryList"]:
@@ -2520,7 +2804,7 @@ class AWSResourceInventory:
     def _discover_waf_resources(self, region: str):
         """Discover WAF resources."""
         try:
-            waf = self.session.client("wafv2", region_name=region)
+            waf = self.client_pool.get_client(self.session, "wafv2", region_name=region)
 
             # Web ACLs
             web_acls = waf.list_web_acls(Scope="REGIONAL")
@@ -2544,41 +2828,47 @@ class AWSResourceInventory:
     def _enhance_ec2_resources(self, region: str):
         """Enhance EC2 resources with additional details from EC2 API."""
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client_pool.get_client(self.session, "ec2", region_name=region)
+            # Instances and security groups come from the regional snapshot the
+            # analyzers share, so they are filtered client-side; volumes are
+            # only read here and keep the server-side tag filters
+            snapshot = get_ec2_snapshot_store().get_snapshot(self.session, region)
+            filter_params = {}
+            if self.tag_filters:
+                filter_params["Filters"] = self._build_ec2_tag_filters()
 
             # EC2 Instances
-            instances = ec2.describe_instances()
-            for reservation in instances["Reservations"]:
-                for instance in reservation["Instances"]:
-                    self.resources.append(
-                        {
-                            "service": "EC2",
-                            "type": "Instance",
-                            "region": region,
-                            "id": instance["InstanceId"],
-                            "name": self._get_tag_value(
-                                instance.get("Tags", []), "Name"
-                            ),
-                            "state": instance["State"]["Name"],
-                            "instance_type": instance["InstanceType"],
-                            "vpc_id": instance.get("VpcId"),
-                            "subnet_id": instance.get("SubnetId"),
-                            "launch_time": (
-                                instance["LaunchTime"].isoformat()
-                                if "LaunchTime" in instance
-                                else None
-                            ),
-                            "tags": {
-                                tag["Key"]: tag["Value"]
-                                for tag in instance.get("Tags", [])
-                            },
-                            "discovered_at": datetime.utcnow().isoformat(),
-                        }
-                    )
+            for instance in snapshot.get("instances"):
+                if not self._matches_tag_list(instance.get("Tags", [])):
+                    continue
+                self.resources.append(
+                    {
+                        "service": "EC2",
+                        "type": "Instance",
+                        "region": region,
+                        "id": instance["InstanceId"],
+                        "name": self._get_tag_value(instance.get("Tags", []), "Name"),
+                        "state": instance["State"]["Name"],
+                        "instance_type": instance["InstanceType"],
+                        "vpc_id": instance.get("VpcId"),
+                        "subnet_id": instance.get("SubnetId"),
+                        "launch_time": (
+                            instance["LaunchTime"].isoformat()
+                            if "LaunchTime" in instance
+                            else None
+                        ),
+                        "tags": {
+                            tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])
+                        },
+                        "discovered_at": datetime.utcnow().isoformat(),
+                    }
+                )
 
             # EBS Volumes
-            volumes = ec2.describe_volumes()
+            volumes = ec2.describe_volumes(**filter_params)
             for volume in volumes["Volumes"]:
+                if not self._matches_tag_list(volume.get("Tags", [])):
+                    continue
                 self.resources.append(
                     {
                         "service": "EC2",
@@ -2599,8 +2889,9 @@ class AWSResourceInventory:
                 )
 
             # Security Groups
-            security_groups = ec2.describe_security_groups()
-            for sg in security_groups["SecurityGroups"]:
+            for sg in snapshot.get("security_groups"):
+                if not self._matches_tag_list(sg.get("Tags", [])):
+                    continue
                 self.resources.append(
                     {
                         "service": "EC2",
@@ -2623,7 +2914,7 @@ class AWSResourceInventory:
     def _enhance_s3_resources(self, region: str):
         """Enhance S3 resources with additional details from S3 API."""
         try:
-            s3 = self.session.client("s3", region_name=region)
+            s3 = self.client_pool.get_client(self.session, "s3", region_name=region)
 
             # S3 Buckets (global service, only check once)
             if region == "us-east-1":  # Only check from one region
@@ -2668,7 +2959,7 @@ class AWSResourceInventory:
     def _enhance_rds_resources(self, region: str):
         """Enhance RDS resources with additional details from RDS API."""
         try:
-            rds = self.session.client("rds", region_name=region)
+            rds = self.client_pool.get_client(self.session, "rds", region_name=region)
 
             # RDS Instances
             instances = rds.describe_db_instances()
@@ -2709,7 +3000,9 @@ class AWSResourceInventory:
     def _enhance_lambda_resources(self, region: str):
         """Enhance Lambda resources with additional details from Lambda API."""
         try:
-            lambda_client = self.session.client("lambda", region_name=region)
+            lambda_client = self.client_pool.get_client(
+                self.session, "lambda", region_name=region
+            )
 
             functions = lambda_client.list_functions()
             for function in functions["Functions"]:
@@ -2747,7 +3040,7 @@ class AWSResourceInventory:
             return
 
         try:
-            iam = self.session.client("iam")
+            iam = self.client_pool.get_client(self.session, "iam")
 
             # IAM Roles
             roles = iam.list_roles()
@@ -2809,11 +3102,10 @@ class AWSResourceInventory:
     def _enhance_vpc_resources(self, region: str):
         """Enhance VPC resources with additional details from VPC API."""
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            snapshot = get_ec2_snapshot_store().get_snapshot(self.session, region)
 
             # VPCs
-            vpcs = ec2.describe_vpcs()
-            for vpc in vpcs["Vpcs"]:
+            for vpc in snapshot.get("vpcs"):
                 self.resources.append(
                     {
                         "service": "VPC",
@@ -2832,8 +3124,7 @@ class AWSResourceInventory:
                 )
 
             # Subnets
-            subnets = ec2.describe_subnets()
-            for subnet in subnets["Subnets"]:
+            for subnet in snapshot.get("subnets"):
                 self.resources.append(
                     {
                         "service": "VPC",
@@ -2858,7 +3149,9 @@ class AWSResourceInventory:
     def _enhance_cloudformation_resources(self, region: str):
         """Enhance CloudFormation resources with additional details from CloudFormation API."""
         try:
-            cf = self.session.client("cloudformation", region_name=region)
+            cf = self.client_pool.get_client(
+                self.session, "cloudformation", region_name=region
+            )
 
             stacks = cf.list_stacks(
                 StackStatusFilter=[
@@ -2900,7 +3193,7 @@ class AWSResourceInventory:
     def _enhance_ecs_resources(self, region: str):
         """Enhance ECS resources with additional details from ECS API."""
         try:
-            ecs = self.session.client("ecs", region_name=region)
+            ecs = self.client_pool.get_client(self.session, "ecs", region_name=region)
 
             # ECS Clusters
             clusters = ecs.list_clusters()
@@ -2941,7 +3234,7 @@ class AWSResourceInventory:
     def _enhance_eks_resources(self, region: str):
         """Enhance EKS resources with additional details from EKS API."""
         try:
-            eks = self.session.client("eks", region_name=region)
+            eks = self.client_pool.get_client(self.session, "eks", region_name=region)
 
             clusters = eks.list_clusters()
             for cluster_name in clusters["clusters"]:
@@ -2974,7 +3267,9 @@ class AWSResourceInventory:
     def _discover_cloudwatch_resources(self, region: str):
         """Discover CloudWatch resources using CloudWatch API."""
         try:
-            cw = self.session.client("cloudwatch", region_name=region)
+            cw = self.client_pool.get_client(
+                self.session, "cloudwatch", region_name=region
+            )
 
             # CloudWatch Alarms
             alarms = cw.describe_alarms()
@@ -3009,7 +3304,9 @@ class AWSResourceInventory:
     def _discover_cloudtrail_resources(self, region: str):
         """Discover CloudTrail resources."""
         try:
-            client = self.session.client("cloudtrail", region_name=region)
+            client = self.client_pool.get_client(
+                self.session, "cloudtrail", region_name=region
+            )
 
             # CloudTrail trails
             trails_response = client.describe_trails()
@@ -3038,7 +3335,9 @@ class AWSResourceInventory:
     def _discover_kms_resources(self, region: str):
         """Discover KMS resources."""
         try:
-            client = self.session.client("kms", region_name=region)
+            client = self.client_pool.get_client(
+                self.session, "kms", region_name=region
+            )
 
             # KMS keys
             keys_response = client.list_keys()
@@ -3070,7 +3369,9 @@ class AWSResourceInventory:
     def _discover_glue_resources(self, region: str):
         """Discover Glue resources."""
         try:
-            client = self.session.client("glue", region_name=region)
+            client = self.client_pool.get_client(
+                self.session, "glue", region_name=region
+            )
 
             # Glue databases
             try:
@@ -3114,7 +3415,9 @@ class AWSResourceInventory:
     def _discover_cloudwatch_events_resources(self, region: str):
         """Discover CloudWatch Events resources."""
         try:
-            client = self.session.client("events", region_name=region)
+            client = self.client_pool.get_client(
+                self.session, "events", region_name=region
+            )
 
             # EventBridge rules
             rules_response = client.list_rules()
@@ -3156,7 +3459,9 @@ class AWSResourceInventory:
     def _discover_workmail_resources(self, region: str):
         """Discover WorkMail resources."""
         try:
-            client = self.session.client("workmail", region_name=region)
+            client = self.client_pool.get_client(
+                self.session, "workmail", region_name=region
+            )
 
             # WorkMail organizations
             try:
@@ -3210,7 +3515,7 @@ class AWSResourceInventory:
     def upload_to_s3(self, bucket_name: str, key: str, format_type: str = "json"):
         """Upload resources to S3."""
         try:
-            s3 = self.session.client("s3")
+            s3 = self.client_pool.get_client(self.session, "s3")
 
             if format_type.lower() == "json":
                 content = json.dumps(self.resources, indent=2, default=str)
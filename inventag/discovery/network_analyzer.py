@@ -7,15 +7,53 @@ Extracted and enhanced from bom_converter.py VPC enrichment functionality.
 """
 
 import ipaddress
+import threading
 import boto3
-from typing import Dict, List, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
 from botocore.exceptions import ClientError
 import logging
 
+from .cidr_index import CIDRIndex, analyze_vpc_address_space
+from .client_pool import get_client_pool
+from .ec2_snapshot import RegionalEC2Snapshot, get_ec2_snapshot_store
+from .network_topology import (
+    NETWORK_INTERFACE,
+    PEERING,
+    RESOURCE,
+    ROUTE_TABLE,
+    ROUTE_TABLE_ASSOCIATION,
+    SECURITY_GROUP,
+    SECURITY_GROUP_MEMBER,
+    SUBNET,
+    TRANSIT_GATEWAY,
+    TRANSIT_GATEWAY_ATTACHMENT,
+    VPC,
+    NetworkTopologyGraph,
+)
+
 logger = logging.getLogger(__name__)
 
+# Snapshot kinds read per region; the describes behind them are independent
+NETWORK_SNAPSHOT_KINDS = (
+    "vpcs",
+    "subnets",
+    "internet_gateways",
+    "nat_gateways",
+    "vpc_endpoints",
+    "peering_connections",
+    "transit_gateway_attachments",
+    "network_interfaces",
+    "route_tables",
+)
+
+# Overlapping VPC pairs listed in the CIDR analysis; totals are always complete
+MAX_CIDR_OVERLAP_DETAILS = 100
+# Member blocks listed per overlap group
+MAX_CIDR_GROUP_MEMBERS = 100
+
 
 @dataclass
 class SubnetAnalysis:
@@ -54,6 +92,9 @@ class VPCAnalysis:
     peering_connections: List[str] = field(default_factory=list)
     transit_gateway_attachments: List[str] = field(default_factory=list)
     tags: Dict[str, str] = field(default_factory=dict)
+    account_id: Optional[str] = None
+    region: Optional[str] = None
+    is_default: bool = False
 
 
 @dataclass
@@ -68,6 +109,7 @@ class NetworkSummary:
     vpc_utilization_stats: Dict[str, float] = field(default_factory=dict)
     capacity_warnings: List[str] = field(default_factory=list)
     optimization_recommendations: List[str] = field(default_factory=list)
+    cidr_analysis: Dict[str, Any] = field(default_factory=dict)
 
 
 class NetworkAnalyzer:
@@ -83,17 +125,38 @@ class NetworkAnalyzer:
     - VPC peering and transit gateway relationship mapping
     """
 
-    def __init__(self, session: Optional[boto3.Session] = None):
-        """Initialize the NetworkAnalyzer."""
+    def __init__(
+        self,
+        session: Optional[boto3.Session] = None,
+        max_workers: int = 8,
+        topology: Optional[NetworkTopologyGraph] = None,
+    ):
+        """Initialize the NetworkAnalyzer.
+
+        Args:
+            session: boto3 session used for the EC2 describe calls
+            max_workers: Regions whose network metadata is fetched concurrently
+            topology: Graph to record network relationships in, so it can be
+                shared with other analyzers
+        """
         self.session = session or boto3.Session()
+        self.client_pool = get_client_pool()
+        self.snapshot_store = get_ec2_snapshot_store()
+        self.max_workers = max(1, max_workers)
+        self.topology = topology if topology is not None else NetworkTopologyGraph()
         self.vpc_cache: Dict[str, VPCAnalysis] = {}
         self.subnet_cache: Dict[str, SubnetAnalysis] = {}
         self.region_clients: Dict[str, Any] = {}
+        # Guards the caches while regions are merged concurrently
+        self._cache_lock = threading.RLock()
 
         # Thresholds for warnings and recommendations
         self.high_utilization_threshold = 80.0  # Percentage
         self.capacity_warning_threshold = 90.0  # Percentage
 
+        # Subnet size free VPC address space is counted in
+        self.free_block_prefix_length = 24
+
     def analyze_vpc_resources(
         self, resources: List[Dict[str, Any]]
     ) -> Dict[str, VPCAnalysis]:
@@ -111,9 +174,13 @@ class NetworkAnalyzer:
         # Get unique regions from resources
         regions = self._extract_regions(resources)
 
-        # Cache VPC and subnet information for each region
-        for region in regions:
-            self._cache_network_info(region)
+        # Cache VPC and subnet information for all regions concurrently
+        if regions:
+            self.client_pool.ensure_capacity(len(NETWORK_SNAPSHOT_KINDS))
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(regions))
+            ) as executor:
+                list(executor.map(self._cache_network_info, sorted(regions)))
 
         # Map resources to their network context
         self._map_resources_to_network(resources)
@@ -250,6 +317,7 @@ class NetworkAnalyzer:
         optimization_recommendations = self._generate_optimization_recommendations(
             vpc_analysis
         )
+        cidr_analysis = self.analyze_cidr_space(vpc_analysis.values())
 
         return NetworkSummary(
             total_vpcs=total_vpcs,
@@ -260,8 +328,81 @@ class NetworkAnalyzer:
             vpc_utilization_stats=vpc_utilization_stats,
             capacity_warnings=capacity_warnings,
             optimization_recommendations=optimization_recommendations,
+            cidr_analysis=cidr_analysis,
         )
 
+    def analyze_cidr_space(self, vpc_analyses: Iterable[VPCAnalysis]) -> Dict[str, Any]:
+        """
+        Find overlapping VPC CIDRs and unallocated VPC address space.
+
+        The VPCs may come from several accounts and regions, e.g. every
+        account of a multi-account BOM run, so overlaps that would block
+        peering or transit gateway routing are reported before that work.
+
+        Args:
+            vpc_analyses: VPCAnalysis objects to compare
+
+        Overlaps are reported per group of nested blocks with pair totals.
+        Default VPCs all use the same CIDR in every region and account, so
+        they are counted per CIDR instead of listed, and only the first
+        MAX_CIDR_OVERLAP_DETAILS pairs not made of two default VPCs are listed.
+
+        Returns:
+            Dictionary with the overlap groups and totals, a sample of
+            overlapping pairs and per-VPC free space
+        """
+        vpc_analyses = list(vpc_analyses)
+        index = CIDRIndex.from_vpc_analyses(vpc_analyses)
+        groups = index.find_overlap_groups()
+        overlaps = index.find_overlaps(
+            limit=MAX_CIDR_OVERLAP_DETAILS, skip_default_pairs=True
+        )
+        overlap_count = sum(group.overlap_count for group in groups)
+
+        overlapping_vpcs = {
+            entry.vpc_id
+            for group in groups
+            for entry in group.members
+            if not entry.is_default
+        }
+        default_vpc_cidrs: Dict[str, int] = defaultdict(int)
+        for vpc in vpc_analyses:
+            if vpc.is_default:
+                default_vpc_cidrs[vpc.cidr_block] += 1
+
+        vpc_address_space = {}
+        for vpc in vpc_analyses:
+            space = analyze_vpc_address_space(vpc, self.free_block_prefix_length)
+            vpc_address_space[vpc.vpc_id] = {
+                "account_id": space.account_id,
+                "region": space.region,
+                "total_ips": space.total_ips,
+                "unallocated_ips": space.unallocated_ips,
+                "largest_free_blocks": space.largest_free_blocks,
+                "free_block_count": space.free_block_count,
+            }
+
+        return {
+            "total_cidr_blocks": len(index),
+            "overlap_count": overlap_count,
+            "cross_account_overlap_count": sum(
+                group.cross_account_overlap_count for group in groups
+            ),
+            "overlap_group_count": len(groups),
+            "overlap_groups": [
+                group.to_dict(MAX_CIDR_GROUP_MEMBERS) for group in groups
+            ],
+            "overlapping_vpcs": sorted(overlapping_vpcs),
+            "default_vpcs": {
+                "count": sum(default_vpc_cidrs.values()),
+                "cidr_blocks": dict(default_vpc_cidrs),
+            },
+            "overlaps": [overlap.to_dict() for overlap in overlaps],
+            "overlaps_truncated": overlap_count > len(overlaps),
+            "free_block_prefix_length": self.free_block_prefix_length,
+            "vpc_address_space": vpc_address_space,
+        }
+
     def _extract_regions(self, resources: List[Dict[str, Any]]) -> Set[str]:
         """Extract unique regions from resources."""
         regions = set()
@@ -272,170 +413,253 @@ class NetworkAnalyzer:
         return regions
 
     def _cache_network_info(self, region: str):
-        """Cache VPC and subnet information for a region."""
+        """Cache VPC, subnet and network component information for a region.
+
+        The describe calls are independent, so the regional EC2 snapshot fetches
+        them concurrently; results are merged VPCs first so subnets and
+        components can attach to them.
+        """
         try:
             logger.info(f"Caching network information for region: {region}")
-            ec2 = self.session.client("ec2", region_name=region)
-            self.region_clients[region] = ec2
-
-            # Cache VPC information
-            self._cache_vpc_info(ec2, region)
-
-            # Cache subnet information
-            self._cache_subnet_info(ec2, region)
-
-            # Cache additional network components
-            self._cache_network_components(ec2, region)
+            ec2 = self.client_pool.get_client(self.session, "ec2", region_name=region)
+            with self._cache_lock:
+                self.region_clients[region] = ec2
+
+            snapshot = self.snapshot_store.get_snapshot(self.session, region)
+            snapshot.prefetch(NETWORK_SNAPSHOT_KINDS)
+            results = {
+                kind: self._snapshot_items(snapshot, kind)
+                for kind in NETWORK_SNAPSHOT_KINDS
+            }
+
+            with self._cache_lock:
+                self._merge_vpcs(results["vpcs"], region)
+                self._merge_subnets(results["subnets"])
+                self._merge_network_components(results)
 
         except ClientError as e:
             logger.warning(f"Could not cache network info for {region}: {e}")
 
-    def _cache_vpc_info(self, ec2_client, region: str):
-        """Cache VPC information."""
+    def _snapshot_items(
+        self, snapshot: RegionalEC2Snapshot, kind: str
+    ) -> List[Dict[str, Any]]:
+        """Return a snapshot kind's items, or an empty list if it failed."""
         try:
-            vpcs_response = ec2_client.describe_vpcs()
-
-            for vpc in vpcs_response["Vpcs"]:
-                vpc_id = vpc["VpcId"]
-                vpc_name = self._get_tag_value(vpc.get("Tags", []), "Name") or vpc_id
-
-                # Handle multiple CIDR blocks
-                cidr_blocks = [vpc["CidrBlock"]]
-                if "CidrBlockAssociationSet" in vpc:
-                    for cidr_assoc in vpc["CidrBlockAssociationSet"]:
-                        if cidr_assoc["CidrBlockState"]["State"] == "associated":
-                            cidr_block = cidr_assoc["CidrBlock"]
-                            if cidr_block not in cidr_blocks:
-                                cidr_blocks.append(cidr_block)
-
-                # Calculate total IPs across all CIDR blocks
-                total_ips = sum(self._calculate_cidr_ips(cidr) for cidr in cidr_blocks)
-
-                # Extract tags
-                tags = {tag["Key"]: tag["Value"] for tag in vpc.get("Tags", [])}
-
-                vpc_analysis = VPCAnalysis(
-                    vpc_id=vpc_id,
-                    vpc_name=vpc_name,
-                    cidr_block=vpc["CidrBlock"],  # Primary CIDR
-                    cidr_blocks=cidr_blocks,
-                    total_ips=total_ips,
-                    tags=tags,
-                )
-
-                self.vpc_cache[vpc_id] = vpc_analysis
+            return snapshot.get(kind)
+        except ClientError as e:
+            # Transit Gateway might not be available in all regions
+            if kind != "transit_gateway_attachments":
+                logger.warning(f"Could not describe {kind} in {snapshot.region}: {e}")
+        except Exception as e:
+            logger.warning(f"Could not describe {kind} in {snapshot.region}: {e}")
+        return []
 
+    def _cache_vpc_info(self, region: str):
+        """Cache VPC information."""
+        try:
+            snapshot = self.snapshot_store.get_snapshot(self.session, region)
+            vpcs = snapshot.get("vpcs")
+            with self._cache_lock:
+                self._merge_vpcs(vpcs, region)
         except Exception as e:
             logger.warning(f"Could not cache VPC info for {region}: {e}")
 
-    def _cache_subnet_info(self, ec2_client, region: str):
+    def _cache_subnet_info(self, region: str):
         """Cache subnet information."""
         try:
-            subnets_response = ec2_client.describe_subnets()
+            snapshot = self.snapshot_store.get_snapshot(self.session, region)
+            subnets = snapshot.get("subnets")
+            with self._cache_lock:
+                self._merge_subnets(subnets)
+        except Exception as e:
+            logger.warning(f"Could not cache subnet info for {region}: {e}")
 
-            for subnet in subnets_response["Subnets"]:
-                subnet_id = subnet["SubnetId"]
-                subnet_name = (
-                    self._get_tag_value(subnet.get("Tags", []), "Name") or subnet_id
-                )
-                vpc_id = subnet["VpcId"]
-
-                # Calculate IP utilization
-                total_ips = self._calculate_cidr_ips(subnet["CidrBlock"])
-                available_ips = subnet["AvailableIpAddressCount"]
-                utilization_percentage = (
-                    ((total_ips - available_ips) / total_ips * 100)
-                    if total_ips > 0
-                    else 0
-                )
+    def _cache_network_components(self, region: str):
+        """Cache additional network components like IGW, NAT, VPC endpoints."""
+        snapshot = self.snapshot_store.get_snapshot(self.session, region)
+        results = {
+            kind: self._snapshot_items(snapshot, kind)
+            for kind in NETWORK_SNAPSHOT_KINDS
+            if kind not in ("vpcs", "subnets")
+        }
 
-                # Extract tags
-                tags = {tag["Key"]: tag["Value"] for tag in subnet.get("Tags", [])}
-
-                subnet_analysis = SubnetAnalysis(
-                    subnet_id=subnet_id,
-                    subnet_name=subnet_name,
-                    cidr_block=subnet["CidrBlock"],
-                    availability_zone=subnet["AvailabilityZone"],
-                    vpc_id=vpc_id,
-                    total_ips=total_ips,
-                    available_ips=available_ips,
-                    utilization_percentage=utilization_percentage,
-                    tags=tags,
-                )
+        with self._cache_lock:
+            self._merge_network_components(results)
+
+    def _merge_vpcs(self, vpcs: List[Dict[str, Any]], region: Optional[str] = None):
+        """Add described VPCs to the VPC cache (caller holds the lock)."""
+        for vpc in vpcs:
+            vpc_id = vpc["VpcId"]
+            vpc_name = self._get_tag_value(vpc.get("Tags", []), "Name") or vpc_id
+
+            # Handle multiple CIDR blocks
+            cidr_blocks = [vpc["CidrBlock"]]
+            if "CidrBlockAssociationSet" in vpc:
+                for cidr_assoc in vpc["CidrBlockAssociationSet"]:
+                    if cidr_assoc["CidrBlockState"]["State"] == "associated":
+                        cidr_block = cidr_assoc["CidrBlock"]
+                        if cidr_block not in cidr_blocks:
+                            cidr_blocks.append(cidr_block)
+
+            # Calculate total IPs across all CIDR blocks
+            total_ips = sum(self._calculate_cidr_ips(cidr) for cidr in cidr_blocks)
+
+            # Extract tags
+            tags = {tag["Key"]: tag["Value"] for tag in vpc.get("Tags", [])}
+
+            vpc_analysis = VPCAnalysis(
+                vpc_id=vpc_id,
+                vpc_name=vpc_name,
+                cidr_block=vpc["CidrBlock"],  # Primary CIDR
+                cidr_blocks=cidr_blocks,
+                total_ips=total_ips,
+                tags=tags,
+                account_id=vpc.get("OwnerId"),
+                region=region,
+                is_default=vpc.get("IsDefault", False),
+            )
+
+            # Keep resources mapped before a re-cache; the topology remembers them
+            previous = self.vpc_cache.get(vpc_id)
+            if previous is not None:
+                vpc_analysis.associated_resources = previous.associated_resources
+
+            self.vpc_cache[vpc_id] = vpc_analysis
+            self.topology.add_node(vpc_id, VPC)
+
+    def _merge_subnets(self, subnets: List[Dict[str, Any]]):
+        """Add described subnets to the subnet cache (caller holds the lock)."""
+        for subnet in subnets:
+            subnet_id = subnet["SubnetId"]
+            subnet_name = (
+                self._get_tag_value(subnet.get("Tags", []), "Name") or subnet_id
+            )
+            vpc_id = subnet["VpcId"]
+
+            # Calculate IP utilization
+            total_ips = self._calculate_cidr_ips(subnet["CidrBlock"])
+            available_ips = subnet["AvailableIpAddressCount"]
+            utilization_percentage = (
+                ((total_ips - available_ips) / total_ips * 100) if total_ips > 0 else 0
+            )
+
+            # Extract tags
+            tags = {tag["Key"]: tag["Value"] for tag in subnet.get("Tags", [])}
+
+            subnet_analysis = SubnetAnalysis(
+                subnet_id=subnet_id,
+                subnet_name=subnet_name,
+                cidr_block=subnet["CidrBlock"],
+                availability_zone=subnet["AvailabilityZone"],
+                vpc_id=vpc_id,
+                total_ips=total_ips,
+                available_ips=available_ips,
+                utilization_percentage=utilization_percentage,
+                tags=tags,
+            )
+
+            previous = self.subnet_cache.get(subnet_id)
+            if previous is not None:
+                subnet_analysis.associated_resources = previous.associated_resources
+
+            self.subnet_cache[subnet_id] = subnet_analysis
+            self.topology.add_containment(vpc_id, subnet_id, VPC, SUBNET)
+
+            # Add subnet to VPC analysis
+            if vpc_id in self.vpc_cache:
+                self.vpc_cache[vpc_id].subnets.append(subnet_analysis)
+
+    def _merge_network_components(self, results: Dict[str, List[Dict[str, Any]]]):
+        """Attach gateways, endpoints, peerings, TGWs, ENIs and route tables."""
+        # Internet Gateways
+        for igw in results.get("internet_gateways", []):
+            for attachment in igw.get("Attachments", []):
+                vpc_id = attachment.get("VpcId")
+                if vpc_id and vpc_id in self.vpc_cache:
+                    self.vpc_cache[vpc_id].internet_gateway_id = igw[
+                        "InternetGatewayId"
+                    ]
 
-                self.subnet_cache[subnet_id] = subnet_analysis
+        # NAT Gateways
+        for nat in results.get("nat_gateways", []):
+            vpc_id = nat.get("VpcId")
+            if vpc_id and vpc_id in self.vpc_cache:
+                self.vpc_cache[vpc_id].nat_gateways.append(nat["NatGatewayId"])
 
-                # Add subnet to VPC analysis
-                if vpc_id in self.vpc_cache:
-                    self.vpc_cache[vpc_id].subnets.append(subnet_analysis)
+        # VPC Endpoints
+        for endpoint in results.get("vpc_endpoints", []):
+            vpc_id = endpoint.get("VpcId")
+            if vpc_id and vpc_id in self.vpc_cache:
+                self.vpc_cache[vpc_id].vpc_endpoints.append(endpoint["VpcEndpointId"])
 
-        except Exception as e:
-            logger.warning(f"Could not cache subnet info for {region}: {e}")
+        # VPC Peering Connections
+        for peering in results.get("peering_connections", []):
+            accepter_vpc = peering.get("AccepterVpcInfo", {}).get("VpcId")
+            requester_vpc = peering.get("RequesterVpcInfo", {}).get("VpcId")
 
-    def _cache_network_components(self, ec2_client, region: str):
-        """Cache additional network components like IGW, NAT, VPC endpoints."""
-        try:
-            # Internet Gateways
-            igw_response = ec2_client.describe_internet_gateways()
-            for igw in igw_response["InternetGateways"]:
-                for attachment in igw.get("Attachments", []):
-                    vpc_id = attachment.get("VpcId")
-                    if vpc_id and vpc_id in self.vpc_cache:
-                        self.vpc_cache[vpc_id].internet_gateway_id = igw[
-                            "InternetGatewayId"
-                        ]
-
-            # NAT Gateways
-            nat_response = ec2_client.describe_nat_gateways()
-            for nat in nat_response["NatGateways"]:
-                vpc_id = nat.get("VpcId")
-                if vpc_id and vpc_id in self.vpc_cache:
-                    self.vpc_cache[vpc_id].nat_gateways.append(nat["NatGatewayId"])
+            if accepter_vpc and accepter_vpc in self.vpc_cache:
+                self.vpc_cache[accepter_vpc].peering_connections.append(
+                    peering["VpcPeeringConnectionId"]
+                )
+            if requester_vpc and requester_vpc in self.vpc_cache:
+                self.vpc_cache[requester_vpc].peering_connections.append(
+                    peering["VpcPeeringConnectionId"]
+                )
+            if accepter_vpc and requester_vpc:
+                self.topology.add_link(accepter_vpc, requester_vpc, PEERING)
 
-            # VPC Endpoints
-            endpoint_response = ec2_client.describe_vpc_endpoints()
-            for endpoint in endpoint_response["VpcEndpoints"]:
-                vpc_id = endpoint.get("VpcId")
+        # Transit Gateway Attachments
+        for attachment in results.get("transit_gateway_attachments", []):
+            if attachment.get("ResourceType") == "vpc":
+                vpc_id = attachment.get("ResourceId")
                 if vpc_id and vpc_id in self.vpc_cache:
-                    self.vpc_cache[vpc_id].vpc_endpoints.append(
-                        endpoint["VpcEndpointId"]
+                    self.vpc_cache[vpc_id].transit_gateway_attachments.append(
+                        attachment["TransitGatewayAttachmentId"]
                     )
-
-            # VPC Peering Connections
-            peering_response = ec2_client.describe_vpc_peering_connections()
-            for peering in peering_response["VpcPeeringConnections"]:
-                accepter_vpc = peering.get("AccepterVpcInfo", {}).get("VpcId")
-                requester_vpc = peering.get("RequesterVpcInfo", {}).get("VpcId")
-
-                if accepter_vpc and accepter_vpc in self.vpc_cache:
-                    self.vpc_cache[accepter_vpc].peering_connections.append(
-                        peering["VpcPeeringConnectionId"]
+                tgw_id = attachment.get("TransitGatewayId")
+                if vpc_id and tgw_id:
+                    self.topology.add_node(tgw_id, TRANSIT_GATEWAY)
+                    self.topology.add_link(vpc_id, tgw_id, TRANSIT_GATEWAY_ATTACHMENT)
+
+        # Network Interfaces: subnet -> ENI -> attached instance
+        for eni in results.get("network_interfaces", []):
+            eni_id = eni["NetworkInterfaceId"]
+            subnet_id = eni.get("SubnetId")
+            if subnet_id:
+                self.topology.add_containment(
+                    subnet_id, eni_id, SUBNET, NETWORK_INTERFACE
+                )
+                if eni.get("VpcId"):
+                    self.topology.add_containment(eni["VpcId"], subnet_id, VPC, SUBNET)
+            else:
+                self.topology.add_node(eni_id, NETWORK_INTERFACE)
+            instance_id = eni.get("Attachment", {}).get("InstanceId")
+            if instance_id:
+                self.topology.add_containment(eni_id, instance_id, child_type=RESOURCE)
+            for group in eni.get("Groups", []):
+                self.topology.add_node(group["GroupId"], SECURITY_GROUP)
+                self.topology.add_link(eni_id, group["GroupId"], SECURITY_GROUP_MEMBER)
+
+        # Route Tables: linked to associated subnets, or the VPC when main
+        for route_table in results.get("route_tables", []):
+            route_table_id = route_table["RouteTableId"]
+            self.topology.add_node(route_table_id, ROUTE_TABLE)
+            for association in route_table.get("Associations", []):
+                if association.get("SubnetId"):
+                    self.topology.add_link(
+                        route_table_id, association["SubnetId"], ROUTE_TABLE_ASSOCIATION
                     )
-                if requester_vpc and requester_vpc in self.vpc_cache:
-                    self.vpc_cache[requester_vpc].peering_connections.append(
-                        peering["VpcPeeringConnectionId"]
+                elif association.get("Main") and route_table.get("VpcId"):
+                    self.topology.add_link(
+                        route_table_id, route_table["VpcId"], ROUTE_TABLE_ASSOCIATION
                     )
 
-            # Transit Gateway Attachments
-            try:
-                tgw_response = ec2_client.describe_transit_gateway_attachments()
-                for attachment in tgw_response["TransitGatewayAttachments"]:
-                    if attachment.get("ResourceType") == "vpc":
-                        vpc_id = attachment.get("ResourceId")
-                        if vpc_id and vpc_id in self.vpc_cache:
-                            self.vpc_cache[vpc_id].transit_gateway_attachments.append(
-                                attachment["TransitGatewayAttachmentId"]
-                            )
-            except ClientError:
-                # Transit Gateway might not be available in all regions
-                pass
-
-        except Exception as e:
-            logger.warning(f"Could not cache network components for {region}: {e}")
-
     def _map_resources_to_network(self, resources: List[Dict[str, Any]]):
-        """Map resources to their VPC and subnet context."""
+        """Map resources to their VPC and subnet context.
+
+        The topology graph records each edge once, so a resource is appended to
+        a VPC or subnet's associated_resources only the first time it is seen.
+        """
         for resource in resources:
             vpc_id = self._extract_vpc_id(resource)
             subnet_id = self._extract_subnet_id(resource)
@@ -443,12 +667,14 @@ class NetworkAnalyzer:
 
             # Add resource to VPC
             if vpc_id and vpc_id in self.vpc_cache:
-                if resource_id not in self.vpc_cache[vpc_id].associated_resources:
+                if self.topology.add_containment(vpc_id, resource_id, VPC, RESOURCE):
                     self.vpc_cache[vpc_id].associated_resources.append(resource_id)
 
             # Add resource to subnet
             if subnet_id and subnet_id in self.subnet_cache:
-                if resource_id not in self.subnet_cache[subnet_id].associated_resources:
+                if self.topology.add_containment(
+                    subnet_id, resource_id, SUBNET, RESOURCE
+                ):
                     self.subnet_cache[subnet_id].associated_resources.append(
                         resource_id
                     )
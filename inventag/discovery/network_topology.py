@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+InvenTag - Network Topology Graph
+Set-based graph of VPC, subnet, ENI and resource relationships.
+
+Containment edges run VPC -> subnet -> ENI -> resource (with direct VPC/subnet ->
+resource edges when no ENI is known). Symmetric link edges connect security
+groups, route tables, transit gateways and peered VPCs. Adjacency is kept in
+sets so membership checks are O(1) and queries walk only the affected part of
+the graph instead of rescanning resource lists.
+"""
+
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Node types
+VPC = "vpc"
+SUBNET = "subnet"
+NETWORK_INTERFACE = "network_interface"
+RESOURCE = "resource"
+SECURITY_GROUP = "security_group"
+ROUTE_TABLE = "route_table"
+TRANSIT_GATEWAY = "transit_gateway"
+
+# Link relations
+PEERING = "peering"
+SECURITY_GROUP_MEMBER = "security_group"
+ROUTE_TABLE_ASSOCIATION = "route_table"
+TRANSIT_GATEWAY_ATTACHMENT = "transit_gateway"
+
+
+class NetworkTopologyGraph:
+    """Thread-safe network topology with set-based adjacency."""
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._lock = threading.RLock()
+        self._node_types: Dict[str, str] = {}
+        self._children: Dict[str, Set[str]] = defaultdict(set)
+        self._parents: Dict[str, Set[str]] = defaultdict(set)
+        # relation -> node -> linked nodes
+        self._links: Dict[str, Dict[str, Set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+
+    def add_node(self, node_id: str, node_type: str):
+        """Add a node, keeping the first type recorded for it."""
+        with self._lock:
+            self._node_types.setdefault(node_id, node_type)
+
+    def add_containment(
+        self,
+        parent_id: str,
+        child_id: str,
+        parent_type: Optional[str] = None,
+        child_type: Optional[str] = None,
+    ) -> bool:
+        """
+        Add a parent -> child containment edge.
+
+        Returns:
+            True if the edge is new, False if it already existed
+        """
+        with self._lock:
+            if parent_type:
+                self._node_types.setdefault(parent_id, parent_type)
+            if child_type:
+                self._node_types.setdefault(child_id, child_type)
+            if child_id in self._children[parent_id]:
+                return False
+            self._children[parent_id].add(child_id)
+            self._parents[child_id].add(parent_id)
+            return True
+
+    def add_link(self, node_a: str, node_b: str, relation: str) -> bool:
+        """
+        Add a symmetric link edge of the given relation.
+
+        Returns:
+            True if the edge is new, False if it already existed
+        """
+        with self._lock:
+            adjacency = self._links[relation]
+            if node_b in adjacency[node_a]:
+                return False
+            adjacency[node_a].add(node_b)
+            adjacency[node_b].add(node_a)
+            return True
+
+    def add_resource(
+        self,
+        resource_id: str,
+        vpc_id: Optional[str] = None,
+        subnet_id: Optional[str] = None,
+        security_group_ids: Iterable[str] = (),
+        network_interface_ids: Iterable[str] = (),
+    ):
+        """Add a resource with its VPC, subnet, security group and ENI edges."""
+        with self._lock:
+            self.add_node(resource_id, RESOURCE)
+            if vpc_id:
+                self.add_containment(vpc_id, resource_id, VPC, RESOURCE)
+                if subnet_id:
+                    self.add_containment(vpc_id, subnet_id, VPC, SUBNET)
+            if subnet_id:
+                self.add_containment(subnet_id, resource_id, SUBNET, RESOURCE)
+            for eni_id in network_interface_ids:
+                self.add_containment(eni_id, resource_id, NETWORK_INTERFACE, RESOURCE)
+                if subnet_id:
+                    self.add_containment(subnet_id, eni_id, SUBNET, NETWORK_INTERFACE)
+            for sg_id in security_group_ids:
+                self.add_node(sg_id, SECURITY_GROUP)
+                self.add_link(resource_id, sg_id, SECURITY_GROUP_MEMBER)
+
+    def contains(self, parent_id: str, child_id: str) -> bool:
+        """Return True if child_id is a direct child of parent_id."""
+        return child_id in self._children.get(parent_id, ())
+
+    def is_linked(self, node_a: str, node_b: str, relation: str) -> bool:
+        """Return True if the two nodes share a link of the given relation."""
+        return node_b in self._links.get(relation, {}).get(node_a, ())
+
+    def node_type(self, node_id: str) -> Optional[str]:
+        """Return the type of a node, or None if it is unknown."""
+        return self._node_types.get(node_id)
+
+    def children(self, node_id: str) -> Set[str]:
+        """Return the direct children of a node."""
+        with self._lock:
+            return set(self._children.get(node_id, ()))
+
+    def parents(self, node_id: str) -> Set[str]:
+        """Return the direct parents of a node."""
+        with self._lock:
+            return set(self._parents.get(node_id, ()))
+
+    def linked(self, node_id: str, relation: str) -> Set[str]:
+        """Return the nodes linked to node_id by the given relation."""
+        with self._lock:
+            return set(self._links.get(relation, {}).get(node_id, ()))
+
+    def descendants(self, node_id: str) -> Set[str]:
+        """Return every node reachable through containment edges."""
+        with self._lock:
+            seen: Set[str] = set()
+            queue = deque(self._children.get(node_id, ()))
+            while queue:
+                current = queue.popleft()
+                if current in seen:
+                    continue
+                seen.add(current)
+                queue.extend(self._children.get(current, ()))
+            return seen
+
+    def resources_in(self, node_id: str) -> Set[str]:
+        """Return all resources contained by a VPC, subnet or ENI."""
+        return {
+            node
+            for node in self.descendants(node_id)
+            if self._node_types.get(node) == RESOURCE
+        }
+
+    def connected_vpcs(
+        self, vpc_id: str, include_transit_gateways: bool = True
+    ) -> Set[str]:
+        """
+        Return the VPCs one hop away from vpc_id.
+
+        Peering is not transitive, so only direct peers are returned; VPCs
+        attached to the same transit gateway are included when requested.
+        """
+        with self._lock:
+            connected = set(self._links.get(PEERING, {}).get(vpc_id, ()))
+            if include_transit_gateways:
+                tgw_links = self._links.get(TRANSIT_GATEWAY_ATTACHMENT, {})
+                for tgw_id in tgw_links.get(vpc_id, ()):
+                    connected.update(tgw_links.get(tgw_id, ()))
+            connected.discard(vpc_id)
+            return connected
+
+    def reachable_resources(
+        self, vpc_id: str, include_transit_gateways: bool = True
+    ) -> Set[str]:
+        """Return resources in VPCs reachable from vpc_id via peering or TGW."""
+        reachable: Set[str] = set()
+        for connected_vpc in self.connected_vpcs(vpc_id, include_transit_gateways):
+            reachable |= self.resources_in(connected_vpc)
+        return reachable
+
+    def blast_radius(self, node_id: str) -> Set[str]:
+        """
+        Return the resources affected if node_id fails or changes.
+
+        VPCs, subnets and ENIs affect what they contain; security groups their
+        members; route tables the subnets (or VPC) they are associated with;
+        transit gateways the VPCs attached to them.
+        """
+        node_type = self._node_types.get(node_id)
+        if node_type == SECURITY_GROUP:
+            affected: Set[str] = set()
+            for member in self.linked(node_id, SECURITY_GROUP_MEMBER):
+                if self._node_types.get(member) == RESOURCE:
+                    affected.add(member)
+                else:
+                    # ENIs carry the group for the resources attached to them
+                    affected |= self.resources_in(member)
+            return affected
+        if node_type == ROUTE_TABLE:
+            linked = self.linked(node_id, ROUTE_TABLE_ASSOCIATION)
+        elif node_type == TRANSIT_GATEWAY:
+            linked = self.linked(node_id, TRANSIT_GATEWAY_ATTACHMENT)
+        else:
+            return self.resources_in(node_id)
+
+        affected = set()
+        for associated in linked:
+            affected |= self.resources_in(associated)
+        return affected
+
+    def clear(self):
+        """Remove all nodes and edges."""
+        with self._lock:
+            self._node_types.clear()
+            self._children.clear()
+            self._parents.clear()
+            self._links.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return node counts by type and edge counts by kind."""
+        with self._lock:
+            nodes_by_type: Dict[str, int] = defaultdict(int)
+            for node_type in self._node_types.values():
+                nodes_by_type[node_type] += 1
+            return {
+                "nodes": len(self._node_types),
+                "nodes_by_type": dict(nodes_by_type),
+                "containment_edges": sum(len(c) for c in self._children.values()),
+                "link_edges": {
+                    relation: sum(len(n) for n in adjacency.values()) // 2
+                    for relation, adjacency in self._links.items()
+                },
+            }
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._node_types
+
+    def __len__(self) -> int:
+        return len(self._node_types)
+
+    @classmethod
+    def from_resources(
+        cls, resources: List[Dict[str, Any]], id_key: str = "id"
+    ) -> "NetworkTopologyGraph":
+        """Build a graph from inventory resources' network attributes."""
+        graph = cls()
+        for resource in resources:
+            resource_id = resource.get(id_key)
+            if not resource_id:
+                continue
+            graph.add_resource(
+                resource_id,
+                vpc_id=resource.get("vpc_id"),
+                subnet_id=resource.get("subnet_id"),
+                security_group_ids=security_group_ids_of(resource),
+                network_interface_ids=network_interface_ids_of(resource),
+            )
+        return graph
+
+
+def security_group_ids_of(resource: Dict[str, Any]) -> List[str]:
+    """Return the security group IDs referenced by a resource dictionary."""
+    sg_ids = []
+    for field in ("security_groups", "SecurityGroups", "security_group_ids"):
+        value = resource.get(field)
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list):
+            continue
+        for sg in value:
+            if isinstance(sg, dict):
+                sg_id = sg.get("GroupId") or sg.get("group_id") or sg.get("id")
+                if sg_id:
+                    sg_ids.append(sg_id)
+            elif isinstance(sg, str):
+                sg_ids.append(sg)
+    return sg_ids
+
+
+def network_interface_ids_of(resource: Dict[str, Any]) -> List[str]:
+    """Return the ENI IDs referenced by a resource dictionary."""
+    eni_ids = []
+    for field in ("network_interfaces", "NetworkInterfaces"):
+        value = resource.get(field)
+        if not isinstance(value, list):
+            continue
+        for eni in value:
+            if isinstance(eni, dict):
+                eni_id = eni.get("NetworkInterfaceId") or eni.get("id")
+                if eni_id:
+                    eni_ids.append(eni_id)
+            elif isinstance(eni, str):
+                eni_ids.append(eni)
+    return eni_ids
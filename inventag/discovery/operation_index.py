@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Operation Plan Index
+
+Precompiled, per-botocore-version index of how to call each AWS operation for
+resource discovery, read from the botocore service and paginator models:
+
+- whether the operation has required input members (and so cannot be called
+  blindly during discovery)
+- whether it is paginated, its page-size parameter and the model's maximum
+- which output member holds the resource list
+
+Compiling a service takes one pass over its model. Given a directory (the
+run's state directory), the result is written to disk keyed by botocore
+version so later runs get O(1) lookups without touching the models again;
+without one the index lives for the process only.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import botocore
+import botocore.session
+
+logger = logging.getLogger(__name__)
+
+# Operation prefixes that read resources without side effects
+_DISCOVERY_PREFIXES = ("List", "Describe", "Get")
+
+# Output members that carry pagination state rather than resources
+_TOKEN_MEMBERS = {
+    "NextToken",
+    "nextToken",
+    "NextMarker",
+    "Marker",
+    "NextContinuationToken",
+    "NextPageToken",
+    "nextPageToken",
+    "PaginationToken",
+}
+
+
+def _prefix_rank(operation_name: str) -> int:
+    for rank, prefix in enumerate(_DISCOVERY_PREFIXES):
+        if operation_name.startswith(prefix):
+            return rank
+    return len(_DISCOVERY_PREFIXES)
+
+
+@dataclass
+class OperationPlan:
+    """How to call one operation during discovery."""
+
+    name: str  # PascalCase API name
+    method_name: str  # snake_case client method
+    requires_input: bool
+    paginated: bool
+    limit_key: Optional[str] = None
+    max_page_size: Optional[int] = None
+    result_key: Optional[str] = None
+
+    @property
+    def is_discovery_candidate(self) -> bool:
+        """Read-only list operation callable without parameters."""
+        return (
+            self.name.startswith(_DISCOVERY_PREFIXES)
+            and not self.requires_input
+            and self.result_key is not None
+        )
+
+    def pagination_config(self) -> Dict[str, int]:
+        """PaginationConfig requesting the largest page the model allows."""
+        if self.paginated and self.limit_key and self.max_page_size:
+            return {"PageSize": self.max_page_size}
+        return {}
+
+
+class OperationPlanIndex:
+    """Thread-safe, disk-backed index of OperationPlans per service."""
+
+    def __init__(self, index_dir: Optional[str] = None):
+        """
+        Initialize the index.
+
+        Args:
+            index_dir: Directory for the compiled index, or None to keep it
+                in memory for this process only
+        """
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.index_file = (
+            self.index_dir / f"operation_plans_{botocore.__version__}.json"
+            if self.index_dir
+            else None
+        )
+        self._lock = threading.Lock()
+        self._botocore_session = None
+        self._plans: Dict[str, Dict[str, OperationPlan]] = self._load()
+        self._stats = {"services_compiled": 0, "lookups": 0}
+
+    def get_service_plans(self, client) -> Dict[str, OperationPlan]:
+        """Return the plans for every operation of a client's service."""
+        service_name = client.meta.service_model.service_name
+        with self._lock:
+            self._stats["lookups"] += 1
+            plans = self._plans.get(service_name)
+        if plans is not None:
+            return plans
+
+        plans = self._compile_service(client.meta.service_model)
+        with self._lock:
+            self._plans[service_name] = plans
+            self._stats["services_compiled"] += 1
+            self._save()
+        return plans
+
+    def get_plan(self, client, operation_name: str) -> Optional[OperationPlan]:
+        """Return the plan for one operation (PascalCase or snake_case name)."""
+        plans = self.get_service_plans(client)
+        plan = plans.get(operation_name)
+        if plan is None:
+            plan = next(
+                (p for p in plans.values() if p.method_name == operation_name), None
+            )
+        return plan
+
+    def get_discovery_operations(self, client) -> List[OperationPlan]:
+        """Return list operations callable without input, List* first."""
+        candidates = [
+            plan
+            for plan in self.get_service_plans(client).values()
+            if plan.is_discovery_candidate
+        ]
+        return sorted(candidates, key=lambda p: (_prefix_rank(p.name), p.name))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return index size and lookup counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["indexed_services"] = len(self._plans)
+        stats["botocore_version"] = botocore.__version__
+        return stats
+
+    def _compile_service(self, service_model) -> Dict[str, OperationPlan]:
+        """Build the plans for every operation in a botocore ServiceModel."""
+        paginator_model = self._get_paginator_model(service_model)
+        plans = {}
+
+        for operation_name in service_model.operation_names:
+            try:
+                operation_model = service_model.operation_model(operation_name)
+                plans[operation_name] = self._compile_operation(
+                    operation_model, paginator_model
+                )
+            except Exception as e:
+                logger.debug(f"Could not index {operation_name}: {e}")
+
+        return plans
+
+    def _compile_operation(self, operation_model, paginator_model) -> OperationPlan:
+        input_shape = operation_model.input_shape
+        output_shape = operation_model.output_shape
+
+        pagination = None
+        if paginator_model is not None:
+            try:
+                pagination = paginator_model.get_paginator(operation_model.name)
+            except ValueError:
+                pagination = None
+
+        limit_key = pagination.get("limit_key") if pagination else None
+        max_page_size = None
+        if limit_key and input_shape is not None and limit_key in input_shape.members:
+            max_page_size = input_shape.members[limit_key].metadata.get("max")
+
+        return OperationPlan(
+            name=operation_model.name,
+            method_name=botocore.xform_name(operation_model.name),
+            requires_input=bool(input_shape and input_shape.required_members),
+            paginated=pagination is not None,
+            limit_key=limit_key,
+            max_page_size=max_page_size,
+            result_key=self._find_result_key(output_shape, pagination),
+        )
+
+    @staticmethod
+    def _find_result_key(output_shape, pagination: Optional[Dict]) -> Optional[str]:
+        """Pick the output member holding the resource list."""
+        if pagination and pagination.get("result_key"):
+            result_key = pagination["result_key"]
+            if isinstance(result_key, list):
+                result_key = result_key[0]
+            # Keep the top-level member of JMESPath keys like Reservations[].Instances
+            return result_key.split(".")[0].split("[")[0]
+
+        if output_shape is None:
+            return None
+
+        list_members = [
+            (name, shape)
+            for name, shape in output_shape.members.items()
+            if shape.type_name == "list" and name not in _TOKEN_MEMBERS
+        ]
+        for name, shape in list_members:
+            if shape.member.type_name == "structure":
+                return name
+        return list_members[0][0] if list_members else None
+
+    def _get_paginator_model(self, service_model):
+        with self._lock:
+            if self._botocore_session is None:
+                self._botocore_session = botocore.session.get_session()
+            session = self._botocore_session
+        try:
+            return session.get_paginator_model(
+                service_model.service_name, service_model.api_version
+            )
+        except Exception:
+            # Service ships no paginators
+            return None
+
+    def _load(self) -> Dict[str, Dict[str, OperationPlan]]:
+        if self.index_file is None or not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, "r") as f:
+                data = json.load(f)
+            return {
+                service: {name: OperationPlan(**plan) for name, plan in ops.items()}
+                for service, ops in data.items()
+            }
+        except Exception as e:
+            logger.warning(f"Could not load operation plan index: {e}")
+            return {}
+
+    def _save(self):
+        if self.index_file is None:
+            return
+        data = {
+            service: {name: asdict(plan) for name, plan in ops.items()}
+            for service, ops in self._plans.items()
+        }
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            # The in-memory index still serves this run
+            logger.debug(f"Could not save operation plan index: {e}")
+
+
+_shared_index: Optional[OperationPlanIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_operation_index() -> OperationPlanIndex:
+    """Return the process-wide in-memory operation plan index."""
+    global _shared_index
+
+    if _shared_index is None:
+        with _shared_index_lock:
+            if _shared_index is None:
+                _shared_index = OperationPlanIndex()
+    return _shared_index
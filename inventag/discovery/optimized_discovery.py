@@ -920,8 +920,13 @@ class OptimizedFieldMapper(IntelligentFieldMapper):
 class OptimizedAWSDiscovery(IntelligentAWSDiscovery):
     """Optimized discovery system with enhanced service coverage, region handling, and AWS managed resource filtering."""
 
-    def __init__(self, session: boto3.Session = None, regions: List[str] = None):
-        super().__init__(session, regions)
+    def __init__(
+        self,
+        session: boto3.Session = None,
+        regions: List[str] = None,
+        owner_scoped: bool = True,
+    ):
+        super().__init__(session, regions, owner_scoped=owner_scoped)
         self.field_mapper = OptimizedFieldMapper()
 
         # Priority services that had issues in the original system
@@ -965,7 +970,9 @@ class OptimizedAWSDiscovery(IntelligentAWSDiscovery):
             self._clients_in_progress.add(client_key)
 
         try:
-            client = self.session.client(service_name, region_name=region)
+            client = self.client_pool.get_client(
+                self.session, service_name, region_name=region
+            )
             return client
         except Exception as e:
             self.logger.error(
@@ -1176,10 +1183,10 @@ class OptimizedAWSDiscovery(IntelligentAWSDiscovery):
 
         try:
             # Get the operation
-            operation = getattr(client, self._snake_case(operation_name))
+            operation = getattr(client, self._pascal_to_snake_case(operation_name))
 
-            # Call the operation
-            response = operation()
+            # Call the operation, scoped to account-owned resources if supported
+            response = operation(**self._get_request_params(client, operation_name))
 
             # Extract resources from response
             resources = self._extract_resources_from_response_enhanced(
@@ -20,6 +20,11 @@ from dataclasses import dataclass
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from .client_pool import get_client_pool
+from .operation_index import OperationPlanIndex, get_operation_index
+from .owner_scope import apply_owner_scope, client_service_name
+from .response_cache import APIResponseCache
+
 
 @dataclass
 class DiscoveryResult:
@@ -37,13 +42,28 @@ class DiscoveryResult:
 class OptimizedDynamicDiscovery:
     """High-performance dynamic discovery with parallel processing and caching."""
 
-    def __init__(self, session: boto3.Session = None, max_workers: int = 20):
+    def __init__(
+        self,
+        session: boto3.Session = None,
+        max_workers: int = 20,
+        response_cache: Optional[APIResponseCache] = None,
+        owner_scoped: bool = True,
+        operation_index: Optional[OperationPlanIndex] = None,
+    ):
         self.session = session or boto3.Session()
+        self.client_pool = get_client_pool()
+        self.operation_index = operation_index or get_operation_index()
+        self.response_cache = response_cache
+        # Request only account-owned resources where the API supports it
+        self.owner_scoped = owner_scoped
         self.logger = logging.getLogger(__name__)
         self.max_workers = max_workers
+        self.client_pool.ensure_capacity(max_workers)
+
+        # Pages fetched per paginated operation
+        self.max_pages_per_operation = 5
 
         # Performance caches
-        self._client_cache = {}
         self._operation_cache = {}
         self._successful_operations = {}
         self._failed_services = set()
@@ -323,22 +343,13 @@ class OptimizedDynamicDiscovery:
             )
 
     def _get_cached_client(self, service_name: str, region: str):
-        """Get cached AWS service client or create new one."""
-        cache_key = f"{service_name}:{region}"
-
-        with self._cache_lock:
-            if cache_key in self._client_cache:
-                return self._client_cache[cache_key]
-
+        """Get a client for the service from the shared client pool."""
         try:
             # Map service name to client name
             client_name = self._get_client_name(service_name)
-            client = self.session.client(client_name, region_name=region)
-
-            with self._cache_lock:
-                self._client_cache[cache_key] = client
-
-            return client
+            return self.client_pool.get_client(
+                self.session, client_name, region_name=region
+            )
 
         except Exception as e:
             self.logger.debug(f"Failed to create client for {service_name}: {e}")
@@ -368,7 +379,11 @@ class OptimizedDynamicDiscovery:
         # If no known operations, discover them
         if not operations:
             try:
-                available_operations = client._service_model.operation_names
+                # Only operations callable without input that return a list
+                available_operations = [
+                    plan.name
+                    for plan in self.operation_index.get_discovery_operations(client)
+                ]
 
                 # Prioritize List and Describe operations
                 list_ops = [op for op in available_operations if op.startswith("List")]
@@ -394,28 +409,32 @@ class OptimizedDynamicDiscovery:
     ) -> List[Dict]:
         """Execute AWS operation with intelligent result processing."""
         try:
-            # Get the operation
-            operation = getattr(client, self._snake_case(operation_name))
+            method_name = self._snake_case(operation_name)
+            plan = self._get_operation_plan(client, operation_name)
+            result_key = plan.result_key if plan else None
+            params = {}
+            if self.owner_scoped and client_service_name(client):
+                params = apply_owner_scope(client_service_name(client), operation_name)
 
             # Handle paginated operations
-            if hasattr(client, "get_paginator"):
+            if hasattr(client, "get_paginator") and (plan is None or plan.paginated):
                 try:
-                    paginator = client.get_paginator(self._snake_case(operation_name))
+                    paginator = client.get_paginator(method_name)
                     resources = []
 
-                    page_count = 0
-                    for page in paginator.paginate():
-                        page_count += 1
+                    for page in self._fetch_pages_cached(
+                        client,
+                        method_name,
+                        paginator,
+                        plan.pagination_config() if plan else None,
+                        params,
+                    ):
                         resources.extend(
                             self._extract_resources_from_response(
-                                page, service_name, region, operation_name
+                                page, service_name, region, operation_name, result_key
                             )
                         )
 
-                        # Limit pages to avoid excessive API calls
-                        if page_count >= 5:
-                            break
-
                     return resources
 
                 except Exception:
@@ -423,9 +442,9 @@ class OptimizedDynamicDiscovery:
                     pass
 
             # Direct operation call
-            response = operation()
+            response = self._call_operation_cached(client, method_name, params)
             return self._extract_resources_from_response(
-                response, service_name, region, operation_name
+                response, service_name, region, operation_name, result_key
             )
 
         except ClientError as e:
@@ -441,10 +460,84 @@ class OptimizedDynamicDiscovery:
             self.logger.debug(f"Operation error in {operation_name}: {e}")
             return []
 
+    def _get_operation_plan(self, client, operation_name: str):
+        """Return the compiled plan for an operation, if it can be indexed."""
+        try:
+            return self.operation_index.get_plan(client, operation_name)
+        except Exception:
+            return None
+
+    def _fetch_pages_cached(
+        self,
+        client,
+        method_name: str,
+        paginator,
+        pagination_config: Optional[Dict[str, int]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict]:
+        """Fetch up to ``max_pages_per_operation`` pages via the response cache."""
+        params = params or {}
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.operation_key(
+                self.session, client, method_name, params
+            )
+            cached_pages = self.response_cache.get_pages(
+                *cache_key, max_pages=self.max_pages_per_operation
+            )
+            if cached_pages is not None:
+                return cached_pages
+
+        pages = []
+        complete = True
+        paginate_kwargs = dict(params)
+        if pagination_config:
+            paginate_kwargs["PaginationConfig"] = pagination_config
+        for page in paginator.paginate(**paginate_kwargs):
+            pages.append(page)
+
+            # Limit pages to avoid excessive API calls
+            if len(pages) >= self.max_pages_per_operation:
+                complete = False
+                break
+
+        if cache_key is not None:
+            self.response_cache.put_pages(*cache_key, pages, complete=complete)
+        return pages
+
+    def _call_operation_cached(
+        self, client, method_name: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict:
+        """Call a non-paginated operation via the response cache."""
+        params = params or {}
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache.operation_key(
+                self.session, client, method_name, params
+            )
+            cached_pages = self.response_cache.get_pages(*cache_key, max_pages=1)
+            if cached_pages is not None:
+                return cached_pages[0]
+
+        response = getattr(client, method_name)(**params)
+
+        if cache_key is not None:
+            self.response_cache.put_pages(*cache_key, [response])
+        return response
+
     def _extract_resources_from_response(
-        self, response: Dict, service_name: str, region: str, operation_name: str
+        self,
+        response: Dict,
+        service_name: str,
+        region: str,
+        operation_name: str,
+        result_key: Optional[str] = None,
     ) -> List[Dict]:
-        """Extract resource information from AWS API response."""
+        """Extract resource information from AWS API response.
+
+        ``result_key`` is the output member the operation plan index recorded
+        as holding the resource list; it is checked before the common keys.
+        """
         resources = []
 
         # Common response keys that contain resource lists
@@ -478,6 +571,8 @@ class OptimizedDynamicDiscovery:
             "Certificates",
             "Stacks",
         ]
+        if result_key:
+            resource_keys.insert(0, result_key)
 
         for key in resource_keys:
             if key in response:
@@ -614,11 +709,14 @@ class OptimizedDynamicDiscovery:
             if operation_name not in self._successful_operations[service_name]:
                 self._successful_operations[service_name].append(operation_name)
 
-    def _get_cache_stats(self) -> Dict[str, int]:
+    def _get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for performance monitoring."""
+        pool_stats = self.client_pool.get_statistics()
         with self._cache_lock:
-            return {
-                "client_cache_size": len(self._client_cache),
+            stats = {
+                "client_cache_size": pool_stats["cached_clients"],
+                "client_pool_hits": pool_stats["hits"],
+                "client_pool_misses": pool_stats["misses"],
                 "operation_cache_size": len(self._operation_cache),
                 "successful_operations": sum(
                     len(ops) for ops in self._successful_operations.values()
@@ -626,6 +724,14 @@ class OptimizedDynamicDiscovery:
                 "failed_services": len(self._failed_services),
             }
 
+        if self.response_cache is not None:
+            response_stats = self.response_cache.get_statistics()
+            stats["response_cache_hits"] = response_stats["hits"]
+            stats["response_cache_misses"] = (
+                response_stats["misses"] + response_stats["expired"]
+            )
+        return stats
+
     @staticmethod
     def _snake_case(camel_case: str) -> str:
         """Convert CamelCase to snake_case."""
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Owner-Scoped Discovery Parameters
+
+Declarative table of request parameters that limit List/Describe results to
+resources owned by the calling account, so AWS-managed and public items (IAM
+managed policies, public AMIs and snapshots, Amazon-owned SSM documents, ...)
+are never downloaded. The managed-resource filters in OptimizedFieldMapper
+remain as a safety net for operations without such parameters.
+
+Keys are (botocore service name, PascalCase operation name).
+"""
+
+from typing import Any, Dict, Optional
+
+import botocore
+
+OWNER_SCOPED_PARAMETERS: Dict[tuple, Dict[str, Any]] = {
+    ("iam", "ListPolicies"): {"Scope": "Local"},
+    ("ec2", "DescribeImages"): {"Owners": ["self"]},
+    ("ec2", "DescribeSnapshots"): {"OwnerIds": ["self"]},
+    ("ec2", "DescribeFpgaImages"): {"Owners": ["self"]},
+    ("rds", "DescribeDBSnapshots"): {"IncludeShared": False, "IncludePublic": False},
+    ("rds", "DescribeDBClusterSnapshots"): {
+        "IncludeShared": False,
+        "IncludePublic": False,
+    },
+    ("ssm", "ListDocuments"): {"Filters": [{"Key": "Owner", "Values": ["Self"]}]},
+    ("ssm", "DescribePatchBaselines"): {
+        "Filters": [{"Key": "OWNER", "Values": ["Self"]}]
+    },
+    ("cloudformation", "ListTypes"): {"Visibility": "PRIVATE"},
+    ("ram", "GetResourceShares"): {"resourceOwner": "SELF"},
+    ("ram", "ListResources"): {"resourceOwner": "SELF"},
+    ("imagebuilder", "ListImages"): {"owner": "Self"},
+    ("imagebuilder", "ListComponents"): {"owner": "Self"},
+    ("imagebuilder", "ListImageRecipes"): {"owner": "Self"},
+    ("imagebuilder", "ListContainerRecipes"): {"owner": "Self"},
+}
+
+# snake_case method name -> PascalCase operation name, per service
+_METHOD_TO_OPERATION = {
+    (service, botocore.xform_name(operation)): operation
+    for service, operation in OWNER_SCOPED_PARAMETERS
+}
+
+
+def get_owner_scope_params(service_name: str, operation_name: str) -> Dict[str, Any]:
+    """
+    Return the owner-scoping parameters for an operation (empty if none).
+
+    Args:
+        service_name: botocore service name, e.g. ``ec2``
+        operation_name: PascalCase operation or snake_case client method name
+    """
+    service = str(service_name).lower()
+    operation = _METHOD_TO_OPERATION.get((service, operation_name), operation_name)
+    params = OWNER_SCOPED_PARAMETERS.get((service, operation), {})
+    # Callers may mutate their request parameters
+    return {key: _copy_value(value) for key, value in params.items()}
+
+
+def apply_owner_scope(
+    service_name: str, operation_name: str, params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Merge owner-scoping parameters under explicitly given request parameters."""
+    scoped = get_owner_scope_params(service_name, operation_name)
+    scoped.update(params or {})
+    return scoped
+
+
+def client_service_name(client) -> Optional[str]:
+    """Return the botocore service name of a client, if it can be determined."""
+    try:
+        name = client.meta.service_model.service_name
+    except AttributeError:
+        return None
+    return name if isinstance(name, str) else None
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    return value
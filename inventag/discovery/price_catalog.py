@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+InvenTag - Price Catalog
+Local, indexed store of AWS on-demand prices built from bulk price-list offer files.
+
+The AWS Price List bulk API publishes one offer file per service (and per
+region) in JSON and CSV form. Ingesting those files into a SQLite catalog
+turns cost estimation into an indexed lookup on (service code, location,
+instance type, usage type) with no Pricing API calls. Offer files are
+re-ingested on a schedule; every (service, location) pair records when it was
+last refreshed so stale catalogs can be detected.
+
+CSV offer files are streamed row by row. JSON offer files are parsed whole
+(the standard library has no incremental JSON parser), so the CSV format is
+the one to use for large offers such as AmazonEC2, whose files run to
+gigabytes.
+
+Attribute names are normalized to lowercase alphanumerics, so the JSON
+attribute ``operatingSystem``, the CSV column ``Operating System`` and the
+Pricing API filter field ``operating-system`` all refer to the same attribute.
+"""
+
+import csv
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = timedelta(days=7)
+
+# JSON offer files above this size are loaded with a warning to use the CSV one
+LARGE_JSON_OFFER_BYTES = 256 * 1024 * 1024
+
+# Attributes stored in their own indexed columns rather than in the JSON blob
+INDEXED_ATTRIBUTES = ("location", "instancetype", "usagetype")
+
+# CSV columns that describe the price term rather than the product
+CSV_TERM_COLUMNS = {
+    "SKU",
+    "OfferTermCode",
+    "RateCode",
+    "TermType",
+    "PriceDescription",
+    "EffectiveDate",
+    "StartingRange",
+    "EndingRange",
+    "Unit",
+    "PricePerUnit",
+    "Currency",
+    "LeaseContractLength",
+    "PurchaseOption",
+    "OfferingClass",
+    "RelatedTo",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    service_code TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    location TEXT,
+    instance_type TEXT,
+    usage_type TEXT,
+    product_family TEXT,
+    attributes TEXT NOT NULL,
+    price_per_unit TEXT NOT NULL,
+    unit TEXT,
+    PRIMARY KEY (service_code, sku)
+);
+CREATE INDEX IF NOT EXISTS idx_prices_lookup
+    ON prices (service_code, location, instance_type, usage_type);
+CREATE TABLE IF NOT EXISTS offers (
+    service_code TEXT NOT NULL,
+    location TEXT NOT NULL,
+    version TEXT,
+    publication_date TEXT,
+    source TEXT,
+    product_count INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL,
+    PRIMARY KEY (service_code, location)
+);
+"""
+
+
+def normalize_attribute_name(name: str) -> str:
+    """Return the comparable form of a price-list attribute or column name."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+@dataclass
+class CatalogPrice:
+    """On-demand price of a single product in the catalog."""
+
+    service_code: str
+    sku: str
+    price_per_unit: Decimal
+    unit: str
+    attributes: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class OfferFileSummary:
+    """Result of ingesting one offer file."""
+
+    service_code: str
+    source: str
+    version: Optional[str]
+    publication_date: Optional[str]
+    product_count: int
+    locations: List[str] = field(default_factory=list)
+
+
+class PriceCatalog:
+    """Thread-safe SQLite catalog of on-demand prices from AWS offer files."""
+
+    def __init__(self, path: str = ":memory:", max_age: timedelta = DEFAULT_MAX_AGE):
+        """
+        Open (or create) a price catalog.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a throwaway catalog
+            max_age: Age after which ingested offers are considered stale
+        """
+        self.path = path
+        self.max_age = max_age
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "PriceCatalog":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def ingest_offer_file(self, path: str) -> OfferFileSummary:
+        """
+        Load a bulk price-list offer file into the catalog.
+
+        JSON and CSV offer files are both accepted; the format is chosen from
+        the file extension. CSV files are streamed, while JSON files are read
+        into memory whole, so prefer CSV for large offers. Prices already
+        stored for the file's service and locations are replaced, so
+        re-ingesting a newer file refreshes them.
+
+        Args:
+            path: Path of the offer file
+
+        Returns:
+            OfferFileSummary describing what was loaded
+        """
+        if path.lower().endswith(".csv"):
+            metadata, rows = _read_csv_offer(path)
+        else:
+            metadata, rows = _read_json_offer(path)
+
+        service_code = metadata.get("offerCode")
+        if not service_code:
+            raise ValueError(f"Offer file {path} does not name its service")
+
+        ingested_at = datetime.now(timezone.utc).isoformat()
+        source = os.path.basename(path)
+
+        # Rows are staged first so that only the locations present in the
+        # file are replaced; CSV rows reach SQLite without being collected
+        with self._lock, self._connection:
+            connection = self._connection
+            connection.execute("DROP TABLE IF EXISTS temp.staged_prices")
+            connection.execute(
+                "CREATE TEMP TABLE staged_prices AS SELECT * FROM prices WHERE 0"
+            )
+            connection.executemany(
+                "INSERT INTO staged_prices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (_record_values(service_code, record) for record in rows),
+            )
+            counts = connection.execute(
+                "SELECT COALESCE(location, ''), COUNT(*) FROM staged_prices "
+                "GROUP BY COALESCE(location, '') ORDER BY 1"
+            ).fetchall()
+            connection.executemany(
+                "DELETE FROM prices WHERE service_code = ? AND "
+                "COALESCE(location, '') = ?",
+                [(service_code, location) for location, _ in counts],
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO prices SELECT * FROM staged_prices"
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO offers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        service_code,
+                        location,
+                        metadata.get("version"),
+                        metadata.get("publicationDate"),
+                        source,
+                        count,
+                        ingested_at,
+                    )
+                    for location, count in counts
+                ],
+            )
+            connection.execute("DROP TABLE temp.staged_prices")
+
+        locations = [location for location, _ in counts]
+        product_count = sum(count for _, count in counts)
+        logger.info(
+            f"Ingested {product_count} {service_code} prices from {source} "
+            f"for {len(locations)} location(s)"
+        )
+        return OfferFileSummary(
+            service_code=service_code,
+            source=source,
+            version=metadata.get("version"),
+            publication_date=metadata.get("publicationDate"),
+            product_count=product_count,
+            locations=[location for location in locations if location],
+        )
+
+    def ingest_offer_files(self, paths: Iterable[str]) -> List[OfferFileSummary]:
+        """Load several offer files, returning a summary for each."""
+        return [self.ingest_offer_file(path) for path in paths]
+
+    def lookup(
+        self,
+        service_code: str,
+        location: Optional[str] = None,
+        attributes: Optional[Dict[str, str]] = None,
+    ) -> Optional[CatalogPrice]:
+        """
+        Return the on-demand price of the product matching the given attributes.
+
+        Location, instance type and usage type are matched through the index;
+        any other attributes are compared case-insensitively against the
+        stored product attributes. Among several matches a non-zero price is
+        preferred, then the lowest SKU, so lookups are deterministic.
+
+        Args:
+            service_code: Price-list service code, e.g. "AmazonEC2"
+            location: Price-list location name, e.g. "US East (N. Virginia)"
+            attributes: Further product attributes to match
+
+        Returns:
+            CatalogPrice for the best match, or None if nothing matches
+        """
+        wanted = {
+            normalize_attribute_name(name): str(value)
+            for name, value in (attributes or {}).items()
+        }
+        if location is not None:
+            wanted["location"] = location
+
+        clauses = ["service_code = ?"]
+        parameters: List[Any] = [service_code]
+        for attribute, column in zip(
+            INDEXED_ATTRIBUTES, ("location", "instance_type", "usage_type")
+        ):
+            if attribute in wanted:
+                clauses.append(f"{column} = ? COLLATE NOCASE")
+                parameters.append(wanted.pop(attribute))
+
+        query = (
+            "SELECT sku, attributes, price_per_unit, unit FROM prices WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY CAST(price_per_unit AS REAL) = 0, sku"
+        )
+        expected = {name: value.casefold() for name, value in wanted.items()}
+
+        with self._lock:
+            cursor = self._connection.execute(query, parameters)
+            for sku, stored_attributes, price_per_unit, unit in cursor:
+                product_attributes = json.loads(stored_attributes)
+                if all(
+                    product_attributes.get(name, "").casefold() == value
+                    for name, value in expected.items()
+                ):
+                    return CatalogPrice(
+                        service_code=service_code,
+                        sku=sku,
+                        price_per_unit=Decimal(price_per_unit),
+                        unit=unit or "",
+                        attributes=product_attributes,
+                    )
+        return None
+
+    def has_offer(self, service_code: str, location: Optional[str] = None) -> bool:
+        """Return whether an offer file for the service (and location) was ingested."""
+        query = "SELECT 1 FROM offers WHERE service_code = ?"
+        parameters: List[Any] = [service_code]
+        if location is not None:
+            query += " AND location = ?"
+            parameters.append(location)
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchone() is not None
+
+    def last_refreshed(self, service_code: Optional[str] = None) -> Optional[datetime]:
+        """Return when the least recently ingested matching offer was loaded."""
+        query = "SELECT MIN(ingested_at) FROM offers"
+        parameters: List[Any] = []
+        if service_code is not None:
+            query += " WHERE service_code = ?"
+            parameters.append(service_code)
+        with self._lock:
+            (oldest,) = self._connection.execute(query, parameters).fetchone()
+        return datetime.fromisoformat(oldest) if oldest else None
+
+    def is_stale(self, service_code: Optional[str] = None) -> bool:
+        """Return whether the catalog is empty or older than its max age."""
+        refreshed = self.last_refreshed(service_code)
+        if refreshed is None:
+            return True
+        return datetime.now(timezone.utc) - refreshed > self.max_age
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM prices").fetchone()[0]
+
+
+def _record_values(service_code: str, record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the prices table row for a parsed offer record."""
+    attributes = record["attributes"]
+    return (
+        service_code,
+        record["sku"],
+        attributes.get("location"),
+        attributes.get("instancetype"),
+        attributes.get("usagetype"),
+        record.get("product_family"),
+        json.dumps(attributes, sort_keys=True),
+        str(record["price_per_unit"]),
+        record.get("unit"),
+    )
+
+
+def _parse_price(value: Any) -> Optional[Decimal]:
+    """Return a price as Decimal, or None if it is missing or malformed."""
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+
+
+def _first_tier_dimension(terms: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the USD price dimension of the first usage tier of an on-demand term."""
+    for term in terms.values():
+        dimensions = [
+            dimension
+            for dimension in term.get("priceDimensions", {}).values()
+            if "USD" in dimension.get("pricePerUnit", {})
+        ]
+        for dimension in dimensions:
+            if str(dimension.get("beginRange", "0")) in ("0", ""):
+                return dimension
+        if dimensions:
+            return dimensions[0]
+    return None
+
+
+def _read_json_offer(
+    path: str,
+) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """
+    Read a JSON offer file, returning its metadata and on-demand product records.
+
+    The whole file is parsed into memory; large offers should be ingested
+    from their CSV offer file instead.
+    """
+    size = os.path.getsize(path)
+    if size > LARGE_JSON_OFFER_BYTES:
+        logger.warning(
+            f"Loading {size // (1024 * 1024)} MB JSON offer file {path} into "
+            f"memory; use the service's CSV offer file to stream it instead"
+        )
+    with open(path, "r", encoding="utf-8") as f:
+        offer = json.load(f)
+
+    metadata = {
+        "offerCode": offer.get("offerCode"),
+        "version": offer.get("version"),
+        "publicationDate": offer.get("publicationDate"),
+    }
+    on_demand = offer.get("terms", {}).get("OnDemand", {})
+
+    def records() -> Iterator[Dict[str, Any]]:
+        for sku, product in offer.get("products", {}).items():
+            dimension = _first_tier_dimension(on_demand.get(sku, {}))
+            if dimension is None:
+                continue
+            price = _parse_price(dimension["pricePerUnit"]["USD"])
+            if price is None:
+                continue
+            yield {
+                "sku": sku,
+                "product_family": product.get("productFamily"),
+                "attributes": {
+                    normalize_attribute_name(name): str(value)
+                    for name, value in product.get("attributes", {}).items()
+                },
+                "price_per_unit": price,
+                "unit": dimension.get("unit"),
+            }
+
+    return metadata, records()
+
+
+def _read_csv_offer(
+    path: str,
+) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    """
+    Read a CSV offer file, returning its metadata and on-demand product records.
+
+    CSV offer files start with a few "key","value" metadata lines before the
+    column header row. Rows are streamed, so large offer files are not held
+    in memory; only the first usage tier of each SKU's on-demand term is kept.
+    """
+    f = open(path, "r", encoding="utf-8", newline="")
+    reader = csv.reader(f)
+
+    metadata: Dict[str, Any] = {}
+    header: Optional[List[str]] = None
+    for line in reader:
+        if line and line[0] == "SKU":
+            header = line
+            break
+        if len(line) >= 2:
+            key = line[0].replace(" ", "")
+            metadata[key[0].lower() + key[1:] if key else key] = line[1]
+    if header is None:
+        f.close()
+        raise ValueError(f"Offer file {path} has no column header row")
+
+    columns = {name: position for position, name in enumerate(header)}
+    attribute_columns = [
+        (normalize_attribute_name(name), position)
+        for position, name in enumerate(header)
+        if name not in CSV_TERM_COLUMNS
+    ]
+
+    def cell(row: List[str], name: str) -> str:
+        position = columns.get(name)
+        return row[position] if position is not None and position < len(row) else ""
+
+    def records() -> Iterator[Dict[str, Any]]:
+        seen = set()
+        try:
+            for row in reader:
+                sku = cell(row, "SKU")
+                if not sku or sku in seen or cell(row, "TermType") != "OnDemand":
+                    continue
+                if cell(row, "Currency") not in ("", "USD"):
+                    continue
+                if cell(row, "StartingRange") not in ("", "0"):
+                    continue
+                price = _parse_price(cell(row, "PricePerUnit"))
+                if price is None:
+                    continue
+                seen.add(sku)
+                attributes = {
+                    name: row[position]
+                    for name, position in attribute_columns
+                    if position < len(row) and row[position]
+                }
+                yield {
+                    "sku": sku,
+                    "product_family": attributes.get("productfamily"),
+                    "attributes": attributes,
+                    "price_per_unit": price,
+                    "unit": cell(row, "Unit"),
+                }
+        finally:
+            f.close()
+
+    return metadata, records()
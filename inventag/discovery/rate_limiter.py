@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Adaptive Rate Limiter
+
+Throttle-aware token buckets for AWS API calls, one per (service, region).
+
+Each bucket follows an AIMD policy: its refill rate grows additively after every
+successful call and is cut multiplicatively whenever the API reports throttling.
+Combined with botocore's adaptive retry mode this keeps discovery close to the
+highest request rate each API will sustain without dropping work to throttling.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# Error codes AWS services use to signal request throttling (mirrors botocore's
+# own retry classification)
+THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "RequestThrottled",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+    "TransactionInProgressException",
+    "SlowDown",
+    "BandwidthLimitExceeded",
+    "LimitExceededException",
+    "EC2ThrottledException",
+    "PriorRequestNotComplete",
+}
+
+# botocore client config enabling client-side adaptive retries
+ADAPTIVE_RETRY_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Check whether an exception is an AWS throttling error."""
+    if not isinstance(error, ClientError):
+        return False
+    error_code = error.response.get("Error", {}).get("Code", "")
+    return error_code in THROTTLING_ERROR_CODES
+
+
+class TokenBucket:
+    """Token bucket whose refill rate can be adjusted at runtime."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last_refill) * self.rate
+                )
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+
+                sleep_for = (1 - self.tokens) / self.rate
+
+            time.sleep(sleep_for)
+            waited += sleep_for
+
+    def set_rate(self, rate: float):
+        """Change the refill rate; burst capacity follows the rate."""
+        with self._lock:
+            self.rate = rate
+            self.capacity = max(1.0, rate)
+            self.tokens = min(self.tokens, self.capacity)
+
+
+class AdaptiveRateLimiter:
+    """Per-key AIMD token buckets with throttle and wait-time accounting."""
+
+    def __init__(
+        self,
+        initial_rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        additive_increase: float = 0.5,
+        multiplicative_decrease: float = 0.5,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            initial_rate: Starting requests per second for each key
+            min_rate: Floor the rate never drops below
+            max_rate: Ceiling the rate never grows above
+            additive_increase: Requests per second added after each success
+            multiplicative_decrease: Factor applied to the rate on throttling
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+
+        self._buckets: Dict[Hashable, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "throttle_events": 0,
+            "wait_time_seconds": 0.0,
+        }
+        self._throttles_by_key: Dict[Hashable, int] = {}
+
+    def acquire(self, key: Hashable) -> float:
+        """Wait for permission to issue a request for ``key``."""
+        waited = self._get_bucket(key).acquire()
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["wait_time_seconds"] += waited
+        return waited
+
+    def record_success(self, key: Hashable):
+        """Additively grow the rate for ``key`` after a successful request."""
+        bucket = self._get_bucket(key)
+        if bucket.rate < self.max_rate:
+            bucket.set_rate(min(self.max_rate, bucket.rate + self.additive_increase))
+
+    def record_throttle(self, key: Hashable):
+        """Multiplicatively shrink the rate for ``key`` after throttling."""
+        bucket = self._get_bucket(key)
+        new_rate = max(self.min_rate, bucket.rate * self.multiplicative_decrease)
+        bucket.set_rate(new_rate)
+
+        with self._lock:
+            self._stats["throttle_events"] += 1
+            self._throttles_by_key[key] = self._throttles_by_key.get(key, 0) + 1
+
+        logger.debug(f"Throttled on {key}; reducing rate to {new_rate:.2f} req/s")
+
+    def get_rate(self, key: Hashable) -> Optional[float]:
+        """Return the current rate for ``key`` if it has been used."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+        return bucket.rate if bucket else None
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return request, throttle and wait-time statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["throttles_by_key"] = {
+                self._format_key(key): count
+                for key, count in self._throttles_by_key.items()
+            }
+            stats["throttled_keys"] = len(self._throttles_by_key)
+        return stats
+
+    def _get_bucket(self, key: Hashable) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.initial_rate, max(1.0, self.initial_rate))
+                self._buckets[key] = bucket
+            return bucket
+
+    @staticmethod
+    def _format_key(key: Hashable) -> str:
+        if isinstance(key, tuple):
+            return ":".join(str(part) for part in key)
+        return str(key)
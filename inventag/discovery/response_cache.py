@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Persistent API Response Cache
+
+Opt-in on-disk cache of List/Describe responses so repeated runs (for example
+several report formats generated within the hour) do not re-issue every call.
+
+Each response page is stored as one JSON file keyed by
+(account, region, client, operation, params, page token). Pages are chained by
+their continuation token, so a cached pagination is only served when every page
+is present and unexpired; otherwise the operation is fetched live and the chain
+rewritten. Entries expire after a per-service TTL and the oldest files are
+evicted once the cache grows past its size limit.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client_pool import get_client_pool
+
+logger = logging.getLogger(__name__)
+
+# Default lifetime of a cached response in seconds
+DEFAULT_TTL_SECONDS = 900
+
+# Slow-changing services keep their responses longer (botocore client names)
+DEFAULT_SERVICE_TTLS = {
+    "iam": 86400,
+    "organizations": 86400,
+    "route53": 21600,
+    "cloudfront": 21600,
+    "s3": 3600,
+}
+
+# Response keys carrying the continuation token of the next page
+_PAGE_TOKEN_KEYS = (
+    "NextToken",
+    "nextToken",
+    "NextMarker",
+    "Marker",
+    "NextContinuationToken",
+    "NextPageToken",
+    "nextPageToken",
+    "PaginationToken",
+    "NextRecordName",
+)
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON fallback preserving datetimes and bytes from botocore responses."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+    return str(value)
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__bytes__" in obj:
+            return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+class APIResponseCache:
+    """Size-bounded on-disk cache of AWS API response pages with per-service TTLs."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        default_ttl: int = DEFAULT_TTL_SECONDS,
+        service_ttls: Optional[Dict[str, int]] = None,
+        max_size_mb: int = 256,
+        refresh_services: Optional[List[str]] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding cached response files
+            default_ttl: Lifetime in seconds for services without their own TTL
+            service_ttls: Per-service TTL overrides (botocore client names)
+            max_size_mb: Size limit before the oldest entries are evicted
+            refresh_services: Services whose cached responses are ignored (and
+                rewritten) for this run
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.service_ttls = dict(DEFAULT_SERVICE_TTLS)
+        self.service_ttls.update(service_ttls or {})
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.refresh_services = {s.lower() for s in (refresh_services or [])}
+
+        self._lock = threading.Lock()
+        self._size_bytes: Optional[int] = None
+        self._accounts = weakref.WeakKeyDictionary()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "refreshed": 0,
+            "writes": 0,
+            "evictions": 0,
+        }
+
+    def get_pages(
+        self,
+        account_id: str,
+        region: Optional[str],
+        service: str,
+        operation: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the cached response pages for an operation.
+
+        Returns None unless the whole page chain (or its first ``max_pages``
+        pages) is cached and unexpired, or when ``service`` is being refreshed.
+        """
+        if service.lower() in self.refresh_services:
+            self._increment("refreshed")
+            return None
+
+        ttl = self.get_ttl(service)
+        pages = []
+        page_token = None
+        seen_tokens = set()
+
+        while max_pages is None or len(pages) < max_pages:
+            entry = self._read_entry(
+                self._entry_path(
+                    account_id, region, service, operation, params, page_token
+                )
+            )
+            if entry is None:
+                self._increment("misses")
+                return None
+            if time.time() - entry["created_at"] > ttl:
+                self._increment("expired")
+                return None
+
+            pages.append(entry["response"])
+            page_token = entry.get("next_token")
+            if page_token is None:
+                break
+            if page_token in seen_tokens:
+                self._increment("misses")
+                return None
+            seen_tokens.add(page_token)
+
+        self._increment("hits")
+        return pages
+
+    def put_pages(
+        self,
+        account_id: str,
+        region: Optional[str],
+        service: str,
+        operation: str,
+        params: Optional[Dict[str, Any]],
+        pages: List[Dict[str, Any]],
+        complete: bool = True,
+    ):
+        """
+        Store the response pages of an operation, in request order.
+
+        Pass ``complete=False`` when pagination stopped early so the stored
+        chain is not later served as the full result.
+        """
+        page_token = None
+        for index, page in enumerate(pages):
+            next_token = self._next_page_token(page)
+            if next_token == page_token:
+                # Some APIs echo the request marker back on the last page
+                next_token = None
+            is_last = index == len(pages) - 1
+            if next_token is None and (not is_last or not complete):
+                # Token key not recognised; chain pages by position instead
+                next_token = f"#page-{index + 1}"
+
+            self._write_entry(
+                self._entry_path(
+                    account_id, region, service, operation, params, page_token
+                ),
+                {
+                    "created_at": time.time(),
+                    "service": service,
+                    "operation": operation,
+                    "next_token": next_token,
+                    "response": {
+                        k: v for k, v in page.items() if k != "ResponseMetadata"
+                    },
+                },
+            )
+            page_token = next_token
+
+        self._evict_if_needed()
+
+    def operation_key(
+        self, session, client, operation_name: str, params: Optional[Dict] = None
+    ) -> Tuple[str, Optional[str], str, str, Dict[str, Any]]:
+        """Build the (account, region, client, operation, params) key for a call."""
+        return (
+            self.get_account_id(session),
+            client.meta.region_name,
+            client.meta.service_model.service_name,
+            operation_name,
+            dict(params or {}),
+        )
+
+    def get_account_id(self, session) -> str:
+        """Return (and remember) the account a boto3 session belongs to."""
+        with self._lock:
+            account_id = self._accounts.get(session)
+        if account_id:
+            return account_id
+
+        try:
+            sts_client = get_client_pool().get_client(session, "sts")
+            account_id = sts_client.get_caller_identity()["Account"]
+        except Exception as e:
+            logger.debug(f"Could not resolve account for response cache: {e}")
+            account_id = "unknown"
+
+        with self._lock:
+            self._accounts[session] = account_id
+        return account_id
+
+    def get_ttl(self, service: str) -> int:
+        """Return the TTL in seconds for a service."""
+        return self.service_ttls.get(service.lower(), self.default_ttl)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current cache size."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["size_bytes"] = self._current_size()
+        lookups = stats["hits"] + stats["misses"] + stats["expired"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Delete every cached response."""
+        with self._lock:
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._size_bytes = 0
+
+    def _entry_path(
+        self,
+        account_id: str,
+        region: Optional[str],
+        service: str,
+        operation: str,
+        params: Optional[Dict[str, Any]],
+        page_token: Optional[str],
+    ) -> Path:
+        key = json.dumps(
+            [account_id, region, service, operation, params or {}, page_token],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    @staticmethod
+    def _next_page_token(page: Dict[str, Any]) -> Optional[str]:
+        for key in _PAGE_TOKEN_KEYS:
+            token = page.get(key)
+            if token:
+                return str(token)
+        return None
+
+    def _read_entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f, object_hook=_decode_object)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _write_entry(self, path: Path, entry: Dict[str, Any]):
+        try:
+            payload = json.dumps(entry, default=_encode_value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Response not cacheable for {entry['operation']}: {e}")
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            old_size = path.stat().st_size if path.exists() else 0
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            self._stats["writes"] += 1
+            if self._size_bytes is not None:
+                self._size_bytes += len(payload.encode("utf-8")) - old_size
+
+    def _current_size(self) -> int:
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(
+                    p.stat().st_size for p in self.cache_dir.glob("*/*.json")
+                )
+            return self._size_bytes
+
+    def _evict_if_needed(self):
+        """Delete least recently written entries until under the size limit."""
+        if self._current_size() <= self.max_size_bytes:
+            return
+
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            # Evict down to 90% so every write does not trigger a full scan
+            target = int(self.max_size_bytes * 0.9)
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                self._stats["evictions"] += 1
+
+            self._size_bytes = total
+
+    def _increment(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
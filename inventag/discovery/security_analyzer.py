@@ -19,6 +19,16 @@ from collections import defaultdict
 from botocore.exceptions import ClientError
 import logging
 
+from .client_pool import get_client_pool
+from .ec2_snapshot import get_ec2_snapshot_store
+from .exposure_engine import ExposureEngine, ResourceExposure
+from .network_topology import (
+    RESOURCE,
+    SECURITY_GROUP,
+    SECURITY_GROUP_MEMBER,
+    NetworkTopologyGraph,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,6 +108,7 @@ class SecuritySummary:
     total_nacls: int = 0
     nacl_optimization_opportunities: int = 0
     circular_dependencies: List[Tuple[str, str]] = field(default_factory=list)
+    internet_exposed_resources: Dict[str, Dict[str, str]] = field(default_factory=dict)
 
 
 class SecurityAnalyzer:
@@ -114,12 +125,31 @@ class SecurityAnalyzer:
     - Port and protocol analysis with common service identification
     """
 
-    def __init__(self, session: Optional[boto3.Session] = None):
-        """Initialize the SecurityAnalyzer."""
+    def __init__(
+        self,
+        session: Optional[boto3.Session] = None,
+        topology: Optional[NetworkTopologyGraph] = None,
+    ):
+        """Initialize the SecurityAnalyzer.
+
+        Args:
+            session: boto3 session used for the EC2 describe calls
+            topology: Graph to record security group membership in, so it can
+                be shared with the NetworkAnalyzer
+        """
         self.session = session or boto3.Session()
+        self.topology = topology if topology is not None else NetworkTopologyGraph()
+        self.client_pool = get_client_pool()
+        self.snapshot_store = get_ec2_snapshot_store()
         self.sg_cache: Dict[str, SecurityGroupAnalysis] = {}
         self.nacl_cache: Dict[str, NACLAnalysis] = {}
         self.region_clients: Dict[str, Any] = {}
+        # Compiled from the caches on first use, dropped when they are refreshed
+        self._exposure_engine: Optional[ExposureEngine] = None
+        # sg_id -> (analysis the risks were built from, risks)
+        self._permissive_rule_cache: Dict[
+            str, Tuple[SecurityGroupAnalysis, List[Dict[str, Any]]]
+        ] = {}
 
         # Common service port mappings
         self.common_services = {
@@ -209,41 +239,84 @@ class SecurityAnalyzer:
         risks = []
 
         for sg_id, sg in sg_analysis.items():
-            # Check inbound rules
-            for rule in sg.inbound_rules:
-                if rule.is_permissive:
-                    risk = {
-                        "security_group_id": sg_id,
-                        "security_group_name": sg.group_name,
-                        "rule_type": "inbound",
-                        "protocol": rule.protocol,
-                        "port_range": rule.port_range,
-                        "source": rule.source_destination,
-                        "risk_level": rule.risk_assessment,
-                        "description": rule.description,
-                        "common_service": rule.common_service,
-                    }
-                    risks.append(risk)
-
-            # Check outbound rules
-            for rule in sg.outbound_rules:
-                if rule.is_permissive:
-                    risk = {
-                        "security_group_id": sg_id,
-                        "security_group_name": sg.group_name,
-                        "rule_type": "outbound",
-                        "protocol": rule.protocol,
-                        "port_range": rule.port_range,
-                        "destination": rule.source_destination,
-                        "risk_level": rule.risk_assessment,
-                        "description": rule.description,
-                        "common_service": rule.common_service,
-                    }
-                    risks.append(risk)
+            cached = self._permissive_rule_cache.get(sg_id)
+            if cached is None or cached[0] is not sg:
+                cached = (sg, self._find_permissive_rules(sg_id, sg))
+                self._permissive_rule_cache[sg_id] = cached
+            risks.extend(cached[1])
 
         logger.info(f"Identified {len(risks)} overly permissive rules")
         return risks
 
+    def get_exposure_engine(self) -> ExposureEngine:
+        """
+        Return the exposure engine compiled from the cached groups and NACLs.
+
+        The engine is compiled once and reused until the caches are refreshed.
+        """
+        if self._exposure_engine is None:
+            self._exposure_engine = ExposureEngine(self.sg_cache, self.nacl_cache)
+        return self._exposure_engine
+
+    def analyze_resource_exposure(
+        self, resources: List[Dict[str, Any]]
+    ) -> Dict[str, ResourceExposure]:
+        """
+        Calculate the internet-reachable ports of resources.
+
+        Args:
+            resources: Resource dictionaries with security group and subnet IDs
+
+        Returns:
+            Dictionary mapping resource IDs to ResourceExposure objects
+        """
+        exposures = self.get_exposure_engine().exposure_for_resources(resources)
+        exposed = sum(1 for e in exposures.values() if e.is_internet_exposed)
+        logger.info(
+            f"{exposed} of {len(exposures)} resources have internet-reachable ports"
+        )
+        return exposures
+
+    def _find_permissive_rules(
+        self, sg_id: str, sg: SecurityGroupAnalysis
+    ) -> List[Dict[str, Any]]:
+        """Build the risk dictionaries for a security group's permissive rules."""
+        risks = []
+
+        # Check inbound rules
+        for rule in sg.inbound_rules:
+            if rule.is_permissive:
+                risk = {
+                    "security_group_id": sg_id,
+                    "security_group_name": sg.group_name,
+                    "rule_type": "inbound",
+                    "protocol": rule.protocol,
+                    "port_range": rule.port_range,
+                    "source": rule.source_destination,
+                    "risk_level": rule.risk_assessment,
+                    "description": rule.description,
+                    "common_service": rule.common_service,
+                }
+                risks.append(risk)
+
+        # Check outbound rules
+        for rule in sg.outbound_rules:
+            if rule.is_permissive:
+                risk = {
+                    "security_group_id": sg_id,
+                    "security_group_name": sg.group_name,
+                    "rule_type": "outbound",
+                    "protocol": rule.protocol,
+                    "port_range": rule.port_range,
+                    "destination": rule.source_destination,
+                    "risk_level": rule.risk_assessment,
+                    "description": rule.description,
+                    "common_service": rule.common_service,
+                }
+                risks.append(risk)
+
+        return risks
+
     def analyze_nacls(
         self, nacl_resources: List[Dict[str, Any]]
     ) -> Dict[str, NACLAnalysis]:
@@ -388,15 +461,16 @@ class SecurityAnalyzer:
 
     def _cache_security_group_info(self, region: str):
         """Cache security group information for a region."""
+        self._exposure_engine = None
         try:
             logger.info(f"Caching security group information for region: {region}")
-            ec2 = self.session.client("ec2", region_name=region)
+            ec2 = self.client_pool.get_client(self.session, "ec2", region_name=region)
             self.region_clients[region] = ec2
 
-            # Get security groups
-            sg_response = ec2.describe_security_groups()
+            # Get security groups from the shared regional snapshot
+            snapshot = self.snapshot_store.get_snapshot(self.session, region)
 
-            for sg in sg_response["SecurityGroups"]:
+            for sg in snapshot.get("security_groups"):
                 sg_id = sg["GroupId"]
                 sg_name = sg["GroupName"]
                 description = sg["Description"]
@@ -425,7 +499,12 @@ class SecurityAnalyzer:
                     tags=tags,
                 )
 
+                previous = self.sg_cache.get(sg_id)
+                if previous is not None:
+                    sg_analysis.associated_resources = previous.associated_resources
+
                 self.sg_cache[sg_id] = sg_analysis
+                self.topology.add_node(sg_id, SECURITY_GROUP)
 
         except Exception as e:
             logger.warning(f"Could not cache security group info for {region}: {e}")
@@ -538,14 +617,14 @@ class SecurityAnalyzer:
 
     def _cache_nacl_info(self, region: str):
         """Cache NACL information for a region."""
+        self._exposure_engine = None
         try:
             logger.info(f"Caching NACL information for region: {region}")
-            ec2 = self.session.client("ec2", region_name=region)
 
-            # Get NACLs
-            nacl_response = ec2.describe_network_acls()
+            # Get NACLs from the shared regional snapshot
+            snapshot = self.snapshot_store.get_snapshot(self.session, region)
 
-            for nacl in nacl_response["NetworkAcls"]:
+            for nacl in snapshot.get("network_acls"):
                 nacl_id = nacl["NetworkAclId"]
                 is_default = nacl["IsDefault"]
                 vpc_id = nacl["VpcId"]
@@ -628,14 +707,21 @@ class SecurityAnalyzer:
         )
 
     def _map_resources_to_security_groups(self, resources: List[Dict[str, Any]]):
-        """Map resources to their security group associations."""
+        """Map resources to their security group associations.
+
+        Membership is recorded in the topology graph, so each resource is
+        appended to a group's associated_resources only once.
+        """
         for resource in resources:
             sg_ids = self._extract_security_group_ids(resource)
             resource_id = resource.get("id", "unknown")
 
             for sg_id in sg_ids:
                 if sg_id in self.sg_cache:
-                    if resource_id not in self.sg_cache[sg_id].associated_resources:
+                    self.topology.add_node(resource_id, RESOURCE)
+                    if self.topology.add_link(
+                        resource_id, sg_id, SECURITY_GROUP_MEMBER
+                    ):
                         self.sg_cache[sg_id].associated_resources.append(resource_id)
 
     def _extract_security_group_ids(self, resource: Dict[str, Any]) -> List[str]:
@@ -7,12 +7,40 @@ Extracted and enhanced from existing aws_resource_inventory.py patterns.
 """
 
 import boto3
+import botocore
+import json
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Set, Type
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Type
 from botocore.exceptions import ClientError
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
+
+from .client_pool import get_client_pool
+
+# Upper bounds (seconds) of the partition duration histogram buckets
+ENRICHMENT_DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 30.0)
+
+# Error code endings of multi-ID describe calls naming unknown or malformed IDs,
+# e.g. InvalidInstanceID.NotFound, DBInstanceNotFoundFault
+INVALID_ID_ERROR_SUFFIXES = (
+    "NotFound",
+    "NotFoundFault",
+    "NotFoundException",
+    "Malformed",
+)
+
+
+def is_invalid_id_error(error: ClientError) -> bool:
+    """Whether a describe call failed because some requested IDs are unknown."""
+    code = error.response.get("Error", {}).get("Code", "")
+    return code.endswith(INVALID_ID_ERROR_SUFFIXES) or code == "InvalidParameterValue"
 
 
 @dataclass
@@ -30,9 +58,17 @@ class ServiceDiscoveryResult:
 class ServiceHandler(ABC):
     """Base class for service-specific attribute handlers."""
 
+    # Handlers that override enrich_batch with multi-resource API calls
+    supports_batch_enrichment = False
+
+    # Resource type -> raw_data keys marking a full discovery payload, for types
+    # whose service attributes can be built without describing them again
+    payload_attribute_keys: Dict[str, Tuple[str, ...]] = {}
+
     def __init__(self, session: boto3.Session):
         """Initialize service handler with AWS session."""
         self.session = session
+        self.client_pool = get_client_pool()
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._read_only_operations = self._define_read_only_operations()
 
@@ -51,6 +87,168 @@ class ServiceHandler(ABC):
         """Define list of read-only operations this handler uses."""
         pass
 
+    def enrich_batch(self, resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich several resources, returning them in the same order.
+
+        Resources carrying a full discovery payload are enriched from it; the
+        rest go to ``_enrich_described``.
+        """
+        enriched = list(resources)
+        remaining = []
+        for index, resource in enumerate(resources):
+            attributes = self.attributes_from_payload(resource)
+            if attributes is None:
+                remaining.append(index)
+            else:
+                enriched[index] = {**resource, "service_attributes": attributes}
+
+        if remaining:
+            described = self._enrich_described([resources[i] for i in remaining])
+            for index, resource in zip(remaining, described):
+                enriched[index] = resource
+        return enriched
+
+    def _enrich_described(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich resources that need API calls, returning them in order.
+
+        The default enriches one resource at a time; handlers for services with
+        multi-resource describe calls override this to batch IDs per region.
+        """
+        return [self.enrich_resource(resource) for resource in resources]
+
+    def attributes_from_payload(
+        self, resource: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Build service attributes from the resource's discovery payload.
+
+        Returns None when the type has no payload mapping, ``raw_data`` does
+        not hold a full describe/list item for it, or the handler does not map
+        payloads; the resource is then described through the API.
+        """
+        required_keys = self.payload_attribute_keys.get(resource.get("type", ""))
+        raw_data = resource.get("raw_data")
+        if not required_keys or not isinstance(raw_data, dict):
+            return None
+
+        # Discovery engines may nest the full item, e.g. raw_data["boto3_config"]
+        candidates = [raw_data] + [
+            value for value in raw_data.values() if isinstance(value, dict)
+        ]
+        for payload in candidates:
+            if all(key in payload for key in required_keys):
+                return self._payload_attributes(resource, payload)
+        return None
+
+    def _payload_attributes(
+        self, resource: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Map a discovery payload to service attributes.
+
+        Handlers that declare ``payload_attribute_keys`` override this; the
+        default returns None so the resource is described instead.
+        """
+        return None
+
+    @staticmethod
+    def _group_by_region(
+        resources: List[Dict[str, Any]],
+    ) -> Dict[Optional[str], List[int]]:
+        """Group resource indices by region (None for global or unknown)."""
+        groups: Dict[Optional[str], List[int]] = {}
+        for index, resource in enumerate(resources):
+            region = resource.get("region")
+            if region in ("", "global"):
+                region = None
+            groups.setdefault(region, []).append(index)
+        return groups
+
+    @staticmethod
+    def _ids_of_type(
+        resources: List[Dict[str, Any]], indices: List[int], resource_type: str
+    ) -> List[str]:
+        """Return the IDs of the indexed resources with the given type."""
+        return [
+            resources[i]["id"]
+            for i in indices
+            if resources[i].get("type") == resource_type and resources[i].get("id")
+        ]
+
+    def _describe_in_chunks(
+        self,
+        ids: List[str],
+        chunk_size: int,
+        fetch: Callable[[List[str]], Optional[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Describe IDs in chunks of ``chunk_size`` and merge the results.
+
+        ``fetch`` returns a mapping of ID to description (None to skip the
+        chunk) and raises ClientError when the call fails. Chunks rejected for
+        unknown or malformed IDs are split in half and retried, so one bad ID
+        does not lose the descriptions of the rest. Any other error (access
+        denied, throttling) propagates: splitting would only multiply the
+        failing calls (see ``_recover_failed_batch``).
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        pending = [
+            unique_ids[i : i + chunk_size]
+            for i in range(0, len(unique_ids), chunk_size)
+        ]
+        found: Dict[str, Any] = {}
+
+        while pending:
+            chunk = pending.pop()
+            try:
+                described = fetch(chunk)
+            except ClientError as e:
+                if not is_invalid_id_error(e):
+                    raise
+                if len(chunk) > 1:
+                    middle = len(chunk) // 2
+                    pending.extend([chunk[:middle], chunk[middle:]])
+                continue
+            if described is not None:
+                found.update(described)
+
+        return found
+
+    def _enrich_individually(
+        self,
+        resources: List[Dict[str, Any]],
+        indices: List[int],
+        enriched: List[Dict[str, Any]],
+    ):
+        """Enrich the indexed resources one at a time after a batch failed."""
+        for index in indices:
+            enriched[index] = self.enrich_resource(resources[index])
+
+    def _recover_failed_batch(
+        self,
+        resources: List[Dict[str, Any]],
+        indices: List[int],
+        enriched: List[Dict[str, Any]],
+        description: str,
+        error: Exception,
+    ):
+        """Handle a batched describe that failed for a whole region.
+
+        Only unknown or malformed IDs are retried one resource at a time.
+        Denied or throttled calls would fail the same way once per resource,
+        so those resources are left unenriched instead.
+        """
+        if isinstance(error, ClientError) and is_invalid_id_error(error):
+            self.logger.warning(
+                f"{description} rejected unknown IDs, enriching one at a time: {error}"
+            )
+            self._enrich_individually(resources, indices, enriched)
+            return
+
+        self.logger.warning(
+            f"{description} failed, leaving {len(indices)} resources "
+            f"unenriched: {error}"
+        )
+
     def get_read_only_operations(self) -> List[str]:
         """Return list of read-only operations this handler uses."""
         return self._read_only_operations
@@ -96,16 +294,71 @@ class ServiceHandler(ABC):
             self.logger.warning(f"Unexpected error in {operation_name}: {e}")
             return None
 
+    def _batch_api_call(self, client, operation_name: str, **kwargs) -> Optional[Dict]:
+        """Execute a multi-resource describe call, raising ClientError on failure.
+
+        Unlike ``_safe_api_call`` the error is kept, so ``_describe_in_chunks``
+        can tell unknown IDs from access or throttling errors.
+        """
+        if not self.validate_read_only_operation(operation_name):
+            self.logger.warning(
+                f"Operation {operation_name} is not validated as read-only"
+            )
+            return None
+        return getattr(client, operation_name)(**kwargs)
+
 
 class DynamicServiceHandler(ServiceHandler):
     """Generic handler for unknown services using pattern-based discovery with caching."""
 
-    def __init__(self, session: boto3.Session):
-        """Initialize with caching for discovered patterns."""
+    def __init__(
+        self,
+        session: boto3.Session,
+        cache_size: int = 1000,
+        cache_ttl: int = 3600,
+        failure_cache_dir: Optional[str] = None,
+        failure_ttl: int = 7 * 86400,
+    ):
+        """Initialize with caching for discovered patterns.
+
+        Args:
+            session: boto3 session used for API calls
+            cache_size: Maximum successful results kept (least recently used
+                entries are evicted first)
+            cache_ttl: Lifetime in seconds of a successful result
+            failure_cache_dir: Directory persisting failed (service, operation)
+                patterns between runs; failures stay in memory when None
+            failure_ttl: Lifetime in seconds of a failed pattern
+        """
         super().__init__(session)
-        self._pattern_cache: Dict[str, Dict[str, Any]] = {}
-        self._failed_patterns: Set[str] = set()
+        self.cache_size = max(1, cache_size)
+        self.cache_ttl = cache_ttl
+        self.failure_ttl = failure_ttl
+        self.failure_cache_file = (
+            Path(failure_cache_dir)
+            / f"dynamic_pattern_failures_{botocore.__version__}.json"
+            if failure_cache_dir
+            else None
+        )
+
+        # Enrichment runs from many threads (BOMDataProcessor parallel mode)
+        self._cache_lock = threading.RLock()
+        # cache key -> (expires_at, result), least recently used first
+        self._pattern_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # "service:pattern" -> time the pattern was recorded as failed
+        self._failed_patterns: Dict[str, float] = self._load_failed_patterns()
+        self._working_patterns: Set[str] = set()
+        self._failures_dirty = False
         self._service_operation_cache: Dict[str, List[str]] = {}
+        self._cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "evictions": 0,
+            "failed_pattern_hits": 0,
+            "failed_patterns_recorded": 0,
+            "failed_patterns_loaded": len(self._failed_patterns),
+        }
 
     def can_handle(self, service: str, resource_type: str) -> bool:
         """Can handle any service as fallback."""
@@ -307,33 +560,108 @@ class DynamicServiceHandler(ServiceHandler):
     def _is_pattern_cached_as_failed(self, service: str, pattern: str) -> bool:
         """Check if a pattern is cached as failed to avoid repeated attempts."""
         cache_key = f"{service}:{pattern}"
-        return cache_key in self._failed_patterns
+        with self._cache_lock:
+            failed_at = self._failed_patterns.get(cache_key)
+            if failed_at is None:
+                return False
+            if time.time() - failed_at > self.failure_ttl:
+                del self._failed_patterns[cache_key]
+                self._failures_dirty = True
+                return False
+            self._cache_stats["failed_pattern_hits"] += 1
+            return True
 
     def _cache_failed_pattern(self, service: str, pattern: str):
         """Cache a pattern as failed to avoid repeated attempts."""
         cache_key = f"{service}:{pattern}"
-        self._failed_patterns.add(cache_key)
+        with self._cache_lock:
+            # A pattern that worked for another resource is not a dead end
+            if cache_key in self._working_patterns:
+                return
+            self._failed_patterns[cache_key] = time.time()
+            self._failures_dirty = True
+            self._cache_stats["failed_patterns_recorded"] += 1
 
     def _get_cached_pattern_result(
         self, service: str, resource_type: str, resource_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get cached result for a service/resource combination."""
         cache_key = f"{service}:{resource_type}:{resource_id}"
-        return self._pattern_cache.get(cache_key)
+        with self._cache_lock:
+            entry = self._pattern_cache.get(cache_key)
+            if entry is None:
+                self._cache_stats["misses"] += 1
+                return None
+            expires_at, result = entry
+            if time.time() > expires_at:
+                del self._pattern_cache[cache_key]
+                self._cache_stats["expired"] += 1
+                self._cache_stats["misses"] += 1
+                return None
+            self._pattern_cache.move_to_end(cache_key)
+            self._cache_stats["hits"] += 1
+            return result
 
     def _cache_pattern_result(
         self, service: str, resource_type: str, resource_id: str, result: Dict[str, Any]
     ):
         """Cache successful pattern result."""
         cache_key = f"{service}:{resource_type}:{resource_id}"
-        self._pattern_cache[cache_key] = result
+        with self._cache_lock:
+            self._pattern_cache[cache_key] = (time.time() + self.cache_ttl, result)
+            self._pattern_cache.move_to_end(cache_key)
+
+            # Evict least recently used entries past the size limit
+            while len(self._pattern_cache) > self.cache_size:
+                self._pattern_cache.popitem(last=False)
+                self._cache_stats["evictions"] += 1
+
+    def _record_working_pattern(self, service: str, pattern: str):
+        """Remember a pattern that returned data so it is never marked failed."""
+        cache_key = f"{service}:{pattern}"
+        with self._cache_lock:
+            self._working_patterns.add(cache_key)
+            if self._failed_patterns.pop(cache_key, None) is not None:
+                self._failures_dirty = True
+
+    def _load_failed_patterns(self) -> Dict[str, float]:
+        """Load unexpired failed patterns persisted by earlier runs."""
+        if self.failure_cache_file is None or not self.failure_cache_file.exists():
+            return {}
+        try:
+            with open(self.failure_cache_file, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Could not load failed pattern cache: {e}")
+            return {}
+
+        now = time.time()
+        return {
+            key: float(failed_at)
+            for key, failed_at in data.items()
+            if now - float(failed_at) <= self.failure_ttl
+        }
+
+    def save_failed_patterns(self):
+        """Persist failed patterns if they changed since the last save."""
+        if self.failure_cache_file is None:
+            return
+        with self._cache_lock:
+            if not self._failures_dirty:
+                return
+            data = dict(self._failed_patterns)
+            self._failures_dirty = False
 
-        # Limit cache size to prevent memory issues
-        if len(self._pattern_cache) > 1000:
-            # Remove oldest entries (simple FIFO)
-            oldest_keys = list(self._pattern_cache.keys())[:100]
-            for key in oldest_keys:
-                del self._pattern_cache[key]
+        try:
+            self.failure_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.failure_cache_file.with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.failure_cache_file)
+        except OSError as e:
+            self.logger.debug(f"Could not save failed pattern cache: {e}")
 
     def enrich_resource(self, resource: Dict[str, Any]) -> Dict[str, Any]:
         """Attempt to enrich unknown service resources using comprehensive pattern-based discovery."""
@@ -368,7 +696,7 @@ class DynamicServiceHandler(ServiceHandler):
 
         try:
             # Try to get a client for the service
-            client = self.session.client(service)
+            client = self.client_pool.get_client(self.session, service)
 
             # Get available operations for this service
             available_operations = self._get_service_operations(client)
@@ -410,6 +738,7 @@ class DynamicServiceHandler(ServiceHandler):
             # Try each operation pattern
             for pattern in valid_patterns:
                 discovery_metadata["attempted_patterns"].append(pattern)
+                responded = False
 
                 try:
                     # Try each parameter pattern
@@ -419,6 +748,7 @@ class DynamicServiceHandler(ServiceHandler):
                                 client, pattern, **param_pattern
                             )
                             if response:
+                                responded = True
                                 # Extract resource data from response
                                 extracted_attributes = self._extract_resource_data(
                                     response, resource_type
@@ -453,6 +783,12 @@ class DynamicServiceHandler(ServiceHandler):
                             )
                             continue
 
+                    if responded:
+                        self._record_working_pattern(service, pattern)
+                    elif parameter_patterns:
+                        # No parameter combination got a response
+                        self._cache_failed_pattern(service, pattern)
+
                     if attributes:
                         break
 
@@ -480,33 +816,54 @@ class DynamicServiceHandler(ServiceHandler):
 
     def get_cache_statistics(self) -> Dict[str, Any]:
         """Get statistics about the pattern cache."""
-        return {
-            "cached_results": len(self._pattern_cache),
-            "failed_patterns": len(self._failed_patterns),
-            "service_operations_cached": len(self._service_operation_cache),
-            "total_cached_operations": sum(
-                len(ops) for ops in self._service_operation_cache.values()
-            ),
-        }
+        with self._cache_lock:
+            stats = {
+                "cached_results": len(self._pattern_cache),
+                "failed_patterns": len(self._failed_patterns),
+                "service_operations_cached": len(self._service_operation_cache),
+                "total_cached_operations": sum(
+                    len(ops) for ops in self._service_operation_cache.values()
+                ),
+                "cache_size_limit": self.cache_size,
+            }
+            stats.update(self._cache_stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
 
     def clear_cache(self):
-        """Clear all caches."""
-        self._pattern_cache.clear()
-        self._failed_patterns.clear()
-        self._service_operation_cache.clear()
+        """Clear all caches, including persisted failed patterns."""
+        with self._cache_lock:
+            self._pattern_cache.clear()
+            self._failures_dirty = bool(self._failed_patterns)
+            self._failed_patterns.clear()
+            self._working_patterns.clear()
+            self._service_operation_cache.clear()
+        self.save_failed_patterns()
         self.logger.info("Cleared all dynamic service handler caches")
 
 
 class ServiceHandlerFactory:
     """Factory for creating and managing service handlers."""
 
-    def __init__(self, session: boto3.Session):
-        """Initialize factory with AWS session."""
+    def __init__(self, session: boto3.Session, failure_cache_dir: Optional[str] = None):
+        """Initialize factory with AWS session.
+
+        Args:
+            session: boto3 session shared by the handlers
+            failure_cache_dir: Directory where the dynamic handler persists
+                failed operation patterns between runs (in memory when None)
+        """
         self.session = session
         self.logger = logging.getLogger(f"{__name__}.ServiceHandlerFactory")
         self._handlers: Dict[str, Type[ServiceHandler]] = {}
         self._handler_instances: Dict[str, ServiceHandler] = {}
-        self._dynamic_handler = DynamicServiceHandler(session)
+        # (service, resource type) -> handler, so lookups skip the handler scan
+        self._resolved_handlers: Dict[Tuple[str, str], ServiceHandler] = {}
+        self._lock = threading.RLock()
+        self._dynamic_handler = DynamicServiceHandler(
+            session, failure_cache_dir=failure_cache_dir
+        )
 
         # Register built-in handlers
         self._register_builtin_handlers()
@@ -544,11 +901,23 @@ class ServiceHandlerFactory:
 
     def register_handler(self, service: str, handler_class: Type[ServiceHandler]):
         """Register a service handler class."""
-        self._handlers[service.upper()] = handler_class
+        with self._lock:
+            self._handlers[service.upper()] = handler_class
+            self._resolved_handlers.clear()
         self.logger.info(f"Registered handler for service: {service}")
 
     def get_handler(self, service: str, resource_type: str) -> ServiceHandler:
         """Get appropriate handler for service and resource type."""
+        key = (service, resource_type)
+        handler = self._resolved_handlers.get(key)
+        if handler is None:
+            with self._lock:
+                handler = self._resolve_handler(service, resource_type)
+                self._resolved_handlers[key] = handler
+        return handler
+
+    def _resolve_handler(self, service: str, resource_type: str) -> ServiceHandler:
+        """Find the handler for a service and resource type."""
         service_upper = service.upper()
 
         # Check for specific service handler
@@ -585,11 +954,29 @@ class ServiceHandlerFactory:
 class ServiceAttributeEnricher:
     """Main service attribute enrichment orchestrator."""
 
-    def __init__(self, session: Optional[boto3.Session] = None):
-        """Initialize service attribute enricher."""
+    def __init__(
+        self,
+        session: Optional[boto3.Session] = None,
+        batch_size: int = 1000,
+        failure_cache_dir: Optional[str] = None,
+        max_workers: int = 8,
+    ):
+        """Initialize service attribute enricher.
+
+        Args:
+            session: boto3 session used by the service handlers
+            batch_size: Maximum resources handed to a batch-capable handler at once
+            failure_cache_dir: Directory persisting operation patterns that
+                failed for unknown services, so later runs skip them
+            max_workers: (handler, region) partitions enriched concurrently
+        """
         self.session = session or boto3.Session()
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
         self.logger = logging.getLogger(f"{__name__}.ServiceAttributeEnricher")
-        self.handler_factory = ServiceHandlerFactory(self.session)
+        self.handler_factory = ServiceHandlerFactory(
+            self.session, failure_cache_dir=failure_cache_dir
+        )
         self.discovered_services: Set[str] = set()
         self.unknown_services: Set[str] = set()
         self.enrichment_stats = {
@@ -598,6 +985,9 @@ class ServiceAttributeEnricher:
             "failed_enrichments": 0,
             "unknown_services_count": 0,
         }
+        # Handler class name -> partition timings and error counts
+        self.handler_metrics: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
 
     def discover_all_services(self, resources: List[Dict[str, Any]]) -> Set[str]:
         """Discover all AWS services from resource inventory."""
@@ -615,27 +1005,44 @@ class ServiceAttributeEnricher:
     def enrich_resources_with_attributes(
         self, resources: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Enrich all resources with service-specific attributes."""
-        enriched_resources = []
+        """Enrich all resources with service-specific attributes.
+
+        Resources are partitioned by (handler, region) and the partitions run
+        concurrently, so slow services do not hold up fast ones. Handlers that
+        support batch enrichment receive their partition in batches of
+        ``batch_size``; all other resources are enriched one at a time. The
+        returned list keeps the input order.
+        """
+        enriched_resources = list(resources)
         self.enrichment_stats["total_resources"] = len(resources)
 
         self.logger.info(f"Starting enrichment of {len(resources)} resources")
 
-        for resource in resources:
-            try:
-                enriched_resource = self.enrich_single_resource(resource)
-                enriched_resources.append(enriched_resource)
+        partitions = self._partition_resources(resources)
+        workers = min(self.max_workers, len(partitions)) or 1
 
-                # Track success
-                if "service_attributes" in enriched_resource:
-                    self.enrichment_stats["enriched_resources"] += 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_partition = {
+                executor.submit(
+                    self._enrich_partition, handler, [resources[i] for i in indices]
+                ): (handler, indices)
+                for (handler, _), indices in partitions.items()
+            }
+            for future in as_completed(future_to_partition):
+                handler, indices = future_to_partition[future]
+                try:
+                    partition_results = future.result()
+                except Exception as e:
+                    self.logger.warning(
+                        f"Enrichment of {len(indices)} resources with "
+                        f"{handler.__class__.__name__} failed: {e}"
+                    )
+                    self._increment_stat("failed_enrichments", len(indices))
+                    continue
+                for index, enriched_resource in zip(indices, partition_results):
+                    enriched_resources[index] = enriched_resource
 
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to enrich resource {resource.get('id', 'unknown')}: {e}"
-                )
-                enriched_resources.append(resource)  # Add original resource
-                self.enrichment_stats["failed_enrichments"] += 1
+        self.save_failed_patterns()
 
         self.logger.info(
             f"Enrichment complete. Success: {self.enrichment_stats['enriched_resources']}, "
@@ -644,6 +1051,110 @@ class ServiceAttributeEnricher:
 
         return enriched_resources
 
+    def _partition_resources(
+        self, resources: List[Dict[str, Any]]
+    ) -> Dict[Tuple[ServiceHandler, Optional[str]], List[int]]:
+        """Group resource indices by (handler, region), keeping input order."""
+        partitions: Dict[Tuple[ServiceHandler, Optional[str]], List[int]] = {}
+        for index, resource in enumerate(resources):
+            service = resource.get("service", "")
+            handler = (
+                self.handler_factory.get_handler(service, resource.get("type", ""))
+                if service
+                else None
+            )
+            region = resource.get("region") or None
+            if region == "global":
+                region = None
+            partitions.setdefault((handler, region), []).append(index)
+        return partitions
+
+    def _enrich_partition(
+        self, handler: Optional[ServiceHandler], resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich one (handler, region) partition and record its metrics."""
+        started = time.monotonic()
+        errors: Dict[str, int] = {}
+
+        if (
+            len(resources) > 1
+            and getattr(handler, "supports_batch_enrichment", False) is True
+        ):
+            results = []
+            for start in range(0, len(resources), self.batch_size):
+                results.extend(
+                    self._enrich_batch(
+                        handler, resources[start : start + self.batch_size]
+                    )
+                )
+        else:
+            results = []
+            for resource in resources:
+                try:
+                    enriched_resource = self.enrich_single_resource(resource)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to enrich resource {resource.get('id', 'unknown')}: {e}"
+                    )
+                    self._increment_stat("failed_enrichments")
+                    errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                    results.append(resource)
+                    continue
+                if "service_attributes" in enriched_resource:
+                    self._increment_stat("enriched_resources")
+                results.append(enriched_resource)
+
+        unenriched = sum(1 for r in results if "service_attributes" not in r)
+        unenriched -= sum(errors.values())
+        if unenriched:
+            errors["NoAttributes"] = unenriched
+
+        self._record_partition_metrics(
+            handler.__class__.__name__ if handler else "None",
+            len(resources),
+            time.monotonic() - started,
+            errors,
+        )
+        return results
+
+    def _record_partition_metrics(
+        self,
+        handler_name: str,
+        resource_count: int,
+        duration: float,
+        errors: Dict[str, int],
+    ):
+        """Add a partition's duration and errors to the handler's histograms."""
+        bucket = next(
+            (f"<{limit}s" for limit in ENRICHMENT_DURATION_BUCKETS if duration < limit),
+            f">={ENRICHMENT_DURATION_BUCKETS[-1]}s",
+        )
+        with self._stats_lock:
+            metrics = self.handler_metrics.setdefault(
+                handler_name,
+                {
+                    "partitions": 0,
+                    "resources": 0,
+                    "total_seconds": 0.0,
+                    "max_seconds": 0.0,
+                    "duration_histogram": {},
+                    "error_histogram": {},
+                },
+            )
+            metrics["partitions"] += 1
+            metrics["resources"] += resource_count
+            metrics["total_seconds"] += duration
+            metrics["max_seconds"] = max(metrics["max_seconds"], duration)
+            histogram = metrics["duration_histogram"]
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+            for error_type, count in errors.items():
+                error_histogram = metrics["error_histogram"]
+                error_histogram[error_type] = error_histogram.get(error_type, 0) + count
+
+    def _increment_stat(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self.enrichment_stats[name] += amount
+
     def enrich_single_resource(self, resource: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich a single resource with service-specific attributes."""
         service = resource.get("service", "")
@@ -663,8 +1174,9 @@ class ServiceAttributeEnricher:
             isinstance(handler, DynamicServiceHandler)
             and service.upper() not in self.discovered_services
         ):
-            self.unknown_services.add(service.upper())
-            self.enrichment_stats["unknown_services_count"] += 1
+            with self._stats_lock:
+                self.unknown_services.add(service.upper())
+            self._increment_stat("unknown_services_count")
 
         # Enrich resource
         try:
@@ -685,6 +1197,63 @@ class ServiceAttributeEnricher:
             )
             return resource
 
+    def _get_batch_handler(self, resource: Dict[str, Any]) -> Optional[ServiceHandler]:
+        """Return the resource's handler if it supports batch enrichment."""
+        service = resource.get("service", "")
+        if not service:
+            return None
+        handler = self.handler_factory.get_handler(service, resource.get("type", ""))
+        if getattr(handler, "supports_batch_enrichment", False) is True:
+            return handler
+        return None
+
+    def _enrich_batch(
+        self, handler: ServiceHandler, batch: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich a batch with one handler, falling back to single enrichment."""
+        try:
+            enriched_batch = handler.enrich_batch(batch)
+        except Exception as e:
+            self.logger.warning(
+                f"Batch enrichment with {handler.__class__.__name__} failed, "
+                f"enriching {len(batch)} resources individually: {e}"
+            )
+            enriched_batch = None
+
+        if enriched_batch is None or len(enriched_batch) != len(batch):
+            results = []
+            for resource in batch:
+                try:
+                    enriched_resource = self.enrich_single_resource(resource)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to enrich resource {resource.get('id', 'unknown')}: {e}"
+                    )
+                    self._increment_stat("failed_enrichments")
+                    results.append(resource)
+                    continue
+                if "service_attributes" in enriched_resource:
+                    self._increment_stat("enriched_resources")
+                results.append(enriched_resource)
+            return results
+
+        enriched_at = datetime.now(timezone.utc).isoformat()
+        read_only_operations = handler.get_read_only_operations()
+        results = []
+        for enriched_resource in enriched_batch:
+            enriched_resource = {
+                **enriched_resource,
+                "enrichment_metadata": {
+                    "handler_type": handler.__class__.__name__,
+                    "enriched_at": enriched_at,
+                    "read_only_operations": read_only_operations,
+                },
+            }
+            if "service_attributes" in enriched_resource:
+                self._increment_stat("enriched_resources")
+            results.append(enriched_resource)
+        return results
+
     def handle_unknown_service(
         self, service: str, resource: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -703,10 +1272,19 @@ class ServiceAttributeEnricher:
         enriched = handler.enrich_resource(resource)
         return enriched.get("service_attributes", {})
 
+    def save_failed_patterns(self):
+        """Persist the dynamic handler's failed operation patterns.
+
+        Called once per enrichment pass rather than per resource, so the
+        worker threads never write the cache file.
+        """
+        self.handler_factory._dynamic_handler.save_failed_patterns()
+
     def get_enrichment_statistics(self) -> Dict[str, Any]:
         """Get enrichment statistics and discovered services."""
         return {
             "statistics": self.enrichment_stats,
+            "handler_metrics": self.handler_metrics,
             "discovered_services": sorted(list(self.discovered_services)),
             "unknown_services": sorted(list(self.unknown_services)),
             "registered_handlers": self.handler_factory.list_registered_handlers(),
@@ -8,14 +8,62 @@ attribute enrichment capabilities.
 
 import boto3
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
 from botocore.exceptions import ClientError
 from .service_enrichment import ServiceHandler
+from .ec2_snapshot import get_ec2_snapshot_store
+
+# Maximum IDs per multi-resource describe call
+EC2_INSTANCE_BATCH_SIZE = 1000
+EC2_VOLUME_BATCH_SIZE = 500
+RDS_FILTER_BATCH_SIZE = 100
+ECS_CLUSTER_BATCH_SIZE = 100
+ECS_SERVICE_BATCH_SIZE = 10
+
+# Per-bucket S3 attribute calls, issued concurrently against the bucket's region:
+# (attribute, operation, response key, value if key missing, value if call fails)
+S3_BUCKET_ATTRIBUTE_CALLS = [
+    (
+        "encryption",
+        "get_bucket_encryption",
+        "ServerSideEncryptionConfiguration",
+        {},
+        None,
+    ),
+    ("versioning_status", "get_bucket_versioning", "Status", "Disabled", "Unknown"),
+    ("lifecycle_rules", "get_bucket_lifecycle_configuration", "Rules", [], []),
+    (
+        "public_access_block",
+        "get_public_access_block",
+        "PublicAccessBlockConfiguration",
+        {},
+        {},
+    ),
+    (
+        "object_lock",
+        "get_object_lock_configuration",
+        "ObjectLockConfiguration",
+        {},
+        None,
+    ),
+]
 
 
 class S3Handler(ServiceHandler):
     """Handler for Amazon S3 service with comprehensive bucket attribute enrichment."""
 
+    supports_batch_enrichment = True
+
+    # Buckets enriched in parallel by enrich_batch
+    max_bucket_workers = 16
+
+    def __init__(self, session: boto3.Session):
+        super().__init__(session)
+        self._bucket_regions: Dict[str, str] = {}
+        self._region_lock = threading.Lock()
+
     def can_handle(self, service: str, resource_type: str) -> bool:
         """Handle S3 service resources."""
         return service.upper() == "S3"
@@ -53,83 +101,111 @@ class S3Handler(ServiceHandler):
             return resource
 
         try:
-            s3_client = self.session.client("s3")
-            attributes = {}
+            with ThreadPoolExecutor(
+                max_workers=len(S3_BUCKET_ATTRIBUTE_CALLS)
+            ) as call_pool:
+                attributes = self._get_bucket_attributes(bucket_name, call_pool)
+            return {**resource, "service_attributes": attributes}
 
-            # Get bucket encryption
-            encryption_response = self._safe_api_call(
-                s3_client, "get_bucket_encryption", Bucket=bucket_name
-            )
-            if encryption_response:
-                attributes["encryption"] = encryption_response.get(
-                    "ServerSideEncryptionConfiguration", {}
-                )
-            else:
-                attributes["encryption"] = None
+        except Exception as e:
+            self.logger.warning(f"Failed to enrich S3 bucket {bucket_name}: {e}")
+            return resource
 
-            # Get versioning status
-            versioning_response = self._safe_api_call(
-                s3_client, "get_bucket_versioning", Bucket=bucket_name
-            )
-            if versioning_response:
-                attributes["versioning_status"] = versioning_response.get(
-                    "Status", "Disabled"
-                )
-            else:
-                attributes["versioning_status"] = "Unknown"
+    def enrich_batch(self, resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich buckets in parallel, each with concurrent per-attribute calls."""
+        enriched = list(resources)
+        bucket_indices = [
+            index
+            for index, resource in enumerate(resources)
+            if resource.get("type") == "Bucket" and resource.get("id")
+        ]
+        if not bucket_indices:
+            return enriched
+
+        bucket_workers = min(self.max_bucket_workers, len(bucket_indices))
+        call_workers = bucket_workers * len(S3_BUCKET_ATTRIBUTE_CALLS)
+        self.client_pool.ensure_capacity(call_workers)
+
+        # Separate pools so bucket tasks never wait on their own pool for calls
+        with ThreadPoolExecutor(max_workers=bucket_workers) as bucket_pool:
+            with ThreadPoolExecutor(max_workers=call_workers) as call_pool:
+                future_to_index = {
+                    bucket_pool.submit(
+                        self._get_bucket_attributes, resources[index]["id"], call_pool
+                    ): index
+                    for index in bucket_indices
+                }
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        attributes = future.result()
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Failed to enrich S3 bucket {resources[index]['id']}: {e}"
+                        )
+                        continue
+                    enriched[index] = {
+                        **resources[index],
+                        "service_attributes": attributes,
+                    }
 
-            # Get bucket location
-            location_response = self._safe_api_call(
-                s3_client, "get_bucket_location", Bucket=bucket_name
-            )
-            if location_response:
-                attributes["location"] = (
-                    location_response.get("LocationConstraint") or "us-east-1"
-                )
-            else:
-                attributes["location"] = "Unknown"
+        return enriched
 
-            # Get lifecycle configuration
-            lifecycle_response = self._safe_api_call(
-                s3_client, "get_bucket_lifecycle_configuration", Bucket=bucket_name
+    def _get_bucket_attributes(
+        self, bucket_name: str, call_pool: ThreadPoolExecutor
+    ) -> Dict[str, Any]:
+        """Fetch a bucket's attributes concurrently from its own region."""
+        region = self._resolve_bucket_region(bucket_name)
+        s3_client = self.client_pool.get_client(self.session, "s3", region_name=region)
+
+        futures = {
+            attribute: call_pool.submit(
+                self._safe_api_call, s3_client, operation_name, Bucket=bucket_name
             )
-            if lifecycle_response:
-                attributes["lifecycle_rules"] = lifecycle_response.get("Rules", [])
-            else:
-                attributes["lifecycle_rules"] = []
-
-            # Get public access block
-            public_access_response = self._safe_api_call(
-                s3_client, "get_public_access_block", Bucket=bucket_name
+            for attribute, operation_name, _, _, _ in S3_BUCKET_ATTRIBUTE_CALLS
+        }
+
+        attributes = {"location": region or "Unknown"}
+        for attribute, _, response_key, default, failed in S3_BUCKET_ATTRIBUTE_CALLS:
+            response = futures[attribute].result()
+            attributes[attribute] = (
+                response.get(response_key, default) if response else failed
             )
-            if public_access_response:
-                attributes["public_access_block"] = public_access_response.get(
-                    "PublicAccessBlockConfiguration", {}
-                )
-            else:
-                attributes["public_access_block"] = {}
+        return attributes
 
-            # Get object lock configuration
-            object_lock_response = self._safe_api_call(
-                s3_client, "get_object_lock_configuration", Bucket=bucket_name
-            )
-            if object_lock_response:
-                attributes["object_lock"] = object_lock_response.get(
-                    "ObjectLockConfiguration", {}
-                )
-            else:
-                attributes["object_lock"] = None
+    def _resolve_bucket_region(self, bucket_name: str) -> Optional[str]:
+        """Return the bucket's region, looking it up once per handler."""
+        with self._region_lock:
+            if bucket_name in self._bucket_regions:
+                return self._bucket_regions[bucket_name]
 
-            return {**resource, "service_attributes": attributes}
+        s3_client = self.client_pool.get_client(self.session, "s3")
+        response = self._safe_api_call(
+            s3_client, "get_bucket_location", Bucket=bucket_name
+        )
+        if response is None:
+            return None
 
-        except Exception as e:
-            self.logger.warning(f"Failed to enrich S3 bucket {bucket_name}: {e}")
-            return resource
+        region = response.get("LocationConstraint") or "us-east-1"
+        # Legacy constraint for buckets created in eu-west-1
+        if region == "EU":
+            region = "eu-west-1"
+
+        with self._region_lock:
+            self._bucket_regions[bucket_name] = region
+        return region
 
 
 class RDSHandler(ServiceHandler):
     """Handler for Amazon RDS service with database configuration enrichment."""
 
+    supports_batch_enrichment = True
+
+    payload_attribute_keys = {
+        "DBInstance": ("DBInstanceIdentifier", "Engine", "DBInstanceClass"),
+        "DBCluster": ("DBClusterIdentifier", "Engine", "DBClusterMembers"),
+    }
+
     def can_handle(self, service: str, resource_type: str) -> bool:
         """Handle RDS service resources."""
         return service.upper() == "RDS"
@@ -159,8 +235,12 @@ class RDSHandler(ServiceHandler):
         if not resource_id:
             return resource
 
+        payload_attributes = self.attributes_from_payload(resource)
+        if payload_attributes is not None:
+            return {**resource, "service_attributes": payload_attributes}
+
         try:
-            rds_client = self.session.client("rds")
+            rds_client = self.client_pool.get_client(self.session, "rds")
             attributes = {}
 
             if resource_type == "DBInstance":
@@ -172,57 +252,7 @@ class RDSHandler(ServiceHandler):
                 )
                 if response and "DBInstances" in response:
                     db_instance = response["DBInstances"][0]
-                    attributes.update(
-                        {
-                            "engine": db_instance.get("Engine"),
-                            "engine_version": db_instance.get("EngineVersion"),
-                            "db_instance_class": db_instance.get("DBInstanceClass"),
-                            "allocated_storage": db_instance.get("AllocatedStorage"),
-                            "storage_type": db_instance.get("StorageType"),
-                            "storage_encrypted": db_instance.get("StorageEncrypted"),
-                            "kms_key_id": db_instance.get("KmsKeyId"),
-                            "multi_az": db_instance.get("MultiAZ"),
-                            "publicly_accessible": db_instance.get(
-                                "PubliclyAccessible"
-                            ),
-                            "backup_retention_period": db_instance.get(
-                                "BackupRetentionPeriod"
-                            ),
-                            "preferred_backup_window": db_instance.get(
-                                "PreferredBackupWindow"
-                            ),
-                            "preferred_maintenance_window": db_instance.get(
-                                "PreferredMaintenanceWindow"
-                            ),
-                            "vpc_security_groups": [
-                                sg["VpcSecurityGroupId"]
-                                for sg in db_instance.get("VpcSecurityGroups", [])
-                            ],
-                            "db_subnet_group": db_instance.get("DBSubnetGroup", {}).get(
-                                "DBSubnetGroupName"
-                            ),
-                            "parameter_groups": [
-                                pg["DBParameterGroupName"]
-                                for pg in db_instance.get("DBParameterGroups", [])
-                            ],
-                            "option_group_memberships": [
-                                og["OptionGroupName"]
-                                for og in db_instance.get("OptionGroupMemberships", [])
-                            ],
-                            "deletion_protection": db_instance.get(
-                                "DeletionProtection"
-                            ),
-                            "performance_insights_enabled": db_instance.get(
-                                "PerformanceInsightsEnabled"
-                            ),
-                            "monitoring_interval": db_instance.get(
-                                "MonitoringInterval"
-                            ),
-                            "enhanced_monitoring_resource_arn": db_instance.get(
-                                "EnhancedMonitoringResourceArn"
-                            ),
-                        }
-                    )
+                    attributes.update(self._db_instance_attributes(db_instance))
 
             elif resource_type == "DBCluster":
                 # Get DB cluster details
@@ -231,46 +261,7 @@ class RDSHandler(ServiceHandler):
                 )
                 if response and "DBClusters" in response:
                     db_cluster = response["DBClusters"][0]
-                    attributes.update(
-                        {
-                            "engine": db_cluster.get("Engine"),
-                            "engine_version": db_cluster.get("EngineVersion"),
-                            "engine_mode": db_cluster.get("EngineMode"),
-                            "storage_encrypted": db_cluster.get("StorageEncrypted"),
-                            "kms_key_id": db_cluster.get("KmsKeyId"),
-                            "backup_retention_period": db_cluster.get(
-                                "BackupRetentionPeriod"
-                            ),
-                            "preferred_backup_window": db_cluster.get(
-                                "PreferredBackupWindow"
-                            ),
-                            "preferred_maintenance_window": db_cluster.get(
-                                "PreferredMaintenanceWindow"
-                            ),
-                            "vpc_security_groups": [
-                                sg["VpcSecurityGroupId"]
-                                for sg in db_cluster.get("VpcSecurityGroups", [])
-                            ],
-                            "db_subnet_group": db_cluster.get("DBSubnetGroup"),
-                            "db_cluster_parameter_group": db_cluster.get(
-                                "DBClusterParameterGroup"
-                            ),
-                            "deletion_protection": db_cluster.get("DeletionProtection"),
-                            "multi_az": db_cluster.get("MultiAZ"),
-                            "cluster_members": [
-                                member["DBInstanceIdentifier"]
-                                for member in db_cluster.get("DBClusterMembers", [])
-                            ],
-                            "global_write_forwarding_status": db_cluster.get(
-                                "GlobalWriteForwardingStatus"
-                            ),
-                            "cross_account_clone": db_cluster.get("CrossAccountClone"),
-                            "capacity": db_cluster.get("Capacity"),
-                            "scaling_configuration_info": db_cluster.get(
-                                "ScalingConfigurationInfo", {}
-                            ),
-                        }
-                    )
+                    attributes.update(self._db_cluster_attributes(db_cluster))
 
             return {**resource, "service_attributes": attributes}
 
@@ -278,10 +269,187 @@ class RDSHandler(ServiceHandler):
             self.logger.warning(f"Failed to enrich RDS resource {resource_id}: {e}")
             return resource
 
+    def _enrich_described(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich RDS instances and clusters with filtered describes per region."""
+        enriched = list(resources)
+
+        for region, indices in self._group_by_region(resources).items():
+            try:
+                rds_client = self.client_pool.get_client(
+                    self.session, "rds", region_name=region
+                )
+                db_instances = self._describe_in_chunks(
+                    self._ids_of_type(resources, indices, "DBInstance"),
+                    RDS_FILTER_BATCH_SIZE,
+                    lambda ids: self._describe_by_filter(
+                        rds_client,
+                        "describe_db_instances",
+                        "db-instance-id",
+                        ids,
+                        "DBInstances",
+                        ("DBInstanceIdentifier", "DBInstanceArn"),
+                    ),
+                )
+                db_clusters = self._describe_in_chunks(
+                    self._ids_of_type(resources, indices, "DBCluster"),
+                    RDS_FILTER_BATCH_SIZE,
+                    lambda ids: self._describe_by_filter(
+                        rds_client,
+                        "describe_db_clusters",
+                        "db-cluster-id",
+                        ids,
+                        "DBClusters",
+                        ("DBClusterIdentifier", "DBClusterArn"),
+                    ),
+                )
+            except Exception as e:
+                self._recover_failed_batch(
+                    resources,
+                    indices,
+                    enriched,
+                    f"Batched RDS describe in {region}",
+                    e,
+                )
+                continue
+
+            for index in indices:
+                resource = resources[index]
+                resource_id = resource.get("id", "")
+                if not resource_id:
+                    continue
+                attributes = {}
+                if resource.get("type") == "DBInstance" and resource_id in db_instances:
+                    attributes = self._db_instance_attributes(db_instances[resource_id])
+                elif resource.get("type") == "DBCluster" and resource_id in db_clusters:
+                    attributes = self._db_cluster_attributes(db_clusters[resource_id])
+                enriched[index] = {**resource, "service_attributes": attributes}
+
+        return enriched
+
+    def _payload_attributes(
+        self, resource: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Map a describe_db_instances/describe_db_clusters item to attributes."""
+        if resource.get("type") == "DBCluster":
+            return self._db_cluster_attributes(payload)
+        return self._db_instance_attributes(payload)
+
+    def _describe_by_filter(
+        self,
+        client,
+        operation_name: str,
+        filter_name: str,
+        ids: List[str],
+        list_key: str,
+        id_keys: tuple,
+    ) -> Optional[Dict[str, Any]]:
+        """Describe RDS resources matching an ID filter, keyed by ID and ARN."""
+        params = {"Filters": [{"Name": filter_name, "Values": ids}]}
+        found = {}
+        while True:
+            response = self._batch_api_call(client, operation_name, **params)
+            if response is None:
+                return None
+            for item in response.get(list_key, []):
+                for key in id_keys:
+                    if item.get(key):
+                        found[item[key]] = item
+            if not response.get("Marker"):
+                return found
+            params["Marker"] = response["Marker"]
+
+    @staticmethod
+    def _db_instance_attributes(db_instance: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a DBInstance description to service attributes."""
+        return {
+            "engine": db_instance.get("Engine"),
+            "engine_version": db_instance.get("EngineVersion"),
+            "db_instance_class": db_instance.get("DBInstanceClass"),
+            "allocated_storage": db_instance.get("AllocatedStorage"),
+            "storage_type": db_instance.get("StorageType"),
+            "storage_encrypted": db_instance.get("StorageEncrypted"),
+            "kms_key_id": db_instance.get("KmsKeyId"),
+            "multi_az": db_instance.get("MultiAZ"),
+            "publicly_accessible": db_instance.get("PubliclyAccessible"),
+            "backup_retention_period": db_instance.get("BackupRetentionPeriod"),
+            "preferred_backup_window": db_instance.get("PreferredBackupWindow"),
+            "preferred_maintenance_window": db_instance.get(
+                "PreferredMaintenanceWindow"
+            ),
+            "vpc_security_groups": [
+                sg["VpcSecurityGroupId"]
+                for sg in db_instance.get("VpcSecurityGroups", [])
+            ],
+            "db_subnet_group": db_instance.get("DBSubnetGroup", {}).get(
+                "DBSubnetGroupName"
+            ),
+            "parameter_groups": [
+                pg["DBParameterGroupName"]
+                for pg in db_instance.get("DBParameterGroups", [])
+            ],
+            "option_group_memberships": [
+                og["OptionGroupName"]
+                for og in db_instance.get("OptionGroupMemberships", [])
+            ],
+            "deletion_protection": db_instance.get("DeletionProtection"),
+            "performance_insights_enabled": db_instance.get(
+                "PerformanceInsightsEnabled"
+            ),
+            "monitoring_interval": db_instance.get("MonitoringInterval"),
+            "enhanced_monitoring_resource_arn": db_instance.get(
+                "EnhancedMonitoringResourceArn"
+            ),
+        }
+
+    @staticmethod
+    def _db_cluster_attributes(db_cluster: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a DBCluster description to service attributes."""
+        return {
+            "engine": db_cluster.get("Engine"),
+            "engine_version": db_cluster.get("EngineVersion"),
+            "engine_mode": db_cluster.get("EngineMode"),
+            "storage_encrypted": db_cluster.get("StorageEncrypted"),
+            "kms_key_id": db_cluster.get("KmsKeyId"),
+            "backup_retention_period": db_cluster.get("BackupRetentionPeriod"),
+            "preferred_backup_window": db_cluster.get("PreferredBackupWindow"),
+            "preferred_maintenance_window": db_cluster.get(
+                "PreferredMaintenanceWindow"
+            ),
+            "vpc_security_groups": [
+                sg["VpcSecurityGroupId"]
+                for sg in db_cluster.get("VpcSecurityGroups", [])
+            ],
+            "db_subnet_group": db_cluster.get("DBSubnetGroup"),
+            "db_cluster_parameter_group": db_cluster.get("DBClusterParameterGroup"),
+            "deletion_protection": db_cluster.get("DeletionProtection"),
+            "multi_az": db_cluster.get("MultiAZ"),
+            "cluster_members": [
+                member["DBInstanceIdentifier"]
+                for member in db_cluster.get("DBClusterMembers", [])
+            ],
+            "global_write_forwarding_status": db_cluster.get(
+                "GlobalWriteForwardingStatus"
+            ),
+            "cross_account_clone": db_cluster.get("CrossAccountClone"),
+            "capacity": db_cluster.get("Capacity"),
+            "scaling_configuration_info": db_cluster.get(
+                "ScalingConfigurationInfo", {}
+            ),
+        }
+
 
 class EC2Handler(ServiceHandler):
     """Handler for Amazon EC2 service with instance and volume enrichment."""
 
+    supports_batch_enrichment = True
+
+    payload_attribute_keys = {
+        "Instance": ("InstanceId", "InstanceType", "State"),
+        "Volume": ("VolumeId", "VolumeType", "Size"),
+    }
+
     def can_handle(self, service: str, resource_type: str) -> bool:
         """Handle EC2 service resources."""
         return service.upper() == "EC2"
@@ -317,11 +485,21 @@ class EC2Handler(ServiceHandler):
         if not resource_id:
             return resource
 
+        payload_attributes = self.attributes_from_payload(resource)
+        if payload_attributes is not None:
+            return {**resource, "service_attributes": payload_attributes}
+
         try:
-            ec2_client = self.session.client("ec2")
+            ec2_client = self.client_pool.get_client(self.session, "ec2")
             attributes = {}
+            snapshot_instances = self._snapshot_instances(resource.get("region"))
+
+            if resource_type == "Instance" and resource_id in snapshot_instances:
+                attributes.update(
+                    self._instance_attributes(snapshot_instances[resource_id])
+                )
 
-            if resource_type == "Instance":
+            elif resource_type == "Instance":
                 # Get instance details
                 response = self._safe_api_call(
                     ec2_client, "describe_instances", InstanceIds=[resource_id]
@@ -330,90 +508,7 @@ class EC2Handler(ServiceHandler):
                     for reservation in response["Reservations"]:
                         for instance in reservation.get("Instances", []):
                             if instance["InstanceId"] == resource_id:
-                                attributes.update(
-                                    {
-                                        "instance_type": instance.get("InstanceType"),
-                                        "state": instance.get("State", {}).get("Name"),
-                                        "platform": instance.get("Platform"),
-                                        "architecture": instance.get("Architecture"),
-                                        "hypervisor": instance.get("Hypervisor"),
-                                        "virtualization_type": instance.get(
-                                            "VirtualizationType"
-                                        ),
-                                        "ami_id": instance.get("ImageId"),
-                                        "key_name": instance.get("KeyName"),
-                                        "launch_time": instance.get("LaunchTime"),
-                                        "availability_zone": instance.get(
-                                            "Placement", {}
-                                        ).get("AvailabilityZone"),
-                                        "tenancy": instance.get("Placement", {}).get(
-                                            "Tenancy"
-                                        ),
-                                        "host_id": instance.get("Placement", {}).get(
-                                            "HostId"
-                                        ),
-                                        "subnet_id": instance.get("SubnetId"),
-                                        "vpc_id": instance.get("VpcId"),
-                                        "private_ip_address": instance.get(
-                                            "PrivateIpAddress"
-                                        ),
-                                        "public_ip_address": instance.get(
-                                            "PublicIpAddress"
-                                        ),
-                                        "private_dns_name": instance.get(
-                                            "PrivateDnsName"
-                                        ),
-                                        "public_dns_name": instance.get(
-                                            "PublicDnsName"
-                                        ),
-                                        "security_groups": [
-                                            sg["GroupId"]
-                                            for sg in instance.get("SecurityGroups", [])
-                                        ],
-                                        "iam_instance_profile": instance.get(
-                                            "IamInstanceProfile", {}
-                                        ).get("Arn"),
-                                        "monitoring_state": instance.get(
-                                            "Monitoring", {}
-                                        ).get("State"),
-                                        "source_dest_check": instance.get(
-                                            "SourceDestCheck"
-                                        ),
-                                        "ebs_optimized": instance.get("EbsOptimized"),
-                                        "sriov_net_support": instance.get(
-                                            "SriovNetSupport"
-                                        ),
-                                        "ena_support": instance.get("EnaSupport"),
-                                        "root_device_type": instance.get(
-                                            "RootDeviceType"
-                                        ),
-                                        "root_device_name": instance.get(
-                                            "RootDeviceName"
-                                        ),
-                                        "block_device_mappings": instance.get(
-                                            "BlockDeviceMappings", []
-                                        ),
-                                        "network_interfaces": [
-                                            ni["NetworkInterfaceId"]
-                                            for ni in instance.get(
-                                                "NetworkInterfaces", []
-                                            )
-                                        ],
-                                        "cpu_options": instance.get("CpuOptions", {}),
-                                        "capacity_reservation_specification": instance.get(
-                                            "CapacityReservationSpecification", {}
-                                        ),
-                                        "hibernation_options": instance.get(
-                                            "HibernationOptions", {}
-                                        ),
-                                        "metadata_options": instance.get(
-                                            "MetadataOptions", {}
-                                        ),
-                                        "enclave_options": instance.get(
-                                            "EnclaveOptions", {}
-                                        ),
-                                    }
-                                )
+                                attributes.update(self._instance_attributes(instance))
                                 break
 
             elif resource_type == "Volume":
@@ -423,24 +518,7 @@ class EC2Handler(ServiceHandler):
                 )
                 if response and "Volumes" in response:
                     volume = response["Volumes"][0]
-                    attributes.update(
-                        {
-                            "size": volume.get("Size"),
-                            "volume_type": volume.get("VolumeType"),
-                            "iops": volume.get("Iops"),
-                            "throughput": volume.get("Throughput"),
-                            "state": volume.get("State"),
-                            "encrypted": volume.get("Encrypted"),
-                            "kms_key_id": volume.get("KmsKeyId"),
-                            "snapshot_id": volume.get("SnapshotId"),
-                            "availability_zone": volume.get("AvailabilityZone"),
-                            "create_time": volume.get("CreateTime"),
-                            "attachments": volume.get("Attachments", []),
-                            "multi_attach_enabled": volume.get("MultiAttachEnabled"),
-                            "fast_restored": volume.get("FastRestored"),
-                            "outpost_arn": volume.get("OutpostArn"),
-                        }
-                    )
+                    attributes.update(self._volume_attributes(volume))
 
             return {**resource, "service_attributes": attributes}
 
@@ -448,10 +526,182 @@ class EC2Handler(ServiceHandler):
             self.logger.warning(f"Failed to enrich EC2 resource {resource_id}: {e}")
             return resource
 
+    def _enrich_described(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich EC2 instances and volumes with batched describes per region."""
+        enriched = list(resources)
+
+        for region, indices in self._group_by_region(resources).items():
+            try:
+                ec2_client = self.client_pool.get_client(
+                    self.session, "ec2", region_name=region
+                )
+                instances = self._snapshot_instances(region)
+                instances.update(
+                    self._describe_in_chunks(
+                        [
+                            instance_id
+                            for instance_id in self._ids_of_type(
+                                resources, indices, "Instance"
+                            )
+                            if instance_id not in instances
+                        ],
+                        EC2_INSTANCE_BATCH_SIZE,
+                        lambda ids: self._describe_by_ids(
+                            ec2_client, "describe_instances", "InstanceIds", ids
+                        ),
+                    )
+                )
+                volumes = self._describe_in_chunks(
+                    self._ids_of_type(resources, indices, "Volume"),
+                    EC2_VOLUME_BATCH_SIZE,
+                    lambda ids: self._describe_by_ids(
+                        ec2_client, "describe_volumes", "VolumeIds", ids
+                    ),
+                )
+            except Exception as e:
+                self._recover_failed_batch(
+                    resources,
+                    indices,
+                    enriched,
+                    f"Batched EC2 describe in {region}",
+                    e,
+                )
+                continue
+
+            for index in indices:
+                resource = resources[index]
+                resource_id = resource.get("id", "")
+                if not resource_id:
+                    continue
+                attributes = {}
+                if resource.get("type") == "Instance" and resource_id in instances:
+                    attributes = self._instance_attributes(instances[resource_id])
+                elif resource.get("type") == "Volume" and resource_id in volumes:
+                    attributes = self._volume_attributes(volumes[resource_id])
+                enriched[index] = {**resource, "service_attributes": attributes}
+
+        return enriched
+
+    def _snapshot_instances(self, region: Optional[str]) -> Dict[str, Any]:
+        """Instances already in the region's EC2 snapshot, keyed by ID.
+
+        Only reads what another consumer has fetched this run; the handler
+        never triggers a full-region describe itself.
+        """
+        if not region or region == "global":
+            return {}
+        snapshot = get_ec2_snapshot_store().get_snapshot(self.session, region)
+        return {
+            instance["InstanceId"]: instance
+            for instance in snapshot.peek("instances") or []
+        }
+
+    def _payload_attributes(
+        self, resource: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Map a describe_instances/describe_volumes item to attributes."""
+        if resource.get("type") == "Volume":
+            return self._volume_attributes(payload)
+        return self._instance_attributes(payload)
+
+    def _describe_by_ids(
+        self, client, operation_name: str, ids_param: str, ids: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Describe instances or volumes by ID, keyed by ID."""
+        params = {ids_param: ids}
+        found = {}
+        while True:
+            response = self._batch_api_call(client, operation_name, **params)
+            if response is None:
+                return None
+            for reservation in response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    found[instance["InstanceId"]] = instance
+            for volume in response.get("Volumes", []):
+                found[volume["VolumeId"]] = volume
+            if not response.get("NextToken"):
+                return found
+            params["NextToken"] = response["NextToken"]
+
+    @staticmethod
+    def _instance_attributes(instance: Dict[str, Any]) -> Dict[str, Any]:
+        """Map an instance description to service attributes."""
+        return {
+            "instance_type": instance.get("InstanceType"),
+            "state": instance.get("State", {}).get("Name"),
+            "platform": instance.get("Platform"),
+            "architecture": instance.get("Architecture"),
+            "hypervisor": instance.get("Hypervisor"),
+            "virtualization_type": instance.get("VirtualizationType"),
+            "ami_id": instance.get("ImageId"),
+            "key_name": instance.get("KeyName"),
+            "launch_time": instance.get("LaunchTime"),
+            "availability_zone": instance.get("Placement", {}).get("AvailabilityZone"),
+            "tenancy": instance.get("Placement", {}).get("Tenancy"),
+            "host_id": instance.get("Placement", {}).get("HostId"),
+            "subnet_id": instance.get("SubnetId"),
+            "vpc_id": instance.get("VpcId"),
+            "private_ip_address": instance.get("PrivateIpAddress"),
+            "public_ip_address": instance.get("PublicIpAddress"),
+            "private_dns_name": instance.get("PrivateDnsName"),
+            "public_dns_name": instance.get("PublicDnsName"),
+            "security_groups": [
+                sg["GroupId"] for sg in instance.get("SecurityGroups", [])
+            ],
+            "iam_instance_profile": instance.get("IamInstanceProfile", {}).get("Arn"),
+            "monitoring_state": instance.get("Monitoring", {}).get("State"),
+            "source_dest_check": instance.get("SourceDestCheck"),
+            "ebs_optimized": instance.get("EbsOptimized"),
+            "sriov_net_support": instance.get("SriovNetSupport"),
+            "ena_support": instance.get("EnaSupport"),
+            "root_device_type": instance.get("RootDeviceType"),
+            "root_device_name": instance.get("RootDeviceName"),
+            "block_device_mappings": instance.get("BlockDeviceMappings", []),
+            "network_interfaces": [
+                ni["NetworkInterfaceId"] for ni in instance.get("NetworkInterfaces", [])
+            ],
+            "cpu_options": instance.get("CpuOptions", {}),
+            "capacity_reservation_specification": instance.get(
+                "CapacityReservationSpecification", {}
+            ),
+            "hibernation_options": instance.get("HibernationOptions", {}),
+            "metadata_options": instance.get("MetadataOptions", {}),
+            "enclave_options": instance.get("EnclaveOptions", {}),
+        }
+
+    @staticmethod
+    def _volume_attributes(volume: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a volume description to service attributes."""
+        return {
+            "size": volume.get("Size"),
+            "volume_type": volume.get("VolumeType"),
+            "iops": volume.get("Iops"),
+            "throughput": volume.get("Throughput"),
+            "state": volume.get("State"),
+            "encrypted": volume.get("Encrypted"),
+            "kms_key_id": volume.get("KmsKeyId"),
+            "snapshot_id": volume.get("SnapshotId"),
+            "availability_zone": volume.get("AvailabilityZone"),
+            "create_time": volume.get("CreateTime"),
+            "attachments": volume.get("Attachments", []),
+            "multi_attach_enabled": volume.get("MultiAttachEnabled"),
+            "fast_restored": volume.get("FastRestored"),
+            "outpost_arn": volume.get("OutpostArn"),
+        }
+
 
 class LambdaHandler(ServiceHandler):
     """Handler for AWS Lambda service with function configuration enrichment."""
 
+    supports_batch_enrichment = True
+
+    # list_functions items carry the full function configuration
+    payload_attribute_keys = {
+        "Function": ("FunctionName", "FunctionArn", "MemorySize"),
+    }
+
     def can_handle(self, service: str, resource_type: str) -> bool:
         """Handle Lambda service resources."""
         return service.upper() == "LAMBDA"
@@ -481,8 +731,12 @@ class LambdaHandler(ServiceHandler):
         if not resource_id or resource_type != "Function":
             return resource
 
+        payload_attributes = self.attributes_from_payload(resource)
+        if payload_attributes is not None:
+            return {**resource, "service_attributes": payload_attributes}
+
         try:
-            lambda_client = self.session.client("lambda")
+            lambda_client = self.client_pool.get_client(self.session, "lambda")
             attributes = {}
 
             # Get function configuration
@@ -493,56 +747,7 @@ class LambdaHandler(ServiceHandler):
                 config = response.get("Configuration", {})
                 code = response.get("Code", {})
 
-                attributes.update(
-                    {
-                        "runtime": config.get("Runtime"),
-                        "role": config.get("Role"),
-                        "handler": config.get("Handler"),
-                        "code_size": config.get("CodeSize"),
-                        "description": config.get("Description"),
-                        "timeout": config.get("Timeout"),
-                        "memory_size": config.get("MemorySize"),
-                        "last_modified": config.get("LastModified"),
-                        "code_sha256": config.get("CodeSha256"),
-                        "version": config.get("Version"),
-                        "vpc_config": config.get("VpcConfig", {}),
-                        "environment": config.get("Environment", {}),
-                        "dead_letter_config": config.get("DeadLetterConfig", {}),
-                        "kms_key_arn": config.get("KMSKeyArn"),
-                        "tracing_config": config.get("TracingConfig", {}),
-                        "master_arn": config.get("MasterArn"),
-                        "revision_id": config.get("RevisionId"),
-                        "layers": config.get("Layers", []),
-                        "state": config.get("State"),
-                        "state_reason": config.get("StateReason"),
-                        "state_reason_code": config.get("StateReasonCode"),
-                        "last_update_status": config.get("LastUpdateStatus"),
-                        "last_update_status_reason": config.get(
-                            "LastUpdateStatusReason"
-                        ),
-                        "last_update_status_reason_code": config.get(
-                            "LastUpdateStatusReasonCode"
-                        ),
-                        "file_system_configs": config.get("FileSystemConfigs", []),
-                        "package_type": config.get("PackageType"),
-                        "image_config_response": config.get("ImageConfigResponse", {}),
-                        "signing_profile_version_arn": config.get(
-                            "SigningProfileVersionArn"
-                        ),
-                        "signing_job_arn": config.get("SigningJobArn"),
-                        "architectures": config.get("Architectures", []),
-                        "ephemeral_storage": config.get("EphemeralStorage", {}),
-                        "snap_start": config.get("SnapStart", {}),
-                        "runtime_version_config": config.get(
-                            "RuntimeVersionConfig", {}
-                        ),
-                        "logging_config": config.get("LoggingConfig", {}),
-                        "code_repository_type": code.get("RepositoryType"),
-                        "code_location": code.get("Location"),
-                        "code_image_uri": code.get("ImageUri"),
-                        "code_resolved_image_uri": code.get("ResolvedImageUri"),
-                    }
-                )
+                attributes.update(self._function_attributes(config, code))
 
             # Get function concurrency
             concurrency_response = self._safe_api_call(
@@ -559,10 +764,135 @@ class LambdaHandler(ServiceHandler):
             self.logger.warning(f"Failed to enrich Lambda function {resource_id}: {e}")
             return resource
 
+    def _enrich_described(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich Lambda functions with one GetFunction call each per region.
+
+        Lambda has no multi-function describe, so batching uses regional clients
+        and reads reserved concurrency from the GetFunction response instead of
+        a separate GetFunctionConcurrency call.
+        """
+        enriched = list(resources)
+
+        for region, indices in self._group_by_region(resources).items():
+            try:
+                lambda_client = self.client_pool.get_client(
+                    self.session, "lambda", region_name=region
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to create Lambda client for {region}: {e}")
+                continue
+
+            for index in indices:
+                resource = resources[index]
+                resource_id = resource.get("id", "")
+                if not resource_id or resource.get("type") != "Function":
+                    continue
+
+                attributes = {}
+                response = self._safe_api_call(
+                    lambda_client, "get_function", FunctionName=resource_id
+                )
+                if response:
+                    attributes.update(
+                        self._function_attributes(
+                            response.get("Configuration", {}),
+                            response.get("Code", {}),
+                        )
+                    )
+                    concurrency = response.get("Concurrency")
+                    if concurrency:
+                        attributes["reserved_concurrency_executions"] = concurrency.get(
+                            "ReservedConcurrentExecutions"
+                        )
+                enriched[index] = {**resource, "service_attributes": attributes}
+
+        return enriched
+
+    def _payload_attributes(
+        self, resource: Dict[str, Any], payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Map a list_functions item to attributes.
+
+        Reserved concurrency is not part of the function configuration, so it
+        is the one attribute still fetched from the API.
+        """
+        attributes = self._function_attributes(payload, {})
+        region = resource.get("region")
+        try:
+            lambda_client = self.client_pool.get_client(
+                self.session,
+                "lambda",
+                region_name=None if region in ("", "global") else region,
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to create Lambda client for {region}: {e}")
+            return attributes
+
+        response = self._safe_api_call(
+            lambda_client,
+            "get_function_concurrency",
+            FunctionName=payload["FunctionName"],
+        )
+        if response:
+            attributes["reserved_concurrency_executions"] = response.get(
+                "ReservedConcurrentExecutions"
+            )
+        return attributes
+
+    @staticmethod
+    def _function_attributes(
+        config: Dict[str, Any], code: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Map GetFunction configuration and code to service attributes."""
+        return {
+            "runtime": config.get("Runtime"),
+            "role": config.get("Role"),
+            "handler": config.get("Handler"),
+            "code_size": config.get("CodeSize"),
+            "description": config.get("Description"),
+            "timeout": config.get("Timeout"),
+            "memory_size": config.get("MemorySize"),
+            "last_modified": config.get("LastModified"),
+            "code_sha256": config.get("CodeSha256"),
+            "version": config.get("Version"),
+            "vpc_config": config.get("VpcConfig", {}),
+            "environment": config.get("Environment", {}),
+            "dead_letter_config": config.get("DeadLetterConfig", {}),
+            "kms_key_arn": config.get("KMSKeyArn"),
+            "tracing_config": config.get("TracingConfig", {}),
+            "master_arn": config.get("MasterArn"),
+            "revision_id": config.get("RevisionId"),
+            "layers": config.get("Layers", []),
+            "state": config.get("State"),
+            "state_reason": config.get("StateReason"),
+            "state_reason_code": config.get("StateReasonCode"),
+            "last_update_status": config.get("LastUpdateStatus"),
+            "last_update_status_reason": config.get("LastUpdateStatusReason"),
+            "last_update_status_reason_code": config.get("LastUpdateStatusReasonCode"),
+            "file_system_configs": config.get("FileSystemConfigs", []),
+            "package_type": config.get("PackageType"),
+            "image_config_response": config.get("ImageConfigResponse", {}),
+            "signing_profile_version_arn": config.get("SigningProfileVersionArn"),
+            "signing_job_arn": config.get("SigningJobArn"),
+            "architectures": config.get("Architectures", []),
+            "ephemeral_storage": config.get("EphemeralStorage", {}),
+            "snap_start": config.get("SnapStart", {}),
+            "runtime_version_config": config.get("RuntimeVersionConfig", {}),
+            "logging_config": config.get("LoggingConfig", {}),
+            "code_repository_type": code.get("RepositoryType"),
+            "code_location": code.get("Location"),
+            "code_image_uri": code.get("ImageUri"),
+            "code_resolved_image_uri": code.get("ResolvedImageUri"),
+        }
+
 
 class ECSHandler(ServiceHandler):
     """Handler for Amazon ECS service with cluster and service enrichment."""
 
+    supports_batch_enrichment = True
+
     def can_handle(self, service: str, resource_type: str) -> bool:
         """Handle ECS service resources."""
         return service.upper() == "ECS"
@@ -593,7 +923,7 @@ class ECSHandler(ServiceHandler):
             return resource
 
         try:
-            ecs_client = self.session.client("ecs")
+            ecs_client = self.client_pool.get_client(self.session, "ecs")
             attributes = {}
 
             if resource_type == "Cluster":
@@ -603,25 +933,7 @@ class ECSHandler(ServiceHandler):
                 )
                 if response and "clusters" in response:
                     cluster = response["clusters"][0]
-                    attributes.update(
-                        {
-                            "status": cluster.get("status"),
-                            "running_tasks_count": cluster.get("runningTasksCount"),
-                            "pending_tasks_count": cluster.get("pendingTasksCount"),
-                            "active_services_count": cluster.get("activeServicesCount"),
-                            "statistics": cluster.get("statistics", []),
-                            "capacity_providers": cluster.get("capacityProviders", []),
-                            "default_capacity_provider_strategy": cluster.get(
-                                "defaultCapacityProviderStrategy", []
-                            ),
-                            "attachments": cluster.get("attachments", []),
-                            "settings": cluster.get("settings", []),
-                            "configuration": cluster.get("configuration", {}),
-                            "service_connect_defaults": cluster.get(
-                                "serviceConnectDefaults", {}
-                            ),
-                        }
-                    )
+                    attributes.update(self._cluster_attributes(cluster))
 
             elif resource_type == "Service":
                 # For services, we need cluster name as well
@@ -634,45 +946,7 @@ class ECSHandler(ServiceHandler):
                 )
                 if response and "services" in response:
                     service = response["services"][0]
-                    attributes.update(
-                        {
-                            "cluster_arn": service.get("clusterArn"),
-                            "task_definition": service.get("taskDefinition"),
-                            "desired_count": service.get("desiredCount"),
-                            "running_count": service.get("runningCount"),
-                            "pending_count": service.get("pendingCount"),
-                            "launch_type": service.get("launchType"),
-                            "capacity_provider_strategy": service.get(
-                                "capacityProviderStrategy", []
-                            ),
-                            "platform_version": service.get("platformVersion"),
-                            "platform_family": service.get("platformFamily"),
-                            "role_arn": service.get("roleArn"),
-                            "deployment_configuration": service.get(
-                                "deploymentConfiguration", {}
-                            ),
-                            "deployments": service.get("deployments", []),
-                            "load_balancers": service.get("loadBalancers", []),
-                            "service_registries": service.get("serviceRegistries", []),
-                            "status": service.get("status"),
-                            "health_check_grace_period_seconds": service.get(
-                                "healthCheckGracePeriodSeconds"
-                            ),
-                            "scheduling_strategy": service.get("schedulingStrategy"),
-                            "deployment_controller": service.get(
-                                "deploymentController", {}
-                            ),
-                            "network_configuration": service.get(
-                                "networkConfiguration", {}
-                            ),
-                            "service_connect_configuration": service.get(
-                                "serviceConnectConfiguration", {}
-                            ),
-                            "volume_configurations": service.get(
-                                "volumeConfigurations", []
-                            ),
-                        }
-                    )
+                    attributes.update(self._service_attributes(service))
 
             return {**resource, "service_attributes": attributes}
 
@@ -680,6 +954,145 @@ class ECSHandler(ServiceHandler):
             self.logger.warning(f"Failed to enrich ECS resource {resource_id}: {e}")
             return resource
 
+    def _enrich_described(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich ECS clusters and services with batched describes per region."""
+        enriched = list(resources)
+
+        for region, indices in self._group_by_region(resources).items():
+            try:
+                ecs_client = self.client_pool.get_client(
+                    self.session, "ecs", region_name=region
+                )
+                clusters = self._describe_in_chunks(
+                    self._ids_of_type(resources, indices, "Cluster"),
+                    ECS_CLUSTER_BATCH_SIZE,
+                    lambda ids: self._describe_clusters(ecs_client, ids),
+                )
+
+                # describe_services is scoped to one cluster
+                service_ids_by_cluster: Dict[str, List[str]] = {}
+                for index in indices:
+                    resource = resources[index]
+                    if resource.get("type") == "Service" and resource.get("id"):
+                        service_ids_by_cluster.setdefault(
+                            resource.get("cluster", "default"), []
+                        ).append(resource["id"])
+                services = {
+                    cluster_name: self._describe_in_chunks(
+                        service_ids,
+                        ECS_SERVICE_BATCH_SIZE,
+                        lambda ids, cluster_name=cluster_name: self._describe_services(
+                            ecs_client, cluster_name, ids
+                        ),
+                    )
+                    for cluster_name, service_ids in service_ids_by_cluster.items()
+                }
+            except Exception as e:
+                self._recover_failed_batch(
+                    resources,
+                    indices,
+                    enriched,
+                    f"Batched ECS describe in {region}",
+                    e,
+                )
+                continue
+
+            for index in indices:
+                resource = resources[index]
+                resource_id = resource.get("id", "")
+                if not resource_id:
+                    continue
+                attributes = {}
+                if resource.get("type") == "Cluster" and resource_id in clusters:
+                    attributes = self._cluster_attributes(clusters[resource_id])
+                elif resource.get("type") == "Service":
+                    service = services.get(resource.get("cluster", "default"), {}).get(
+                        resource_id
+                    )
+                    if service:
+                        attributes = self._service_attributes(service)
+                enriched[index] = {**resource, "service_attributes": attributes}
+
+        return enriched
+
+    def _describe_clusters(self, client, ids: List[str]) -> Optional[Dict[str, Any]]:
+        """Describe clusters, keyed by name and ARN."""
+        response = self._batch_api_call(client, "describe_clusters", clusters=ids)
+        if response is None:
+            return None
+        found = {}
+        for cluster in response.get("clusters", []):
+            found[cluster.get("clusterName")] = cluster
+            found[cluster.get("clusterArn")] = cluster
+        return found
+
+    def _describe_services(
+        self, client, cluster_name: str, ids: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Describe services of one cluster, keyed by name and ARN."""
+        response = self._batch_api_call(
+            client, "describe_services", cluster=cluster_name, services=ids
+        )
+        if response is None:
+            return None
+        found = {}
+        for service in response.get("services", []):
+            found[service.get("serviceName")] = service
+            found[service.get("serviceArn")] = service
+        return found
+
+    @staticmethod
+    def _cluster_attributes(cluster: Dict[str, Any]) -> Dict[str, Any]:
+        """Map an ECS cluster description to service attributes."""
+        return {
+            "status": cluster.get("status"),
+            "running_tasks_count": cluster.get("runningTasksCount"),
+            "pending_tasks_count": cluster.get("pendingTasksCount"),
+            "active_services_count": cluster.get("activeServicesCount"),
+            "statistics": cluster.get("statistics", []),
+            "capacity_providers": cluster.get("capacityProviders", []),
+            "default_capacity_provider_strategy": cluster.get(
+                "defaultCapacityProviderStrategy", []
+            ),
+            "attachments": cluster.get("attachments", []),
+            "settings": cluster.get("settings", []),
+            "configuration": cluster.get("configuration", {}),
+            "service_connect_defaults": cluster.get("serviceConnectDefaults", {}),
+        }
+
+    @staticmethod
+    def _service_attributes(service: Dict[str, Any]) -> Dict[str, Any]:
+        """Map an ECS service description to service attributes."""
+        return {
+            "cluster_arn": service.get("clusterArn"),
+            "task_definition": service.get("taskDefinition"),
+            "desired_count": service.get("desiredCount"),
+            "running_count": service.get("runningCount"),
+            "pending_count": service.get("pendingCount"),
+            "launch_type": service.get("launchType"),
+            "capacity_provider_strategy": service.get("capacityProviderStrategy", []),
+            "platform_version": service.get("platformVersion"),
+            "platform_family": service.get("platformFamily"),
+            "role_arn": service.get("roleArn"),
+            "deployment_configuration": service.get("deploymentConfiguration", {}),
+            "deployments": service.get("deployments", []),
+            "load_balancers": service.get("loadBalancers", []),
+            "service_registries": service.get("serviceRegistries", []),
+            "status": service.get("status"),
+            "health_check_grace_period_seconds": service.get(
+                "healthCheckGracePeriodSeconds"
+            ),
+            "scheduling_strategy": service.get("schedulingStrategy"),
+            "deployment_controller": service.get("deploymentController", {}),
+            "network_configuration": service.get("networkConfiguration", {}),
+            "service_connect_configuration": service.get(
+                "serviceConnectConfiguration", {}
+            ),
+            "volume_configurations": service.get("volumeConfigurations", []),
+        }
+
 
 class EKSHandler(ServiceHandler):
     """Handler for Amazon EKS service with cluster and node group enrichment."""
@@ -715,7 +1128,7 @@ class EKSHandler(ServiceHandler):
             return resource
 
         try:
-            eks_client = self.session.client("eks")
+            eks_client = self.client_pool.get_client(self.session, "eks")
             attributes = {}
 
             if resource_type == "Cluster":
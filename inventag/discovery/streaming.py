@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Discovery Streaming Utilities
+
+Bridges callback-style discovery workers and generator consumers so resources
+can be processed while discovery is still running.
+
+A producer function runs on a background thread and hands each item to an
+``emit`` callback; the consumer iterates the items from a bounded queue. The
+bound applies back-pressure to the producer, so memory held between discovery
+and downstream processing is limited by the queue size rather than estate size.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List
+
+# Sentinel marking the end of a stream
+_STREAM_END = object()
+
+
+class StreamCancelled(BaseException):
+    """Raised inside a producer when its consumer stopped iterating.
+
+    Like GeneratorExit it derives from BaseException so the broad
+    ``except Exception`` handlers around individual discovery calls let it
+    unwind the producer instead of swallowing it.
+    """
+
+
+def stream_from_producer(
+    producer: Callable[[Callable[[Any], None]], None],
+    max_buffered: int = 1000,
+    thread_name: str = "inventag-stream",
+) -> Iterator[Any]:
+    """
+    Run ``producer(emit)`` on a background thread and yield each emitted item.
+
+    Exceptions raised by the producer are re-raised in the consumer once all
+    items emitted before the failure have been yielded. Closing the generator
+    early cancels the producer at its next ``emit`` call.
+
+    Args:
+        producer: Function receiving an ``emit(item)`` callback
+        max_buffered: Maximum number of items waiting for the consumer
+        thread_name: Name of the producer thread (useful in logs)
+
+    Yields:
+        Items in the order they were emitted
+    """
+    items: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_buffered))
+    cancelled = threading.Event()
+    failure: List[BaseException] = []
+
+    def emit(item: Any):
+        while not cancelled.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise StreamCancelled()
+
+    def run():
+        try:
+            producer(emit)
+        except StreamCancelled:
+            pass
+        except BaseException as e:  # Forwarded to the consumer
+            failure.append(e)
+        finally:
+            while not cancelled.is_set():
+                try:
+                    items.put(_STREAM_END, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    worker = threading.Thread(target=run, name=thread_name, daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = items.get()
+            if item is _STREAM_END:
+                break
+            yield item
+    finally:
+        cancelled.set()
+        worker.join(timeout=5)
+
+    if failure:
+        raise failure[0]
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most ``batch_size`` items."""
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
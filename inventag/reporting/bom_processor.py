@@ -15,20 +15,28 @@ Features:
 
 import logging
 import boto3
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # Import analyzers and enrichers
 from ..discovery.network_analyzer import NetworkAnalyzer, NetworkSummary
 from ..discovery.security_analyzer import SecurityAnalyzer, SecuritySummary
+from ..discovery.network_topology import (
+    NetworkTopologyGraph,
+    network_interface_ids_of,
+    security_group_ids_of,
+)
 from ..discovery.service_enrichment import ServiceAttributeEnricher
 from ..discovery.service_descriptions import ServiceDescriptionManager
 from ..discovery.tag_mapping import TagMappingEngine
 from ..discovery.cost_analyzer import CostAnalyzer, CostThresholds, CostAnalysisSummary
+from ..discovery.billing_store import DailyCostStore
+from ..discovery.price_catalog import PriceCatalog
+from ..discovery.streaming import iter_batches
 
 
 @dataclass
@@ -47,7 +55,15 @@ class BOMProcessingConfig:
     service_descriptions_config: Optional[str] = None
     tag_mappings_config: Optional[str] = None
     cost_thresholds: Optional[CostThresholds] = None
+    # Local price catalog built from bulk price-list offer files
+    price_catalog_path: Optional[str] = None
+    # Seconds forgotten-resource detection may take; costliest resources go first
+    forgotten_analysis_time_budget: Optional[float] = None
     processing_timeout: int = 300  # seconds
+    stream_batch_size: int = 500  # Resources per batch when processing a stream
+    # Persist operation patterns that failed for unknown services across runs;
+    # CloudBOMGenerator defaults this to <output_directory>/state
+    pattern_failure_cache_dir: Optional[str] = None
 
 
 @dataclass
@@ -96,11 +112,16 @@ class BOMDataProcessor:
     """
 
     def __init__(
-        self, config: BOMProcessingConfig, session: Optional[boto3.Session] = None
+        self,
+        config: BOMProcessingConfig,
+        session: Optional[boto3.Session] = None,
+        cost_store: Optional[DailyCostStore] = None,
     ):
         """Initialize the BOM data processor."""
         self.config = config
         self.session = session or boto3.Session()
+        # Daily Cost Explorer spend shared with the inventory's billing checks
+        self.cost_store = cost_store
         self.logger = logging.getLogger(f"{__name__}.BOMDataProcessor")
 
         # Initialize analyzers and enrichers
@@ -114,9 +135,13 @@ class BOMDataProcessor:
     def _initialize_components(self):
         """Initialize all processing components."""
         try:
+            # Topology graph shared by the network and security analyzers
+            self.topology = NetworkTopologyGraph()
+
             # Network analyzer
             if self.config.enable_network_analysis:
                 self.network_analyzer = NetworkAnalyzer(self.session)
+                self.network_analyzer.topology = self.topology
                 self.logger.info("Initialized NetworkAnalyzer")
             else:
                 self.network_analyzer = None
@@ -124,13 +149,21 @@ class BOMDataProcessor:
             # Security analyzer
             if self.config.enable_security_analysis:
                 self.security_analyzer = SecurityAnalyzer(self.session)
+                self.security_analyzer.topology = self.topology
                 self.logger.info("Initialized SecurityAnalyzer")
             else:
                 self.security_analyzer = None
 
             # Service attribute enricher
             if self.config.enable_service_enrichment:
-                self.service_enricher = ServiceAttributeEnricher(self.session)
+                enricher_options = {}
+                if self.config.pattern_failure_cache_dir:
+                    enricher_options["failure_cache_dir"] = (
+                        self.config.pattern_failure_cache_dir
+                    )
+                self.service_enricher = ServiceAttributeEnricher(
+                    self.session, **enricher_options
+                )
                 self.logger.info("Initialized ServiceAttributeEnricher")
             else:
                 self.service_enricher = None
@@ -155,8 +188,16 @@ class BOMDataProcessor:
 
             # Cost analyzer (optional feature)
             if self.config.enable_cost_analysis:
+                price_catalog = (
+                    PriceCatalog(self.config.price_catalog_path)
+                    if self.config.price_catalog_path
+                    else None
+                )
                 self.cost_analyzer = CostAnalyzer(
-                    self.session, self.config.cost_thresholds
+                    self.session,
+                    self.config.cost_thresholds,
+                    price_catalog=price_catalog,
+                    cost_store=self.cost_store,
                 )
                 self.logger.info("Initialized CostAnalyzer")
             else:
@@ -192,46 +233,145 @@ class BOMDataProcessor:
             )
 
             # Step 2: Parallel enrichment processing
-            if self.config.enable_parallel_processing:
-                enriched_resources = self._parallel_enrichment_processing(
-                    processed_resources
-                )
-            else:
-                enriched_resources = self._sequential_enrichment_processing(
-                    processed_resources
-                )
+            enriched_resources = self._enrich_resources(processed_resources)
+
+            # Steps 3-4: Generate analysis summaries and create BOM data structure
+            bom_data = self._build_bom_data(enriched_resources)
+
+            # Update statistics
+            processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            self.statistics.processing_time_seconds = processing_time
+            self.statistics.processed_resources = len(enriched_resources)
+
+            self.logger.info(
+                f"BOM processing completed in {processing_time:.2f}s. "
+                f"Processed {self.statistics.processed_resources}/{self.statistics.total_resources} resources"
+            )
+
+            return bom_data
+
+        except Exception as e:
+            self.logger.error(f"BOM processing failed: {e}")
+            self.statistics.errors.append(str(e))
+            raise
+
+    def process_inventory_stream(
+        self,
+        resources: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> BOMData:
+        """
+        Process a stream of discovered resources into BOM-ready format.
+
+        Resources are standardized and enriched in bounded batches while the
+        stream is still being produced (see ``iter_processed_resources``).
+        Each enriched batch is folded into the network topology, compliance
+        counts, custom attributes and cost estimates as it arrives.
+
+        The enriched resources themselves are still collected: they are the
+        rows of the BOM (``BOMData.resources``), and internet exposure,
+        forgotten-resource detection and cost trends need every security
+        group and resource once the stream ends. Memory for enrichment is
+        bounded by the batch size; the returned BOM grows with the estate.
+        """
+        start_time = datetime.now(timezone.utc)
+
+        self.logger.info("Starting streaming BOM data processing")
+
+        try:
+            enriched_resources: List[Dict[str, Any]] = []
+            compliance_counts: Counter = Counter()
+            custom_attributes: Set[str] = set()
+            cost_estimates = []
+            estimate_costs = self.config.enable_cost_analysis and self.cost_analyzer
+
+            for batch in self._iter_processed_batches(resources, batch_size):
+                self._add_resources_to_topology(batch)
+                compliance_counts.update(self._count_compliance(batch))
+                custom_attributes.update(self._extract_custom_attributes(batch))
+                if estimate_costs:
+                    cost_estimates.extend(
+                        self.cost_analyzer.estimate_resource_costs(batch)
+                    )
+                enriched_resources.extend(batch)
 
-            # Step 3: Generate analysis summaries
             network_analysis = self._generate_network_analysis(enriched_resources)
             security_analysis = self._generate_security_analysis(enriched_resources)
             cost_analysis = (
-                self._generate_cost_analysis(enriched_resources)
+                self._generate_cost_analysis(
+                    enriched_resources, cost_estimates=cost_estimates
+                )
                 if self.config.enable_cost_analysis
                 else {}
             )
-
-            # Step 4: Create BOM data structure
             bom_data = self._create_bom_data_structure(
-                enriched_resources, network_analysis, security_analysis, cost_analysis
+                enriched_resources,
+                network_analysis,
+                security_analysis,
+                cost_analysis,
+                compliance_summary=self._compliance_summary_from_counts(
+                    compliance_counts
+                ),
+                custom_attributes=sorted(custom_attributes),
             )
 
-            # Update statistics
             processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
             self.statistics.processing_time_seconds = processing_time
-            self.statistics.processed_resources = len(enriched_resources)
 
             self.logger.info(
-                f"BOM processing completed in {processing_time:.2f}s. "
+                f"Streaming BOM processing completed in {processing_time:.2f}s. "
                 f"Processed {self.statistics.processed_resources}/{self.statistics.total_resources} resources"
             )
 
             return bom_data
 
         except Exception as e:
-            self.logger.error(f"BOM processing failed: {e}")
+            self.logger.error(f"Streaming BOM processing failed: {e}")
             self.statistics.errors.append(str(e))
             raise
 
+    def iter_processed_resources(
+        self,
+        resources: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Standardize and enrich a resource stream in batches of ``batch_size``.
+
+        Only one batch is held in the pipeline at a time, so when ``resources``
+        is a discovery generator such as ``AWSResourceInventory.iter_resources()``
+        enrichment overlaps with discovery. Duplicates spanning batches keep the
+        first occurrence.
+        """
+        for batch in self._iter_processed_batches(resources, batch_size):
+            yield from batch
+
+    def _iter_processed_batches(
+        self,
+        resources: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each standardized, deduplicated and enriched batch of a stream."""
+        batch_size = max(1, batch_size or self.config.stream_batch_size)
+        self.statistics = ProcessingStatistics()
+        seen_keys: Set[str] = set()
+
+        for batch in iter_batches(resources, batch_size):
+            self.statistics.total_resources += len(batch)
+
+            unique_resources = []
+            for resource in self._extract_and_standardize_resources(batch):
+                key = self._resource_dedup_key(resource)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                unique_resources.append(resource)
+
+            enriched_resources = self._enrich_resources(unique_resources)
+            self.statistics.processed_resources += len(enriched_resources)
+
+            yield enriched_resources
+
     def _extract_and_standardize_resources(
         self, raw_data: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -454,15 +594,7 @@ class BOMDataProcessor:
         duplicate_count = 0
 
         for resource in resources:
-            # Create unique key based on ARN or fallback to service+id+region
-            arn = resource.get("arn", "")
-            if arn:
-                key = arn
-            else:
-                service = resource.get("service", "")
-                res_id = resource.get("id", "")
-                region = resource.get("region", "")
-                key = f"{service}:{res_id}:{region}"
+            key = self._resource_dedup_key(resource)
 
             if key in seen_resources:
                 # Keep the resource with more fields
@@ -484,6 +616,63 @@ class BOMDataProcessor:
 
         return deduplicated
 
+    def _resource_dedup_key(self, resource: Dict[str, Any]) -> str:
+        """Create unique key based on ARN or fallback to service+id+region."""
+        arn = resource.get("arn", "")
+        if arn:
+            return arn
+        service = resource.get("service", "")
+        res_id = resource.get("id", "")
+        region = resource.get("region", "")
+        return f"{service}:{res_id}:{region}"
+
+    def _enrich_resources(
+        self, resources: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Enrich resources in parallel or sequentially as configured."""
+        if self.config.enable_parallel_processing:
+            enriched_resources = self._parallel_enrichment_processing(resources)
+        else:
+            enriched_resources = self._sequential_enrichment_processing(resources)
+
+        # Failed dynamic-discovery patterns are written once per pass
+        if self.service_enricher:
+            self.service_enricher.save_failed_patterns()
+        return enriched_resources
+
+    def _build_bom_data(self, enriched_resources: List[Dict[str, Any]]) -> BOMData:
+        """Generate analysis summaries and create the BOM data structure."""
+        self._add_resources_to_topology(enriched_resources)
+        network_analysis = self._generate_network_analysis(enriched_resources)
+        security_analysis = self._generate_security_analysis(enriched_resources)
+        cost_analysis = (
+            self._generate_cost_analysis(enriched_resources)
+            if self.config.enable_cost_analysis
+            else {}
+        )
+
+        return self._create_bom_data_structure(
+            enriched_resources, network_analysis, security_analysis, cost_analysis
+        )
+
+    def _add_resources_to_topology(self, resources: List[Dict[str, Any]]):
+        """Record every resource's VPC, subnet, ENI and security group edges.
+
+        Later queries (resources in a VPC, blast radius of a subnet) then read
+        the graph instead of rescanning the resource list.
+        """
+        for resource in resources:
+            resource_id = resource.get("id")
+            if not resource_id:
+                continue
+            self.topology.add_resource(
+                resource_id,
+                vpc_id=resource.get("vpc_id"),
+                subnet_id=resource.get("subnet_id"),
+                security_group_ids=security_group_ids_of(resource),
+                network_interface_ids=network_interface_ids_of(resource),
+            )
+
     def _parallel_enrichment_processing(
         self, resources: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -730,27 +919,57 @@ class BOMDataProcessor:
                 sg_analysis = self.security_analyzer.analyze_security_groups(
                     sg_resources
                 )
-                return self.security_analyzer.generate_security_summary(sg_analysis)
+                self.security_analyzer.analyze_nacls(sg_resources)
+                summary = self.security_analyzer.generate_security_summary(sg_analysis)
+                summary.internet_exposed_resources = self._add_internet_exposure(
+                    resources
+                )
+                return summary
             return {}
         except Exception as e:
             self.logger.error(f"Security analysis generation failed: {e}")
             self.statistics.errors.append(f"Security analysis failed: {e}")
             return {}
 
+    def _add_internet_exposure(
+        self, resources: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Record each resource's internet-reachable ports on the resource.
+
+        The compiled answer travels with the resource into state snapshots, so
+        the delta stage compares it instead of re-deriving it from rules.
+        """
+        exposed = {}
+        exposures = self.security_analyzer.analyze_resource_exposure(resources)
+        for resource in resources:
+            exposure = exposures.get(resource.get("id"))
+            if exposure is not None and exposure.is_internet_exposed:
+                resource["internet_exposure"] = exposure.internet_ports
+                exposed[exposure.resource_id] = exposure.internet_ports
+        return exposed
+
     def _create_bom_data_structure(
         self,
         resources: List[Dict[str, Any]],
         network_analysis: Dict[str, Any],
         security_analysis: Dict[str, Any],
         cost_analysis: Dict[str, Any] = None,
+        compliance_summary: Optional[Dict[str, Any]] = None,
+        custom_attributes: Optional[List[str]] = None,
     ) -> BOMData:
-        """Create the final BOM data structure."""
+        """Create the final BOM data structure.
+
+        Compliance summary and custom attributes already aggregated batch by
+        batch are used as given instead of being recomputed.
+        """
 
         # Generate compliance summary
-        compliance_summary = self._generate_compliance_summary(resources)
+        if compliance_summary is None:
+            compliance_summary = self._generate_compliance_summary(resources)
 
         # Generate custom attributes list
-        custom_attributes = self._extract_custom_attributes(resources)
+        if custom_attributes is None:
+            custom_attributes = self._extract_custom_attributes(resources)
 
         # Create generation metadata
         generation_metadata = {
@@ -795,17 +1014,19 @@ class BOMDataProcessor:
         self, resources: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate compliance summary from processed resources."""
-        total_resources = len(resources)
-        compliant_resources = 0
-        non_compliant_resources = 0
+        return self._compliance_summary_from_counts(self._count_compliance(resources))
 
-        # Count compliance status
-        for resource in resources:
-            compliance_status = resource.get("compliance_status", "unknown")
-            if compliance_status == "compliant":
-                compliant_resources += 1
-            elif compliance_status == "non_compliant":
-                non_compliant_resources += 1
+    def _count_compliance(self, resources: List[Dict[str, Any]]) -> Counter:
+        """Count resources per compliance status."""
+        return Counter(
+            resource.get("compliance_status", "unknown") for resource in resources
+        )
+
+    def _compliance_summary_from_counts(self, counts: Counter) -> Dict[str, Any]:
+        """Build the compliance summary from per-status resource counts."""
+        total_resources = sum(counts.values())
+        compliant_resources = counts.get("compliant", 0)
+        non_compliant_resources = counts.get("non_compliant", 0)
 
         compliance_percentage = (
             (compliant_resources / total_resources * 100) if total_resources > 0 else 0
@@ -860,9 +1081,15 @@ class BOMDataProcessor:
         return resource
 
     def _generate_cost_analysis(
-        self, resources: List[Dict[str, Any]]
+        self,
+        resources: List[Dict[str, Any]],
+        cost_estimates: Optional[List[Any]] = None,
     ) -> Dict[str, Any]:
-        """Generate comprehensive cost analysis summary."""
+        """Generate comprehensive cost analysis summary.
+
+        Cost estimates already made batch by batch can be passed in; otherwise
+        every resource is estimated here.
+        """
         if not self.cost_analyzer:
             return {}
 
@@ -870,7 +1097,8 @@ class BOMDataProcessor:
             self.logger.info("Generating cost analysis summary")
 
             # Get cost estimates for all resources
-            cost_estimates = self.cost_analyzer.estimate_resource_costs(resources)
+            if cost_estimates is None:
+                cost_estimates = self.cost_analyzer.estimate_resource_costs(resources)
 
             # Identify expensive resources
             expensive_resources = self.cost_analyzer.identify_expensive_resources(
@@ -879,7 +1107,7 @@ class BOMDataProcessor:
 
             # Detect forgotten resources
             forgotten_resources = self.cost_analyzer.detect_forgotten_resources(
-                resources
+                resources, time_budget=self.config.forgotten_analysis_time_budget
             )
 
             # Analyze cost trends
@@ -977,6 +1205,15 @@ class BOMDataProcessor:
                     "cost_by_region": {
                         k: float(v) for k, v in cost_summary.cost_by_region.items()
                     },
+                    "cost_by_account": {
+                        k: float(v) for k, v in cost_summary.cost_by_account.items()
+                    },
+                    "cost_by_cost_center": {
+                        k: float(v) for k, v in cost_summary.cost_by_cost_center.items()
+                    },
+                    "cost_percentiles": {
+                        k: float(v) for k, v in cost_summary.cost_percentiles.items()
+                    },
                     "optimization_opportunities": cost_summary.optimization_opportunities,
                     "analysis_timestamp": cost_summary.analysis_timestamp.isoformat(),
                 },
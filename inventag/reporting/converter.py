@@ -14,6 +14,8 @@ from typing import Dict, List, Any, Union, Optional
 from datetime import datetime
 from botocore.exceptions import ClientError
 
+from ..discovery.ec2_snapshot import get_ec2_snapshot_store
+
 try:
     from openpyxl import Workbook
     from openpyxl.styles import Font, PatternFill, Alignment
@@ -289,11 +291,10 @@ class BOMConverter:
     def _cache_vpc_subnet_info(self, region: str):
         """Cache VPC and subnet information for a region."""
         try:
-            ec2 = self.session.client("ec2", region_name=region)
+            snapshot = get_ec2_snapshot_store().get_snapshot(self.session, region)
 
             # Cache VPC information
-            vpcs = ec2.describe_vpcs()
-            for vpc in vpcs["Vpcs"]:
+            for vpc in snapshot.get("vpcs"):
                 vpc_id = vpc["VpcId"]
                 vpc_name = self._get_tag_value(vpc.get("Tags", []), "Name") or vpc_id
                 self.vpc_cache[vpc_id] = {
@@ -302,8 +303,7 @@ class BOMConverter:
                 }
 
             # Cache subnet information
-            subnets = ec2.describe_subnets()
-            for subnet in subnets["Subnets"]:
+            for subnet in snapshot.get("subnets"):
                 subnet_id = subnet["SubnetId"]
                 subnet_name = (
                     self._get_tag_value(subnet.get("Tags", []), "Name") or subnet_id
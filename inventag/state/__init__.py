@@ -8,9 +8,11 @@ capabilities for AWS resource inventory and compliance data.
 from .state_manager import StateManager
 from .delta_detector import DeltaDetector
 from .changelog_generator import ChangelogGenerator
+from .resource_store import ResourceBlobStore
 
 __all__ = [
     "StateManager",
     "DeltaDetector",
     "ChangelogGenerator",
+    "ResourceBlobStore",
 ]
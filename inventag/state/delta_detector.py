@@ -12,8 +12,15 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import defaultdict
 import logging
 
+from ..discovery.network_topology import (
+    SECURITY_GROUP_MEMBER,
+    NetworkTopologyGraph,
+    security_group_ids_of,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,6 +139,7 @@ class DeltaDetector:
             "iam_roles": ChangeSeverity.CRITICAL,
             "encryption": ChangeSeverity.CRITICAL,
             "public_access": ChangeSeverity.CRITICAL,
+            "internet_exposure": ChangeSeverity.CRITICAL,
             "vpc_id": ChangeSeverity.CRITICAL,
             "subnet_id": ChangeSeverity.HIGH,
             # High severity changes
@@ -673,6 +681,7 @@ class DeltaDetector:
                 "ssl",
                 "tls",
                 "certificate",
+                "exposure",
             ]
         ) or path_lower.startswith("encryption."):
             return ChangeCategory.SECURITY
@@ -969,6 +978,7 @@ class DeltaDetector:
         public_indicators = [
             resource.get("public_access", False),
             resource.get("publicly_accessible", False),
+            bool(resource.get("internet_exposure")),
             "0.0.0.0/0" in str(resource.get("security_groups", [])),
             resource.get("public_ip") is not None,
             resource.get("public_dns_name") is not None,
@@ -1146,6 +1156,9 @@ class DeltaDetector:
             "cascade_risks": [],
         }
 
+        # Built once so each change queries relationships instead of rescanning
+        relationship_index = self._build_relationship_index(new_resources_map)
+
         for change in all_changes:
             service = change.service.upper()
 
@@ -1155,7 +1168,11 @@ class DeltaDetector:
 
                 # Find related resources that might be affected
                 related_resources = self._find_related_resources(
-                    change, patterns, old_resources_map, new_resources_map
+                    change,
+                    patterns,
+                    old_resources_map,
+                    new_resources_map,
+                    relationship_index,
                 )
 
                 if related_resources:
@@ -1201,6 +1218,7 @@ class DeltaDetector:
         dependency_patterns: Dict[str, List[str]],
         old_resources_map: Dict[str, Dict],
         new_resources_map: Dict[str, Dict],
+        relationship_index: Optional[Dict[str, Any]] = None,
     ) -> List[str]:
         """Find resources that might be affected by this change"""
         related_resources = []
@@ -1212,12 +1230,19 @@ class DeltaDetector:
         if not resource_data:
             return related_resources
 
-        # Check resources that depend on this one
-        for arn, resource in new_resources_map.items():
-            if arn == change.resource_arn:
-                continue
+        if relationship_index is None:
+            relationship_index = self._build_relationship_index(new_resources_map)
 
-            resource_service = resource.get("service", "").upper()
+        # Only resources sharing a VPC, subnet, security group, role or key
+        # can be related; keep them in inventory order
+        positions = relationship_index["positions"]
+        candidates = self._related_candidates(resource_data, relationship_index)
+        candidates.discard(change.resource_arn)
+        ordered_candidates = sorted(candidates, key=positions.__getitem__)
+
+        # Check resources that depend on this one
+        for arn in ordered_candidates:
+            resource_service = new_resources_map[arn].get("service", "").upper()
 
             # Check if this resource type depends on the changed resource type
             if resource_service in self.dependency_patterns:
@@ -1225,23 +1250,69 @@ class DeltaDetector:
                     "depends_on", []
                 )
                 if change.service.upper() in depends_on:
-                    # Check for actual relationships (VPC, subnet, security groups, etc.)
-                    if self._resources_are_related(resource_data, resource):
-                        related_resources.append(arn)
+                    related_resources.append(arn)
 
         # Check resources that this one affects
         affects = dependency_patterns.get("affects", [])
-        for arn, resource in new_resources_map.items():
-            if arn == change.resource_arn:
-                continue
-
-            resource_service = resource.get("service", "").upper()
+        for arn in ordered_candidates:
+            resource_service = new_resources_map[arn].get("service", "").upper()
             if resource_service in affects:
-                if self._resources_are_related(resource_data, resource):
-                    related_resources.append(arn)
+                related_resources.append(arn)
 
         return related_resources
 
+    def _build_relationship_index(
+        self, resources_map: Dict[str, Dict]
+    ) -> Dict[str, Any]:
+        """Index resources by the attributes _resources_are_related compares.
+
+        VPC, subnet and security group membership go into a network topology
+        graph; IAM role and KMS key sharing into a plain value index.
+        """
+        graph = NetworkTopologyGraph()
+        shared: Dict[Tuple[str, Any], Set[str]] = defaultdict(set)
+
+        for arn, resource in resources_map.items():
+            for field in ("vpc_id", "subnet_id"):
+                for value in self._relationship_values(resource.get(field)):
+                    graph.add_containment(value, arn)
+            for sg_id in security_group_ids_of(resource):
+                graph.add_link(arn, sg_id, SECURITY_GROUP_MEMBER)
+            for field in ("iam_role", "kms_key_id"):
+                for value in self._relationship_values(resource.get(field)):
+                    shared[(field, value)].add(arn)
+
+        return {
+            "graph": graph,
+            "shared": shared,
+            "positions": {arn: i for i, arn in enumerate(resources_map)},
+        }
+
+    def _related_candidates(
+        self, resource: Dict, relationship_index: Dict[str, Any]
+    ) -> Set[str]:
+        """Return indexed resources sharing a relationship value with resource"""
+        graph = relationship_index["graph"]
+        shared = relationship_index["shared"]
+        candidates: Set[str] = set()
+
+        for field in ("vpc_id", "subnet_id"):
+            for value in self._relationship_values(resource.get(field)):
+                candidates |= graph.children(value)
+        for sg_id in security_group_ids_of(resource):
+            candidates |= graph.linked(sg_id, SECURITY_GROUP_MEMBER)
+        for field in ("iam_role", "kms_key_id"):
+            for value in self._relationship_values(resource.get(field)):
+                candidates |= shared.get((field, value), set())
+
+        return candidates
+
+    @staticmethod
+    def _relationship_values(value: Any) -> List[Any]:
+        """Normalize a single or list relationship value to hashable values"""
+        values = value if isinstance(value, list) else [value]
+        return [v for v in values if v and isinstance(v, (str, int))]
+
     def _resources_are_related(self, resource1: Dict, resource2: Dict) -> bool:
         """Check if two resources are actually related"""
         # Check common relationship indicators
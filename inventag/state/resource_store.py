@@ -0,0 +1,254 @@
+"""
+ResourceBlobStore - Content-addressed storage of resource records
+
+Consecutive inventory snapshots are nearly identical, so each resource record
+is stored once under the SHA-256 of its canonical JSON (sorted keys, compact
+separators) and snapshots refer to records by hash. Fields stamped on every
+run (VOLATILE_FIELDS, e.g. discovered_at) are left out of the stored record
+and its hash; snapshots keep them next to the hash. Every record carries a
+reference count of the snapshot entries pointing at it; a record is deleted
+when the last snapshot referring to it is removed. Saving a snapshot then
+only writes the records that changed since any retained snapshot.
+
+Records live in a single SQLite database next to the snapshot manifests.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Hashes per query, below SQLite's default host parameter limit
+QUERY_CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    refs INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+# Per-run fields excluded from stored records; dotted paths reach into
+# nested dictionaries
+VOLATILE_FIELDS = (
+    "discovered_at",
+    "discovery_timestamp",
+    "consolidation_timestamp",
+    "last_updated",
+    "last_seen",
+    "scan_time",
+    "enrichment_metadata.enriched_at",
+)
+
+
+def split_volatile_fields(
+    resource: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Separate the per-run fields of a resource record from the rest.
+
+    The record itself is not modified.
+
+    Returns:
+        Tuple of (record without VOLATILE_FIELDS, {dotted path: value})
+    """
+    stable = resource
+    volatile = {}
+    for path in VOLATILE_FIELDS:
+        *parents, field_name = path.split(".")
+        node = stable
+        for parent in parents:
+            node = node.get(parent) if isinstance(node, dict) else None
+        if not isinstance(node, dict) or field_name not in node:
+            continue
+
+        if stable is resource:
+            stable = dict(resource)
+        # Copy the dictionaries along the path before removing the field
+        node = stable
+        for parent in parents:
+            node[parent] = dict(node[parent])
+            node = node[parent]
+        volatile[path] = node.pop(field_name)
+    return stable, volatile
+
+
+def merge_volatile_fields(resource: Dict[str, Any], volatile: Dict[str, Any]):
+    """Put per-run fields taken out by split_volatile_fields back in place."""
+    for path, value in volatile.items():
+        *parents, field_name = path.split(".")
+        node = resource
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[field_name] = value
+
+
+def resource_hash(resource: Dict[str, Any]) -> str:
+    """Return the content hash of a resource record, ignoring per-run fields."""
+    stable, _ = split_volatile_fields(resource)
+    return _content_hash(stable)
+
+
+def _content_hash(record: Dict[str, Any]) -> str:
+    canonical = json.dumps(record, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _chunks(items: List[str], size: int = QUERY_CHUNK_SIZE) -> Iterable[List[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class ResourceBlobStore:
+    """Reference-counted, content-addressed store of resource records."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the store. The database is opened on first use.
+
+        Args:
+            path: SQLite database file holding the records
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, opening it once."""
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def add(self, resources: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store resource records and take one reference per record.
+
+        Per-run fields are left out of the stored records. Records already
+        stored are not written again; only their reference count changes.
+
+        Returns:
+            Hash of each record, in order
+        """
+        hashes = []
+        new_blobs = {}
+        for resource in resources:
+            stable, _ = split_volatile_fields(resource)
+            digest = _content_hash(stable)
+            hashes.append(digest)
+            if digest not in new_blobs:
+                new_blobs[digest] = stable
+
+        with self._lock:
+            connection = self._connect()
+            known = set()
+            for chunk in _chunks(list(new_blobs)):
+                placeholders = ",".join("?" * len(chunk))
+                known.update(
+                    row[0]
+                    for row in connection.execute(
+                        f"SELECT hash FROM blobs WHERE hash IN ({placeholders})",
+                        chunk,
+                    )
+                )
+
+            with connection:
+                connection.executemany(
+                    "INSERT INTO blobs (hash, data) VALUES (?, ?)",
+                    [
+                        (digest, json.dumps(resource, default=str))
+                        for digest, resource in new_blobs.items()
+                        if digest not in known
+                    ],
+                )
+                connection.executemany(
+                    "UPDATE blobs SET refs = refs + ? WHERE hash = ?",
+                    [(count, digest) for digest, count in Counter(hashes).items()],
+                )
+
+        logger.debug(
+            f"Stored {len(new_blobs) - len(known)} new of {len(hashes)} resource records"
+        )
+        return hashes
+
+    def get(self, hashes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Return the resource records with the given hashes, in order.
+
+        Raises:
+            KeyError: If a record is not in the store
+        """
+        blobs: Dict[str, str] = {}
+        with self._lock:
+            connection = self._connect()
+            for chunk in _chunks(list(set(hashes))):
+                placeholders = ",".join("?" * len(chunk))
+                blobs.update(
+                    connection.execute(
+                        f"SELECT hash, data FROM blobs WHERE hash IN ({placeholders})",
+                        chunk,
+                    )
+                )
+
+        missing = [digest for digest in hashes if digest not in blobs]
+        if missing:
+            raise KeyError(
+                f"{len(missing)} resource record(s) missing, e.g. {missing[0]}"
+            )
+
+        # Records shared by several entries are decoded into separate objects
+        return [json.loads(blobs[digest]) for digest in hashes]
+
+    def release(self, hashes: List[str]) -> int:
+        """
+        Drop one reference per hash and delete records no longer referenced.
+
+        Returns:
+            Number of records deleted
+        """
+        counts = Counter(hashes)
+        removed = 0
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "UPDATE blobs SET refs = refs - ? WHERE hash = ?",
+                    [(count, digest) for digest, count in counts.items()],
+                )
+                for chunk in _chunks(list(counts)):
+                    placeholders = ",".join("?" * len(chunk))
+                    removed += connection.execute(
+                        f"DELETE FROM blobs WHERE refs <= 0 AND hash IN ({placeholders})",
+                        chunk,
+                    ).rowcount
+        return removed
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Return the number of records stored and the size of the database."""
+        if self._connection is None and not os.path.exists(self.path):
+            return {"records": 0, "data_bytes": 0, "size_bytes": 0}
+        with self._lock:
+            count, data_bytes = (
+                self._connect()
+                .execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM blobs")
+                .fetchone()
+            )
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {"records": count, "data_bytes": data_bytes, "size_bytes": size}
@@ -16,6 +16,12 @@ from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
 import logging
 
+from .resource_store import (
+    ResourceBlobStore,
+    merge_volatile_fields,
+    split_volatile_fields,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +63,7 @@ class StateManager:
         retention_days: int = 30,
         max_snapshots: int = 100,
         compression: bool = True,
+        content_addressed: bool = True,
     ):
         """
         Initialize StateManager with configurable storage and retention policies.
@@ -66,11 +73,14 @@ class StateManager:
             retention_days: Number of days to retain state snapshots
             max_snapshots: Maximum number of snapshots to keep
             compression: Whether to compress state files
+            content_addressed: Store each resource record once in a shared blob
+                store and save snapshots as manifests of record hashes
         """
         self.state_dir = Path(state_dir)
         self.retention_days = retention_days
         self.max_snapshots = max_snapshots
         self.compression = compression
+        self.content_addressed = content_addressed
 
         # Create state directory if it doesn't exist
         self.state_dir.mkdir(parents=True, exist_ok=True)
@@ -79,6 +89,9 @@ class StateManager:
         self.metadata_file = self.state_dir / "metadata.json"
         self._load_metadata_index()
 
+        # Resource records shared by manifest snapshots, opened on first use
+        self.resource_store = ResourceBlobStore(str(self.state_dir / "resources.db"))
+
     def _load_metadata_index(self):
         """Load the metadata index for quick state lookup"""
         if self.metadata_file.exists():
@@ -191,14 +204,18 @@ class StateManager:
         # Save state file
         state_file = self.state_dir / f"state_{timestamp}.json"
         try:
-            with open(state_file, "w") as f:
-                json.dump(asdict(snapshot), f, indent=2, default=str)
+            if self.content_addressed:
+                self._write_manifest(state_file, snapshot)
+            else:
+                with open(state_file, "w") as f:
+                    json.dump(asdict(snapshot), f, indent=2, default=str)
 
             # Update metadata index
             self.metadata_index[timestamp] = {
                 "file": str(state_file),
                 "metadata": asdict(metadata),
                 "size_bytes": state_file.stat().st_size,
+                "storage": "manifest" if self.content_addressed else "full",
             }
             self._save_metadata_index()
 
@@ -244,11 +261,20 @@ class StateManager:
             with open(state_file, "r") as f:
                 data = json.load(f)
 
+            if "resource_manifest" in data:
+                manifest = data["resource_manifest"]
+                resources = self.resource_store.get([entry[1] for entry in manifest])
+                for resource, entry in zip(resources, manifest):
+                    if len(entry) > 2:
+                        merge_volatile_fields(resource, entry[2])
+            else:
+                resources = data["resources"]
+
             # Convert back to StateSnapshot
             metadata = StateMetadata(**data["metadata"])
             snapshot = StateSnapshot(
                 metadata=metadata,
-                resources=data["resources"],
+                resources=resources,
                 compliance_data=data.get("compliance_data"),
                 network_analysis=data.get("network_analysis"),
                 security_analysis=data.get("security_analysis"),
@@ -263,6 +289,46 @@ class StateManager:
             logger.error(f"Failed to load state {state_id}: {e}")
             return None
 
+    def _write_manifest(self, state_file: Path, snapshot: StateSnapshot):
+        """Store a snapshot's resources in the blob store and write its manifest
+
+        Each manifest entry is [ARN or ID, record hash, per-run fields], so
+        records that differ only in their discovery timestamps are shared.
+        """
+        hashes = self.resource_store.add(snapshot.resources)
+        manifest = [
+            [
+                resource.get("arn") or resource.get("id", ""),
+                digest,
+                split_volatile_fields(resource)[1],
+            ]
+            for resource, digest in zip(snapshot.resources, hashes)
+        ]
+        data = {
+            "metadata": asdict(snapshot.metadata),
+            "resource_manifest": manifest,
+            "compliance_data": snapshot.compliance_data,
+            "network_analysis": snapshot.network_analysis,
+            "security_analysis": snapshot.security_analysis,
+        }
+        try:
+            with open(state_file, "w") as f:
+                json.dump(data, f, separators=(",", ":"), default=str)
+        except Exception:
+            # Give back the references of a manifest that was never written
+            self.resource_store.release(hashes)
+            raise
+
+    def _read_manifest_hashes(self, state_file: Path) -> List[str]:
+        """Return the record hashes a state file refers to (none for full states)"""
+        try:
+            with open(state_file, "r") as f:
+                data = json.load(f)
+        except ValueError as e:
+            logger.warning(f"Could not read manifest {state_file}: {e}")
+            return []
+        return [entry[1] for entry in data.get("resource_manifest", [])]
+
     def list_states(self, limit: Optional[int] = None) -> List[Dict]:
         """
         List available states with metadata.
@@ -446,6 +512,9 @@ class StateManager:
             state_file = Path(self.metadata_index[state_id]["file"])
             try:
                 if state_file.exists():
+                    hashes = self._read_manifest_hashes(state_file)
+                    if hashes:
+                        self.resource_store.release(hashes)
                     state_file.unlink()
                 del self.metadata_index[state_id]
                 logger.debug(f"Removed state: {state_id}")
@@ -461,6 +530,9 @@ class StateManager:
             total_size += state_info.get("size_bytes", 0)
             total_files += 1
 
+        store_stats = self.resource_store.get_statistics()
+        total_size += store_stats["size_bytes"]
+
         return {
             "total_states": total_files,
             "total_size_bytes": total_size,
@@ -468,6 +540,7 @@ class StateManager:
             "state_directory": str(self.state_dir),
             "retention_days": self.retention_days,
             "max_snapshots": self.max_snapshots,
+            "resource_records": store_stats["records"],
         }
 
     def validate_state_integrity(self, state_id: Optional[str] = None) -> Dict:
@@ -114,6 +114,147 @@ class TestAWSResourceInventory:
         assert isinstance(resources, list)
         assert len(resources) == 0
 
+    @patch("boto3.Session")
+    def test_resource_groups_tagging_scan_runs_regions_concurrently(
+        self, mock_session
+    ):
+        """Test that every region is scanned and merged via its own client"""
+        regions = ["us-east-1", "us-west-2", "eu-west-1"]
+
+        def mock_client(service_name, region_name=None, **kwargs):
+            client = Mock()
+            paginator = Mock()
+            paginator.paginate.return_value = [
+                {
+                    "ResourceTagMappingList": [
+                        {
+                            "ResourceARN": f"arn:aws:ec2:{region_name}:123456789012:instance/i-{region_name}",
+                            "Tags": [{"Key": "Name", "Value": region_name}],
+                        },
+                        {
+                            "ResourceARN": f"arn:aws:s3:::bucket-{region_name}",
+                            "Tags": [],
+                        },
+                    ]
+                }
+            ]
+            client.get_paginator.return_value = paginator
+            return client
+
+        mock_session.return_value.client.side_effect = mock_client
+
+        inventory = AWSResourceInventory(regions=regions, max_region_workers=2)
+        inventory._discover_via_resource_groups_tagging_api()
+
+        assert len(inventory.resources) == 6
+        assert {r["id"] for r in inventory.resources if r["service"] == "EC2"} == {
+            f"i-{region}" for region in regions
+        }
+        client_regions = [
+            c.kwargs.get("region_name")
+            for c in mock_session.return_value.client.call_args_list
+            if c.args and c.args[0] == "resourcegroupstaggingapi"
+        ]
+        assert sorted(client_regions) == sorted(regions)
+
+    @patch("boto3.Session")
+    def test_resource_groups_tagging_scan_isolates_region_failures(
+        self, mock_session
+    ):
+        """Test that a failing region does not prevent other regions from merging"""
+
+        def mock_client(service_name, region_name=None, **kwargs):
+            client = Mock()
+            if region_name == "us-west-2":
+                client.get_paginator.side_effect = Exception("Endpoint unavailable")
+            else:
+                paginator = Mock()
+                paginator.paginate.return_value = [
+                    {
+                        "ResourceTagMappingList": [
+                            {
+                                "ResourceARN": "arn:aws:lambda:us-east-1:123456789012:function:fn",
+                                "Tags": [{"Key": "Environment", "Value": "prod"}],
+                            }
+                        ]
+                    }
+                ]
+                client.get_paginator.return_value = paginator
+            return client
+
+        mock_session.return_value.client.side_effect = mock_client
+
+        inventory = AWSResourceInventory(
+            regions=["us-east-1", "us-west-2"],
+            tag_filters={"Environment": "prod"},
+        )
+        inventory._discover_via_resource_groups_tagging_api()
+
+        assert len(inventory.resources) == 1
+        assert inventory.resources[0]["service"] == "Lambda"
+
+    @patch("boto3.Session")
+    def test_resource_groups_tagging_filters_pushed_down(self, mock_session):
+        """Test that service and tag filters are sent as GetResources parameters"""
+        paginator = Mock()
+        paginator.paginate.return_value = [{"ResourceTagMappingList": []}]
+        mock_session.return_value.client.return_value.get_paginator.return_value = (
+            paginator
+        )
+
+        inventory = AWSResourceInventory(
+            regions=["us-east-1"],
+            services=["RDS", "ec2"],
+            tag_filters={"Environment": "prod", "Team": ["a", "b"], "Owner": None},
+        )
+        inventory._discover_via_resource_groups_tagging_api()
+
+        paginator.paginate.assert_called_once_with(
+            ResourceTypeFilters=["ec2", "rds"],
+            TagFilters=[
+                {"Key": "Environment", "Values": ["prod"]},
+                {"Key": "Team", "Values": ["a", "b"]},
+                {"Key": "Owner"},
+            ],
+        )
+
+    @patch("boto3.Session")
+    def test_rejected_filters_fall_back_to_client_side(self, mock_session):
+        """Test that invalid server-side filters retry unfiltered and filter locally"""
+        from botocore.exceptions import ClientError
+
+        def paginate(**kwargs):
+            if kwargs:
+                raise ClientError(
+                    {"Error": {"Code": "InvalidParameterException"}}, "GetResources"
+                )
+            return [
+                {
+                    "ResourceTagMappingList": [
+                        {
+                            "ResourceARN": "arn:aws:ec2:us-east-1:123456789012:vpc/vpc-1",
+                            "Tags": [],
+                        },
+                        {
+                            "ResourceARN": "arn:aws:vpc:us-east-1:123456789012:thing/x",
+                            "Tags": [],
+                        },
+                    ]
+                }
+            ]
+
+        paginator = Mock()
+        paginator.paginate.side_effect = paginate
+        mock_session.return_value.client.return_value.get_paginator.return_value = (
+            paginator
+        )
+
+        inventory = AWSResourceInventory(regions=["us-east-1"], services=["vpc"])
+        inventory._discover_via_resource_groups_tagging_api()
+
+        assert paginator.paginate.call_count == 2
+        assert [r["id"] for r in inventory.resources] == ["x"]
+
     def test_get_tag_value(self):
         """Test tag value extraction"""
         with patch("boto3.Session"):
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the daily cost store
+
+Tests that Cost Explorer is only asked for days the store does not hold yet.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+from inventag.discovery.billing_store import DailyCostStore
+from inventag.discovery.cost_analyzer import CostAnalyzer
+
+
+def daily_results(start, end, cost_for_day):
+    """Return DAILY get_cost_and_usage results from start to end."""
+    results = []
+    day = date.fromisoformat(start)
+    while day < date.fromisoformat(end):
+        results.append(
+            {
+                "TimePeriod": {
+                    "Start": day.isoformat(),
+                    "End": (day + timedelta(days=1)).isoformat(),
+                },
+                "Groups": [
+                    {
+                        "Keys": ["AWS Lambda"],
+                        "Metrics": {
+                            "BlendedCost": {"Amount": cost_for_day(day)},
+                            "UsageQuantity": {"Amount": "24"},
+                        },
+                    }
+                ],
+            }
+        )
+        day += timedelta(days=1)
+    return results
+
+
+def make_session(cost_for_day=lambda day: "1.5"):
+    """Return a mock session whose STS and Cost Explorer clients are faked."""
+    client = Mock()
+    client.get_caller_identity.return_value = {"Account": "123456789012"}
+
+    def get_cost_and_usage(TimePeriod, **kwargs):
+        assert kwargs["Granularity"] == "DAILY"
+        return {
+            "ResultsByTime": daily_results(
+                TimePeriod["Start"], TimePeriod["End"], cost_for_day
+            )
+        }
+
+    client.get_cost_and_usage.side_effect = get_cost_and_usage
+    session = Mock()
+    session.client.return_value = client
+    return session, client
+
+
+def requested_periods(client):
+    """Return the (start, end) of every Cost Explorer request made."""
+    return [
+        (c.kwargs["TimePeriod"]["Start"], c.kwargs["TimePeriod"]["End"])
+        for c in client.get_cost_and_usage.call_args_list
+    ]
+
+
+def today():
+    return datetime.now(timezone.utc).date()
+
+
+def test_only_missing_days_are_fetched():
+    """A wider window fetches only the days it adds."""
+    store = DailyCostStore()
+    session, client = make_session()
+    end = today()
+
+    costs = store.service_costs(session, end - timedelta(days=30), end)
+    again = store.service_costs(session, end - timedelta(days=30), end)
+    store.service_costs(session, end - timedelta(days=60), end)
+
+    service = "AWS Lambda"
+    assert costs[service].cost == Decimal("45.0")
+    assert costs[service].usage == 720
+    assert again[service].cost == costs[service].cost
+    assert requested_periods(client) == [
+        ((end - timedelta(days=30)).isoformat(), end.isoformat()),
+        (
+            (end - timedelta(days=60)).isoformat(),
+            (end - timedelta(days=30)).isoformat(),
+        ),
+    ]
+
+
+def test_unsettled_days_are_refetched_once_expired(tmp_path):
+    """Recent days are fetched again after their TTL, settled days never are."""
+    path = str(tmp_path / "state" / "daily_costs.db")
+    session, client = make_session()
+    end = today()
+
+    first = DailyCostStore(path, settle_days=3)
+    first.service_costs(session, end - timedelta(days=10), end)
+    first.close()
+
+    # A later run with an expired TTL for unsettled days
+    second = DailyCostStore(path, settle_days=3, unsettled_ttl=timedelta(0))
+    second.service_costs(session, end - timedelta(days=10), end)
+
+    assert requested_periods(client)[1] == (
+        (end - timedelta(days=3)).isoformat(),
+        end.isoformat(),
+    )
+    assert second.get_statistics()["days_served"] == 7
+
+
+def test_cost_trends_are_served_from_the_store():
+    """Trend analysis compares the last 30 days with the 30 days before."""
+    end = today()
+    session, client = make_session(
+        lambda day: "2" if day >= end - timedelta(days=30) else "1"
+    )
+    analyzer = CostAnalyzer(session, cost_store=DailyCostStore())
+
+    trends = analyzer.analyze_cost_trends(
+        [{"id": "fn-1", "service": "Lambda"}, {"id": "fn-2", "service": "Lambda"}]
+    )
+
+    assert len(trends) == 2
+    assert trends[0].current_monthly_cost == Decimal("30")
+    assert trends[0].previous_monthly_cost == Decimal("15")
+    assert trends[0].trend_direction == "increasing"
+    assert trends[0].alert_triggered
+    assert client.get_cost_and_usage.call_count == 1
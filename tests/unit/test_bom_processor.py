@@ -483,6 +483,68 @@ class TestBOMDataProcessor(unittest.TestCase):
         self.assertIn("Network analysis failed", str(bom_data.error_summary["errors"]))
         self.assertEqual(bom_data.network_analysis, {})  # Should be empty due to error
 
+    def test_process_inventory_stream_in_batches(self):
+        """Test streaming processing enriches bounded batches and drops duplicates."""
+        config = BOMProcessingConfig(
+            enable_network_analysis=False,
+            enable_security_analysis=False,
+            enable_service_enrichment=False,
+            enable_service_descriptions=False,
+            enable_tag_mapping=False,
+            enable_parallel_processing=False,
+            stream_batch_size=1,
+        )
+        processor = BOMDataProcessor(config, self.mock_session)
+
+        batch_sizes = []
+        original_enrich = processor._enrich_resources
+
+        def record_batch(resources):
+            batch_sizes.append(len(resources))
+            return original_enrich(resources)
+
+        processor._enrich_resources = record_batch
+
+        # Duplicate of the first resource arrives in a later batch
+        stream = iter(self.sample_resources + [dict(self.sample_resources[0])])
+        bom_data = processor.process_inventory_stream(stream)
+
+        self.assertEqual(len(bom_data.resources), 2)
+        self.assertEqual(batch_sizes, [1, 1, 0])
+        self.assertEqual(processor.statistics.total_resources, 3)
+        self.assertEqual(processor.statistics.processed_resources, 2)
+
+    def test_process_inventory_stream_aggregates_per_batch(self):
+        """Test per-batch summaries match those of a single list."""
+        config = BOMProcessingConfig(
+            enable_network_analysis=False,
+            enable_security_analysis=False,
+            enable_service_enrichment=False,
+            enable_service_descriptions=False,
+            enable_tag_mapping=False,
+            enable_parallel_processing=False,
+            stream_batch_size=1,
+        )
+        resources = [
+            dict(resource, compliance_status=status)
+            for resource, status in zip(
+                self.sample_resources, ["compliant", "non_compliant"]
+            )
+        ]
+
+        expected = BOMDataProcessor(config, self.mock_session).process_inventory_data(
+            [dict(resource) for resource in resources]
+        )
+        processor = BOMDataProcessor(config, self.mock_session)
+        processor._generate_compliance_summary = Mock(
+            side_effect=AssertionError("summary should come from batch counts")
+        )
+        bom_data = processor.process_inventory_stream(iter(resources))
+
+        self.assertEqual(bom_data.compliance_summary, expected.compliance_summary)
+        self.assertEqual(bom_data.compliance_summary["compliant_resources"], 1)
+        self.assertEqual(bom_data.custom_attributes, expected.custom_attributes)
+
     def test_get_processing_statistics(self):
         """Test getting processing statistics."""
         processor = BOMDataProcessor(self.config, self.mock_session)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the CIDR interval index
+
+Tests cross-account overlap detection and free address block queries.
+"""
+
+from inventag.discovery.cidr_index import (
+    CIDRIndex,
+    analyze_vpc_address_space,
+    count_free_blocks,
+)
+from inventag.discovery.network_analyzer import (
+    NetworkAnalyzer,
+    SubnetAnalysis,
+    VPCAnalysis,
+)
+
+
+def make_vpc(
+    vpc_id, cidr_blocks, account_id="111111111111", region="us-east-1", is_default=False
+):
+    """Return a VPCAnalysis with the given CIDR blocks."""
+    return VPCAnalysis(
+        vpc_id=vpc_id,
+        vpc_name=vpc_id,
+        cidr_block=cidr_blocks[0],
+        cidr_blocks=cidr_blocks,
+        account_id=account_id,
+        region=region,
+        is_default=is_default,
+    )
+
+
+def make_default_vpcs(accounts, regions):
+    """Return a default VPC in every region of every account."""
+    return [
+        make_vpc(
+            f"vpc-default-{account}-{region}",
+            ["172.31.0.0/16"],
+            account_id=f"{account:012d}",
+            region=f"region-{region}",
+            is_default=True,
+        )
+        for account in range(accounts)
+        for region in range(regions)
+    ]
+
+
+def make_subnet(subnet_id, vpc_id, cidr_block):
+    """Return a SubnetAnalysis for a CIDR block."""
+    return SubnetAnalysis(
+        subnet_id=subnet_id,
+        subnet_name=subnet_id,
+        cidr_block=cidr_block,
+        availability_zone="us-east-1a",
+        vpc_id=vpc_id,
+        total_ips=0,
+        available_ips=0,
+        utilization_percentage=0.0,
+    )
+
+
+class TestCIDRIndex:
+    """Test the CIDRIndex class."""
+
+    def test_finds_overlaps_across_accounts(self):
+        """Test nested and equal blocks of different VPCs are reported once."""
+        index = CIDRIndex.from_vpc_analyses(
+            [
+                make_vpc("vpc-a", ["10.0.0.0/16", "10.1.0.0/16"]),
+                make_vpc("vpc-b", ["10.0.128.0/20"], account_id="222222222222"),
+                make_vpc("vpc-c", ["10.1.0.0/16"], region="eu-west-1"),
+                make_vpc("vpc-d", ["172.16.0.0/16"]),
+            ]
+        )
+
+        overlaps = {(o.first.vpc_id, o.second.vpc_id): o for o in index.find_overlaps()}
+
+        assert set(overlaps) == {("vpc-a", "vpc-b"), ("vpc-a", "vpc-c")}
+        assert overlaps[("vpc-a", "vpc-b")].overlapping_cidr == "10.0.128.0/20"
+        assert overlaps[("vpc-a", "vpc-b")].overlapping_ips == 4096
+        assert overlaps[("vpc-a", "vpc-b")].cross_account
+        assert overlaps[("vpc-a", "vpc-c")].cross_region
+        assert not overlaps[("vpc-a", "vpc-c")].cross_account
+
+    def test_adjacent_blocks_do_not_overlap(self):
+        """Test blocks that only touch are not reported."""
+        index = CIDRIndex()
+        index.add("10.0.0.0/24", "vpc-a")
+        index.add("10.0.1.0/24", "vpc-b")
+        index.add("fd00::/56", "vpc-c")
+        index.add("not-a-cidr", "vpc-d")
+
+        assert index.find_overlaps() == []
+        assert len(index) == 3
+
+    def test_find_free_blocks(self):
+        """Test unused space is returned as aligned blocks, filtered by size."""
+        index = CIDRIndex()
+        index.add("10.0.0.0/16", "vpc-a")
+        index.add("10.2.0.0/16", "vpc-b")
+
+        assert index.find_free_blocks("10.0.0.0/14") == [
+            "10.1.0.0/16",
+            "10.3.0.0/16",
+        ]
+        assert index.find_free_blocks("10.0.0.0/8", prefix_length=9) == ["10.128.0.0/9"]
+        assert index.find_free_blocks("10.0.0.0/8", limit=1) == ["10.1.0.0/16"]
+        assert index.find_free_blocks("10.0.0.0/16") == []
+
+    def test_scales_to_many_blocks(self):
+        """Test a large disjoint index sweeps without reporting pairs."""
+        index = CIDRIndex()
+        for i in range(20000):
+            index.add(f"10.{i // 256}.{i % 256}.0/24", f"vpc-{i}")
+
+        assert index.find_overlaps() == []
+        assert index.find_free_blocks("10.0.0.0/8", limit=1) == ["10.78.32.0/19"]
+
+
+    def test_overlap_groups_count_pairs_without_building_them(self):
+        """Test overlaps are grouped per outermost block with pair totals."""
+        index = CIDRIndex.from_vpc_analyses(
+            [
+                make_vpc("vpc-a", ["10.0.0.0/16", "10.1.0.0/16"]),
+                make_vpc("vpc-b", ["10.0.128.0/20"], account_id="222222222222"),
+                make_vpc("vpc-e", ["10.0.0.0/24", "10.0.1.0/24"]),
+                make_vpc("vpc-c", ["10.1.0.0/16"], region="eu-west-1"),
+                make_vpc("vpc-d", ["172.16.0.0/16"]),
+            ]
+        )
+
+        groups = {group.cidr: group for group in index.find_overlap_groups()}
+
+        assert set(groups) == {"10.0.0.0/16", "10.1.0.0/16"}
+        assert groups["10.0.0.0/16"].vpc_ids == ["vpc-a", "vpc-e", "vpc-b"]
+        assert groups["10.0.0.0/16"].overlap_count == 3
+        assert groups["10.0.0.0/16"].cross_account_overlap_count == 1
+        assert groups["10.1.0.0/16"].overlap_count == 1
+        assert sum(g.overlap_count for g in groups.values()) == len(
+            index.find_overlaps()
+        )
+
+    def test_default_vpcs_are_grouped_not_paired(self):
+        """Test thousands of default VPCs make one group and no listed pairs."""
+        index = CIDRIndex.from_vpc_analyses(make_default_vpcs(100, 17))
+        index.add("172.31.16.0/20", "vpc-custom", account_id="999999999999")
+
+        groups = index.find_overlap_groups()
+        pairs = index.find_overlaps(limit=10, skip_default_pairs=True)
+
+        assert len(groups) == 1
+        assert groups[0].overlap_count == 1700 * 1699 // 2 + 1700
+        assert len(groups[0].to_dict(max_members=5)["members"]) == 1
+        assert groups[0].to_dict()["default_vpc_count"] == 1700
+        assert len(pairs) == 10
+        assert all(pair.second.vpc_id == "vpc-custom" for pair in pairs)
+        assert len(index.find_overlaps(limit=3)) == 3
+
+
+class TestVPCAddressSpace:
+    """Test unallocated VPC address space."""
+
+    def test_unallocated_space_excludes_subnets(self):
+        """Test subnets are subtracted from every VPC CIDR block."""
+        vpc = make_vpc("vpc-a", ["10.0.0.0/22", "10.1.0.0/24"])
+        vpc.subnets = [
+            make_subnet("subnet-1", "vpc-a", "10.0.0.0/24"),
+            make_subnet("subnet-2", "vpc-a", "10.0.2.0/24"),
+        ]
+
+        space = analyze_vpc_address_space(vpc, prefix_length=24)
+
+        assert space.total_ips == 1280
+        assert space.unallocated_ips == 768
+        assert space.largest_free_blocks[0] == "10.0.1.0/24"
+        assert space.free_block_count == 3
+        assert count_free_blocks(["10.0.0.0/23", "10.0.4.0/25"], 24) == 2
+
+    def test_network_summary_includes_cidr_analysis(self):
+        """Test the network summary carries the CIDR section."""
+        analyzer = NetworkAnalyzer(session=object())
+        vpcs = {
+            "vpc-a": make_vpc("vpc-a", ["10.0.0.0/16"]),
+            "vpc-b": make_vpc("vpc-b", ["10.0.0.0/16"], account_id="222222222222"),
+        }
+
+        summary = analyzer.generate_network_summary(vpcs)
+
+        assert summary.cidr_analysis["overlap_count"] == 1
+        assert summary.cidr_analysis["cross_account_overlap_count"] == 1
+        assert summary.cidr_analysis["overlap_group_count"] == 1
+        assert summary.cidr_analysis["overlapping_vpcs"] == ["vpc-a", "vpc-b"]
+        assert (
+            summary.cidr_analysis["vpc_address_space"]["vpc-a"]["free_block_count"]
+            == 256
+        )
+
+    def test_cidr_analysis_output_stays_small_with_default_vpcs(self):
+        """Test default VPCs across accounts and regions are aggregated."""
+        analyzer = NetworkAnalyzer(session=object())
+        vpcs = make_default_vpcs(100, 17) + [
+            make_vpc("vpc-a", ["10.0.0.0/16"]),
+            make_vpc("vpc-b", ["10.0.0.0/16"], account_id="222222222222"),
+        ]
+
+        cidr_analysis = analyzer.analyze_cidr_space(vpcs)
+
+        assert cidr_analysis["overlap_count"] == 1700 * 1699 // 2 + 1
+        assert cidr_analysis["overlap_group_count"] == 2
+        assert cidr_analysis["default_vpcs"] == {
+            "count": 1700,
+            "cidr_blocks": {"172.31.0.0/16": 1700},
+        }
+        assert cidr_analysis["overlapping_vpcs"] == ["vpc-a", "vpc-b"]
+        assert len(cidr_analysis["overlaps"]) == 1
+        assert cidr_analysis["overlaps_truncated"]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AWSClientPool
+
+Tests the shared, thread-safe botocore client pool used by discovery engines.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from inventag.discovery.client_pool import AWSClientPool, get_client_pool
+
+
+class TestAWSClientPool:
+    """Test the AWSClientPool class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pool = AWSClientPool(max_pool_connections=5)
+        self.session = Mock()
+        self.session.client.side_effect = lambda *args, **kwargs: Mock()
+
+    def test_reuses_client_for_same_key(self):
+        """Test that the same (session, service, region) returns one client."""
+        first = self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+        second = self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+
+        assert first is second
+        assert self.session.client.call_count == 1
+
+        stats = self.pool.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["cached_clients"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_separate_clients_per_service_region_and_session(self):
+        """Test that clients are keyed by account session, service and region."""
+        other_session = Mock()
+        other_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+        ec2_east = self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+        ec2_west = self.pool.get_client(self.session, "ec2", region_name="us-west-2")
+        s3_east = self.pool.get_client(self.session, "s3", region_name="us-east-1")
+        other_east = self.pool.get_client(other_session, "ec2", region_name="us-east-1")
+
+        assert len({id(ec2_east), id(ec2_west), id(s3_east), id(other_east)}) == 4
+        assert self.pool.get_statistics()["cached_clients"] == 4
+
+    def test_client_config_uses_pool_size(self):
+        """Test that clients are built with the configured connection pool size."""
+        self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+
+        config = self.session.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == 5
+
+    def test_ensure_capacity_rebuilds_smaller_clients(self):
+        """Test that growing the pool rebuilds clients created with fewer connections."""
+        first = self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+
+        self.pool.ensure_capacity(20)
+        second = self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+
+        assert first is not second
+        assert self.session.client.call_args.kwargs["config"].max_pool_connections == 20
+        assert self.pool.get_statistics()["resized"] == 1
+
+        # Shrinking requests never reduce the pool size
+        self.pool.ensure_capacity(2)
+        assert self.pool.get_client(self.session, "ec2", region_name="us-east-1") is (
+            second
+        )
+
+    def test_creation_errors_are_counted_and_raised(self):
+        """Test that client creation failures propagate and are tracked."""
+        self.session.client.side_effect = Exception("Unknown service")
+
+        with pytest.raises(Exception, match="Unknown service"):
+            self.pool.get_client(self.session, "not-a-service")
+
+        assert self.pool.get_statistics()["creation_errors"] == 1
+        assert self.pool.get_statistics()["cached_clients"] == 0
+
+    def test_concurrent_requests_create_single_client(self):
+        """Test that concurrent lookups from many threads build one client."""
+        results = []
+
+        def worker():
+            results.append(
+                self.pool.get_client(self.session, "iam", region_name="us-east-1")
+            )
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(client) for client in results}) == 1
+        assert self.session.client.call_count == 1
+
+    def test_clear_resets_clients_and_statistics(self):
+        """Test that clear drops cached clients and counters."""
+        self.pool.get_client(self.session, "ec2", region_name="us-east-1")
+        self.pool.clear()
+
+        stats = self.pool.get_statistics()
+        assert stats["cached_clients"] == 0
+        assert stats["misses"] == 0
+
+    def test_shared_pool_is_singleton(self):
+        """Test that get_client_pool returns one process-wide pool."""
+        assert get_client_pool() is get_client_pool()
@@ -26,6 +26,7 @@ from inventag.discovery.cost_analyzer import (
     CostTrendAnalysis,
     CostAnalysisSummary,
 )
+from inventag.discovery.inventory import AWSResourceInventory
 
 
 class TestCostThresholds(unittest.TestCase):
@@ -343,6 +344,163 @@ class TestCostAnalyzer(unittest.TestCase):
         days = self.cost_analyzer._calculate_days_since_activity(activity_indicators)
         self.assertGreater(days, self.thresholds.forgotten_resource_days_threshold)
 
+    def test_detect_forgotten_resources_batches_metric_queries(self):
+        """Test activity metrics are fetched with batched GetMetricData calls."""
+        recent = datetime.now(timezone.utc) - timedelta(days=2)
+        self.mock_session.client.return_value = self.mock_cloudwatch_client
+
+        def get_metric_data(**kwargs):
+            results = []
+            for query in kwargs["MetricDataQueries"]:
+                dimension = query["MetricStat"]["Metric"]["Dimensions"][0]["Value"]
+                busy = dimension == "i-busy"
+                results.append(
+                    {
+                        "Id": query["Id"],
+                        "Timestamps": [recent] if busy else [],
+                        "Values": [50.0] if busy else [],
+                    }
+                )
+            return {"MetricDataResults": results}
+
+        self.mock_cloudwatch_client.get_metric_data.side_effect = get_metric_data
+        resources = [
+            {"id": f"i-{n}", "service": "EC2", "type": "Instance", "region": "us-east-1"}
+            for n in range(300)
+        ]
+        resources.append(
+            {"id": "i-busy", "service": "EC2", "type": "Instance", "region": "us-east-1"}
+        )
+
+        forgotten = self.cost_analyzer.detect_forgotten_resources(resources)
+
+        # 301 instances x 2 metrics = 602 queries -> two requests
+        calls = self.mock_cloudwatch_client.get_metric_data.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(calls[0].kwargs["MetricDataQueries"]), 500)
+        self.assertEqual(calls[0].kwargs["StartTime"], calls[1].kwargs["StartTime"])
+        self.assertEqual(len(forgotten), 300)
+        self.assertNotIn("i-busy", [f.resource_id for f in forgotten])
+
+        # Results are cached for the run
+        self.cost_analyzer.detect_forgotten_resources(resources)
+        self.assertEqual(self.mock_cloudwatch_client.get_metric_data.call_count, 2)
+
+    def test_detect_forgotten_resources_by_cost_priority(self):
+        """Test free resources are skipped and costlier resources come first."""
+        resources = [
+            {"id": "fn-1", "service": "LAMBDA", "type": "Function", "region": "us-east-1"},
+            {"id": "sg-1", "service": "EC2", "type": "SecurityGroup", "region": "us-east-1"},
+            {"id": "lb-1", "service": "ELB", "type": "LoadBalancer", "region": "us-east-1"},
+            {"id": "q-1", "service": "SQS", "type": "Queue", "region": "us-east-1"},
+        ]
+
+        forgotten = self.cost_analyzer.detect_forgotten_resources(resources)
+
+        self.assertEqual([f.resource_id for f in forgotten], ["lb-1", "q-1", "fn-1"])
+
+    def test_detect_forgotten_resources_skips_inventory_vpc_resources(self):
+        """Test VPC networking as reported by the inventory is treated as free."""
+        resources = [
+            {
+                "service": "VPC",
+                "type": "VPC",
+                "region": "us-east-1",
+                "id": "vpc-1",
+                "cidr_block": "10.0.0.0/16",
+                "state": "available",
+                "is_default": False,
+                "tags": {},
+                "discovered_at": "2024-01-01T00:00:00",
+            },
+            {
+                "service": "VPC",
+                "type": "Subnet",
+                "region": "us-east-1",
+                "id": "subnet-1",
+                "vpc_id": "vpc-1",
+                "cidr_block": "10.0.1.0/24",
+                "tags": {},
+                "discovered_at": "2024-01-01T00:00:00",
+            },
+        ]
+        resources.append(
+            {"id": "lb-1", "service": "ELB", "type": "LoadBalancer", "region": "us-east-1"}
+        )
+
+        with patch.object(
+            self.cost_analyzer,
+            "_analyze_resource_activity",
+            wraps=self.cost_analyzer._analyze_resource_activity,
+        ) as analyze:
+            forgotten = self.cost_analyzer.detect_forgotten_resources(resources)
+
+        self.assertEqual([f.resource_id for f in forgotten], ["lb-1"])
+        self.assertEqual([c.args[0]["id"] for c in analyze.call_args_list], ["lb-1"])
+
+    def test_inventory_display_types_are_free(self):
+        """Test display-name types emitted by the inventory match the free types."""
+        inventory = AWSResourceInventory.__new__(AWSResourceInventory)
+        resources = [
+            # As emitted by _enhance_ec2_resources
+            {
+                "service": "EC2",
+                "type": "Security Group",
+                "region": "us-east-1",
+                "id": "sg-1",
+                "name": "web",
+                "description": "web",
+                "vpc_id": "vpc-1",
+                "tags": {},
+                "discovered_at": "2024-01-01T00:00:00",
+            }
+        ]
+        resources += [
+            {
+                "service": "EC2",
+                "type": inventory._normalize_resource_type("ec2", arn_type),
+                "region": "us-east-1",
+                "id": f"{arn_type}-1",
+            }
+            for arn_type in ("route-table", "network-acl", "key-pair", "internet-gateway")
+        ]
+
+        self.assertEqual(
+            [r["type"] for r in resources],
+            ["Security Group", "Route Table", "Network ACL", "Key Pair", "Internet Gateway"],
+        )
+        for resource in resources:
+            self.assertEqual(
+                self.cost_analyzer._estimate_resource_cost_simple(resource), Decimal("0.00")
+            )
+        self.assertEqual(self.cost_analyzer.detect_forgotten_resources(resources), [])
+
+    def test_detect_forgotten_resources_stops_at_time_budget(self):
+        """Test the analysis stops when its time budget runs out."""
+        clock = [0.0]
+        analyze = self.cost_analyzer._analyze_resource_activity
+
+        def slow_analyze(resource):
+            clock[0] += 10
+            return analyze(resource)
+
+        resources = [
+            {"id": f"fn-{n}", "service": "LAMBDA", "type": "Function", "region": "us-east-1"}
+            for n in range(3)
+        ]
+        resources.append(
+            {"id": "lb-1", "service": "ELB", "type": "LoadBalancer", "region": "us-east-1"}
+        )
+
+        with patch("inventag.discovery.cost_analyzer.FORGOTTEN_ANALYSIS_WAVE_SIZE", 1), patch(
+            "inventag.discovery.cost_analyzer.time.monotonic", side_effect=lambda: clock[0]
+        ), patch.object(
+            self.cost_analyzer, "_analyze_resource_activity", side_effect=slow_analyze
+        ):
+            forgotten = self.cost_analyzer.detect_forgotten_resources(resources, time_budget=15)
+
+        self.assertEqual([f.resource_id for f in forgotten], ["lb-1", "fn-0"])
+
     def test_generate_cost_analysis_summary(self):
         """Test cost analysis summary generation."""
         cost_estimates = [
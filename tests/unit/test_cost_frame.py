@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the columnar cost frame
+
+Tests group-by rollups, thresholds, top-N and percentiles over cost estimates.
+"""
+
+from decimal import Decimal
+
+from inventag.discovery.cost_analyzer import (
+    CostAnalyzer,
+    CostThresholds,
+    ResourceCostEstimate,
+)
+from inventag.discovery.cost_frame import CostFrame, cost_center_of
+
+
+def make_estimate(resource_id, cost, service="EC2", region="us-east-1", **kwargs):
+    """Return a ResourceCostEstimate with the given monthly cost."""
+    return ResourceCostEstimate(
+        resource_id=resource_id,
+        resource_type="Instance",
+        service=service,
+        region=region,
+        estimated_monthly_cost=Decimal(cost),
+        **kwargs,
+    )
+
+
+def sample_estimates():
+    return [
+        make_estimate("a", "0.1", account_id="111", tags={"CostCenter": "web"}),
+        make_estimate("b", "0.2", account_id="111", tags={"costcenter": "web"}),
+        make_estimate(
+            "c", "250.00", service="RDS", region="eu-west-1", account_id="222"
+        ),
+        make_estimate(
+            "d",
+            "75.5",
+            service="S3",
+            tags=[{"Key": "Cost-Center", "Value": "data"}],
+        ),
+    ]
+
+
+def test_group_sums_are_exact_decimals():
+    """Rollups per dimension match Decimal arithmetic to the cent."""
+    frame = CostFrame.from_estimates(sample_estimates())
+
+    assert frame.total() == Decimal("325.8")
+    assert frame.group_sum("service") == {
+        "EC2": Decimal("0.3"),
+        "RDS": Decimal("250"),
+        "S3": Decimal("75.5"),
+    }
+    assert frame.group_sum("account") == {
+        "111": Decimal("0.3"),
+        "222": Decimal("250"),
+        "Unassigned": Decimal("75.5"),
+    }
+    assert frame.group_sum("cost_center")["web"] == Decimal("0.3")
+    assert frame.group_count("region") == {"us-east-1": 3, "eu-west-1": 1}
+
+
+def test_thresholds_top_n_and_percentiles():
+    """Threshold and ranking queries return row indices."""
+    frame = CostFrame.from_estimates(sample_estimates())
+
+    assert list(frame.indices_at_least("75.5")) == [2, 3]
+    assert frame.count_at_least("75.5", inclusive=False) == 1
+    assert [frame.resource_ids[i] for i in frame.top_n(2)] == ["c", "d"]
+    assert len(frame.top_n(10)) == 4
+    assert frame.percentile(100) == Decimal("250")
+    assert frame.percentile(0) == Decimal("0.1")
+    assert set(frame.percentiles()) == {"p50", "p90", "p99"}
+
+
+def test_cost_center_tag_forms():
+    """Cost-center tags are read from dict and raw AWS list forms."""
+    assert cost_center_of({"COSTCENTER": "ops"}) == "ops"
+    assert cost_center_of([{"Key": "cost_center", "Value": "ml"}]) == "ml"
+    assert cost_center_of({"Owner": "me"}) is None
+
+
+def test_summary_is_built_from_one_frame():
+    """The summary reports every dimension from a single frame."""
+    analyzer = CostAnalyzer(
+        thresholds=CostThresholds(expensive_resource_monthly_threshold=Decimal("50"))
+    )
+    estimates = sample_estimates()
+
+    expensive = analyzer.identify_expensive_resources(estimates)
+    summary = analyzer.generate_cost_analysis_summary(estimates, [], [])
+
+    assert [e.resource_id for e in expensive] == ["c", "d"]
+    assert summary.total_estimated_monthly_cost == Decimal("325.8")
+    assert summary.expensive_resources_count == 2
+    assert summary.cost_by_region["eu-west-1"] == Decimal("250")
+    assert summary.cost_by_cost_center == {
+        "web": Decimal("0.3"),
+        "Unassigned": Decimal("250"),
+        "data": Decimal("75.5"),
+    }
+    assert summary.cost_percentiles["p99"] <= Decimal("250")
+
+
+def test_rollups_follow_lists_changed_in_place():
+    """A list edited between calls is summarized as it is now."""
+    analyzer = CostAnalyzer()
+    estimates = sample_estimates()
+    analyzer.generate_cost_analysis_summary(estimates, [], [])
+
+    estimates[0] = make_estimate("a", "100.1", account_id="111")
+    summary = analyzer.generate_cost_analysis_summary(estimates, [], [])
+
+    assert summary.total_estimated_monthly_cost == Decimal("425.8")
+    assert summary.cost_by_service["EC2"] == Decimal("100.3")
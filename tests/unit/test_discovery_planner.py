@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DiscoveryPlanner
+
+Tests history-driven ordering and skipping of discovery tasks.
+"""
+
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from inventag.discovery.comprehensive_discovery import ComprehensiveAWSDiscovery
+from inventag.discovery.discovery_planner import DiscoveryPlanner
+from inventag.state.state_manager import StateManager
+
+
+def make_task(service, region, priority=1, operations=2):
+    return {
+        "service": service,
+        "region": region,
+        "config": {"operations": [("op", "Key", "Type")] * operations},
+        "priority": priority,
+    }
+
+
+class TestDiscoveryPlanner:
+    """Test the DiscoveryPlanner class."""
+
+    @pytest.fixture
+    def history_file(self, tmp_path):
+        return str(tmp_path / "discovery_history.json")
+
+    def test_skips_pairs_empty_in_last_runs(self, history_file):
+        """Test that a pair empty in the last N runs is skipped."""
+        tasks = [make_task("ec2", "us-east-1"), make_task("ec2", "eu-west-1")]
+
+        for _ in range(2):
+            planner = DiscoveryPlanner(history_file, empty_runs_to_skip=2)
+            planner.plan(tasks)
+            planner.record_run({("ec2", "us-east-1"): 4, ("ec2", "eu-west-1"): 0})
+
+        planner = DiscoveryPlanner(history_file, empty_runs_to_skip=2)
+        plan = planner.plan(tasks)
+
+        assert [t["region"] for t in plan.tasks] == ["us-east-1"]
+        assert plan.skipped == [("ec2", "eu-west-1")]
+        assert plan.calls_avoided == 2
+        assert planner.get_statistics()["tasks_skipped"] == 1
+
+    def test_failed_tasks_are_not_treated_as_empty(self, history_file):
+        """Test that failures (None) do not count towards skipping."""
+        planner = DiscoveryPlanner(history_file, empty_runs_to_skip=1)
+        planner.plan([make_task("rds", "us-east-1")])
+        planner.record_run({("rds", "us-east-1"): None})
+
+        plan = DiscoveryPlanner(history_file, empty_runs_to_skip=1).plan(
+            [make_task("rds", "us-east-1")]
+        )
+        assert len(plan.tasks) == 1
+
+    def test_periodic_full_sweep(self, history_file):
+        """Test that every Nth run scans skipped pairs again."""
+        task = make_task("lambda", "us-west-2")
+
+        skipped_runs = []
+        for _ in range(4):
+            planner = DiscoveryPlanner(
+                history_file, empty_runs_to_skip=1, full_sweep_interval=3
+            )
+            plan = planner.plan([task])
+            skipped_runs.append(bool(plan.skipped))
+            planner.record_run({("lambda", "us-west-2"): 0} if plan.tasks else {})
+
+        # Run 1 has no history, run 3 is a full sweep
+        assert skipped_runs == [False, True, False, True]
+
+    def test_orders_by_expected_count_within_priority(self, history_file):
+        """Test that larger pairs run first and unknown pairs are not starved."""
+        planner = DiscoveryPlanner(history_file)
+        planner.plan([])
+        planner.record_run({("s3", "us-east-1"): 2, ("ec2", "us-east-1"): 50})
+
+        planner = DiscoveryPlanner(history_file)
+        plan = planner.plan(
+            [
+                make_task("s3", "us-east-1"),
+                make_task("ec2", "us-east-1"),
+                make_task("iam", "us-east-1", priority=2),
+                make_task("sqs", "us-east-1"),
+            ]
+        )
+
+        assert [t["service"] for t in plan.tasks] == ["sqs", "ec2", "s3", "iam"]
+
+    def test_seeds_expected_counts_from_snapshot(self, history_file, tmp_path):
+        """Test that the latest state snapshot seeds expected counts."""
+        state_manager = StateManager(state_dir=str(tmp_path / "state"))
+        state_manager.save_state(
+            resources=[
+                {"service": "EC2", "region": "eu-west-1", "account_id": "111"},
+                {"service": "EC2", "region": "eu-west-1", "account_id": "111"},
+                {"service": "EC2", "region": "us-east-1", "account_id": "222"},
+            ],
+            account_id="111",
+            regions=["eu-west-1"],
+        )
+
+        planner = DiscoveryPlanner(
+            history_file, state_manager=state_manager, account_id="111"
+        )
+
+        assert planner.expected_count(("ec2", "eu-west-1")) == 2
+        assert planner.expected_count(("ec2", "us-east-1")) == 0
+
+
+class TestComprehensiveDiscoveryPlanning:
+    """Test planner integration in ComprehensiveAWSDiscovery."""
+
+    def test_skipped_pairs_are_not_executed(self, tmp_path):
+        """Test that skipped tasks make no API calls and are reported."""
+        planner = DiscoveryPlanner(
+            str(tmp_path / "history.json"), empty_runs_to_skip=1
+        )
+        planner.history["pairs"] = {"vpc:eu-west-1": [0], "vpc:us-east-1": [3]}
+
+        discovery = ComprehensiveAWSDiscovery(
+            session=Mock(), regions=["us-east-1", "eu-west-1"], planner=planner
+        )
+        discovery.service_discovery_patterns = {
+            "vpc": {
+                "operations": [("describe_vpcs", "Vpcs", "VPC")],
+                "regional": True,
+                "client_service": "ec2",
+            }
+        }
+        discovery._discover_service_in_region = Mock(return_value=1)
+
+        discovery._discover_all_service_resources(max_workers=2)
+
+        executed = [
+            call.args[0]["region"]
+            for call in discovery._discover_service_in_region.call_args_list
+        ]
+        assert executed == ["us-east-1"]
+
+        stats = discovery.get_discovery_statistics()
+        assert stats["tasks_skipped"] == 1
+        assert stats["calls_avoided"] == 1
+        assert planner.history["pairs"]["vpc:us-east-1"] == [3, 1]
+
+    def test_denied_pairs_are_not_recorded_as_empty(self, tmp_path):
+        """Test that a task whose operations are denied leaves history unchanged."""
+        planner = DiscoveryPlanner(str(tmp_path / "history.json"))
+        planner.history["pairs"] = {"vpc:us-east-1": [3]}
+
+        discovery = ComprehensiveAWSDiscovery(
+            session=Mock(), regions=["us-east-1"], planner=planner
+        )
+        discovery.service_discovery_patterns = {
+            "vpc": {
+                "operations": [("describe_vpcs", "Vpcs", "VPC")],
+                "regional": True,
+                "client_service": "ec2",
+            }
+        }
+        ec2 = boto3.client(
+            "ec2",
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        discovery.client_pool = Mock()
+        discovery.client_pool.get_client.return_value = ec2
+
+        with Stubber(ec2) as stubber:
+            # The paginated call and the direct-call fallback are both denied
+            stubber.add_client_error("describe_vpcs", service_error_code="AccessDenied")
+            stubber.add_client_error("describe_vpcs", service_error_code="AccessDenied")
+            discovery._discover_all_service_resources(max_workers=1)
+
+        assert planner.history["pairs"] == {"vpc:us-east-1": [3]}
+        assert discovery.get_discovery_statistics()["tasks_failed"] == 1
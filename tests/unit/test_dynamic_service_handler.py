@@ -5,6 +5,9 @@ Unit tests for DynamicServiceHandler
 Tests the pattern-based discovery system for unknown AWS services.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import boto3
 from unittest.mock import Mock, MagicMock, patch
@@ -251,5 +254,81 @@ class TestDynamicServiceHandler:
         assert self.handler._is_pattern_cached_as_failed(service, pattern)
 
 
+    def test_result_cache_is_lru_with_ttl(self):
+        """Test least recently used eviction and expiry of cached results."""
+        handler = DynamicServiceHandler(self.mock_session, cache_size=2, cache_ttl=60)
+        handler._cache_pattern_result("svc", "Type", "a", {"n": 1})
+        handler._cache_pattern_result("svc", "Type", "b", {"n": 2})
+        handler._get_cached_pattern_result("svc", "Type", "a")
+        handler._cache_pattern_result("svc", "Type", "c", {"n": 3})
+
+        assert handler._get_cached_pattern_result("svc", "Type", "b") is None
+        assert handler._get_cached_pattern_result("svc", "Type", "a") == {"n": 1}
+
+        later = time.time() + 120
+        with patch("inventag.discovery.service_enrichment.time.time", return_value=later):
+            assert handler._get_cached_pattern_result("svc", "Type", "c") is None
+
+        stats = handler.get_cache_statistics()
+        assert stats["evictions"] == 1
+        assert stats["expired"] == 1
+        assert stats["hits"] == 2
+
+    def test_failed_patterns_persist_between_runs(self, tmp_path):
+        """Test failed patterns are saved, reloaded and expire."""
+        resource = {"service": "textract", "type": "Document", "id": "doc-1"}
+        mock_client = Mock()
+        mock_client._service_model.service_name = "textract"
+        mock_client._service_model.operation_names = ["describe_document"]
+        self.mock_session.client.return_value = mock_client
+
+        first_run = DynamicServiceHandler(
+            self.mock_session, failure_cache_dir=str(tmp_path)
+        )
+        with patch.object(first_run, "_safe_api_call", return_value=None):
+            first_run.enrich_resource(resource)
+        # Saved once per enrichment pass, not per resource
+        assert not list(tmp_path.iterdir())
+        first_run.save_failed_patterns()
+
+        second_run = DynamicServiceHandler(
+            self.mock_session, failure_cache_dir=str(tmp_path)
+        )
+        assert second_run.get_cache_statistics()["failed_patterns_loaded"] == 1
+        with patch.object(second_run, "_safe_api_call") as mock_safe_call:
+            second_run.enrich_resource(resource)
+        mock_safe_call.assert_not_called()
+
+        expired = DynamicServiceHandler(
+            self.mock_session, failure_cache_dir=str(tmp_path), failure_ttl=-1
+        )
+        assert not expired._is_pattern_cached_as_failed(
+            "textract", "describe_document"
+        )
+
+    def test_pattern_that_worked_is_not_marked_failed(self):
+        """Test a per-resource miss does not block a pattern that has worked."""
+        self.handler._record_working_pattern("textract", "describe_document")
+        self.handler._cache_failed_pattern("textract", "describe_document")
+
+        assert not self.handler._is_pattern_cached_as_failed(
+            "textract", "describe_document"
+        )
+
+    def test_concurrent_cache_access(self):
+        """Test the result cache stays bounded under concurrent writers."""
+        handler = DynamicServiceHandler(self.mock_session, cache_size=50)
+
+        def fill(worker):
+            for i in range(200):
+                handler._cache_pattern_result("svc", "Type", f"{worker}-{i}", {})
+                handler._get_cached_pattern_result("svc", "Type", f"{worker}-{i // 2}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(fill, range(8)))
+
+        assert len(handler._pattern_cache) == 50
+        assert handler.get_cache_statistics()["evictions"] == 8 * 200 - 50
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared regional EC2 snapshot
+
+Tests that EC2 describe calls are made once per region and shared by consumers.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from inventag.discovery.ec2_snapshot import (
+    EC2SnapshotStore,
+    RegionalEC2Snapshot,
+    get_ec2_snapshot_store,
+)
+from inventag.discovery.network_analyzer import NetworkAnalyzer
+from inventag.discovery.security_analyzer import SecurityAnalyzer
+from inventag.discovery.service_handlers import EC2Handler
+
+
+def make_ec2_client():
+    """Return a mock EC2 client whose paginators yield one page per operation."""
+    client = Mock()
+    client.get_paginator.side_effect = lambda operation_name: Mock(
+        paginate=Mock(side_effect=lambda **kwargs: [getattr(client, operation_name)()])
+    )
+    return client
+
+
+def make_session(ec2_client):
+    """Return a mock session whose clients are all ``ec2_client``."""
+    session = Mock()
+    session.client.return_value = ec2_client
+    return session
+
+
+class TestRegionalEC2Snapshot:
+    """Test the RegionalEC2Snapshot class."""
+
+    def test_describes_each_kind_once_with_max_page_size(self):
+        """Test that a kind is paged through once and then served from memory."""
+        ec2 = Mock()
+        paginator = ec2.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {"Vpcs": [{"VpcId": "vpc-1"}]},
+            {"Vpcs": [{"VpcId": "vpc-2"}]},
+        ]
+        snapshot = RegionalEC2Snapshot(make_session(ec2), "us-east-1")
+
+        first = snapshot.get("vpcs")
+        second = snapshot.get("vpcs")
+
+        assert [v["VpcId"] for v in first] == ["vpc-1", "vpc-2"]
+        assert second is first
+        ec2.get_paginator.assert_called_once_with("describe_vpcs")
+        paginator.paginate.assert_called_once_with(PaginationConfig={"PageSize": 1000})
+        assert snapshot.api_calls == 2
+
+    def test_instances_are_flattened(self):
+        """Test that reservations are flattened into instances."""
+        ec2 = make_ec2_client()
+        ec2.describe_instances.return_value = {
+            "Reservations": [
+                {"Instances": [{"InstanceId": "i-1"}, {"InstanceId": "i-2"}]},
+                {"Instances": [{"InstanceId": "i-3"}]},
+            ]
+        }
+        snapshot = RegionalEC2Snapshot(make_session(ec2), "us-east-1")
+
+        assert [i["InstanceId"] for i in snapshot.get("instances")] == [
+            "i-1",
+            "i-2",
+            "i-3",
+        ]
+
+    def test_denied_describes_are_remembered(self):
+        """Test that a denied describe is raised again without a second call."""
+        ec2 = make_ec2_client()
+        ec2.describe_network_acls.side_effect = ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeNetworkAcls",
+        )
+        snapshot = RegionalEC2Snapshot(make_session(ec2), "us-east-1")
+
+        for _ in range(2):
+            with pytest.raises(ClientError, match="UnauthorizedOperation"):
+                snapshot.get("network_acls")
+
+        assert ec2.describe_network_acls.call_count == 1
+        assert snapshot.peek("network_acls") is None
+
+    def test_throttled_describes_are_retried(self):
+        """Test that a throttled describe is not remembered."""
+        ec2 = make_ec2_client()
+        ec2.describe_network_acls.side_effect = [
+            ClientError(
+                {"Error": {"Code": "RequestLimitExceeded", "Message": "slow down"}},
+                "DescribeNetworkAcls",
+            ),
+            {"NetworkAcls": [{"NetworkAclId": "acl-1"}]},
+        ]
+        snapshot = RegionalEC2Snapshot(make_session(ec2), "us-east-1")
+
+        with pytest.raises(ClientError, match="RequestLimitExceeded"):
+            snapshot.get("network_acls")
+
+        assert snapshot.get("network_acls") == [{"NetworkAclId": "acl-1"}]
+        assert ec2.describe_network_acls.call_count == 2
+
+    def test_concurrent_gets_describe_once(self):
+        """Test that racing consumers share a single describe call."""
+        ec2 = make_ec2_client()
+        ec2.describe_subnets.return_value = {"Subnets": [{"SubnetId": "subnet-1"}]}
+        snapshot = RegionalEC2Snapshot(make_session(ec2), "us-east-1")
+
+        threads = [
+            threading.Thread(target=snapshot.get, args=("subnets",)) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert ec2.describe_subnets.call_count == 1
+
+    def test_unknown_kind_is_rejected(self):
+        """Test that only registered kinds can be requested."""
+        snapshot = RegionalEC2Snapshot(make_session(Mock()), "us-east-1")
+
+        with pytest.raises(ValueError):
+            snapshot.get("volumes")
+
+
+class TestEC2SnapshotStore:
+    """Test the EC2SnapshotStore class."""
+
+    def test_snapshots_are_keyed_by_session_and_region(self):
+        """Test one snapshot per (session, region) until invalidated."""
+        store = EC2SnapshotStore()
+        session, other_session = Mock(), Mock()
+
+        east = store.get_snapshot(session, "us-east-1")
+
+        assert store.get_snapshot(session, "us-east-1") is east
+        assert store.get_snapshot(session, "eu-west-1") is not east
+        assert store.get_snapshot(other_session, "us-east-1") is not east
+        assert store.get_statistics()["snapshots"] == 3
+
+        store.invalidate(session)
+        assert store.get_snapshot(session, "us-east-1") is not east
+        assert store.get_statistics()["snapshots"] == 2
+
+    def test_shared_store_is_singleton(self):
+        """Test that all consumers get the same process-wide store."""
+        assert get_ec2_snapshot_store() is get_ec2_snapshot_store()
+
+
+class TestSnapshotConsumers:
+    """Test that analyzers and handlers share one snapshot per region."""
+
+    def test_analyzers_share_describe_calls(self):
+        """Test network and security analyzers reuse each other's describes."""
+        ec2 = make_ec2_client()
+        ec2.describe_vpcs.return_value = {
+            "Vpcs": [{"VpcId": "vpc-1", "CidrBlock": "10.0.0.0/16"}]
+        }
+        ec2.describe_security_groups.return_value = {
+            "SecurityGroups": [
+                {"GroupId": "sg-1", "GroupName": "web", "Description": "web"}
+            ]
+        }
+        session = make_session(ec2)
+        resources = [{"id": "sg-1", "region": "us-east-1"}]
+
+        network = NetworkAnalyzer(session=session)
+        network._cache_vpc_info("us-east-1")
+        NetworkAnalyzer(session=session)._cache_vpc_info("us-east-1")
+        SecurityAnalyzer(session=session).analyze_security_groups(resources)
+        SecurityAnalyzer(session=session).analyze_security_groups(resources)
+
+        assert "vpc-1" in network.vpc_cache
+        assert ec2.describe_vpcs.call_count == 1
+        assert ec2.describe_security_groups.call_count == 1
+
+    def test_ec2_handler_reuses_snapshot_instances(self):
+        """Test the EC2 handler only describes instances missing from the snapshot."""
+        session = Mock()
+        snapshot = get_ec2_snapshot_store().get_snapshot(session, "us-east-1")
+        snapshot._items["instances"] = [
+            {"InstanceId": "i-1", "InstanceType": "t3.micro"}
+        ]
+        handler = EC2Handler(session)
+        resources = [
+            {"service": "EC2", "type": "Instance", "id": i, "region": "us-east-1"}
+            for i in ("i-1", "i-2")
+        ]
+
+        def describe(client, operation_name, **kwargs):
+            return {
+                "Reservations": [
+                    {"Instances": [{"InstanceId": i, "InstanceType": "m5.large"}]}
+                    for i in kwargs["InstanceIds"]
+                ]
+            }
+
+        with patch.object(handler, "_batch_api_call", side_effect=describe) as call:
+            result = handler.enrich_batch(resources)
+
+        call.assert_called_once()
+        assert call.call_args.kwargs["InstanceIds"] == ["i-2"]
+        assert result[0]["service_attributes"]["instance_type"] == "t3.micro"
+        assert result[1]["service_attributes"]["instance_type"] == "m5.large"
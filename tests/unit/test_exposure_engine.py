@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the security group exposure engine
+
+Tests port-range interval sets, transitive security group references and
+NACL filtering of internet-reachable ports.
+"""
+
+import time
+
+from inventag.discovery.exposure_engine import ExposureEngine, PortRangeSet
+from inventag.discovery.security_analyzer import (
+    NACLAnalysis,
+    NACLRule,
+    SecurityAnalyzer,
+    SecurityGroupAnalysis,
+    SecurityRule,
+)
+
+
+def cidr_rule(cidr, port_range, protocol="tcp"):
+    """Return an inbound rule allowing a CIDR."""
+    return SecurityRule(
+        protocol=protocol,
+        port_range=port_range,
+        source_destination=cidr,
+        description="",
+        rule_type="inbound",
+        risk_assessment="low",
+        is_permissive=cidr == "0.0.0.0/0",
+    )
+
+
+def sg_rule(sg_id, port_range, protocol="tcp"):
+    """Return an inbound rule allowing another security group."""
+    return SecurityRule(
+        protocol=protocol,
+        port_range=port_range,
+        source_destination=f"sg-{sg_id}",
+        description="",
+        rule_type="inbound",
+        risk_assessment="low",
+        references_security_group=True,
+        referenced_sg_id=sg_id,
+    )
+
+
+def make_sg(sg_id, rules, vpc_id="vpc-1"):
+    """Return a SecurityGroupAnalysis with inbound rules."""
+    return SecurityGroupAnalysis(
+        group_id=sg_id,
+        group_name=sg_id,
+        description="",
+        vpc_id=vpc_id,
+        inbound_rules=rules,
+    )
+
+
+def nacl_rule(number, action, port_range, cidr="0.0.0.0/0", protocol="TCP"):
+    """Return an inbound NACL rule."""
+    return NACLRule(
+        rule_number=number,
+        protocol=protocol,
+        rule_action=action,
+        port_range=port_range,
+        cidr_block=cidr,
+        rule_type="inbound",
+    )
+
+
+class TestPortRangeSet:
+    """Test the PortRangeSet interval operations."""
+
+    def test_ranges_are_merged(self):
+        """Test overlapping and adjacent ranges collapse."""
+        ports = PortRangeSet([(80, 80), (443, 443), (81, 90), (85, 100)])
+
+        assert ports.ranges == ((80, 100), (443, 443))
+        assert 95 in ports and 101 not in ports
+        assert str(ports) == "80-100,443"
+        assert str(PortRangeSet.full()) == "All"
+
+    def test_intersection_and_difference(self):
+        """Test set algebra over interval lists."""
+        a = PortRangeSet([(0, 100), (200, 300)])
+        b = PortRangeSet([(50, 250)])
+
+        assert a.intersection(b).ranges == ((50, 100), (200, 250))
+        assert a.difference(b).ranges == ((0, 49), (251, 300))
+        assert not a.intersection(PortRangeSet([(101, 199)]))
+
+
+class TestExposureEngine:
+    """Test the ExposureEngine class."""
+
+    def test_internet_ports_merge_across_groups(self):
+        """Test internet rules of all of a resource's groups are combined."""
+        engine = ExposureEngine(
+            {
+                "sg-web": make_sg(
+                    "sg-web",
+                    [
+                        cidr_rule("0.0.0.0/0", "443"),
+                        cidr_rule("0.0.0.0/0", "80-90"),
+                        cidr_rule("10.0.0.0/8", "22"),
+                    ],
+                ),
+                "sg-dns": make_sg("sg-dns", [cidr_rule("::/0", "53", "udp")]),
+                "sg-any": make_sg("sg-any", [cidr_rule("0.0.0.0/0", "All", "All")]),
+            }
+        )
+
+        exposure = engine.exposure_for_resource(
+            {"id": "i-1", "security_groups": ["sg-web", "sg-dns"]}
+        )
+
+        assert exposure.internet_ports == {"tcp": "80-90,443", "udp": "53"}
+        assert exposure.exposing_security_groups == ["sg-dns", "sg-web"]
+        assert engine.exposure_for_resource(
+            {"id": "i-2", "security_groups": ["sg-any"]}
+        ).internet_ports == {"icmp": "All", "tcp": "All", "udp": "All"}
+
+    def test_references_resolve_transitively(self):
+        """Test groups reachable through an exposed group's members are flagged."""
+        engine = ExposureEngine(
+            {
+                "sg-lb": make_sg("sg-lb", [cidr_rule("0.0.0.0/0", "443")]),
+                "sg-app": make_sg("sg-app", [sg_rule("sg-lb", "8080")]),
+                "sg-db": make_sg(
+                    "sg-db", [sg_rule("sg-app", "5432"), sg_rule("sg-db", "5432")]
+                ),
+                "sg-admin": make_sg("sg-admin", [sg_rule("sg-bastion", "22")]),
+            }
+        )
+
+        db = engine.exposure_for_resource({"id": "db", "security_groups": ["sg-db"]})
+        admin = engine.exposure_for_resource(
+            {"id": "admin", "security_groups": ["sg-admin"]}
+        )
+
+        assert db.internet_ports == {}
+        assert db.indirect_ports == {"tcp": "5432"}
+        assert db.pivot_security_groups == ["sg-app", "sg-db"]
+        assert admin.indirect_ports == {}
+
+    def test_nacl_filters_internet_ports(self):
+        """Test NACL rules are applied in rule-number order."""
+        nacl = NACLAnalysis(
+            nacl_id="acl-1",
+            nacl_name="acl-1",
+            vpc_id="vpc-1",
+            is_default=False,
+            inbound_rules=[
+                nacl_rule(200, "allow", "All", protocol="All"),
+                nacl_rule(100, "deny", "22"),
+                nacl_rule(110, "allow", "3389", cidr="8.8.8.0/24"),
+                nacl_rule(120, "deny", "3389"),
+                nacl_rule(32767, "deny", "All", protocol="All"),
+            ],
+            associated_subnets=["subnet-1"],
+        )
+        engine = ExposureEngine(
+            {"sg-1": make_sg("sg-1", [cidr_rule("0.0.0.0/0", "All")])},
+            {"acl-1": nacl},
+        )
+
+        exposure = engine.exposure_for_resource(
+            {"id": "i-1", "security_groups": ["sg-1"], "subnet_id": "subnet-1"}
+        )
+
+        assert exposure.nacl_id == "acl-1"
+        assert exposure.internet_ports == {"tcp": "0-21,23-65535"}
+        assert engine.nacl_allowed_ports("acl-1", "tcp").ranges == (
+            (0, 21),
+            (23, 65535),
+        )
+
+    def test_twenty_thousand_groups(self):
+        """Test compiling and querying 20k security groups stays fast."""
+        groups = {}
+        for i in range(20000):
+            rules = [cidr_rule("10.0.0.0/8", "22"), sg_rule(f"sg-{i - 1}", "8080")]
+            if i % 100 == 0:
+                rules.append(cidr_rule("0.0.0.0/0", "443"))
+            groups[f"sg-{i}"] = make_sg(f"sg-{i}", rules)
+        resources = [
+            {"id": f"r-{i}", "security_groups": [f"sg-{i}"]} for i in range(20000)
+        ]
+
+        started = time.time()
+        exposures = ExposureEngine(groups).exposure_for_resources(resources)
+        elapsed = time.time() - started
+
+        assert len(exposures) == 20000
+        assert exposures["r-100"].internet_ports == {"tcp": "443"}
+        assert exposures["r-101"].indirect_ports == {"tcp": "8080"}
+        assert exposures["r-50"].indirect_ports == {"tcp": "8080"}
+        assert elapsed < 10
+
+
+class TestSecurityAnalyzerExposure:
+    """Test SecurityAnalyzer reuse of compiled results."""
+
+    def test_engine_and_permissive_rules_are_reused(self):
+        """Test repeated queries do not recompile or rescan unchanged groups."""
+        analyzer = SecurityAnalyzer(session=object())
+        analyzer.sg_cache["sg-1"] = make_sg("sg-1", [cidr_rule("0.0.0.0/0", "22")])
+
+        engine = analyzer.get_exposure_engine()
+        first = analyzer.identify_overly_permissive_rules(analyzer.sg_cache)
+
+        assert analyzer.get_exposure_engine() is engine
+        assert analyzer.identify_overly_permissive_rules(analyzer.sg_cache) == first
+        assert analyzer.analyze_resource_exposure(
+            [{"id": "i-1", "security_groups": ["sg-1"]}]
+        )["i-1"].internet_ports == {"tcp": "22"}
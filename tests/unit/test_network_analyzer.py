@@ -15,6 +15,17 @@ from inventag.discovery.network_analyzer import (
 )
 
 
+def make_ec2_client(responses):
+    """Return a mock EC2 client answering each operation with one page."""
+    client = Mock()
+    for operation_name, response in responses.items():
+        getattr(client, operation_name).return_value = response
+    client.get_paginator.side_effect = lambda operation_name: Mock(
+        paginate=Mock(side_effect=lambda **kwargs: [getattr(client, operation_name)()])
+    )
+    return client
+
+
 class TestNetworkAnalyzer(unittest.TestCase):
     """Test cases for NetworkAnalyzer class."""
 
@@ -127,8 +138,6 @@ class TestNetworkAnalyzer(unittest.TestCase):
 
     def test_cache_vpc_info(self):
         """Test VPC information caching."""
-        mock_ec2 = Mock()
-
         # Mock VPC response
         vpc_response = {
             "Vpcs": [
@@ -149,9 +158,11 @@ class TestNetworkAnalyzer(unittest.TestCase):
                 }
             ]
         }
-        mock_ec2.describe_vpcs.return_value = vpc_response
+        self.mock_session.client.return_value = make_ec2_client(
+            {"describe_vpcs": vpc_response}
+        )
 
-        self.analyzer._cache_vpc_info(mock_ec2, "us-east-1")
+        self.analyzer._cache_vpc_info("us-east-1")
 
         # Verify VPC was cached
         self.assertIn("vpc-12345", self.analyzer.vpc_cache)
@@ -169,8 +180,6 @@ class TestNetworkAnalyzer(unittest.TestCase):
 
     def test_cache_subnet_info(self):
         """Test subnet information caching."""
-        mock_ec2 = Mock()
-
         # Set up VPC cache first
         self.analyzer.vpc_cache["vpc-12345"] = VPCAnalysis(
             vpc_id="vpc-12345", vpc_name="test-vpc", cidr_block="10.0.0.0/16"
@@ -189,9 +198,11 @@ class TestNetworkAnalyzer(unittest.TestCase):
                 }
             ]
         }
-        mock_ec2.describe_subnets.return_value = subnet_response
+        self.mock_session.client.return_value = make_ec2_client(
+            {"describe_subnets": subnet_response}
+        )
 
-        self.analyzer._cache_subnet_info(mock_ec2, "us-east-1")
+        self.analyzer._cache_subnet_info("us-east-1")
 
         # Verify subnet was cached
         self.assertIn("subnet-12345", self.analyzer.subnet_cache)
@@ -468,43 +479,41 @@ class TestNetworkAnalyzer(unittest.TestCase):
     def test_analyze_vpc_resources_integration(self, mock_logger):
         """Test the main analyze_vpc_resources method integration."""
         # Mock the session and EC2 client
-        mock_ec2 = Mock()
+        mock_ec2 = make_ec2_client(
+            {
+                "describe_vpcs": {
+                    "Vpcs": [
+                        {
+                            "VpcId": "vpc-12345",
+                            "CidrBlock": "10.0.0.0/16",
+                            "Tags": [{"Key": "Name", "Value": "test-vpc"}],
+                        }
+                    ]
+                },
+                "describe_subnets": {
+                    "Subnets": [
+                        {
+                            "SubnetId": "subnet-12345",
+                            "VpcId": "vpc-12345",
+                            "CidrBlock": "10.0.1.0/24",
+                            "AvailabilityZone": "us-east-1a",
+                            "AvailableIpAddressCount": 200,
+                            "Tags": [{"Key": "Name", "Value": "test-subnet"}],
+                        }
+                    ]
+                },
+                # Other network components
+                "describe_internet_gateways": {"InternetGateways": []},
+                "describe_nat_gateways": {"NatGateways": []},
+                "describe_vpc_endpoints": {"VpcEndpoints": []},
+                "describe_vpc_peering_connections": {"VpcPeeringConnections": []},
+                "describe_transit_gateway_attachments": {
+                    "TransitGatewayAttachments": []
+                },
+            }
+        )
         self.mock_session.client.return_value = mock_ec2
 
-        # Mock VPC response
-        mock_ec2.describe_vpcs.return_value = {
-            "Vpcs": [
-                {
-                    "VpcId": "vpc-12345",
-                    "CidrBlock": "10.0.0.0/16",
-                    "Tags": [{"Key": "Name", "Value": "test-vpc"}],
-                }
-            ]
-        }
-
-        # Mock subnet response
-        mock_ec2.describe_subnets.return_value = {
-            "Subnets": [
-                {
-                    "SubnetId": "subnet-12345",
-                    "VpcId": "vpc-12345",
-                    "CidrBlock": "10.0.1.0/24",
-                    "AvailabilityZone": "us-east-1a",
-                    "AvailableIpAddressCount": 200,
-                    "Tags": [{"Key": "Name", "Value": "test-subnet"}],
-                }
-            ]
-        }
-
-        # Mock other network components
-        mock_ec2.describe_internet_gateways.return_value = {"InternetGateways": []}
-        mock_ec2.describe_nat_gateways.return_value = {"NatGateways": []}
-        mock_ec2.describe_vpc_endpoints.return_value = {"VpcEndpoints": []}
-        mock_ec2.describe_vpc_peering_connections.return_value = {"VpcPeeringConnections": []}
-        mock_ec2.describe_transit_gateway_attachments.return_value = {
-            "TransitGatewayAttachments": []
-        }
-
         # Test resources
         resources = [
             {
@@ -524,6 +533,77 @@ class TestNetworkAnalyzer(unittest.TestCase):
         self.assertEqual(len(vpc_analysis.subnets), 1)
         self.assertEqual(vpc_analysis.associated_resources, ["i-12345"])
 
+    def test_describe_uses_max_page_size(self):
+        """Test describe calls paginate with the largest page size."""
+        paginator = Mock()
+        paginator.paginate.return_value = [
+            {"Vpcs": [{"VpcId": "vpc-1", "CidrBlock": "10.0.0.0/16"}]},
+            {"Vpcs": [{"VpcId": "vpc-2", "CidrBlock": "10.1.0.0/16"}]},
+        ]
+        mock_ec2 = Mock()
+        mock_ec2.get_paginator.return_value = paginator
+        self.mock_session.client.return_value = mock_ec2
+
+        self.analyzer._cache_vpc_info("us-east-1")
+
+        self.assertEqual(sorted(self.analyzer.vpc_cache), ["vpc-1", "vpc-2"])
+        mock_ec2.get_paginator.assert_called_once_with("describe_vpcs")
+        paginator.paginate.assert_called_once_with(
+            PaginationConfig={"PageSize": 1000}
+        )
+
+    def test_regions_are_merged_concurrently(self):
+        """Test every region's VPCs and subnets land in the shared caches."""
+        regions = ["us-east-1", "eu-west-1", "ap-southeast-2"]
+
+        def client_for(service_name, region_name=None, **kwargs):
+            index = regions.index(region_name)
+            return make_ec2_client(
+                {
+                    "describe_vpcs": {
+                        "Vpcs": [{"VpcId": f"vpc-{index}", "CidrBlock": "10.0.0.0/16"}]
+                    },
+                    "describe_subnets": {
+                        "Subnets": [
+                            {
+                                "SubnetId": f"subnet-{index}",
+                                "VpcId": f"vpc-{index}",
+                                "CidrBlock": "10.0.1.0/24",
+                                "AvailabilityZone": f"{region_name}a",
+                                "AvailableIpAddressCount": 250,
+                            }
+                        ]
+                    },
+                    "describe_internet_gateways": {
+                        "InternetGateways": [
+                            {
+                                "InternetGatewayId": f"igw-{index}",
+                                "Attachments": [{"VpcId": f"vpc-{index}"}],
+                            }
+                        ]
+                    },
+                    "describe_nat_gateways": {"NatGateways": []},
+                    "describe_vpc_endpoints": {"VpcEndpoints": []},
+                    "describe_vpc_peering_connections": {"VpcPeeringConnections": []},
+                    "describe_transit_gateway_attachments": {
+                        "TransitGatewayAttachments": []
+                    },
+                }
+            )
+
+        session = Mock()
+        session.client.side_effect = client_for
+        analyzer = NetworkAnalyzer(session=session, max_workers=3)
+
+        result = analyzer.analyze_vpc_resources(
+            [{"id": f"r-{r}", "region": r} for r in regions]
+        )
+
+        self.assertEqual(sorted(result), ["vpc-0", "vpc-1", "vpc-2"])
+        self.assertEqual(len(analyzer.subnet_cache), 3)
+        self.assertEqual(result["vpc-2"].internet_gateway_id, "igw-2")
+        self.assertEqual(len(result["vpc-1"].subnets), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the network topology graph
+
+Tests containment, link and blast radius queries over set-based adjacency.
+"""
+
+from inventag.discovery.network_topology import (
+    PEERING,
+    ROUTE_TABLE,
+    ROUTE_TABLE_ASSOCIATION,
+    SECURITY_GROUP_MEMBER,
+    TRANSIT_GATEWAY,
+    TRANSIT_GATEWAY_ATTACHMENT,
+    NetworkTopologyGraph,
+    security_group_ids_of,
+)
+from inventag.state.delta_detector import DeltaDetector
+
+
+def build_graph():
+    """Return a graph with two peered VPCs and a third behind a transit gateway."""
+    graph = NetworkTopologyGraph.from_resources(
+        [
+            {
+                "id": "i-1",
+                "vpc_id": "vpc-a",
+                "subnet_id": "subnet-a1",
+                "security_groups": [{"GroupId": "sg-web"}],
+                "network_interfaces": ["eni-1"],
+            },
+            {"id": "i-2", "vpc_id": "vpc-a", "subnet_id": "subnet-a2"},
+            {
+                "id": "db-1",
+                "vpc_id": "vpc-b",
+                "subnet_id": "subnet-b1",
+                "security_group_ids": ["sg-db"],
+            },
+            {"id": "fn-1", "vpc_id": "vpc-c", "subnet_id": "subnet-c1"},
+        ]
+    )
+    graph.add_link("vpc-a", "vpc-b", PEERING)
+    graph.add_node("tgw-1", TRANSIT_GATEWAY)
+    graph.add_link("vpc-a", "tgw-1", TRANSIT_GATEWAY_ATTACHMENT)
+    graph.add_link("vpc-c", "tgw-1", TRANSIT_GATEWAY_ATTACHMENT)
+    graph.add_node("rtb-1", ROUTE_TABLE)
+    graph.add_link("rtb-1", "subnet-a2", ROUTE_TABLE_ASSOCIATION)
+    return graph
+
+
+class TestNetworkTopologyGraph:
+    """Test the NetworkTopologyGraph class."""
+
+    def test_resources_in_vpc_and_subnet(self):
+        """Test membership queries walk VPC -> subnet -> ENI -> resource."""
+        graph = build_graph()
+
+        assert graph.resources_in("vpc-a") == {"i-1", "i-2"}
+        assert graph.resources_in("subnet-a1") == {"i-1"}
+        assert graph.contains("eni-1", "i-1")
+        assert graph.contains("subnet-a1", "eni-1")
+
+    def test_reachable_resources_via_peering_and_transit_gateway(self):
+        """Test peered and TGW-attached VPCs are one hop away."""
+        graph = build_graph()
+
+        assert graph.connected_vpcs("vpc-a") == {"vpc-b", "vpc-c"}
+        assert graph.connected_vpcs("vpc-a", include_transit_gateways=False) == {
+            "vpc-b"
+        }
+        # Peering is not transitive
+        assert graph.connected_vpcs("vpc-b") == {"vpc-a"}
+        assert graph.reachable_resources("vpc-a") == {"db-1", "fn-1"}
+
+    def test_blast_radius(self):
+        """Test blast radius of subnets, security groups, route tables and TGWs."""
+        graph = build_graph()
+
+        assert graph.blast_radius("subnet-a1") == {"i-1"}
+        assert graph.blast_radius("sg-web") == {"i-1"}
+        assert graph.blast_radius("rtb-1") == {"i-2"}
+        assert graph.blast_radius("tgw-1") == {"i-1", "i-2", "fn-1"}
+
+    def test_edges_are_deduplicated(self):
+        """Test repeated edges are reported and stored once."""
+        graph = NetworkTopologyGraph()
+
+        assert graph.add_containment("vpc-a", "i-1") is True
+        assert graph.add_containment("vpc-a", "i-1") is False
+        assert graph.add_link("i-1", "sg-1", SECURITY_GROUP_MEMBER) is True
+        assert graph.add_link("sg-1", "i-1", SECURITY_GROUP_MEMBER) is False
+
+        stats = graph.get_statistics()
+        assert stats["containment_edges"] == 1
+        assert stats["link_edges"] == {SECURITY_GROUP_MEMBER: 1}
+
+    def test_security_group_ids_of(self):
+        """Test security group IDs are read from the common resource shapes."""
+        assert security_group_ids_of(
+            {"security_groups": ["sg-1"], "SecurityGroups": [{"GroupId": "sg-2"}]}
+        ) == ["sg-1", "sg-2"]
+        assert security_group_ids_of({"security_groups": None}) == []
+
+
+class TestDeltaDetectorRelationshipIndex:
+    """Test that delta impact analysis reads related resources from the index."""
+
+    def test_related_resources_follow_shared_network_attributes(self):
+        """Test only resources sharing a VPC, subnet, SG, role or key are related."""
+        detector = DeltaDetector()
+        resources = {
+            "arn:vpc": {"service": "VPC", "vpc_id": "vpc-1"},
+            "arn:ec2": {
+                "service": "EC2",
+                "vpc_id": "vpc-1",
+                "security_groups": ["sg-1"],
+            },
+            "arn:rds": {"service": "RDS", "security_groups": ["sg-1"]},
+            "arn:other": {"service": "EC2", "vpc_id": "vpc-2"},
+        }
+        index = detector._build_relationship_index(resources)
+
+        assert detector._related_candidates(resources["arn:vpc"], index) == {
+            "arn:vpc",
+            "arn:ec2",
+        }
+        assert detector._related_candidates(resources["arn:rds"], index) == {
+            "arn:ec2",
+            "arn:rds",
+        }
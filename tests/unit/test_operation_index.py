@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OperationPlanIndex
+
+Tests compiling discovery plans from botocore service models.
+"""
+
+from unittest.mock import Mock
+
+import boto3
+import pytest
+
+from inventag.discovery.operation_index import OperationPlanIndex
+from inventag.discovery.optimized_dynamic_discovery import OptimizedDynamicDiscovery
+
+
+@pytest.fixture
+def lambda_client():
+    return boto3.client(
+        "lambda",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+
+
+@pytest.fixture
+def ec2_client():
+    return boto3.client(
+        "ec2",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+
+
+class TestOperationPlanIndex:
+    """Test the OperationPlanIndex class."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        return OperationPlanIndex(index_dir=str(tmp_path / "index"))
+
+    def test_paginated_operation_plan(self, index, lambda_client):
+        """Test page size limits and result keys come from the models."""
+        plan = index.get_plan(lambda_client, "ListFunctions")
+
+        assert plan.method_name == "list_functions"
+        assert plan.paginated
+        assert not plan.requires_input
+        assert plan.result_key == "Functions"
+        assert plan.pagination_config() == {"PageSize": plan.max_page_size}
+
+    def test_nested_result_key_is_trimmed(self, index, ec2_client):
+        """Test JMESPath result keys resolve to their top-level member."""
+        plan = index.get_plan(ec2_client, "describe_instances")
+
+        assert plan.name == "DescribeInstances"
+        assert plan.result_key == "Reservations"
+
+    def test_discovery_operations_exclude_required_input(self, index, lambda_client):
+        """Test operations with required input are never discovery candidates."""
+        names = [p.name for p in index.get_discovery_operations(lambda_client)]
+
+        assert "ListFunctions" in names
+        assert "GetFunction" not in names
+        assert "ListTags" not in names
+        assert not index.get_plan(lambda_client, "GetFunction").is_discovery_candidate
+        assert names[0].startswith("List")
+
+    def test_index_persists_per_botocore_version(self, tmp_path, lambda_client):
+        """Test a compiled service is reloaded from disk without recompiling."""
+        index_dir = str(tmp_path / "index")
+        OperationPlanIndex(index_dir=index_dir).get_service_plans(lambda_client)
+
+        reloaded = OperationPlanIndex(index_dir=index_dir)
+        plan = reloaded.get_plan(lambda_client, "ListFunctions")
+
+        assert plan.result_key == "Functions"
+        assert reloaded.get_statistics()["services_compiled"] == 0
+        assert reloaded.index_file.name.startswith("operation_plans_")
+
+    def test_index_without_directory_stays_in_memory(self, tmp_path, lambda_client):
+        """Test an index without a directory compiles but never writes to disk."""
+        index = OperationPlanIndex()
+
+        assert index.get_plan(lambda_client, "ListFunctions").paginated
+        assert index.index_file is None
+        assert index.get_statistics()["services_compiled"] == 1
+
+
+class TestOptimizedDiscoveryOperationPlans:
+    """Test OptimizedDynamicDiscovery using compiled operation plans."""
+
+    def test_uses_result_key_and_page_size(self, tmp_path, lambda_client):
+        """Test the plan's page size and result key drive extraction."""
+        discovery = OptimizedDynamicDiscovery(
+            session=Mock(), operation_index=OperationPlanIndex(str(tmp_path))
+        )
+
+        paginator = Mock()
+        paginator.paginate.return_value = [
+            {"Functions": [{"FunctionName": "fn", "FunctionArn": "arn:fn"}]}
+        ]
+        client = Mock(wraps=lambda_client)
+        client.meta = lambda_client.meta
+        client.get_paginator.return_value = paginator
+
+        resources = discovery._execute_operation_cached(
+            client, "ListFunctions", "lambda", "us-east-1"
+        )
+
+        plan = discovery.operation_index.get_plan(lambda_client, "ListFunctions")
+        paginator.paginate.assert_called_once_with(
+            PaginationConfig={"PageSize": plan.max_page_size}
+        )
+        assert len(resources) == 1
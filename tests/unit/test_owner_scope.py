@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for owner-scoped discovery parameters
+
+Tests the declarative owner-scoping table and its use by discovery engines.
+"""
+
+from unittest.mock import Mock
+
+import botocore.session
+import pytest
+
+from inventag.discovery.comprehensive_discovery import ComprehensiveAWSDiscovery
+from inventag.discovery.optimized_discovery import OptimizedAWSDiscovery
+from inventag.discovery.owner_scope import (
+    OWNER_SCOPED_PARAMETERS,
+    apply_owner_scope,
+    get_owner_scope_params,
+)
+
+
+def make_client(service_name):
+    client = Mock()
+    client.meta.service_model.service_name = service_name
+    client.meta.region_name = "us-east-1"
+    return client
+
+
+class TestOwnerScopeTable:
+    """Test the owner-scoping parameter table."""
+
+    @pytest.mark.parametrize("key", sorted(OWNER_SCOPED_PARAMETERS))
+    def test_parameters_exist_in_service_models(self, key):
+        """Test every table entry names real operations and input members."""
+        service_name, operation_name = key
+        operation_model = (
+            botocore.session.get_session()
+            .get_service_model(service_name)
+            .operation_model(operation_name)
+        )
+
+        for param in OWNER_SCOPED_PARAMETERS[key]:
+            assert param in operation_model.input_shape.members
+
+    def test_lookup_by_method_name_returns_copy(self):
+        """Test snake_case lookups and that callers cannot mutate the table."""
+        params = get_owner_scope_params("ec2", "describe_snapshots")
+        params["OwnerIds"].append("123456789012")
+
+        assert get_owner_scope_params("EC2", "DescribeSnapshots") == {
+            "OwnerIds": ["self"]
+        }
+        assert get_owner_scope_params("ec2", "describe_vpcs") == {}
+
+    def test_explicit_parameters_take_precedence(self):
+        """Test that configured request parameters override the table."""
+        assert apply_owner_scope("iam", "list_policies", {"Scope": "All"}) == {
+            "Scope": "All"
+        }
+
+
+class TestOwnerScopedDiscovery:
+    """Test owner scoping in the discovery engines."""
+
+    def test_comprehensive_discovery_scopes_requests(self):
+        """Test that table parameters are sent with paginated operations."""
+        paginator = Mock()
+        paginator.paginate.return_value = [{"Images": []}]
+        client = make_client("ec2")
+        client.get_paginator.return_value = paginator
+
+        discovery = ComprehensiveAWSDiscovery(session=Mock(), regions=["us-east-1"])
+        discovery._execute_discovery_operation(
+            client, "ec2", "us-east-1", ("describe_images", "Images", "Image")
+        )
+
+        paginator.paginate.assert_called_once_with(Owners=["self"])
+
+    def test_owner_scoping_can_be_disabled(self):
+        """Test that disabling owner scoping sends the configured params only."""
+        paginator = Mock()
+        paginator.paginate.return_value = [{"Images": []}]
+        client = make_client("ec2")
+        client.get_paginator.return_value = paginator
+
+        discovery = ComprehensiveAWSDiscovery(
+            session=Mock(), regions=["us-east-1"], owner_scoped=False
+        )
+        discovery._execute_discovery_operation(
+            client, "ec2", "us-east-1", ("describe_images", "Images", "Image")
+        )
+
+        paginator.paginate.assert_called_once_with()
+
+    def test_optimized_discovery_scopes_direct_calls(self):
+        """Test that OptimizedAWSDiscovery passes owner scoping to direct calls."""
+        client = make_client("iam")
+        client.list_policies.return_value = {"Policies": []}
+
+        discovery = OptimizedAWSDiscovery(session=Mock(), regions=["us-east-1"])
+        discovery._discover_via_operation_enhanced(
+            client, "ListPolicies", "iam", "us-east-1"
+        )
+
+        client.list_policies.assert_called_once_with(Scope="Local")
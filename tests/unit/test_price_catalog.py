@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local price catalog
+
+Tests ingesting JSON and CSV bulk offer files and offline cost lookups.
+"""
+
+import csv
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import boto3
+import pytest
+
+from inventag.discovery.cost_analyzer import CostAnalyzer
+from inventag.discovery.price_catalog import PriceCatalog
+
+VIRGINIA = "US East (N. Virginia)"
+OREGON = "US West (Oregon)"
+
+
+def ec2_product(sku, instance_type, location=VIRGINIA, operating_system="Linux"):
+    """Return an EC2 product entry of a JSON offer file."""
+    return {
+        "sku": sku,
+        "productFamily": "Compute Instance",
+        "attributes": {
+            "servicecode": "AmazonEC2",
+            "location": location,
+            "instanceType": instance_type,
+            "tenancy": "Shared",
+            "operatingSystem": operating_system,
+            "usagetype": f"BoxUsage:{instance_type}",
+        },
+    }
+
+
+def on_demand_term(sku, price, unit="Hrs"):
+    """Return the on-demand term of a SKU in a JSON offer file."""
+    return {
+        f"{sku}.JRTCKXETXF": {
+            "priceDimensions": {
+                f"{sku}.JRTCKXETXF.6YS6EN2CT7": {
+                    "unit": unit,
+                    "beginRange": "0",
+                    "endRange": "Inf",
+                    "pricePerUnit": {"USD": price},
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture
+def ec2_offer_file(tmp_path):
+    """Write a small EC2 JSON offer file."""
+    products = {
+        "SKU1": ec2_product("SKU1", "t3.micro"),
+        "SKU2": ec2_product("SKU2", "m5.large"),
+        "SKU3": ec2_product("SKU3", "m5.large", operating_system="Windows"),
+        "SKU4": ec2_product("SKU4", "m5.large", location=OREGON),
+    }
+    prices = {"SKU1": "0.0104", "SKU2": "0.0960", "SKU3": "0.1880", "SKU4": "0.0970"}
+    offer = {
+        "formatVersion": "v1.0",
+        "offerCode": "AmazonEC2",
+        "version": "20261001000000",
+        "publicationDate": "2026-10-01T00:00:00Z",
+        "products": products,
+        "terms": {
+            "OnDemand": {
+                sku: on_demand_term(sku, price) for sku, price in prices.items()
+            }
+        },
+    }
+    path = tmp_path / "AmazonEC2.json"
+    path.write_text(json.dumps(offer))
+    return str(path)
+
+
+@pytest.fixture
+def s3_offer_file(tmp_path):
+    """Write a small S3 CSV offer file with tiered storage prices."""
+    path = tmp_path / "AmazonS3.csv"
+    header = [
+        "SKU",
+        "OfferTermCode",
+        "RateCode",
+        "TermType",
+        "PriceDescription",
+        "EffectiveDate",
+        "StartingRange",
+        "EndingRange",
+        "Unit",
+        "PricePerUnit",
+        "Currency",
+        "Product Family",
+        "serviceCode",
+        "Location",
+        "Storage Class",
+        "usageType",
+    ]
+    storage = [
+        "Storage",
+        "AmazonS3",
+        VIRGINIA,
+        "General Purpose",
+        "TimedStorage-ByteHrs",
+    ]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(["FormatVersion", "v1.0"])
+        writer.writerow(["Disclaimer", "Fixture prices"])
+        writer.writerow(["Publication Date", "2026-10-01T00:00:00Z"])
+        writer.writerow(["Version", "20261001000000"])
+        writer.writerow(["OfferCode", "AmazonS3"])
+        writer.writerow(header)
+        writer.writerow(
+            [
+                "S3SKU",
+                "JRTCKXETXF",
+                "R2",
+                "OnDemand",
+                "Next 450 TB",
+                "",
+                "51200",
+                "512000",
+                "GB-Mo",
+                "0.0220",
+                "USD",
+            ]
+            + storage
+        )
+        writer.writerow(
+            [
+                "S3SKU",
+                "JRTCKXETXF",
+                "R1",
+                "OnDemand",
+                "First 50 TB",
+                "",
+                "0",
+                "51200",
+                "GB-Mo",
+                "0.0230",
+                "USD",
+            ]
+            + storage
+        )
+        writer.writerow(
+            [
+                "S3SKU",
+                "4NA7Y494T4",
+                "R3",
+                "Reserved",
+                "Reserved",
+                "",
+                "0",
+                "Inf",
+                "GB-Mo",
+                "0.0100",
+                "USD",
+            ]
+            + storage
+        )
+    return str(path)
+
+
+def test_ingest_json_offer_and_lookup(ec2_offer_file):
+    """Lookups match indexed and free-form attributes of the JSON offer file."""
+    with PriceCatalog() as catalog:
+        summary = catalog.ingest_offer_file(ec2_offer_file)
+
+        assert summary.service_code == "AmazonEC2"
+        assert summary.product_count == 4
+        assert summary.locations == [VIRGINIA, OREGON]
+        assert len(catalog) == 4
+
+        price = catalog.lookup(
+            "AmazonEC2",
+            VIRGINIA,
+            {"instanceType": "m5.large", "operating-system": "Linux"},
+        )
+        assert price.sku == "SKU2"
+        assert price.price_per_unit == Decimal("0.0960")
+        assert price.unit == "Hrs"
+
+        windows = catalog.lookup(
+            "AmazonEC2",
+            VIRGINIA,
+            {"instanceType": "m5.large", "operatingSystem": "windows"},
+        )
+        assert windows.sku == "SKU3"
+        assert (
+            catalog.lookup("AmazonEC2", VIRGINIA, {"instanceType": "x2.huge"}) is None
+        )
+
+
+def test_ingest_csv_offer_keeps_first_on_demand_tier(s3_offer_file):
+    """CSV offer files are parsed after their metadata lines."""
+    with PriceCatalog() as catalog:
+        summary = catalog.ingest_offer_file(s3_offer_file)
+
+        assert summary.service_code == "AmazonS3"
+        assert summary.version == "20261001000000"
+        assert summary.product_count == 1
+
+        price = catalog.lookup(
+            "AmazonS3", VIRGINIA, {"storageClass": "General Purpose"}
+        )
+        assert price.price_per_unit == Decimal("0.0230")
+        assert price.unit == "GB-Mo"
+
+
+def test_large_json_offer_points_to_csv(ec2_offer_file, caplog, monkeypatch):
+    """JSON offer files are read whole, so large ones warn to use the CSV file."""
+    monkeypatch.setattr("inventag.discovery.price_catalog.LARGE_JSON_OFFER_BYTES", 0)
+
+    with PriceCatalog() as catalog:
+        with caplog.at_level("WARNING", logger="inventag.discovery.price_catalog"):
+            summary = catalog.ingest_offer_file(ec2_offer_file)
+
+    assert summary.product_count == 4
+    assert "CSV offer file" in caplog.text
+
+
+def test_reingest_replaces_prices_and_tracks_staleness(ec2_offer_file, tmp_path):
+    """A catalog file survives reopening and refreshes on re-ingest."""
+    path = str(tmp_path / "catalog" / "prices.db")
+    with PriceCatalog(path) as catalog:
+        assert catalog.is_stale()
+        catalog.ingest_offer_file(ec2_offer_file)
+        catalog.ingest_offer_file(ec2_offer_file)
+        assert len(catalog) == 4
+
+    with PriceCatalog(path, max_age=timedelta(days=1)) as catalog:
+        assert catalog.has_offer("AmazonEC2", OREGON)
+        assert not catalog.has_offer("AmazonRDS")
+        assert not catalog.is_stale()
+
+    with PriceCatalog(path, max_age=timedelta(0)) as catalog:
+        assert catalog.is_stale("AmazonEC2")
+
+
+def test_cost_analyzer_prices_from_catalog_without_pricing_api(ec2_offer_file):
+    """Ingested services are priced locally, per instance type."""
+    catalog = PriceCatalog()
+    catalog.ingest_offer_file(ec2_offer_file)
+    session = Mock(spec=boto3.Session)
+    analyzer = CostAnalyzer(session, price_catalog=catalog)
+
+    small = analyzer._get_pricing_info(
+        "EC2", "Instance", "us-east-1", {"instance_type": "t3.micro"}
+    )
+    large = analyzer._get_pricing_info(
+        "EC2", "Instance", "us-east-1", {"instance_type": "m5.large"}
+    )
+
+    assert small["price_per_unit"] == Decimal("0.0104")
+    assert large["price_per_unit"] == Decimal("0.0960")
+    session.client.assert_not_called()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for AdaptiveRateLimiter
+
+Tests the AIMD token buckets and throttle handling in ComprehensiveAWSDiscovery.
+"""
+
+import pytest
+from unittest.mock import Mock
+from botocore.exceptions import ClientError
+
+from inventag.discovery.rate_limiter import (
+    AdaptiveRateLimiter,
+    TokenBucket,
+    is_throttling_error,
+)
+from inventag.discovery.comprehensive_discovery import ComprehensiveAWSDiscovery
+
+
+def _client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "DescribeThings")
+
+
+class TestThrottlingClassification:
+    """Test throttling error detection."""
+
+    @pytest.mark.parametrize(
+        "code", ["Throttling", "ThrottlingException", "RequestLimitExceeded"]
+    )
+    def test_throttling_codes(self, code):
+        assert is_throttling_error(_client_error(code))
+
+    def test_non_throttling_errors(self):
+        assert not is_throttling_error(_client_error("AccessDenied"))
+        assert not is_throttling_error(Exception("Throttling"))
+
+
+class TestAdaptiveRateLimiter:
+    """Test the AdaptiveRateLimiter class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.limiter = AdaptiveRateLimiter(
+            initial_rate=100.0, min_rate=1.0, max_rate=110.0, additive_increase=5.0
+        )
+        self.key = ("ec2", "us-east-1")
+
+    def test_additive_increase_is_capped(self):
+        """Test that successes grow the rate additively up to max_rate."""
+        self.limiter.acquire(self.key)
+        self.limiter.record_success(self.key)
+        assert self.limiter.get_rate(self.key) == 105.0
+
+        for _ in range(5):
+            self.limiter.record_success(self.key)
+        assert self.limiter.get_rate(self.key) == 110.0
+
+    def test_multiplicative_decrease_has_floor(self):
+        """Test that throttling halves the rate but never below min_rate."""
+        self.limiter.record_throttle(self.key)
+        assert self.limiter.get_rate(self.key) == 50.0
+
+        for _ in range(10):
+            self.limiter.record_throttle(self.key)
+        assert self.limiter.get_rate(self.key) == 1.0
+
+        stats = self.limiter.get_statistics()
+        assert stats["throttle_events"] == 11
+        assert stats["throttles_by_key"] == {"ec2:us-east-1": 11}
+
+    def test_buckets_are_independent_per_key(self):
+        """Test that throttling one key does not slow another."""
+        other_key = ("iam", "us-east-1")
+        self.limiter.record_throttle(self.key)
+        self.limiter.acquire(other_key)
+
+        assert self.limiter.get_rate(other_key) == 100.0
+        assert self.limiter.get_rate(("s3", "us-east-1")) is None
+
+    def test_acquire_records_requests(self):
+        """Test that acquire counts requests and accumulates wait time."""
+        for _ in range(3):
+            self.limiter.acquire(self.key)
+
+        stats = self.limiter.get_statistics()
+        assert stats["requests"] == 3
+        assert stats["wait_time_seconds"] >= 0.0
+
+    def test_token_bucket_waits_when_empty(self):
+        """Test that an empty bucket blocks until a token refills."""
+        bucket = TokenBucket(rate=50.0, capacity=1.0)
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() > 0.0
+
+
+class TestComprehensiveDiscoveryThrottling:
+    """Test throttle-aware operation execution in ComprehensiveAWSDiscovery."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.discovery = ComprehensiveAWSDiscovery(
+            session=Mock(),
+            regions=["us-east-1"],
+            rate_limiter=AdaptiveRateLimiter(initial_rate=1000.0),
+            max_throttle_retries=2,
+        )
+        self.operation = ("describe_vpcs", "Vpcs", "VPC")
+
+    def _paginated_client(self, attempts):
+        """Build a client whose paginator replays one scripted attempt per call."""
+        client = Mock()
+        paginator = Mock()
+
+        def paginate(**kwargs):
+            pages = attempts.pop(0)
+            for page in pages:
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+
+        paginator.paginate.side_effect = paginate
+        client.get_paginator.return_value = paginator
+        return client
+
+    def test_throttled_pagination_is_retried_without_losing_resources(self):
+        """Test that a throttled pagination restarts and keeps every resource."""
+        page_one = {"Vpcs": [{"VpcId": "vpc-1"}]}
+        page_two = {"Vpcs": [{"VpcId": "vpc-2"}]}
+        client = self._paginated_client(
+            [
+                [page_one, _client_error("RequestLimitExceeded")],
+                [page_one, page_two],
+            ]
+        )
+
+        found = self.discovery._execute_discovery_operation(
+            client, "vpc", "us-east-1", self.operation
+        )
+
+        assert found == 2
+        assert [r["resource_id"] for r in self.discovery.resources] == [
+            "vpc-1",
+            "vpc-2",
+        ]
+        stats = self.discovery.get_discovery_statistics()
+        assert stats["throttle_events"] == 1
+        assert stats["throttle_retries"] == 1
+        assert stats["operations_incomplete"] == 0
+        assert self.discovery.rate_limiter.get_rate(("vpc", "us-east-1")) < 1000.0
+
+    def test_exhausted_retries_are_reported(self):
+        """Test that persistent throttling is counted instead of silently dropped."""
+        page_one = {"Vpcs": [{"VpcId": "vpc-1"}]}
+        client = self._paginated_client(
+            [[page_one, _client_error("Throttling")] for _ in range(3)]
+        )
+
+        found = self.discovery._execute_discovery_operation(
+            client, "vpc", "us-east-1", self.operation
+        )
+
+        assert found == 1
+        stats = self.discovery.get_discovery_statistics()
+        assert stats["throttle_events"] == 3
+        assert stats["operations_incomplete"] == 1
+
+    def test_non_throttling_errors_are_not_retried(self):
+        """Test that access errors fail fast without retries."""
+        client = Mock()
+        client.get_paginator.side_effect = Exception("not pageable")
+        client.describe_vpcs.side_effect = _client_error("AccessDenied")
+
+        with pytest.raises(ClientError):
+            self.discovery._execute_discovery_operation(
+                client, "vpc", "us-east-1", self.operation
+            )
+
+        assert client.describe_vpcs.call_count == 1
+        assert self.discovery.get_discovery_statistics()["throttle_events"] == 0
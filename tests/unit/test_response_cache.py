@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for APIResponseCache
+
+Tests the persistent on-disk cache of AWS API response pages.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from inventag.discovery.comprehensive_discovery import ComprehensiveAWSDiscovery
+from inventag.discovery.response_cache import APIResponseCache
+
+KEY = ("123456789012", "us-east-1", "ec2", "describe_vpcs", {})
+
+
+class TestAPIResponseCache:
+    """Test the APIResponseCache class."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return APIResponseCache(cache_dir=str(tmp_path / "api_cache"))
+
+    def test_round_trip_preserves_pages_and_types(self, cache):
+        """Test that cached page chains come back intact, including datetimes."""
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        pages = [
+            {"Vpcs": [{"VpcId": "vpc-1", "CreateTime": created}], "NextToken": "t1"},
+            {"Vpcs": [{"VpcId": "vpc-2"}], "ResponseMetadata": {"RequestId": "r"}},
+        ]
+
+        assert cache.get_pages(*KEY) is None
+        cache.put_pages(*KEY, pages)
+
+        cached = cache.get_pages(*KEY)
+        assert [p["Vpcs"][0]["VpcId"] for p in cached] == ["vpc-1", "vpc-2"]
+        assert cached[0]["Vpcs"][0]["CreateTime"] == created
+        assert "ResponseMetadata" not in cached[1]
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["writes"] == 2
+
+    def test_keys_include_params(self, cache):
+        """Test that different request parameters are cached separately."""
+        cache.put_pages(*KEY[:4], {"OwnerIds": ["self"]}, [{"Snapshots": []}])
+
+        assert cache.get_pages(*KEY) is None
+        assert cache.get_pages(*KEY[:4], {"OwnerIds": ["self"]}) is not None
+
+    def test_expired_entries_are_ignored(self, cache):
+        """Test that entries older than the service TTL are treated as misses."""
+        cache.put_pages(*KEY, [{"Vpcs": []}])
+        assert cache.get_pages(*KEY) is not None
+
+        cache.service_ttls["ec2"] = -1
+
+        assert cache.get_pages(*KEY) is None
+        assert cache.get_statistics()["expired"] == 1
+
+    def test_slow_changing_services_have_longer_ttl(self, cache):
+        """Test the built-in per-service TTL table."""
+        assert cache.get_ttl("iam") > cache.get_ttl("ec2")
+        assert cache.get_ttl("ec2") == cache.default_ttl
+
+    def test_refresh_services_bypass_reads(self, tmp_path):
+        """Test that refreshed services skip cached responses."""
+        cache = APIResponseCache(
+            cache_dir=str(tmp_path / "api_cache"), refresh_services=["EC2"]
+        )
+        cache.put_pages(*KEY, [{"Vpcs": []}])
+
+        assert cache.get_pages(*KEY) is None
+        assert cache.get_statistics()["refreshed"] == 1
+
+    def test_incomplete_chain_only_served_up_to_max_pages(self, cache):
+        """Test that truncated paginations are not served as the full result."""
+        cache.put_pages(*KEY, [{"Vpcs": []}, {"Vpcs": []}], complete=False)
+
+        assert cache.get_pages(*KEY) is None
+        assert len(cache.get_pages(*KEY, max_pages=2)) == 2
+
+    def test_eviction_keeps_cache_under_size_limit(self, cache):
+        """Test that the oldest entries are evicted past the size limit."""
+        cache.max_size_bytes = 4096
+        blob = "x" * 1500
+
+        for i in range(6):
+            cache.put_pages(
+                "123456789012", "us-east-1", "ec2", f"op_{i}", {}, [{"Data": blob}]
+            )
+
+        assert cache.get_statistics()["size_bytes"] <= 4096
+        assert cache.get_statistics()["evictions"] > 0
+        assert cache.get_pages("123456789012", "us-east-1", "ec2", "op_5") is not None
+
+
+class TestComprehensiveDiscoveryResponseCache:
+    """Test that ComprehensiveAWSDiscovery serves repeated runs from the cache."""
+
+    def test_second_run_makes_no_api_calls(self, tmp_path):
+        """Test that a cached operation is not re-issued on the next run."""
+        cache = APIResponseCache(cache_dir=str(tmp_path / "api_cache"))
+        session = Mock()
+
+        paginator = Mock()
+        paginator.paginate.return_value = [{"Vpcs": [{"VpcId": "vpc-1"}]}]
+        client = Mock()
+        client.get_paginator.return_value = paginator
+        client.meta.region_name = "us-east-1"
+        client.meta.service_model.service_name = "ec2"
+        cache._accounts[session] = "123456789012"
+
+        for _ in range(2):
+            discovery = ComprehensiveAWSDiscovery(
+                session=session, regions=["us-east-1"], response_cache=cache
+            )
+            found = discovery._execute_discovery_operation(
+                client, "vpc", "us-east-1", ("describe_vpcs", "Vpcs", "VPC")
+            )
+            assert found == 1
+            assert discovery.resources[0]["resource_id"] == "vpc-1"
+
+        assert paginator.paginate.call_count == 1
+        assert cache.get_statistics()["hits"] == 1
@@ -16,6 +16,15 @@ from inventag.discovery.security_analyzer import (
 )
 
 
+def make_ec2_client():
+    """Return a mock EC2 client whose paginators yield one page per operation."""
+    client = Mock()
+    client.get_paginator.side_effect = lambda operation_name: Mock(
+        paginate=Mock(side_effect=lambda **kwargs: [getattr(client, operation_name)()])
+    )
+    return client
+
+
 class TestSecurityAnalyzer(unittest.TestCase):
     """Test cases for SecurityAnalyzer class."""
 
@@ -214,7 +223,7 @@ class TestSecurityAnalyzer(unittest.TestCase):
     @patch("inventag.discovery.security_analyzer.logger")
     def test_cache_security_group_info(self, mock_logger):
         """Test security group information caching."""
-        mock_ec2 = Mock()
+        mock_ec2 = make_ec2_client()
 
         # Mock security group response
         sg_response = {
@@ -264,7 +273,7 @@ class TestSecurityAnalyzer(unittest.TestCase):
     @patch("inventag.discovery.security_analyzer.logger")
     def test_cache_nacl_info(self, mock_logger):
         """Test NACL information caching."""
-        mock_ec2 = Mock()
+        mock_ec2 = make_ec2_client()
 
         # Mock NACL response
         nacl_response = {
@@ -570,7 +579,7 @@ class TestSecurityAnalyzer(unittest.TestCase):
     def test_analyze_security_groups_integration(self, mock_logger):
         """Test the main analyze_security_groups method integration."""
         # Mock the session and EC2 client
-        mock_ec2 = Mock()
+        mock_ec2 = make_ec2_client()
         self.mock_session.client.return_value = mock_ec2
 
         # Mock security group response
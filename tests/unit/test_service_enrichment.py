@@ -5,6 +5,8 @@ Unit tests for Service Attribute Enrichment Framework
 Tests the service handler framework and dynamic discovery patterns.
 """
 
+import threading
+
 import pytest
 import boto3
 from unittest.mock import Mock, MagicMock, patch
@@ -931,6 +933,68 @@ class TestServiceAttributeEnricher:
         handlers = self.enricher.handler_factory.list_registered_handlers()
         assert "CUSTOM" in handlers
 
+    def test_partitions_run_concurrently_in_input_order(self):
+        """Test a slow partition does not block others and order is kept."""
+        release = threading.Event()
+
+        class SlowHandler(ServiceHandler):
+            def can_handle(self, service, resource_type):
+                return service.upper() == "SLOW"
+
+            def enrich_resource(self, resource):
+                assert release.wait(timeout=5)
+                return {**resource, "service_attributes": {"slow": True}}
+
+            def _define_read_only_operations(self):
+                return []
+
+        class FastHandler(SlowHandler):
+            def can_handle(self, service, resource_type):
+                return service.upper() == "FAST"
+
+            def enrich_resource(self, resource):
+                if resource["region"] == "eu-west-1":
+                    release.set()
+                return {**resource, "service_attributes": {"fast": True}}
+
+        self.enricher.register_custom_handler("SLOW", SlowHandler)
+        self.enricher.register_custom_handler("FAST", FastHandler)
+        resources = [
+            {"service": "SLOW", "type": "T", "id": "s1", "region": "us-east-1"},
+            {"service": "FAST", "type": "T", "id": "f1", "region": "us-east-1"},
+            {"service": "FAST", "type": "T", "id": "f2", "region": "eu-west-1"},
+        ]
+
+        result = self.enricher.enrich_resources_with_attributes(resources)
+
+        assert [r["id"] for r in result] == ["s1", "f1", "f2"]
+        assert all("service_attributes" in r for r in result)
+        metrics = self.enricher.get_enrichment_statistics()["handler_metrics"]
+        assert metrics["FastHandler"]["partitions"] == 2
+        assert metrics["SlowHandler"]["resources"] == 1
+        assert sum(metrics["FastHandler"]["duration_histogram"].values()) == 2
+
+    def test_partition_errors_are_histogrammed(self):
+        """Test per-handler error counts by exception type."""
+
+        def mock_enrich_single(resource):
+            if resource["id"] == "bad":
+                raise ValueError("boom")
+            return resource
+
+        resources = [
+            {"service": "EKS", "type": "Cluster", "id": "bad"},
+            {"service": "EKS", "type": "Cluster", "id": "plain"},
+        ]
+        with patch.object(
+            self.enricher, "enrich_single_resource", side_effect=mock_enrich_single
+        ):
+            result = self.enricher.enrich_resources_with_attributes(resources)
+
+        assert result == resources
+        errors = self.enricher.handler_metrics["EKSHandler"]["error_histogram"]
+        assert errors == {"ValueError": 1, "NoAttributes": 1}
+
 
 class TestServiceDiscoveryResult:
     """Test the ServiceDiscoveryResult dataclass."""
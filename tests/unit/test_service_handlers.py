@@ -612,5 +612,316 @@ class TestEKSHandler:
         assert attributes["disk_size"] == 20
 
 
+
+class TestBatchEnrichment:
+    """Test enrich_batch on handlers and batch dispatch in the enricher."""
+
+    def test_ec2_batch_describes_ids_per_region(self):
+        """Test that EC2 instances are described together per region."""
+        handler = EC2Handler(Mock())
+        resources = [
+            {"service": "EC2", "type": "Instance", "id": f"i-{n}", "region": region}
+            for region in ("us-east-1", "eu-west-1")
+            for n in range(3)
+        ]
+
+        def describe(client, operation, **kwargs):
+            return {
+                "Reservations": [
+                    {
+                        "Instances": [
+                            {"InstanceId": i, "InstanceType": "t3.micro"}
+                            for i in kwargs["InstanceIds"]
+                        ]
+                    }
+                ]
+            }
+
+        with patch.object(handler, "_batch_api_call", side_effect=describe) as call:
+            result = handler.enrich_batch(resources)
+
+        assert call.call_count == 2
+        assert [r["id"] for r in result] == [r["id"] for r in resources]
+        assert all(
+            r["service_attributes"]["instance_type"] == "t3.micro" for r in result
+        )
+
+    def test_ec2_batch_isolates_unknown_ids(self):
+        """Test that a failing chunk is split so valid IDs are still enriched."""
+        handler = EC2Handler(Mock())
+        resources = [
+            {"service": "EC2", "type": "Volume", "id": vol_id, "region": "us-east-1"}
+            for vol_id in ("vol-1", "vol-missing", "vol-2", "vol-3")
+        ]
+
+        def describe(client, operation, **kwargs):
+            if "vol-missing" in kwargs["VolumeIds"]:
+                raise ClientError(
+                    {"Error": {"Code": "InvalidVolume.NotFound", "Message": "missing"}},
+                    "DescribeVolumes",
+                )
+            return {"Volumes": [{"VolumeId": v, "Size": 8} for v in kwargs["VolumeIds"]]}
+
+        with patch.object(handler, "_batch_api_call", side_effect=describe):
+            result = handler.enrich_batch(resources)
+
+        sizes = [r["service_attributes"].get("size") for r in result]
+        assert sizes == [8, None, 8, 8]
+
+    def test_ec2_batch_access_denied_makes_no_per_resource_calls(self):
+        """Test that a denied chunk is neither split nor retried per resource."""
+        handler = EC2Handler(Mock())
+        handler.client_pool = Mock()
+        resources = [
+            {"service": "EC2", "type": "Volume", "id": f"vol-{n}", "region": "us-east-1"}
+            for n in range(8)
+        ]
+        denied = ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeVolumes",
+        )
+
+        with patch.object(handler, "_batch_api_call", side_effect=denied) as batch_call:
+            with patch.object(handler, "_safe_api_call", return_value=None) as single_call:
+                result = handler.enrich_batch(resources)
+
+        batch_call.assert_called_once()
+        single_call.assert_not_called()
+        assert result == resources
+
+    def test_rds_batch_throttled_leaves_resources_unenriched(self):
+        """Test that a throttled batch does not turn into one call per resource."""
+        handler = RDSHandler(Mock())
+        handler.client_pool = Mock()
+        resources = [
+            {"service": "RDS", "type": "DBInstance", "id": f"db-{n}", "region": "us-east-1"}
+            for n in range(5)
+        ]
+        throttled = ClientError(
+            {"Error": {"Code": "Throttling", "Message": "slow down"}},
+            "DescribeDBInstances",
+        )
+
+        with patch.object(handler, "_batch_api_call", side_effect=throttled) as batch_call:
+            with patch.object(handler, "_safe_api_call") as single_call:
+                result = handler.enrich_batch(resources)
+
+        batch_call.assert_called_once()
+        single_call.assert_not_called()
+        assert result == resources
+
+    def test_ecs_services_described_in_chunks_of_ten(self):
+        """Test that ECS services are batched per cluster up to the API limit."""
+        handler = ECSHandler(Mock())
+        resources = [
+            {"service": "ECS", "type": "Service", "id": f"svc-{n}", "cluster": "prod"}
+            for n in range(25)
+        ]
+
+        def describe(client, operation, **kwargs):
+            return {
+                "services": [
+                    {"serviceName": name, "status": "ACTIVE"}
+                    for name in kwargs["services"]
+                ]
+            }
+
+        with patch.object(handler, "_batch_api_call", side_effect=describe) as call:
+            result = handler.enrich_batch(resources)
+
+        assert sorted(len(c.kwargs["services"]) for c in call.call_args_list) == [
+            5,
+            10,
+            10,
+        ]
+        assert all(r["service_attributes"]["status"] == "ACTIVE" for r in result)
+
+    def test_enricher_dispatches_batches_per_handler(self):
+        """Test that ServiceAttributeEnricher hands batch handlers whole groups."""
+        from inventag.discovery.service_enrichment import ServiceAttributeEnricher
+
+        enricher = ServiceAttributeEnricher(Mock(), batch_size=2)
+        resources = [
+            {"service": "EC2", "type": "Instance", "id": f"i-{n}"} for n in range(3)
+        ]
+        ec2_handler = enricher.handler_factory.get_handler("EC2", "Instance")
+
+        with patch.object(
+            ec2_handler,
+            "enrich_batch",
+            side_effect=lambda batch: [
+                {**r, "service_attributes": {"batched": True}} for r in batch
+            ],
+        ) as enrich_batch:
+            result = enricher.enrich_resources_with_attributes(resources)
+
+        assert [len(c.args[0]) for c in enrich_batch.call_args_list] == [2, 1]
+        assert [r["id"] for r in result] == ["i-0", "i-1", "i-2"]
+        assert all(r["enrichment_metadata"]["handler_type"] == "EC2Handler" for r in result)
+        assert enricher.enrichment_stats["enriched_resources"] == 3
+
+    def test_enricher_saves_failed_patterns_once_per_pass(self):
+        """Test the failed pattern cache is written after the pass, not per resource."""
+        from inventag.discovery.service_enrichment import ServiceAttributeEnricher
+
+        enricher = ServiceAttributeEnricher(Mock())
+        dynamic_handler = enricher.handler_factory._dynamic_handler
+        resources = [
+            {"service": "textract", "type": "Document", "id": f"doc-{n}"}
+            for n in range(3)
+        ]
+
+        with patch.object(
+            dynamic_handler, "enrich_resource", side_effect=lambda r: r
+        ), patch.object(dynamic_handler, "save_failed_patterns") as save:
+            enricher.enrich_resources_with_attributes(resources)
+
+        save.assert_called_once()
+
+    def test_s3_batch_uses_regional_clients_and_caches_regions(self):
+        """Test bucket regions are looked up once and calls go to that region."""
+        handler = S3Handler(Mock())
+        handler.client_pool = Mock()
+        regions = {"eu-bucket": "EU", "us-bucket": None, "west-bucket": "us-west-2"}
+
+        def safe_call(client, operation_name, **kwargs):
+            if operation_name == "get_bucket_location":
+                return {"LocationConstraint": regions[kwargs["Bucket"]]}
+            if operation_name == "get_bucket_versioning":
+                return {"Status": "Enabled"}
+            return None
+
+        resources = [
+            {"service": "S3", "type": "Bucket", "id": name} for name in regions
+        ] + [{"service": "S3", "type": "Object", "id": "key"}]
+
+        with patch.object(handler, "_safe_api_call", side_effect=safe_call) as call:
+            result = handler.enrich_batch(resources)
+            handler.enrich_batch(resources[:1])
+
+        locations = [r.get("service_attributes", {}).get("location") for r in result]
+        assert locations == ["eu-west-1", "us-east-1", "us-west-2", None]
+        assert result[0]["service_attributes"]["versioning_status"] == "Enabled"
+        assert result[0]["service_attributes"]["encryption"] is None
+
+        location_calls = [
+            c for c in call.call_args_list if c.args[1] == "get_bucket_location"
+        ]
+        assert len(location_calls) == 3
+        regional = {
+            c.kwargs.get("region_name")
+            for c in handler.client_pool.get_client.call_args_list
+        }
+        assert regional == {None, "eu-west-1", "us-east-1", "us-west-2"}
+
+
+
+class TestPayloadEnrichment:
+    """Test building service attributes from discovery payloads."""
+
+    def test_handler_without_payload_mapping_describes_resource(self):
+        """Test the base mapping falls through to the describe path."""
+        handler = S3Handler(Mock())
+        handler.payload_attribute_keys = {"Bucket": ("Name",)}
+        resource = {
+            "service": "S3",
+            "type": "Bucket",
+            "id": "bucket",
+            "raw_data": {"Name": "bucket"},
+        }
+
+        assert handler.attributes_from_payload(resource) is None
+
+    def test_batch_uses_payloads_and_describes_the_rest(self):
+        """Test only resources without a full payload are described."""
+        handler = EC2Handler(Mock())
+        handler.client_pool = Mock()
+        resources = [
+            {
+                "service": "EC2",
+                "type": "Instance",
+                "id": "i-1",
+                "region": "us-east-1",
+                "raw_data": {
+                    "InstanceId": "i-1",
+                    "InstanceType": "t3.micro",
+                    "State": {"Name": "running"},
+                },
+            },
+            {"service": "EC2", "type": "Instance", "id": "i-2", "region": "us-east-1"},
+        ]
+
+        def describe(client, operation_name, **kwargs):
+            return {
+                "Reservations": [
+                    {"Instances": [{"InstanceId": i, "InstanceType": "m5.large"}]}
+                    for i in kwargs["InstanceIds"]
+                ]
+            }
+
+        with patch.object(handler, "_batch_api_call", side_effect=describe) as call:
+            result = handler.enrich_batch(resources)
+
+        call.assert_called_once()
+        assert call.call_args.kwargs["InstanceIds"] == ["i-2"]
+        assert result[0]["service_attributes"]["instance_type"] == "t3.micro"
+        assert result[0]["service_attributes"]["state"] == "running"
+        assert result[1]["service_attributes"]["instance_type"] == "m5.large"
+
+    def test_nested_payload_makes_no_api_calls(self):
+        """Test payloads nested by discovery enhancement are recognised."""
+        handler = RDSHandler(Mock())
+        handler.client_pool = Mock()
+        resource = {
+            "service": "RDS",
+            "type": "DBInstance",
+            "id": "db-1",
+            "raw_data": {
+                "boto3_instance": {
+                    "DBInstanceIdentifier": "db-1",
+                    "Engine": "postgres",
+                    "DBInstanceClass": "db.t3.micro",
+                    "MultiAZ": True,
+                }
+            },
+        }
+
+        result = handler.enrich_resource(resource)
+
+        handler.client_pool.get_client.assert_not_called()
+        assert result["service_attributes"]["engine"] == "postgres"
+        assert result["service_attributes"]["multi_az"] is True
+
+    def test_lambda_payload_fetches_only_concurrency(self):
+        """Test list_functions payloads need just GetFunctionConcurrency."""
+        handler = LambdaHandler(Mock())
+        handler.client_pool = Mock()
+        resource = {
+            "service": "Lambda",
+            "type": "Function",
+            "id": "fn",
+            "region": "eu-west-1",
+            "raw_data": {
+                "FunctionName": "fn",
+                "FunctionArn": "arn:aws:lambda:eu-west-1:123456789012:function:fn",
+                "MemorySize": 256,
+                "Runtime": "python3.12",
+            },
+        }
+
+        with patch.object(
+            handler,
+            "_safe_api_call",
+            return_value={"ReservedConcurrentExecutions": 5},
+        ) as call:
+            result = handler.enrich_batch([resource])[0]
+
+        assert [c.args[1] for c in call.call_args_list] == ["get_function_concurrency"]
+        handler.client_pool.get_client.assert_called_once_with(
+            handler.session, "lambda", region_name="eu-west-1"
+        )
+        assert result["service_attributes"]["memory_size"] == 256
+        assert result["service_attributes"]["reserved_concurrency_executions"] == 5
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -463,6 +463,73 @@ class TestStateManager:
         with pytest.raises(ValueError, match="One or both states not found"):
             state_manager.get_state_comparison_data("20230101_120000", "20230101_130000")
 
+    def test_content_addressed_snapshots_share_records(self, state_manager, sample_resources):
+        """Test unchanged resources are stored once across snapshots"""
+        state_id1 = state_manager.save_state(
+            resources=sample_resources, account_id="123456789012", regions=["us-east-1"]
+        )
+        changed = [dict(sample_resources[0], compliance_status="non-compliant")]
+        state_id2 = state_manager.save_state(
+            resources=changed + sample_resources[1:],
+            account_id="123456789012",
+            regions=["us-east-1"],
+        )
+
+        # Two records of the first snapshot plus the one changed record
+        assert state_manager.get_storage_stats()["resource_records"] == 3
+        assert state_manager.load_state(state_id1).resources == sample_resources
+        assert state_manager.load_state(state_id2).resources[0] == changed[0]
+
+        with open(state_manager.metadata_index[state_id2]["file"], "r") as f:
+            manifest = json.load(f)["resource_manifest"]
+        assert manifest[1][0] == "arn:aws:s3:::test-bucket"
+
+        # Removing the first snapshot drops only the record no one else uses
+        state_manager._remove_state(state_id1)
+        assert state_manager.get_storage_stats()["resource_records"] == 2
+        assert state_manager.load_state(state_id2).resources[1] == sample_resources[1]
+
+    def test_per_run_fields_do_not_create_records(self, state_manager, sample_resources):
+        """Test resources differing only in discovery timestamps are not stored again"""
+
+        def discovered(timestamp):
+            return [
+                dict(
+                    resource,
+                    discovered_at=timestamp,
+                    discovery_timestamp=timestamp,
+                    enrichment_metadata={"handler_type": "EC2Handler", "enriched_at": timestamp},
+                )
+                for resource in sample_resources
+            ]
+
+        first = discovered("2024-01-01T00:00:00")
+        second = discovered("2024-01-02T00:00:00")
+        state_id1 = state_manager.save_state(
+            resources=first, account_id="123456789012", regions=["us-east-1"]
+        )
+        records = state_manager.get_storage_stats()["resource_records"]
+        state_id2 = state_manager.save_state(
+            resources=second, account_id="123456789012", regions=["us-east-1"]
+        )
+
+        assert state_manager.get_storage_stats()["resource_records"] == records
+        assert state_manager.load_state(state_id1).resources == first
+        assert state_manager.load_state(state_id2).resources == second
+
+    def test_full_state_files_still_load(self, temp_dir, sample_resources):
+        """Test states saved without the blob store load alongside manifests"""
+        state_dir = f"{temp_dir}/.inventag/state"
+        full_manager = StateManager(state_dir=state_dir, content_addressed=False)
+        state_id = full_manager.save_state(
+            resources=sample_resources, account_id="123456789012", regions=["us-east-1"]
+        )
+
+        state_manager = StateManager(state_dir=state_dir)
+        assert state_manager.load_state(state_id).resources == sample_resources
+        assert state_manager.validate_state_integrity(state_id)["valid_states"] == [state_id]
+        assert not Path(state_dir, "resources.db").exists()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for discovery streaming
+
+Tests the producer/consumer bridge and the streaming discovery entry points.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from inventag.discovery.comprehensive_discovery import ComprehensiveAWSDiscovery
+from inventag.discovery.streaming import (
+    StreamCancelled,
+    iter_batches,
+    stream_from_producer,
+)
+
+
+class TestStreamFromProducer:
+    """Test the stream_from_producer helper."""
+
+    def test_yields_items_in_order(self):
+        """Test that emitted items are yielded in emission order."""
+
+        def producer(emit):
+            for i in range(10):
+                emit(i)
+
+        assert list(stream_from_producer(producer, max_buffered=2)) == list(range(10))
+
+    def test_producer_error_raised_after_items(self):
+        """Test that producer failures surface after earlier items are consumed."""
+
+        def producer(emit):
+            emit("first")
+            raise RuntimeError("discovery failed")
+
+        stream = stream_from_producer(producer)
+        assert next(stream) == "first"
+        with pytest.raises(RuntimeError, match="discovery failed"):
+            next(stream)
+
+    def test_closing_stream_cancels_producer(self):
+        """Test that a consumer stopping early unblocks and cancels the producer."""
+        cancelled = threading.Event()
+
+        def producer(emit):
+            try:
+                for i in range(1000):
+                    emit(i)
+            except StreamCancelled:
+                cancelled.set()
+                raise
+
+        stream = stream_from_producer(producer, max_buffered=1)
+        assert next(stream) == 0
+        stream.close()
+
+        assert cancelled.wait(timeout=2)
+
+    def test_iter_batches(self):
+        """Test grouping an iterable into bounded batches."""
+        assert list(iter_batches(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(iter_batches([], 3)) == []
+
+
+class TestComprehensiveDiscoveryStreaming:
+    """Test ComprehensiveAWSDiscovery.iter_resources."""
+
+    def setup_method(self):
+        """Set up a discovery instance restricted to one mocked operation."""
+        self.discovery = ComprehensiveAWSDiscovery(
+            session=Mock(), regions=["us-east-1"], fallback_display_mode="always"
+        )
+        self.discovery.service_discovery_patterns = {
+            "vpc": {
+                "operations": [("describe_vpcs", "Vpcs", "VPC")],
+                "regional": True,
+                "client_service": "ec2",
+            }
+        }
+
+        paginator = Mock()
+        paginator.paginate.return_value = [
+            {"Vpcs": [{"VpcId": "vpc-1", "OwnerId": "123456789012"}]},
+            {"Vpcs": [{"VpcId": "vpc-2", "OwnerId": "123456789012"}]},
+        ]
+        ec2_client = Mock()
+        ec2_client.get_paginator.return_value = paginator
+
+        self.discovery.client_pool = Mock()
+        self.discovery.client_pool.get_client.return_value = ec2_client
+
+    def test_streams_resources_with_tags_and_fallbacks(self):
+        """Test that streamed resources carry RGT tags and missed ARNs come last."""
+        vpc_arn = self.discovery._construct_arn("vpc", "us-east-1", "VPC", "vpc-1")
+        queue_arn = "arn:aws:sqs:us-east-1:123456789012:orders"
+        tag_mappings = [
+            ("us-east-1", vpc_arn, {"Name": "main"}),
+            ("us-east-1", queue_arn, {"Team": "payments"}),
+        ]
+
+        with patch.object(
+            self.discovery, "_discover_billing_services"
+        ), patch.object(
+            self.discovery, "_iter_tag_mappings", return_value=iter(tag_mappings)
+        ):
+            resources = list(self.discovery.iter_resources(max_workers=2))
+
+        assert [r["resource_id"] for r in resources] == ["vpc-1", "vpc-2", "orders"]
+        assert resources[0]["tags"] == {"Name": "main"}
+        assert resources[0]["tagged"] is True
+        assert resources[2]["priority"] == "fallback"
+        assert all("billing_validated" in r for r in resources)
+
+        # Streamed resources are handed to the consumer, not retained
+        assert self.discovery.resources == []